@@ -147,7 +147,10 @@ The configuration file should be a JSON file with the following structure:
     "svg_filename_pattern": "{index:02d}_{storey_name}.svg",
     "geojson_filename_pattern": "{index:02d}_{storey_name}.geo.json",
     "manifest_filename": "manifest.json",
-    "write_geojson": true
+    "write_geojson": true,
+    "write_binary": false,
+    "binary_filename_pattern": "{index:02d}_{storey_name}.fpb",
+    "binary_coordinate_precision": 3
   },
   
   "performance": {
@@ -289,6 +292,8 @@ def print_output_info(result: ProcessingResult):
             print(f"  SVG: {storey.svg_file}")
         if storey.geojson_file:
             print(f"  GeoJSON: {storey.geojson_file}")
+        if storey.binary_file:
+            print(f"  Binary: {storey.binary_file}")
     
     if hasattr(result.manifest, 'input_file'):
         print(f"\nManifest: manifest.json")
@@ -6,7 +6,7 @@ Handles loading, validation, and access to configuration data.
 
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 # Try to import jsonschema, but make it optional
@@ -135,6 +135,10 @@ class ConfigurationManager:
             if not isinstance(config["cut_offset_m"], (int, float)) or config["cut_offset_m"] < 0:
                 raise ValidationError("cut_offset_m must be a non-negative number")
         
+        # Validate additional_cut_offsets_m if present
+        if "additional_cut_offsets_m" in config:
+            self._validate_cut_offset_list(config["additional_cut_offsets_m"], "additional_cut_offsets_m")
+        
         # Validate per_storey_overrides if present
         if "per_storey_overrides" in config:
             if not isinstance(config["per_storey_overrides"], dict):
@@ -146,6 +150,11 @@ class ConfigurationManager:
                 if "cut_offset_m" in storey_config:
                     if not isinstance(storey_config["cut_offset_m"], (int, float)) or storey_config["cut_offset_m"] < 0:
                         raise ValidationError(f"cut_offset_m for storey '{storey_name}' must be a non-negative number")
+                if "additional_cut_offsets_m" in storey_config:
+                    self._validate_cut_offset_list(
+                        storey_config["additional_cut_offsets_m"],
+                        f"additional_cut_offsets_m for storey '{storey_name}'"
+                    )
         
         # Validate class_filters if present
         if "class_filters" in config:
@@ -162,6 +171,21 @@ class ConfigurationManager:
         
         return True
     
+    def _validate_cut_offset_list(self, offsets: Any, field_name: str) -> None:
+        """Validate a list of cut offsets in the basic validator.
+        
+        Args:
+            offsets: Value to validate
+            field_name: Field name used in the error message
+            
+        Raises:
+            ValidationError: If the value is not a list of non-negative numbers
+        """
+        if not isinstance(offsets, list):
+            raise ValidationError(f"{field_name} must be an array")
+        if not all(isinstance(offset, (int, float)) and offset >= 0 for offset in offsets):
+            raise ValidationError(f"All items in {field_name} must be non-negative numbers")
+    
     def _dict_to_config(self, config_data: Dict[str, Any]) -> Config:
         """Convert configuration dictionary to Config dataclass.
         
@@ -181,7 +205,8 @@ class ConfigurationManager:
         if "per_storey_overrides" in config_data:
             for storey_name, storey_data in config_data["per_storey_overrides"].items():
                 per_storey_overrides[storey_name] = StoreyConfig(
-                    cut_offset_m=storey_data["cut_offset_m"]
+                    cut_offset_m=storey_data["cut_offset_m"],
+                    additional_cut_offsets_m=storey_data.get("additional_cut_offsets_m")
                 )
         
         # Convert class_filters
@@ -203,7 +228,11 @@ class ConfigurationManager:
         geometry = GeometryConfig(
             use_world_coords=geometry_data.get("use_world_coords", True),
             subtract_openings=geometry_data.get("subtract_openings", True),
-            sew_shells=geometry_data.get("sew_shells", True)
+            sew_shells=geometry_data.get("sew_shells", True),
+            section_backend=geometry_data.get("section_backend", "occ"),
+            z_prefilter=geometry_data.get("z_prefilter", True),
+            disk_cache_dir=geometry_data.get("disk_cache_dir"),
+            disk_cache_max_mb=geometry_data.get("disk_cache_max_mb", 1024.0)
         )
         
         # Convert tolerances config
@@ -220,7 +249,8 @@ class ConfigurationManager:
             default_linewidth_px=rendering_data.get("default_linewidth_px", 1.0),
             background=rendering_data.get("background"),
             invert_y=rendering_data.get("invert_y", True),
-            class_styles=rendering_data.get("class_styles", {})
+            class_styles=rendering_data.get("class_styles", {}),
+            coordinate_precision=rendering_data.get("coordinate_precision", 3)
         )
         
         # Convert output config
@@ -229,20 +259,28 @@ class ConfigurationManager:
             svg_filename_pattern=output_data.get("svg_filename_pattern", "{index:02d}_{storey_name}.svg"),
             geojson_filename_pattern=output_data.get("geojson_filename_pattern", "{index:02d}_{storey_name}.geo.json"),
             manifest_filename=output_data.get("manifest_filename", "manifest.json"),
-            write_geojson=output_data.get("write_geojson", True)
+            write_geojson=output_data.get("write_geojson", True),
+            write_binary=output_data.get("write_binary", False),
+            binary_filename_pattern=output_data.get("binary_filename_pattern", "{index:02d}_{storey_name}.fpb"),
+            binary_coordinate_precision=output_data.get("binary_coordinate_precision", 3)
         )
         
         # Convert performance config
         performance_data = config_data.get("performance", {})
         performance = PerformanceConfig(
             multiprocessing=performance_data.get("multiprocessing", False),
-            max_workers=performance_data.get("max_workers")
+            max_workers=performance_data.get("max_workers"),
+            element_multiprocessing=performance_data.get("element_multiprocessing", False),
+            element_workers=performance_data.get("element_workers"),
+            element_batch_size=performance_data.get("element_batch_size", 50),
+            incremental=performance_data.get("incremental", False)
         )
         
         return Config(
             input_path=input_path,
             output_dir=output_dir,
             cut_offset_m=cut_offset_m,
+            additional_cut_offsets_m=config_data.get("additional_cut_offsets_m", []),
             per_storey_overrides=per_storey_overrides,
             class_filters=class_filters,
             units=units,
@@ -253,6 +291,17 @@ class ConfigurationManager:
             performance=performance
         )
     
+    def set_config(self, config: Config) -> None:
+        """Use an already loaded configuration.
+        
+        Used by worker processes that receive a configuration snapshot
+        instead of reading the configuration file again.
+        
+        Args:
+            config: Configuration to use
+        """
+        self._config = config
+    
     def get_storey_cut_height(self, storey_name: str) -> float:
         """Get cut height for specific storey considering overrides.
         
@@ -274,6 +323,26 @@ class ConfigurationManager:
         
         return self._config.get_storey_cut_height(storey_name)
     
+    def get_storey_cut_heights(self, storey_name: str) -> List[float]:
+        """Get all cut heights for a storey, the primary cut height first.
+        
+        Additional cut offsets come from the storey override if it lists them,
+        otherwise from the global additional_cut_offsets_m.
+        
+        Args:
+            storey_name: Name of the building storey
+            
+        Returns:
+            List[float]: Distinct cut heights in meters
+            
+        Raises:
+            RuntimeError: If no configuration is loaded
+        """
+        if self._config is None:
+            raise RuntimeError("No configuration loaded. Call load_config() first.")
+        
+        return self._config.get_storey_cut_heights(storey_name)
+    
     def has_storey_override(self, storey_name: str) -> bool:
         """Check if a storey has specific configuration overrides.
         
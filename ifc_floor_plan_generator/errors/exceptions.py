@@ -35,6 +35,18 @@ class ProcessingError(Exception):
     def __repr__(self) -> str:
         """Detailed representation of the error."""
         return f"ProcessingError(error_code='{self.error_code}', message='{self.message}', context={self.context})"
+    
+    def __reduce__(self):
+        """Pickle by state so subclasses with their own constructors cross process boundaries."""
+        return (_restore_error, (self.__class__, self.args, self.__dict__))
+
+
+def _restore_error(error_class, args, state) -> ProcessingError:
+    """Recreate a pickled ProcessingError without calling its constructor."""
+    error = error_class.__new__(error_class)
+    error.args = args
+    error.__dict__.update(state)
+    return error
 
 
 class IFCOpenError(ProcessingError):
@@ -6,14 +6,22 @@ Handles 3D geometry generation, caching, and section processing operations.
 
 from .engine import GeometryEngine
 from .section_processor import SectionProcessor
+from .mesh_slicer import MeshSlicer, TriangleMesh
+from .z_range_filter import ZRangeFilter
 from .cache import GeometryCache, CacheEntry, CacheStats
+from .disk_cache import DiskGeometryCache, ElementGeometryHasher
 from ..models import BoundingBox
 
 __all__ = [
     "GeometryEngine",
     "SectionProcessor", 
+    "MeshSlicer",
+    "TriangleMesh",
+    "ZRangeFilter",
     "GeometryCache",
     "CacheEntry",
     "CacheStats",
+    "DiskGeometryCache",
+    "ElementGeometryHasher",
     "BoundingBox"
 ]
\ No newline at end of file
@@ -2,12 +2,12 @@
 Geometry caching system for IFC Floor Plan Generator.
 
 Provides GUID-based geometry caching with memory-efficient storage,
-cache invalidation, and performance monitoring.
+cache invalidation, and performance monitoring. The optional disk tier keeps
+serialised geometry in a single SQLite file across runs.
 """
 
 import logging
 import hashlib
-import pickle
 import weakref
 from typing import Any, Optional, Dict, Set, Tuple, List
 from pathlib import Path
@@ -15,6 +15,12 @@ from threading import RLock
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from .disk_cache import (
+    DiskGeometryCache, KIND_BREP, KIND_MESH,
+    encode_shape, decode_shape, encode_mesh, decode_mesh
+)
+from .mesh_slicer import TriangleMesh
+
 # IfcOpenShell imports with error handling
 try:
     from OCC.Core import TopoDS_Shape
@@ -34,6 +40,7 @@ class CacheEntry:
     access_count: int = 0
     last_accessed: datetime = None
     config_hash: str = ""
+    element_hash: str = ""
     
     def __post_init__(self):
         if self.last_accessed is None:
@@ -67,6 +74,8 @@ class GeometryCache:
     - Memory usage monitoring
     - LRU-style eviction
     - Configuration-based invalidation
+    - Element revision detection through geometry hashes
+    - Persistent single-file disk tier shared by worker processes
     - Performance statistics
     """
     
@@ -75,7 +84,8 @@ class GeometryCache:
                  max_entries: int = 10000,
                  ttl_hours: float = 24.0,
                  enable_disk_cache: bool = False,
-                 disk_cache_dir: Optional[Path] = None):
+                 disk_cache_dir: Optional[Path] = None,
+                 max_disk_mb: float = 1024.0):
         """
         Initialize geometry cache.
         
@@ -85,12 +95,15 @@ class GeometryCache:
             ttl_hours: Time-to-live for cache entries in hours
             enable_disk_cache: Whether to enable disk-based caching
             disk_cache_dir: Directory for disk cache (if enabled)
+            max_disk_mb: Maximum size of the disk cache in MB
         """
         self.max_memory_mb = max_memory_mb
         self.max_entries = max_entries
         self.ttl = timedelta(hours=ttl_hours)
         self.enable_disk_cache = enable_disk_cache
         self.disk_cache_dir = disk_cache_dir
+        self.max_disk_mb = max_disk_mb
+        self._disk_cache: Optional[DiskGeometryCache] = None
         
         # Thread-safe cache storage
         self._cache: Dict[str, CacheEntry] = {}
@@ -115,12 +128,14 @@ class GeometryCache:
                         f"disk_cache={enable_disk_cache}")
     
     def _init_disk_cache(self) -> None:
-        """Initialize disk cache directory."""
+        """Initialize disk cache directory and database."""
         if self.disk_cache_dir is None:
             self.disk_cache_dir = Path.cwd() / ".cache" / "geometry"
+        self.disk_cache_dir = Path(self.disk_cache_dir)
         
         try:
             self.disk_cache_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_cache = DiskGeometryCache(self.disk_cache_dir / "geometry.sqlite", self.max_disk_mb)
             self.logger.debug(f"Disk cache directory: {self.disk_cache_dir}")
         except Exception as e:
             self.logger.warning(f"Failed to create disk cache directory: {e}")
@@ -143,6 +158,7 @@ class GeometryCache:
             'sew_shells': config_dict.get('sew_shells', True),
             'unit_scale_to_m': config_dict.get('unit_scale_to_m'),
             'slice_tol': config_dict.get('slice_tol', 1e-6),
+            'ifcopenshell_version': config_dict.get('ifcopenshell_version'),
         }
         
         # Create deterministic hash
@@ -165,12 +181,14 @@ class GeometryCache:
                 self._current_config_hash = new_config_hash
                 self._stats.invalidations += 1
     
-    def get(self, guid: str) -> Optional[TopoDS_Shape]:
+    def get(self, guid: str, element_hash: str = "") -> Optional[TopoDS_Shape]:
         """
         Retrieve cached geometry by GUID.
         
         Args:
             guid: Element GUID to look up
+            element_hash: Geometry hash of the element; entries stored for another
+                revision of the element are treated as misses
             
         Returns:
             TopoDS_Shape or None: Cached shape if found and valid, None otherwise
@@ -188,7 +206,7 @@ class GeometryCache:
             if entry is None:
                 # Try disk cache if enabled
                 if self.enable_disk_cache:
-                    entry = self._load_from_disk(guid)
+                    entry = self._load_from_disk(guid, element_hash)
                     if entry is not None:
                         # Move back to memory cache
                         self._cache[guid] = entry
@@ -203,8 +221,8 @@ class GeometryCache:
                 self._stats.cache_misses += 1
                 return None
             
-            # Check if entry is from old configuration
-            if entry.config_hash != self._current_config_hash:
+            # Check if entry is from old configuration or an older revision of the element
+            if entry.config_hash != self._current_config_hash or entry.element_hash != element_hash:
                 self._remove_entry(guid)
                 self._invalidated_guids.add(guid)
                 self._stats.cache_misses += 1
@@ -218,13 +236,14 @@ class GeometryCache:
             self.logger.debug(f"Cache hit for {guid}")
             return entry.shape
     
-    def put(self, guid: str, shape: TopoDS_Shape) -> None:
+    def put(self, guid: str, shape: TopoDS_Shape, element_hash: str = "") -> None:
         """
         Store geometry in cache.
         
         Args:
             guid: Element GUID to use as key
             shape: Geometry shape to cache
+            element_hash: Geometry hash of the element the shape was generated from
         """
         if shape is None:
             return
@@ -237,7 +256,8 @@ class GeometryCache:
             entry = CacheEntry(
                 shape=shape,
                 timestamp=datetime.now(),
-                config_hash=self._current_config_hash
+                config_hash=self._current_config_hash,
+                element_hash=element_hash
             )
             
             # Store in memory cache
@@ -259,14 +279,14 @@ class GeometryCache:
         """Check if a cache entry is expired."""
         return datetime.now() - entry.timestamp > self.ttl
     
-    def _remove_entry(self, guid: str) -> None:
-        """Remove entry from cache."""
+    def _remove_entry(self, guid: str, from_disk: bool = True) -> None:
+        """Remove entry from cache, optionally keeping its disk copy."""
         if guid in self._cache:
             del self._cache[guid]
             self._stats.cached_items = len(self._cache)
         
         # Remove from disk cache if enabled
-        if self.enable_disk_cache:
+        if self.enable_disk_cache and from_disk:
             self._remove_from_disk(guid)
     
     def _maybe_evict(self) -> None:
@@ -293,10 +313,10 @@ class GeometryCache:
             key=lambda x: x[1].last_accessed
         )
         
-        # Remove oldest entries
+        # Remove oldest entries from memory; the disk cache has its own size limit
         for i in range(min(count, len(sorted_entries))):
             guid = sorted_entries[i][0]
-            self._remove_entry(guid)
+            self._remove_entry(guid, from_disk=False)
             self.logger.debug(f"Evicted cache entry for {guid}")
     
     def _estimate_memory_usage(self) -> float:
@@ -342,78 +362,120 @@ class GeometryCache:
         return total_bytes / (1024 * 1024)  # Convert to MB
     
     def _invalidate_all(self) -> None:
-        """Invalidate all cached entries."""
+        """Invalidate all cached entries in memory.
+        
+        Disk entries are keyed by configuration hash, so they stay valid for
+        the configuration they were generated with.
+        """
         self._cache.clear()
         self._invalidated_guids.clear()
         self._stats.cached_items = 0
-        
-        # Clear disk cache if enabled
-        if self.enable_disk_cache:
-            self._clear_disk_cache()
     
-    def _load_from_disk(self, guid: str) -> Optional[CacheEntry]:
+    def _load_from_disk(self, guid: str, element_hash: str) -> Optional[CacheEntry]:
         """Load cache entry from disk."""
-        if not self.enable_disk_cache:
+        if not self.enable_disk_cache or self._disk_cache is None:
+            return None
+        
+        data = self._disk_cache.get(guid, KIND_BREP, element_hash, self._current_config_hash)
+        if data is None:
             return None
         
         try:
-            cache_file = self.disk_cache_dir / f"{guid}.cache"
-            if not cache_file.exists():
-                return None
-            
-            with open(cache_file, 'rb') as f:
-                entry = pickle.load(f)
-                
-            # Validate entry
-            if self._is_expired(entry) or entry.config_hash != self._current_config_hash:
-                cache_file.unlink(missing_ok=True)
-                return None
-            
-            return entry
-            
+            return CacheEntry(
+                shape=decode_shape(data),
+                timestamp=datetime.now(),
+                config_hash=self._current_config_hash,
+                element_hash=element_hash
+            )
         except Exception as e:
             self.logger.debug(f"Failed to load cache entry from disk for {guid}: {e}")
             return None
     
     def _save_to_disk(self, guid: str, entry: CacheEntry) -> None:
-        """Save cache entry to disk."""
-        if not self.enable_disk_cache:
+        """Save cache entry to disk as serialised BRep data."""
+        if not self.enable_disk_cache or self._disk_cache is None:
             return
         
         try:
-            cache_file = self.disk_cache_dir / f"{guid}.cache"
-            with open(cache_file, 'wb') as f:
-                pickle.dump(entry, f)
-                
+            data = encode_shape(entry.shape)
         except Exception as e:
             self.logger.debug(f"Failed to save cache entry to disk for {guid}: {e}")
+            return
+        
+        self._disk_cache.put(guid, KIND_BREP, entry.element_hash, entry.config_hash, data)
     
     def _remove_from_disk(self, guid: str) -> None:
         """Remove cache entry from disk."""
-        if not self.enable_disk_cache:
+        if not self.enable_disk_cache or self._disk_cache is None:
             return
         
-        try:
-            cache_file = self.disk_cache_dir / f"{guid}.cache"
-            cache_file.unlink(missing_ok=True)
-        except Exception as e:
-            self.logger.debug(f"Failed to remove cache entry from disk for {guid}: {e}")
+        self._disk_cache.remove(guid)
     
     def _clear_disk_cache(self) -> None:
-        """Clear all disk cache files."""
-        if not self.enable_disk_cache or not self.disk_cache_dir.exists():
+        """Clear all disk cache entries."""
+        if not self.enable_disk_cache or self._disk_cache is None:
             return
         
+        self._disk_cache.clear()
+    
+    def get_mesh(self, guid: str, element_hash: str) -> Optional[TriangleMesh]:
+        """
+        Retrieve a triangle mesh from the disk cache.
+        
+        Meshes are only kept on disk: within a run every element is tessellated
+        once, so a memory copy would never be read again.
+        
+        Args:
+            guid: Element GUID to look up
+            element_hash: Geometry hash of the element
+            
+        Returns:
+            TriangleMesh or None: Cached mesh if found and current, None otherwise
+        """
+        if not self.enable_disk_cache or self._disk_cache is None:
+            return None
+        
+        data = self._disk_cache.get(guid, KIND_MESH, element_hash, self._current_config_hash)
+        if data is None:
+            return None
+        
         try:
-            for cache_file in self.disk_cache_dir.glob("*.cache"):
-                cache_file.unlink(missing_ok=True)
+            return decode_mesh(data)
         except Exception as e:
-            self.logger.warning(f"Failed to clear disk cache: {e}")
+            self.logger.debug(f"Failed to load mesh from disk for {guid}: {e}")
+            return None
+    
+    def put_mesh(self, guid: str, mesh: TriangleMesh, element_hash: str) -> None:
+        """
+        Store a triangle mesh in the disk cache.
+        
+        Args:
+            guid: Element GUID to use as key
+            mesh: Mesh to cache
+            element_hash: Geometry hash of the element the mesh was generated from
+        """
+        if not self.enable_disk_cache or self._disk_cache is None or mesh is None:
+            return
+        
+        self._disk_cache.put(guid, KIND_MESH, element_hash, self._current_config_hash, encode_mesh(mesh))
+    
+    def get_disk_stats(self) -> Optional[Dict[str, Any]]:
+        """Get disk cache statistics, None if the disk cache is disabled."""
+        if not self.enable_disk_cache or self._disk_cache is None:
+            return None
+        return self._disk_cache.get_stats()
+    
+    def close(self) -> None:
+        """Write pending disk cache updates and close the database."""
+        if self._disk_cache is not None:
+            self._disk_cache.close()
     
     def clear(self) -> None:
-        """Clear all cached entries."""
+        """Clear all cached entries, including the disk cache."""
         with self._lock:
             self._invalidate_all()
+            if self.enable_disk_cache:
+                self._clear_disk_cache()
             self.logger.info("Geometry cache cleared")
     
     def get_stats(self) -> CacheStats:
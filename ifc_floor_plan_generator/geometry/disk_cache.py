@@ -0,0 +1,373 @@
+"""
+Persistent geometry cache for IFC Floor Plan Generator.
+
+Stores serialised element geometry in a single SQLite file, so floor plans can
+be regenerated after a model revision without tessellating unchanged elements
+again. Entries are keyed by element GUID, a structural hash of the element's
+geometry-relevant attributes and a hash of the geometry configuration.
+"""
+
+import logging
+import hashlib
+import os
+import sqlite3
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .mesh_slicer import TriangleMesh
+from ..dependencies.occ_wrapper import HAS_OCC, BRepTools_ShapeSet
+
+
+# Bump whenever the stored layout or the meaning of a key changes
+DISK_CACHE_FORMAT_VERSION = 1
+
+# Kinds of stored geometry
+KIND_BREP = "brep"
+KIND_MESH = "mesh"
+
+# Number of stores between checks of the size limit
+EVICTION_CHECK_INTERVAL = 256
+
+_MESH_HEADER = struct.Struct("<II")
+
+
+def encode_mesh(mesh: TriangleMesh) -> bytes:
+    """Serialise a triangle mesh as compressed coordinate and index arrays.
+
+    Args:
+        mesh: Mesh to serialise
+
+    Returns:
+        bytes: Encoded mesh
+    """
+    header = _MESH_HEADER.pack(len(mesh.vertices), len(mesh.faces))
+    payload = mesh.vertices.astype('<f8').tobytes() + mesh.faces.astype('<i4').tobytes()
+    return header + zlib.compress(payload, 1)
+
+
+def decode_mesh(data: bytes) -> TriangleMesh:
+    """Rebuild a triangle mesh serialised by encode_mesh.
+
+    Args:
+        data: Encoded mesh
+
+    Returns:
+        TriangleMesh: Decoded mesh
+    """
+    vertex_count, face_count = _MESH_HEADER.unpack_from(data)
+    payload = zlib.decompress(data[_MESH_HEADER.size:])
+    split = vertex_count * 3 * 8
+    vertices = np.frombuffer(payload[:split], dtype='<f8').reshape(vertex_count, 3)
+    faces = np.frombuffer(payload[split:], dtype='<i4').reshape(face_count, 3)
+    return TriangleMesh(vertices=vertices, faces=faces)
+
+
+def encode_shape(shape: Any) -> bytes:
+    """Serialise an OpenCASCADE shape in the BRep text format.
+
+    Args:
+        shape: TopoDS_Shape to serialise
+
+    Returns:
+        bytes: Compressed BRep data
+
+    Raises:
+        RuntimeError: If OpenCASCADE is not available
+    """
+    if not HAS_OCC:
+        raise RuntimeError("OpenCASCADE is required to serialise BRep shapes")
+
+    shape_set = BRepTools_ShapeSet()
+    shape_set.Add(shape)
+    return zlib.compress(shape_set.WriteToString().encode('ascii'), 1)
+
+
+def decode_shape(data: bytes) -> Any:
+    """Rebuild an OpenCASCADE shape serialised by encode_shape.
+
+    Args:
+        data: Compressed BRep data
+
+    Returns:
+        TopoDS_Shape: Decoded shape
+
+    Raises:
+        RuntimeError: If OpenCASCADE is not available
+    """
+    if not HAS_OCC:
+        raise RuntimeError("OpenCASCADE is required to read BRep shapes")
+
+    shape_set = BRepTools_ShapeSet()
+    shape_set.ReadFromString(zlib.decompress(data).decode('ascii'))
+    return shape_set.Shape(shape_set.NbShapes())
+
+
+class ElementGeometryHasher:
+    """Hashes the attributes of an element that determine its geometry.
+
+    The hash covers the object placement and representation of the element and,
+    optionally, of the openings voiding it. Referenced entities are hashed by
+    content rather than by id, so the hash is stable when an authoring tool
+    renumbers the file and only changes when the geometry itself changes.
+    """
+
+    def __init__(self, include_openings: bool = True):
+        """Initialize element geometry hasher.
+
+        Args:
+            include_openings: Include openings, for geometry with opening subtraction
+        """
+        self.include_openings = include_openings
+
+    def hash_element(self, element: Any) -> str:
+        """Get the geometry hash of an element.
+
+        Args:
+            element: IFC element (IfcProduct or similar)
+
+        Returns:
+            str: Hex digest of the geometry-relevant attributes
+        """
+        memo: Dict[int, bytes] = {}
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(element.is_a().encode('utf-8'))
+
+        for root in self._geometry_roots(element):
+            digest.update(self._value_digest(root, memo))
+
+        return digest.hexdigest()
+
+    def _geometry_roots(self, element: Any) -> List[Any]:
+        """Get the entities whose content determines the element's geometry."""
+        roots = [getattr(element, 'ObjectPlacement', None), getattr(element, 'Representation', None)]
+
+        if self.include_openings:
+            for relation in getattr(element, 'HasOpenings', None) or []:
+                opening = relation.RelatedOpeningElement
+                roots.extend([opening.ObjectPlacement, opening.Representation])
+
+        return roots
+
+    def _value_digest(self, value: Any, memo: Dict[int, bytes]) -> bytes:
+        """Get a digest of an attribute value, recursing into referenced entities."""
+        if isinstance(value, (tuple, list)):
+            return b"(" + b",".join(self._value_digest(item, memo) for item in value) + b")"
+
+        if hasattr(value, 'is_a') and hasattr(value, 'id'):
+            entity_id = value.id()
+            # Inline values such as IfcLengthMeasure have no id and are never shared
+            if entity_id and entity_id in memo:
+                return memo[entity_id]
+
+            digest = hashlib.blake2b(value.is_a().encode('utf-8'), digest_size=16)
+            for index in range(len(value)):
+                digest.update(self._value_digest(value[index], memo))
+            result = digest.digest()
+
+            if entity_id:
+                memo[entity_id] = result
+            return result
+
+        return repr(value).encode('utf-8')
+
+
+class DiskGeometryCache:
+    """Single-file SQLite store of serialised element geometry.
+
+    Every element has at most one entry per kind of geometry; storing geometry
+    for a revised element replaces the stale entry. The database runs in WAL
+    mode, so worker processes can read while another process writes. When the
+    stored data outgrows the size limit, the least recently used entries are
+    deleted.
+    """
+
+    def __init__(self, cache_path: Union[str, Path], max_size_mb: float = 1024.0):
+        """Initialize disk geometry cache.
+
+        Args:
+            cache_path: Path of the SQLite database file
+            max_size_mb: Maximum size of the stored geometry data in MB
+        """
+        self.cache_path = Path(cache_path)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._logger = logging.getLogger(__name__)
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self._stores_since_check = 0
+        self._touched: List[Tuple[float, str, str]] = []
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the connection of the current process, opening it on first use.
+
+        Connections are never shared with forked worker processes.
+        """
+        if self._connection is not None and self._connection_pid == os.getpid():
+            return self._connection
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.cache_path), timeout=30.0, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS geometry ("
+            "guid TEXT NOT NULL, kind TEXT NOT NULL, element_hash TEXT NOT NULL, "
+            "config_hash TEXT NOT NULL, format INTEGER NOT NULL, data BLOB NOT NULL, "
+            "size INTEGER NOT NULL, last_accessed REAL NOT NULL, PRIMARY KEY (guid, kind))"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS geometry_last_accessed ON geometry (last_accessed)")
+
+        self._connection = connection
+        self._connection_pid = os.getpid()
+        self._touched = []
+        return connection
+
+    def get(self, guid: str, kind: str, element_hash: str, config_hash: str) -> Optional[bytes]:
+        """Look up stored geometry data.
+
+        Args:
+            guid: Element GUID
+            kind: Kind of geometry (KIND_BREP or KIND_MESH)
+            element_hash: Geometry hash of the element
+            config_hash: Hash of the geometry configuration
+
+        Returns:
+            bytes or None: Stored data if present and current, None otherwise
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT data FROM geometry WHERE guid = ? AND kind = ? AND element_hash = ? "
+                "AND config_hash = ? AND format = ?",
+                (guid, kind, element_hash, config_hash, DISK_CACHE_FORMAT_VERSION)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._logger.debug(f"Disk cache lookup failed for {guid}: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        # Access times are written in batches to keep readers from contending for the write lock
+        self._touched.append((time.time(), guid, kind))
+        self.hits += 1
+        return row[0]
+
+    def put(self, guid: str, kind: str, element_hash: str, config_hash: str, data: bytes) -> None:
+        """Store geometry data, replacing any older entry of the element.
+
+        Args:
+            guid: Element GUID
+            kind: Kind of geometry (KIND_BREP or KIND_MESH)
+            element_hash: Geometry hash of the element
+            config_hash: Hash of the geometry configuration
+            data: Serialised geometry
+        """
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO geometry VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (guid, kind, element_hash, config_hash, DISK_CACHE_FORMAT_VERSION,
+                 sqlite3.Binary(data), len(data), time.time())
+            )
+            self.stores += 1
+        except sqlite3.Error as e:
+            self._logger.debug(f"Disk cache store failed for {guid}: {e}")
+            return
+
+        self._stores_since_check += 1
+        if self._stores_since_check >= EVICTION_CHECK_INTERVAL:
+            self.flush()
+
+    def remove(self, guid: str) -> None:
+        """Remove all stored geometry of an element.
+
+        Args:
+            guid: Element GUID
+        """
+        try:
+            self._connect().execute("DELETE FROM geometry WHERE guid = ?", (guid,))
+        except sqlite3.Error as e:
+            self._logger.debug(f"Disk cache removal failed for {guid}: {e}")
+
+    def clear(self) -> None:
+        """Remove all stored geometry."""
+        try:
+            self._connect().execute("DELETE FROM geometry")
+            self._touched = []
+        except sqlite3.Error as e:
+            self._logger.warning(f"Failed to clear disk geometry cache: {e}")
+
+    def flush(self) -> None:
+        """Write pending access times and enforce the size limit."""
+        self._stores_since_check = 0
+        try:
+            connection = self._connect()
+            if self._touched:
+                connection.executemany(
+                    "UPDATE geometry SET last_accessed = ? WHERE guid = ? AND kind = ?", self._touched
+                )
+                self._touched = []
+            self._evict(connection)
+        except sqlite3.Error as e:
+            self._logger.debug(f"Disk cache maintenance failed: {e}")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the data fits the size limit."""
+        total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM geometry").fetchone()[0]
+        if total_size <= self.max_size_bytes:
+            return
+
+        # Evict down to 90% of the limit so that the next few stores do not evict again
+        excess = total_size - int(self.max_size_bytes * 0.9)
+        victims = []
+        for guid, kind, size in connection.execute(
+                "SELECT guid, kind, size FROM geometry ORDER BY last_accessed"):
+            if excess <= 0:
+                break
+            victims.append((guid, kind))
+            excess -= size
+
+        connection.executemany("DELETE FROM geometry WHERE guid = ? AND kind = ?", victims)
+        self.evictions += len(victims)
+        self._logger.debug(f"Evicted {len(victims)} entries from disk geometry cache")
+
+    def close(self) -> None:
+        """Flush pending updates and close the connection of the current process."""
+        if self._connection is None or self._connection_pid != os.getpid():
+            return
+        self.flush()
+        self._connection.close()
+        self._connection = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get disk cache statistics.
+
+        Returns:
+            Dict with hit, miss, store and eviction counts and the stored size
+        """
+        entries, size = 0, 0
+        try:
+            entries, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM geometry"
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._logger.debug(f"Disk cache statistics failed: {e}")
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_mb": size / (1024 * 1024)
+        }
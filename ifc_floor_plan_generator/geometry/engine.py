@@ -5,24 +5,38 @@ Generates 3D geometry from IFC elements using IfcOpenShell with configurable set
 """
 
 import logging
+from pathlib import Path
 from typing import Any, Optional, Dict, List, Tuple
 from ..models import BoundingBox, GeometryConfig
 from ..errors.handler import ErrorHandler
 from ..errors.exceptions import GeometryShapeError
 from .cache import GeometryCache, CacheStats
+from .disk_cache import ElementGeometryHasher
+from .mesh_slicer import TriangleMesh
 
 # IfcOpenShell imports with error handling
 try:
     import ifcopenshell
     import ifcopenshell.geom
-    from OCC.Core import TopoDS_Shape, Bnd_Box, BRepBndLib_Add, BRepTools_ShapeSet
-    from OCC.Core.gp import gp_Pnt
     HAS_IFCOPENSHELL = True
 except ImportError:
     HAS_IFCOPENSHELL = False
-    # Create placeholder classes for type hints when IfcOpenShell is not available
-    class TopoDS_Shape:
-        pass
+
+# OpenCASCADE is only needed for BRep shapes; triangle meshes work without it
+from ..dependencies.occ_wrapper import TopoDS_Shape, Bnd_Box, BRepBndLib_Add
+
+
+# Representation items whose tessellation only approximates the true geometry
+CURVED_GEOMETRY_CLASSES = frozenset({
+    'IfcCircle', 'IfcEllipse', 'IfcArcIndex',
+    'IfcBSplineCurve', 'IfcBSplineCurveWithKnots', 'IfcRationalBSplineCurveWithKnots',
+    'IfcBezierCurve', 'IfcRationalBezierCurve',
+    'IfcCircleProfileDef', 'IfcCircleHollowProfileDef', 'IfcEllipseProfileDef',
+    'IfcCylindricalSurface', 'IfcSphericalSurface', 'IfcToroidalSurface', 'IfcSurfaceOfRevolution',
+    'IfcBSplineSurface', 'IfcBSplineSurfaceWithKnots', 'IfcRationalBSplineSurfaceWithKnots',
+    'IfcRevolvedAreaSolid', 'IfcRevolvedAreaSolidTapered', 'IfcSweptDiskSolid',
+    'IfcSweptDiskSolidPolygonal', 'IfcRightCircularCylinder', 'IfcRightCircularCone', 'IfcSphere',
+})
 
 
 class GeometryEngine:
@@ -52,16 +66,20 @@ class GeometryEngine:
         
         # Initialize IfcOpenShell geometry settings
         self._geometry_settings = self._create_geometry_settings()
+        self._mesh_settings = None
         
         # Initialize sophisticated geometry cache
+        self._element_hasher = None
         if self.config.cache_geometry:
             cache_params = cache_config or {}
+            configured_dir = Path(self.config.disk_cache_dir) if self.config.disk_cache_dir else None
             self._geometry_cache = GeometryCache(
                 max_memory_mb=cache_params.get('max_memory_mb', 500.0),
                 max_entries=cache_params.get('max_entries', 10000),
                 ttl_hours=cache_params.get('ttl_hours', 24.0),
-                enable_disk_cache=cache_params.get('enable_disk_cache', False),
-                disk_cache_dir=cache_params.get('disk_cache_dir')
+                enable_disk_cache=cache_params.get('enable_disk_cache', configured_dir is not None),
+                disk_cache_dir=cache_params.get('disk_cache_dir', configured_dir),
+                max_disk_mb=cache_params.get('max_disk_mb', self.config.disk_cache_max_mb)
             )
             
             # Update cache with current configuration
@@ -69,8 +87,13 @@ class GeometryEngine:
                 'use_world_coords': self.config.use_world_coords,
                 'subtract_openings': self.config.subtract_openings,
                 'sew_shells': self.config.sew_shells,
+                'ifcopenshell_version': getattr(ifcopenshell, 'version', None),
             }
             self._geometry_cache.update_configuration(config_dict)
+            
+            # Entries that outlive the run must be tied to the element revision they came from
+            if self._geometry_cache.enable_disk_cache:
+                self._element_hasher = ElementGeometryHasher(include_openings=self.config.subtract_openings)
         else:
             self._geometry_cache = None
         
@@ -87,11 +110,11 @@ class GeometryEngine:
         # Configure based on GeometryConfig
         settings.set(settings.USE_WORLD_COORDS, self.config.use_world_coords)
         settings.set(settings.DISABLE_OPENING_SUBTRACTIONS, not self.config.subtract_openings)
-        settings.set(settings.SEW_SHELLS, self.config.sew_shells)
+        self._set_optional_setting(settings, 'SEW_SHELLS', self.config.sew_shells)
         
         # Additional settings for better geometry quality
-        settings.set(settings.USE_BREP_DATA, True)
-        settings.set(settings.INCLUDE_CURVES, True)
+        self._set_optional_setting(settings, 'USE_BREP_DATA', True)
+        self._set_optional_setting(settings, 'INCLUDE_CURVES', True)
         
         self.logger.debug(f"Geometry settings: world_coords={self.config.use_world_coords}, "
                          f"subtract_openings={self.config.subtract_openings}, "
@@ -99,11 +122,12 @@ class GeometryEngine:
         
         return settings
     
-    def generate_shape(self, element: Any) -> Optional[TopoDS_Shape]:
+    def generate_shape(self, element: Any, element_hash: Optional[str] = None) -> Optional[TopoDS_Shape]:
         """Generate 3D shape from IFC element.
         
         Args:
             element: IFC element (IfcProduct or similar)
+            element_hash: Geometry hash of the element if the caller already computed it
             
         Returns:
             TopoDS_Shape or None: Generated 3D shape, None if generation failed
@@ -123,8 +147,11 @@ class GeometryEngine:
         
         try:
             # Check cache first (if caching is enabled)
-            if self.config.cache_geometry and self._geometry_cache is not None:
-                cached_shape = self._geometry_cache.get(element_guid)
+            element_hash = self._element_hash(element, element_hash)
+            use_cache = (self.config.cache_geometry and self._geometry_cache is not None
+                         and element_hash is not None)
+            if use_cache:
+                cached_shape = self._geometry_cache.get(element_guid, element_hash)
                 if cached_shape is not None:
                     self.logger.debug(f"Using cached geometry for {element_guid}")
                     return cached_shape
@@ -166,8 +193,8 @@ class GeometryEngine:
                 return None
             
             # Cache the shape if caching is enabled
-            if self.config.cache_geometry and self._geometry_cache is not None:
-                self._geometry_cache.put(element_guid, shape)
+            if use_cache:
+                self._geometry_cache.put(element_guid, shape, element_hash)
             
             self.logger.debug(f"Successfully generated shape for {element_guid}")
             return shape
@@ -193,6 +220,152 @@ class GeometryEngine:
                     original_error=e
                 )
     
+    def _element_hash(self, element: Any, element_hash: Optional[str] = None) -> Optional[str]:
+        """Get the geometry hash used to key cache entries of an element.
+        
+        Args:
+            element: IFC element (IfcProduct or similar)
+            element_hash: Precomputed geometry hash, used instead of hashing again
+            
+        Returns:
+            str or None: Geometry hash, an empty string without a disk cache, or
+            None if the element cannot be hashed and must bypass the cache
+        """
+        if self._element_hasher is None:
+            return ""
+        if element_hash is not None:
+            return element_hash
+        
+        try:
+            return self._element_hasher.hash_element(element)
+        except Exception as e:
+            self.logger.debug(f"Could not hash geometry of {getattr(element, 'GlobalId', 'unknown')}: {e}")
+            return None
+    
+    def _set_optional_setting(self, settings: 'ifcopenshell.geom.settings', name: str, value: Any) -> None:
+        """Set a geometry setting that not every IfcOpenShell version provides.
+        
+        Args:
+            settings: Geometry settings to update
+            name: Setting name, e.g. "SEW_SHELLS"
+            value: Setting value
+        """
+        try:
+            settings.set(getattr(settings, name), value)
+        except AttributeError:
+            self.logger.debug(f"Geometry setting {name} is not supported by this IfcOpenShell version")
+    
+    def _create_mesh_settings(self) -> 'ifcopenshell.geom.settings':
+        """Create IfcOpenShell settings for triangulated geometry.
+        
+        Returns:
+            ifcopenshell.geom.settings: Geometry settings without BRep data
+        """
+        settings = ifcopenshell.geom.settings()
+        
+        settings.set(settings.USE_WORLD_COORDS, self.config.use_world_coords)
+        settings.set(settings.DISABLE_OPENING_SUBTRACTIONS, not self.config.subtract_openings)
+        
+        # Welded vertices let the mesh slicer stitch segments along shared edges
+        self._set_optional_setting(settings, 'WELD_VERTICES', True)
+        
+        return settings
+    
+    def generate_mesh(self, element: Any, element_hash: Optional[str] = None) -> Optional[TriangleMesh]:
+        """Generate a triangle mesh from an IFC element.
+        
+        Meshes are produced directly by IfcOpenShell and do not need OpenCASCADE.
+        They are only cached on disk, so that unchanged elements are not tessellated
+        again in later runs.
+        
+        Args:
+            element: IFC element (IfcProduct or similar)
+            element_hash: Geometry hash of the element if the caller already computed it
+            
+        Returns:
+            TriangleMesh or None: Mesh in the same coordinates as generate_shape (world
+            coordinates with use_world_coords, element-local otherwise), None if the
+            element has no geometry
+            
+        Raises:
+            GeometryShapeError: If mesh generation fails
+        """
+        element_guid = getattr(element, 'GlobalId', 'unknown')
+        ifc_class = element.is_a() if hasattr(element, 'is_a') else 'Unknown'
+        
+        element_hash = self._element_hash(element, element_hash) if self._element_hasher is not None else None
+        if element_hash is not None:
+            cached_mesh = self._geometry_cache.get_mesh(element_guid, element_hash)
+            if cached_mesh is not None:
+                self.logger.debug(f"Using cached mesh for {element_guid}")
+                return cached_mesh
+        
+        if self._mesh_settings is None:
+            self._mesh_settings = self._create_mesh_settings()
+        
+        try:
+            shape_data = ifcopenshell.geom.create_shape(self._mesh_settings, element)
+            if shape_data is None:
+                return None
+            
+            geometry = shape_data.geometry
+            mesh = TriangleMesh(vertices=geometry.verts, faces=geometry.faces)
+            
+            if len(mesh.faces) == 0:
+                return None
+            
+            if element_hash is not None:
+                self._geometry_cache.put_mesh(element_guid, mesh, element_hash)
+            
+            self.logger.debug(f"Generated mesh for {element_guid}: "
+                              f"{len(mesh.vertices)} vertices, {len(mesh.faces)} triangles")
+            return mesh
+            
+        except Exception as e:
+            raise GeometryShapeError(
+                element_guid=element_guid,
+                ifc_class=ifc_class,
+                original_error=e
+            )
+    
+    def has_curved_geometry(self, element: Any) -> bool:
+        """Check if an element's representation contains curved geometry.
+        
+        Curves and curved surfaces are tessellated into facets, so their mesh section
+        only approximates the exact OpenCASCADE section.
+        
+        Args:
+            element: IFC element (IfcProduct or similar)
+            
+        Returns:
+            bool: True if any representation item is curved
+        """
+        representation = getattr(element, 'Representation', None)
+        if representation is None:
+            return False
+        
+        pending = [representation]
+        visited = set()
+        
+        while pending:
+            instance = pending.pop()
+            # Inline values such as IfcArcIndex have no id and are never shared
+            if instance.id():
+                if instance.id() in visited:
+                    continue
+                visited.add(instance.id())
+            
+            if instance.is_a() in CURVED_GEOMETRY_CLASSES:
+                return True
+            
+            for value in instance:
+                values = value if isinstance(value, (list, tuple)) else (value,)
+                for item in values:
+                    if isinstance(item, ifcopenshell.entity_instance):
+                        pending.append(item)
+        
+        return False
+    
     def _is_valid_shape(self, shape: TopoDS_Shape) -> bool:
         """Validate that a TopoDS_Shape is valid and usable.
         
@@ -303,7 +476,7 @@ class GeometryEngine:
             }
         
         stats = self._geometry_cache.get_stats()
-        return {
+        cache_stats = {
             "cache_enabled": True,
             "cached_items": stats.cached_items,
             "cache_type": "sophisticated",
@@ -314,6 +487,16 @@ class GeometryEngine:
             "memory_usage_mb": stats.memory_usage_mb,
             "invalidations": stats.invalidations
         }
+        
+        disk_stats = self._geometry_cache.get_disk_stats()
+        if disk_stats is not None:
+            cache_stats["disk_cache"] = disk_stats
+        return cache_stats
+    
+    def close_cache(self) -> None:
+        """Write pending disk cache updates and close the disk cache."""
+        if self._geometry_cache is not None:
+            self._geometry_cache.close()
     
     def cleanup_expired_cache(self) -> int:
         """Clean up expired cache entries.
@@ -355,7 +538,9 @@ class GeometryEngine:
             for element in elements:
                 if hasattr(element, 'GlobalId'):
                     guid = element.GlobalId
-                    cached_shape = self._geometry_cache.get(guid)
+                    element_hash = self._element_hash(element)
+                    cached_shape = (self._geometry_cache.get(guid, element_hash)
+                                    if element_hash is not None else None)
                     if cached_shape is not None:
                         results[guid] = cached_shape
                         self.logger.debug(f"Batch cache hit for {guid}")
@@ -0,0 +1,208 @@
+"""
+Triangle-mesh slicer for IFC Floor Plan Generator.
+
+Cuts triangulated element geometry with a horizontal plane using vectorised
+NumPy operations, as a fast alternative to the OpenCASCADE section algorithm.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+@dataclass
+class TriangleMesh:
+    """Triangulated 3D geometry of one element.
+
+    Attributes:
+        vertices: (n, 3) float64 array of vertex coordinates
+        faces: (m, 3) integer array of vertex indices per triangle
+    """
+    vertices: np.ndarray
+    faces: np.ndarray
+
+    def __post_init__(self):
+        """Normalise array shapes and types after initialization."""
+        self.vertices = np.asarray(self.vertices, dtype=np.float64).reshape(-1, 3)
+        self.faces = np.asarray(self.faces, dtype=np.int64).reshape(-1, 3)
+
+    @property
+    def z_range(self) -> Tuple[float, float]:
+        """Get the minimum and maximum Z coordinate of the mesh."""
+        if len(self.vertices) == 0:
+            return (0.0, 0.0)
+        z_values = self.vertices[:, 2]
+        return (float(z_values.min()), float(z_values.max()))
+
+
+# Indices of the two vertices of each triangle edge
+_EDGE_START = [0, 1, 2]
+_EDGE_END = [1, 2, 0]
+
+
+class MeshSlicer:
+    """Intersects triangle meshes with horizontal planes.
+
+    Every triangle crossing the plane contributes one segment between the points
+    where two of its edges cross. Crossing points are keyed by the mesh edge (or
+    the vertex, if it lies exactly on the plane) they were computed from, so
+    neighbouring triangles produce identical points and segments can be stitched
+    into chains by key instead of by coordinate search.
+    """
+
+    def __init__(self, slice_tolerance: float = 1e-6):
+        """Initialize mesh slicer.
+
+        Args:
+            slice_tolerance: Tolerance for deciding whether a mesh reaches the plane
+        """
+        self.slice_tolerance = slice_tolerance
+        self._logger = logging.getLogger(__name__)
+
+    def slice_segments(self, mesh: TriangleMesh, z_height: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the section segments of a mesh.
+
+        Args:
+            mesh: Triangle mesh to cut
+            z_height: Height of the horizontal section plane
+
+        Returns:
+            Tuple of ((k, 2, 2) segment end points in XY, (k, 2) point keys)
+        """
+        vertices, faces = mesh.vertices, mesh.faces
+        empty = (np.empty((0, 2, 2)), np.empty((0, 2), dtype=np.int64))
+
+        if len(faces) == 0:
+            return empty
+
+        z_min, z_max = mesh.z_range
+        if z_height < z_min - self.slice_tolerance or z_height > z_max + self.slice_tolerance:
+            return empty
+
+        distances = vertices[:, 2] - z_height
+        above = distances >= 0.0
+
+        face_above = above[faces]
+        crossing = face_above.any(axis=1) & ~face_above.all(axis=1)
+        triangles = faces[crossing]
+        if len(triangles) == 0:
+            return empty
+
+        # Canonical edge direction (lower vertex index first) makes shared edges
+        # of neighbouring triangles interpolate to bit-identical points
+        edge_a = triangles[:, _EDGE_START]
+        edge_b = triangles[:, _EDGE_END]
+        low = np.minimum(edge_a, edge_b)
+        high = np.maximum(edge_a, edge_b)
+        edge_crosses = above[low] != above[high]
+
+        # Exactly two edges of every crossing triangle cross the plane
+        rows, columns = np.nonzero(edge_crosses)
+        low = low[rows, columns]
+        high = high[rows, columns]
+
+        # Signs differ on crossing edges, so the denominator is never zero
+        distance_low = distances[low]
+        t = distance_low / (distance_low - distances[high])
+        points = vertices[low, :2] + t[:, None] * (vertices[high, :2] - vertices[low, :2])
+
+        # A point on a vertex lying in the plane is keyed by that vertex so that all
+        # triangles around it agree; other points are keyed by their edge
+        vertex_count = len(vertices)
+        keys = np.where(
+            t == 0.0, low,
+            np.where(t == 1.0, high, vertex_count + low * vertex_count + high)
+        )
+
+        segments = points.reshape(-1, 2, 2)
+        segment_keys = keys.reshape(-1, 2)
+
+        # Triangles touching the plane in a single vertex produce zero-length segments
+        valid = segment_keys[:, 0] != segment_keys[:, 1]
+        return segments[valid], segment_keys[valid]
+
+    def slice_mesh(self, mesh: TriangleMesh, z_height: float) -> List[Tuple[List[Tuple[float, float]], bool]]:
+        """Cut a mesh and stitch the segments into chains.
+
+        Args:
+            mesh: Triangle mesh to cut
+            z_height: Height of the horizontal section plane
+
+        Returns:
+            List of (points, is_closed) chains, in order of their first segment
+        """
+        segments, segment_keys = self.slice_segments(mesh, z_height)
+        if len(segments) == 0:
+            return []
+
+        chains = self._stitch_segments(segments.tolist(), segment_keys.tolist())
+        self._logger.debug(f"Sliced {len(segments)} segments into {len(chains)} chains at Z={z_height}")
+        return chains
+
+    def _stitch_segments(self, segments: List[List[List[float]]],
+                         segment_keys: List[List[int]]) -> List[Tuple[List[Tuple[float, float]], bool]]:
+        """Join segments that share point keys into chains.
+
+        Args:
+            segments: Segment end points as nested lists
+            segment_keys: Point keys of the segment end points
+
+        Returns:
+            List of (points, is_closed) chains
+        """
+        key_points: Dict[int, Tuple[float, float]] = {}
+        key_segments: Dict[int, List[int]] = defaultdict(list)
+
+        for index, ((start_key, end_key), (start, end)) in enumerate(zip(segment_keys, segments)):
+            key_points.setdefault(start_key, (start[0], start[1]))
+            key_points.setdefault(end_key, (end[0], end[1]))
+            key_segments[start_key].append(index)
+            key_segments[end_key].append(index)
+
+        used = [False] * len(segments)
+        chains = []
+
+        for index in range(len(segments)):
+            if used[index]:
+                continue
+            used[index] = True
+            start_key, end_key = segment_keys[index]
+
+            forward = self._walk(end_key, key_segments, segment_keys, used)
+            if forward and forward[-1] == start_key:
+                chain_keys = [start_key, end_key] + forward[:-1]
+                is_closed = True
+            else:
+                backward = self._walk(start_key, key_segments, segment_keys, used)
+                chain_keys = list(reversed(backward)) + [start_key, end_key] + forward
+                is_closed = False
+
+            chains.append(([key_points[key] for key in chain_keys], is_closed))
+
+        return chains
+
+    def _walk(self, key: int, key_segments: Dict[int, List[int]], segment_keys: List[List[int]],
+              used: List[bool]) -> List[int]:
+        """Follow unused segments from a point key until the chain ends.
+
+        Args:
+            key: Point key to start from
+            key_segments: Segment indices by point key
+            segment_keys: Point keys of every segment
+            used: Flags marking consumed segments, updated in place
+
+        Returns:
+            List[int]: Point keys visited after the start key
+        """
+        visited = []
+        while True:
+            next_index = next((i for i in key_segments[key] if not used[i]), None)
+            if next_index is None:
+                return visited
+            used[next_index] = True
+            first, second = segment_keys[next_index]
+            key = second if first == key else first
+            visited.append(key)
@@ -0,0 +1,248 @@
+"""
+Batch polyline operations for IFC Floor Plan Generator.
+
+Transforms, simplifies and deduplicates whole batches of polylines at once on a
+packed coordinate array, instead of looping over (x, y) tuples point by point.
+A batch is an (n, 2) float64 array of all points plus an offsets array, where
+polyline i owns rows offsets[i]:offsets[i + 1].
+"""
+
+from itertools import chain
+from typing import List, Tuple
+
+import numpy as np
+
+from ..models import Polyline2D
+
+
+# Below this many points in total, per-point loops are faster than array set-up
+MIN_BATCH_POINTS = 256
+
+
+def pack_polylines(polylines: List[Polyline2D]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack the points of polylines into one coordinate array.
+
+    Packed coordinates already held by the polylines are reused; otherwise the
+    points are read in one pass without caching arrays on the polylines.
+
+    Args:
+        polylines: Polylines to pack
+
+    Returns:
+        Tuple of ((n, 2) coordinate array, offsets array of length len(polylines) + 1)
+    """
+    offsets = np.zeros(len(polylines) + 1, dtype=np.intp)
+    if not polylines:
+        return np.empty((0, 2), dtype=np.float64), offsets
+
+    cached = [polyline.cached_coordinates() for polyline in polylines]
+    if all(coordinates is not None for coordinates in cached):
+        np.cumsum([len(coordinates) for coordinates in cached], out=offsets[1:])
+        return np.concatenate(cached), offsets
+
+    np.cumsum([len(polyline.points) for polyline in polylines], out=offsets[1:])
+    total = int(offsets[-1])
+    coordinates = np.fromiter(
+        chain.from_iterable(chain.from_iterable(polyline.points for polyline in polylines)),
+        dtype=np.float64, count=2 * total
+    ).reshape(total, 2)
+    return coordinates, offsets
+
+
+def unpack_polylines(coordinates: np.ndarray, offsets: np.ndarray,
+                     templates: List[Polyline2D]) -> List[Polyline2D]:
+    """Create polylines from a packed batch, taking metadata from template polylines.
+
+    Polylines with fewer than 2 points are dropped.
+
+    Args:
+        coordinates: (n, 2) coordinate array
+        offsets: Offsets array of length len(templates) + 1
+        templates: Polylines providing IFC class, GUID and closedness, in batch order
+
+    Returns:
+        List[Polyline2D]: Polylines with packed coordinates
+    """
+    # Convert all coordinates to Python floats at once rather than per polyline
+    xs = coordinates[:, 0].tolist()
+    ys = coordinates[:, 1].tolist()
+
+    polylines = []
+    for template, start, end in zip(templates, offsets[:-1].tolist(), offsets[1:].tolist()):
+        if end - start >= 2:
+            polylines.append(Polyline2D.from_coordinates(
+                coordinates[start:end], template.ifc_class, template.element_guid, template.is_closed,
+                points=list(zip(xs[start:end], ys[start:end]))
+            ))
+    return polylines
+
+
+def transform_batch(coordinates: np.ndarray, invert_y: bool = True, scale_factor: float = 1.0,
+                    offset_x: float = 0.0, offset_y: float = 0.0) -> np.ndarray:
+    """Scale, Y-invert and offset packed coordinates.
+
+    Y is inverted around the middle of the batch's original Y range.
+
+    Args:
+        coordinates: (n, 2) coordinate array
+        invert_y: Whether to invert the Y-axis
+        scale_factor: Scaling factor to apply to coordinates
+        offset_x: X-axis offset to apply
+        offset_y: Y-axis offset to apply
+
+    Returns:
+        np.ndarray: New (n, 2) coordinate array
+    """
+    transformed = coordinates * scale_factor
+    if invert_y and len(coordinates):
+        y_reference = (coordinates[:, 1].max() + coordinates[:, 1].min()) / 2
+        transformed[:, 1] = 2 * y_reference - transformed[:, 1]
+    transformed[:, 0] += offset_x
+    transformed[:, 1] += offset_y
+    return transformed
+
+
+def simplify_batch(coordinates: np.ndarray, offsets: np.ndarray, tolerance: float) -> np.ndarray:
+    """Douglas-Peucker simplification of all polylines in a batch.
+
+    Each polyline keeps its first and last point, and every removed point lies
+    within tolerance of the line through the kept points around it. The recursion
+    runs level by level over all open segments of all polylines at once.
+
+    Args:
+        coordinates: (n, 2) coordinate array
+        offsets: Offsets array of the batch
+        tolerance: Distance tolerance for removing points
+
+    Returns:
+        np.ndarray: Boolean mask of the points to keep
+    """
+    keep = np.zeros(len(coordinates), dtype=bool)
+    starts = offsets[:-1]
+    ends = offsets[1:] - 1
+    non_empty = ends >= starts
+    keep[starts[non_empty]] = True
+    keep[ends[non_empty]] = True
+
+    xs = np.ascontiguousarray(coordinates[:, 0])
+    ys = np.ascontiguousarray(coordinates[:, 1])
+    segment_starts = starts[ends - starts >= 2]
+    segment_ends = ends[ends - starts >= 2]
+
+    while len(segment_starts):
+        # Interior point indices of every segment, grouped by segment
+        interior = segment_ends - segment_starts - 1
+        first_interior = np.cumsum(interior) - interior
+        segment_ids = np.repeat(np.arange(len(segment_starts)), interior)
+        indices = np.arange(len(segment_ids)) + np.repeat(segment_starts + 1 - first_interior, interior)
+
+        distances = _line_distances(xs, ys, indices, segment_ids, segment_starts, segment_ends, tolerance)
+
+        # Farthest interior point per segment (first one on ties); segment ids are sorted
+        max_distances = np.maximum.reduceat(distances, first_interior)
+        maxima = np.flatnonzero(distances == max_distances[segment_ids])
+        maxima_segments = segment_ids[maxima]
+        first_max = np.ones(len(maxima), dtype=bool)
+        first_max[1:] = maxima_segments[1:] != maxima_segments[:-1]
+        split_segments = maxima_segments[first_max]
+        split_points = indices[maxima[first_max]]
+
+        splitting = max_distances[split_segments] > tolerance
+        split_segments = split_segments[splitting]
+        split_points = split_points[splitting]
+        keep[split_points] = True
+
+        segment_starts = np.concatenate([segment_starts[split_segments], split_points])
+        segment_ends = np.concatenate([split_points, segment_ends[split_segments]])
+        open_segments = segment_ends - segment_starts >= 2
+        segment_starts = segment_starts[open_segments]
+        segment_ends = segment_ends[open_segments]
+
+    return keep
+
+
+def deduplicate_batch(coordinates: np.ndarray, offsets: np.ndarray, tolerance: float) -> np.ndarray:
+    """Remove consecutive points within tolerance of the previous kept point.
+
+    Matches point-by-point removal exactly: distances to the previous point are
+    computed in bulk, and only polylines that contain close points are walked
+    from their first close point on.
+
+    Args:
+        coordinates: (n, 2) coordinate array
+        offsets: Offsets array of the batch
+        tolerance: Distance tolerance for considering points as duplicates
+
+    Returns:
+        np.ndarray: Boolean mask of the points to keep
+    """
+    keep = np.ones(len(coordinates), dtype=bool)
+    if len(coordinates) < 2:
+        return keep
+
+    steps = np.hypot(*np.diff(coordinates, axis=0).T)
+    close = np.zeros(len(coordinates), dtype=bool)
+    close[1:] = steps <= tolerance
+    close[offsets[:-1][offsets[:-1] < len(coordinates)]] = False
+
+    close_indices = np.flatnonzero(close)
+    if not len(close_indices):
+        return keep
+
+    polyline_ids = np.searchsorted(offsets, close_indices, side='right') - 1
+    for polyline_id, first_close in zip(*np.unique(polyline_ids, return_index=True)):
+        start = int(close_indices[first_close])
+        end = int(offsets[polyline_id + 1])
+        last_x, last_y = coordinates[start - 1]
+        for i in range(start, end):
+            x, y = coordinates[i]
+            if ((x - last_x) ** 2 + (y - last_y) ** 2) ** 0.5 > tolerance:
+                last_x, last_y = x, y
+            else:
+                keep[i] = False
+
+    return keep
+
+
+def compact_batch(coordinates: np.ndarray, offsets: np.ndarray,
+                  keep: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Drop points from a batch and recompute the offsets.
+
+    Args:
+        coordinates: (n, 2) coordinate array
+        offsets: Offsets array of the batch
+        keep: Boolean mask of the points to keep
+
+    Returns:
+        Tuple of (compacted coordinate array, new offsets array)
+    """
+    kept_before = np.zeros(len(keep) + 1, dtype=np.intp)
+    np.cumsum(keep, out=kept_before[1:])
+    return coordinates[keep], kept_before[offsets]
+
+
+def _line_distances(xs: np.ndarray, ys: np.ndarray, indices: np.ndarray, segment_ids: np.ndarray,
+                    segment_starts: np.ndarray, segment_ends: np.ndarray, tolerance: float) -> np.ndarray:
+    """Perpendicular distances of points to the lines through their segment's end points.
+
+    Line directions are computed once per segment. Where start and end lie within
+    tolerance of each other, as at the ends of a closed outline, the direction is
+    meaningless and the distance to the start point is used.
+    """
+    start_x = xs[segment_starts]
+    start_y = ys[segment_starts]
+    direction_x = xs[segment_ends] - start_x
+    direction_y = ys[segment_ends] - start_y
+    length = np.hypot(direction_x, direction_y)
+    defined = length > tolerance
+    direction_x = np.where(defined, direction_x / np.where(defined, length, 1.0), 0.0)
+    direction_y = np.where(defined, direction_y / np.where(defined, length, 1.0), 0.0)
+
+    relative_x = xs[indices] - start_x[segment_ids]
+    relative_y = ys[indices] - start_y[segment_ids]
+    distances = np.abs(direction_x[segment_ids] * relative_y - direction_y[segment_ids] * relative_x)
+
+    undefined = np.flatnonzero(~defined[segment_ids])
+    if len(undefined):
+        distances[undefined] = np.hypot(relative_x[undefined], relative_y[undefined])
+    return distances
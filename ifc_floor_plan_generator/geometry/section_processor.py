@@ -1,11 +1,14 @@
 """
 Section processor for IFC Floor Plan Generator.
 
-Implements horizontal section cutting and 2D polyline generation using OpenCASCADE.
+Implements horizontal section cutting and 2D polyline generation using OpenCASCADE,
+or a triangle-mesh slicer for tessellated geometry.
 """
 
 import logging
-from typing import List, Tuple, Optional, Any
+import math
+from collections import defaultdict, deque
+from typing import Dict, List, Tuple, Optional, Any
 
 from ..dependencies.occ_wrapper import (
     HAS_OCC, require_occ, OCCDependencyError,
@@ -20,6 +23,11 @@ from ..dependencies.occ_wrapper import (
     TopoDS
 )
 from ..models import Polyline2D
+from .mesh_slicer import MeshSlicer, TriangleMesh
+from .polyline_batch import (
+    MIN_BATCH_POINTS, pack_polylines, unpack_polylines, transform_batch, simplify_batch, deduplicate_batch,
+    compact_batch
+)
 from ..errors.handler import ErrorHandler
 from ..errors.exceptions import ProcessingError, EmptyCutResultError
 
@@ -38,6 +46,7 @@ class SectionProcessor:
         self.chain_tolerance = chain_tolerance
         self._logger = logging.getLogger(__name__)
         self._error_handler = ErrorHandler()
+        self._mesh_slicer = MeshSlicer(slice_tolerance)
         
         # Check OCC availability and warn if not available
         if not HAS_OCC:
@@ -346,12 +355,100 @@ class SectionProcessor:
                 }
             )
     
+    def process_mesh_section(self, mesh: TriangleMesh, z_height: float,
+                             ifc_class: str = "Unknown", element_guid: str = "unknown") -> List[Polyline2D]:
+        """Process a section of a triangle mesh.
+        
+        Mesh counterpart of process_shape_section. Segments are stitched along shared
+        mesh edges; chains left open by unwelded vertices are joined with chain_polylines,
+        and the vertices that tessellation adds along straight edges are removed.
+        
+        Args:
+            mesh: Triangle mesh to section
+            z_height: Height for the horizontal section
+            ifc_class: IFC class of the element (for metadata)
+            element_guid: GUID of the element (for metadata)
+            
+        Returns:
+            List[Polyline2D]: List of resulting polylines
+            
+        Raises:
+            EmptyCutResultError: If no geometry is produced by the section
+        """
+        try:
+            chains = self._mesh_slicer.slice_mesh(mesh, z_height)
+            
+            if not chains:
+                raise EmptyCutResultError(
+                    storey_name="unknown",  # Will be set by caller
+                    cut_height=z_height
+                )
+            
+            polylines = [
+                Polyline2D(points=points, ifc_class=ifc_class, element_guid=element_guid, is_closed=is_closed)
+                for points, is_closed in chains
+            ]
+            
+            if not all(polyline.is_closed for polyline in polylines):
+                polylines = self.chain_polylines(polylines, self.chain_tolerance)
+            
+            for polyline in polylines:
+                if polyline.is_closed:
+                    polyline.points = self._simplify_ring(polyline.points, self.slice_tolerance)
+            polylines = self.optimize_polylines(polylines, self.slice_tolerance)
+            
+            self._logger.debug(f"Processed mesh section: {len(polylines)} polylines generated")
+            return polylines
+            
+        except EmptyCutResultError:
+            # Re-raise empty cut errors as-is
+            raise
+        except Exception as e:
+            self._logger.error(f"Mesh section processing failed: {e}")
+            raise ProcessingError(
+                error_code="SECTION_PROCESSING_FAILED",
+                message=f"Snitt-prosessering av trekantnett feilet: {str(e)}",
+                context={
+                    "z_height": z_height,
+                    "ifc_class": ifc_class,
+                    "element_guid": element_guid,
+                    "error": str(e)
+                }
+            )
+    
+    def _simplify_ring(self, points: List[Tuple[float, float]],
+                       tolerance: float) -> List[Tuple[float, float]]:
+        """Remove collinear points from a closed ring, including around its start.
+        
+        The ring is first rotated to start at a corner, since collinear simplification
+        always keeps the first and last point of the sequence.
+        
+        Args:
+            points: Points of a closed ring, without repeated start point
+            tolerance: Distance tolerance for considering points collinear
+            
+        Returns:
+            List[Tuple[float, float]]: Simplified ring starting at a corner point
+        """
+        count = len(points)
+        for i in range(count):
+            distance = self._point_to_line_distance(points[i], points[i - 1], points[(i + 1) % count])
+            if distance > tolerance:
+                ring = points[i:] + points[:i]
+                return self._simplify_collinear_points(ring + ring[:1], tolerance)[:-1]
+        return points
+    
     def chain_polylines(self, polylines: List[Polyline2D], tolerance: float) -> List[Polyline2D]:
         """Chain polylines with specified tolerance.
         
         Connects polylines that have endpoints within the specified tolerance distance.
         Detects and creates closed loops where possible.
         
+        Endpoints are bucketed in a grid quantised by the tolerance, so each extension
+        step only inspects polylines whose endpoints fall in the neighbouring cells
+        instead of scanning every remaining polyline. Candidates are still tried in
+        input order, which keeps the result identical to a linear scan.
+        
         Args:
             polylines: List of polylines to chain
             tolerance: Distance tolerance for connecting polylines
@@ -365,8 +462,155 @@ class SectionProcessor:
         if len(polylines) == 1:
             return polylines
         
+        # The grid needs a positive cell size and finite coordinates
+        if not tolerance > 0 or not all(self._has_finite_endpoints(p) for p in polylines):
+            return self._chain_polylines_linear(polylines, tolerance)
+        
         self._logger.debug(f"Chaining {len(polylines)} polylines with tolerance {tolerance}")
         
+        # Create working copies of polylines
+        working_polylines = [self._copy_polyline(p) for p in polylines]
+        available = [True] * len(working_polylines)
+        pending = deque(range(len(working_polylines)))
+        
+        # Cells are twice the tolerance so that any point within tolerance of a query
+        # point is guaranteed to lie in the 3x3 neighbourhood, even after rounding
+        cell_size = tolerance * 2.0
+        start_grid: Dict[Tuple[int, int], List[Tuple[int, Tuple[float, float]]]] = defaultdict(list)
+        end_grid: Dict[Tuple[int, int], List[Tuple[int, Tuple[float, float]]]] = defaultdict(list)
+        
+        for index, polyline in enumerate(working_polylines):
+            # Closed polylines never connect, they can only start a chain of their own
+            if polyline.is_closed:
+                continue
+            start_point = polyline.points[0]
+            end_point = polyline.points[-1]
+            start_grid[self._grid_cell(start_point, cell_size)].append((index, start_point))
+            end_grid[self._grid_cell(end_point, cell_size)].append((index, end_point))
+        
+        chained_polylines = []
+        
+        # Process polylines until all are consumed
+        while pending:
+            # Start a new chain with the first available polyline
+            chain_index = pending.popleft()
+            if not available[chain_index]:
+                continue
+            available[chain_index] = False
+            current_chain = working_polylines[chain_index]
+            chain_modified = not current_chain.is_closed
+            
+            # Keep trying to extend the chain until no more connections are found
+            while chain_modified:
+                chain_modified = False
+                chain_start = current_chain.points[0]
+                chain_end = current_chain.points[-1]
+                
+                # Try to connect to the end of the current chain
+                candidates = self._find_chain_candidates(
+                    ((chain_end, start_grid), (chain_end, end_grid)),
+                    available, cell_size, tolerance
+                )
+                for index in candidates:
+                    connection_result = self._try_connect_polylines(
+                        current_chain, working_polylines[index], tolerance
+                    )
+                    
+                    if connection_result is not None:
+                        current_chain = connection_result
+                        available[index] = False
+                        chain_modified = True
+                        break
+                
+                # If no connection at the end, try connecting to the beginning
+                if not chain_modified:
+                    candidates = self._find_chain_candidates(
+                        ((chain_start, end_grid), (chain_end, end_grid)),
+                        available, cell_size, tolerance
+                    )
+                    for index in candidates:
+                        connection_result = self._try_connect_polylines(
+                            working_polylines[index], current_chain, tolerance
+                        )
+                        
+                        if connection_result is not None:
+                            current_chain = connection_result
+                            available[index] = False
+                            chain_modified = True
+                            break
+            
+            # Check if the chain can be closed (forms a loop)
+            current_chain = self._try_close_polyline(current_chain, tolerance)
+            
+            chained_polylines.append(current_chain)
+        
+        self._logger.debug(f"Chaining complete: {len(chained_polylines)} chains created")
+        return chained_polylines
+    
+    def _find_chain_candidates(self, queries, available: List[bool], cell_size: float,
+                               tolerance: float) -> List[int]:
+        """Find unconsumed polylines with an endpoint within tolerance of a query point.
+        
+        Args:
+            queries: Pairs of (query point, endpoint grid to search)
+            available: Flags marking polylines that have not been consumed yet
+            cell_size: Grid cell size
+            tolerance: Distance tolerance for connection
+            
+        Returns:
+            List[int]: Indices of matching polylines in input order
+        """
+        candidates = set()
+        
+        for point, grid in queries:
+            cell_x, cell_y = self._grid_cell(point, cell_size)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for index, endpoint in grid.get((cell_x + dx, cell_y + dy), ()):
+                        if available[index] and self._calculate_distance(point, endpoint) <= tolerance:
+                            candidates.add(index)
+        
+        return sorted(candidates)
+    
+    def _grid_cell(self, point: Tuple[float, float], cell_size: float) -> Tuple[int, int]:
+        """Quantise a point to its endpoint grid cell.
+        
+        Args:
+            point: Point (x, y)
+            cell_size: Grid cell size
+            
+        Returns:
+            Tuple[int, int]: Grid cell coordinates
+        """
+        return (math.floor(point[0] / cell_size), math.floor(point[1] / cell_size))
+    
+    def _has_finite_endpoints(self, polyline: Polyline2D) -> bool:
+        """Check that a polyline's endpoints can be placed in the endpoint grid."""
+        if not polyline.points:
+            return False
+        start_point = polyline.points[0]
+        end_point = polyline.points[-1]
+        return all(math.isfinite(value) for value in (*start_point, *end_point))
+    
+    def _chain_polylines_linear(self, polylines: List[Polyline2D], tolerance: float) -> List[Polyline2D]:
+        """Chain polylines by scanning all remaining polylines for every extension.
+        
+        Reference implementation of chain_polylines. It is quadratic in the number of
+        polylines and is only used when the endpoint grid cannot be built.
+        
+        Args:
+            polylines: List of polylines to chain
+            tolerance: Distance tolerance for connecting polylines
+            
+        Returns:
+            List[Polyline2D]: Chained polylines with optimized connections
+        """
+        if not polylines:
+            return []
+        
+        if len(polylines) == 1:
+            return polylines
+        
         # Create working copies of polylines
         working_polylines = [self._copy_polyline(p) for p in polylines]
         chained_polylines = []
@@ -407,7 +651,6 @@ class SectionProcessor:
             
             chained_polylines.append(current_chain)
         
-        self._logger.debug(f"Chaining complete: {len(chained_polylines)} chains created")
         return chained_polylines
     
     def _copy_polyline(self, polyline: Polyline2D) -> Polyline2D:
@@ -542,45 +785,9 @@ class SectionProcessor:
         if not polylines:
             return []
         
-        transformed_polylines = []
-        
-        # Calculate bounding box for Y-inversion reference if needed
-        y_reference = 0.0
-        if invert_y:
-            all_y_coords = []
-            for polyline in polylines:
-                for point in polyline.points:
-                    all_y_coords.append(point[1])
-            
-            if all_y_coords:
-                y_reference = (max(all_y_coords) + min(all_y_coords)) / 2
-        
-        for polyline in polylines:
-            transformed_points = []
-            
-            for x, y in polyline.points:
-                # Apply scaling
-                new_x = x * scale_factor
-                new_y = y * scale_factor
-                
-                # Apply Y-inversion if requested
-                if invert_y:
-                    new_y = 2 * y_reference - new_y
-                
-                # Apply offsets
-                new_x += offset_x
-                new_y += offset_y
-                
-                transformed_points.append((new_x, new_y))
-            
-            transformed_polyline = Polyline2D(
-                points=transformed_points,
-                ifc_class=polyline.ifc_class,
-                element_guid=polyline.element_guid,
-                is_closed=polyline.is_closed
-            )
-            
-            transformed_polylines.append(transformed_polyline)
+        coordinates, offsets = pack_polylines(polylines)
+        transformed = transform_batch(coordinates, invert_y, scale_factor, offset_x, offset_y)
+        transformed_polylines = unpack_polylines(transformed, offsets, polylines)
         
         self._logger.debug(f"Transformed {len(polylines)} polylines (invert_y={invert_y}, scale={scale_factor})")
         return transformed_polylines
@@ -599,28 +806,80 @@ class SectionProcessor:
         if not polylines:
             return []
         
-        optimized_polylines = []
+        if sum(len(polyline.points) for polyline in polylines) < MIN_BATCH_POINTS:
+            # Array set-up costs more than it saves on a few short polylines
+            optimized_polylines = []
+            for polyline in polylines:
+                points = self._simplify_douglas_peucker(polyline.points, simplification_tolerance)
+                points = self._remove_duplicate_points(points, simplification_tolerance)
+                if len(points) >= 2:
+                    optimized_polylines.append(Polyline2D(
+                        points=points, ifc_class=polyline.ifc_class,
+                        element_guid=polyline.element_guid, is_closed=polyline.is_closed
+                    ))
+            return optimized_polylines
+        
+        # Simplify and remove duplicate consecutive points for the whole batch at once
+        coordinates, offsets = pack_polylines(polylines)
+        coordinates, offsets = compact_batch(
+            coordinates, offsets, simplify_batch(coordinates, offsets, simplification_tolerance)
+        )
+        coordinates, offsets = compact_batch(
+            coordinates, offsets, deduplicate_batch(coordinates, offsets, simplification_tolerance)
+        )
         
-        for polyline in polylines:
-            # Simplify by removing collinear points
-            simplified_points = self._simplify_collinear_points(polyline.points, simplification_tolerance)
-            
-            # Remove duplicate consecutive points
-            simplified_points = self._remove_duplicate_points(simplified_points, simplification_tolerance)
-            
-            # Only keep polylines with sufficient points
-            if len(simplified_points) >= 2:
-                optimized_polyline = Polyline2D(
-                    points=simplified_points,
-                    ifc_class=polyline.ifc_class,
-                    element_guid=polyline.element_guid,
-                    is_closed=polyline.is_closed
-                )
-                optimized_polylines.append(optimized_polyline)
+        # Only keep polylines with sufficient points
+        optimized_polylines = unpack_polylines(coordinates, offsets, polylines)
         
         self._logger.debug(f"Optimized {len(polylines)} polylines to {len(optimized_polylines)}")
         return optimized_polylines
     
+    def _simplify_douglas_peucker(self, points: List[Tuple[float, float]],
+                                  tolerance: float) -> List[Tuple[float, float]]:
+        """Douglas-Peucker simplification of a single polyline.
+        
+        Point-by-point counterpart of simplify_batch for small batches, keeping the
+        same points.
+        
+        Args:
+            points: List of points to simplify
+            tolerance: Distance tolerance for removing points
+            
+        Returns:
+            List[Tuple[float, float]]: Simplified points
+        """
+        if len(points) <= 2:
+            return list(points)
+        
+        keep = [False] * len(points)
+        keep[0] = keep[-1] = True
+        segments = [(0, len(points) - 1)]
+        while segments:
+            start, end = segments.pop()
+            (x1, y1), (x2, y2) = points[start], points[end]
+            dx, dy = x2 - x1, y2 - y1
+            length = (dx * dx + dy * dy) ** 0.5
+            
+            max_distance, split = -1.0, start
+            for i in range(start + 1, end):
+                rx, ry = points[i][0] - x1, points[i][1] - y1
+                if length > tolerance:
+                    distance = abs(dx * ry - dy * rx) / length
+                else:
+                    # Start and end coincide, as on a closed outline
+                    distance = (rx * rx + ry * ry) ** 0.5
+                if distance > max_distance:
+                    max_distance, split = distance, i
+            
+            if max_distance > tolerance:
+                keep[split] = True
+                if split - start >= 2:
+                    segments.append((start, split))
+                if end - split >= 2:
+                    segments.append((split, end))
+        
+        return [point for point, kept in zip(points, keep) if kept]
+    
     def _simplify_collinear_points(self, points: List[Tuple[float, float]], 
                                   tolerance: float) -> List[Tuple[float, float]]:
         """Remove collinear points that don't contribute to the shape.
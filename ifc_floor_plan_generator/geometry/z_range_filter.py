@@ -0,0 +1,279 @@
+"""
+Z-range prefilter for IFC Floor Plan Generator.
+
+Estimates the vertical extent of elements from their placements and parametric
+representations, so that elements which cannot reach the cut plane are dropped
+before any geometry is tessellated.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import ifcopenshell.util.placement
+    HAS_IFCOPENSHELL = True
+except ImportError:
+    HAS_IFCOPENSHELL = False
+
+
+# Parameterized profiles centred on their position: (class, width attribute, depth attribute)
+CENTRED_PROFILE_DIMENSIONS = (
+    ('IfcRectangleProfileDef', 'XDim', 'YDim'),
+    ('IfcIShapeProfileDef', 'OverallWidth', 'OverallDepth'),
+    ('IfcTShapeProfileDef', 'FlangeWidth', 'Depth'),
+    ('IfcUShapeProfileDef', 'FlangeWidth', 'Depth'),
+    ('IfcCShapeProfileDef', 'Width', 'Depth'),
+    ('IfcLShapeProfileDef', 'Width', 'Depth'),
+)
+
+
+class ZRangeFilter:
+    """Drops elements whose vertical extent does not reach the cut plane.
+
+    The extent is a conservative box around the element: extrusions are bounded by
+    their profile and extrusion vector, boolean differences by their first operand
+    and face sets by their coordinate list. An element is only dropped when every
+    item of its body representation could be bounded; anything else is kept and
+    left to the geometry engine.
+    """
+
+    def __init__(self, tolerance: float = 1e-6):
+        """Initialize Z-range filter.
+
+        Args:
+            tolerance: Distance around the cut plane that still counts as crossing
+        """
+        self.tolerance = tolerance
+        self._logger = logging.getLogger(__name__)
+        self._placement_cache: Dict[int, Optional[np.ndarray]] = {}
+
+    def filter_elements(self, elements: List[Any], cut_height: Union[float, Sequence[float]],
+                        unit_scale: float = 1.0) -> Tuple[List[Any], int]:
+        """Remove elements that lie entirely above or below the cut plane.
+
+        Args:
+            elements: IFC elements in processing order
+            cut_height: Height of the horizontal section in metres, or several heights
+                of which an element has to reach at least one
+            unit_scale: Scale from file length units to metres
+
+        Returns:
+            Tuple of (elements that may cross the cut plane in input order, number of skipped elements)
+        """
+        cut_heights = [cut_height] if isinstance(cut_height, (int, float)) else list(cut_height)
+
+        kept = []
+        for element in elements:
+            z_range = self.estimate_z_range(element, unit_scale)
+            if z_range is None or any(self.crosses_cut_plane(z_range, height) for height in cut_heights):
+                kept.append(element)
+
+        skipped_count = len(elements) - len(kept)
+        self._logger.debug(f"Z-range prefilter at {cut_heights}m: kept {len(kept)} elements, "
+                           f"skipped {skipped_count}")
+        return kept, skipped_count
+
+    def crosses_cut_plane(self, z_range: Tuple[float, float], cut_height: float) -> bool:
+        """Check if a vertical extent reaches the cut plane within tolerance.
+
+        Args:
+            z_range: Minimum and maximum Z in metres
+            cut_height: Height of the horizontal section in metres
+
+        Returns:
+            bool: True if the extent may intersect the cut plane
+        """
+        z_min, z_max = z_range
+        return z_min <= cut_height + self.tolerance and z_max >= cut_height - self.tolerance
+
+    def estimate_z_range(self, element: Any, unit_scale: float = 1.0) -> Optional[Tuple[float, float]]:
+        """Estimate the vertical extent of an element without tessellating it.
+
+        Args:
+            element: IFC element (IfcProduct or similar)
+            unit_scale: Scale from file length units to metres
+
+        Returns:
+            Tuple of (minimum Z, maximum Z) in metres, None if the extent cannot be bounded
+        """
+        if not HAS_IFCOPENSHELL:
+            return None
+
+        try:
+            items = self._get_body_items(element)
+            if not items:
+                return None
+
+            placement = self._placement_matrix(getattr(element, 'ObjectPlacement', None))
+            if placement is None:
+                return None
+
+            corners = []
+            for item in items:
+                item_corners = self._item_corners(item)
+                if item_corners is None:
+                    return None
+                corners.append(item_corners)
+
+            z_values = _transform(np.vstack(corners), placement)[:, 2] * unit_scale
+            return (float(z_values.min()), float(z_values.max()))
+
+        except Exception as e:
+            self._logger.debug(f"Could not estimate Z-range of element {element.id()}: {e}")
+            return None
+
+    def _get_body_items(self, element: Any) -> List[Any]:
+        """Get the items of the representation the geometry engine tessellates.
+
+        A bounding box representation is preferred, since it is bounded exactly.
+        """
+        representation = getattr(element, 'Representation', None)
+        if representation is None:
+            return []
+
+        body_items = []
+        for shape_representation in representation.Representations or []:
+            identifier = shape_representation.RepresentationIdentifier
+            if identifier == 'Box':
+                return list(shape_representation.Items)
+            if identifier == 'Body':
+                body_items.extend(shape_representation.Items)
+        return body_items
+
+    def _placement_matrix(self, placement: Any) -> Optional[np.ndarray]:
+        """Resolve an object placement to a 4x4 matrix, caching shared parent placements."""
+        if placement is None:
+            return np.eye(4)
+        if not placement.is_a('IfcLocalPlacement'):
+            return None
+
+        key = placement.id()
+        if key not in self._placement_cache:
+            parent = self._placement_matrix(placement.PlacementRelTo)
+            if parent is None:
+                matrix = None
+            else:
+                matrix = parent @ ifcopenshell.util.placement.get_axis2placement(placement.RelativePlacement)
+            self._placement_cache[key] = matrix
+        return self._placement_cache[key]
+
+    def _item_corners(self, item: Any) -> Optional[np.ndarray]:
+        """Get points whose bounding box contains a representation item.
+
+        Args:
+            item: IfcRepresentationItem
+
+        Returns:
+            (k, 3) array of points in representation coordinates, None if unsupported
+        """
+        if item.is_a('IfcBoundingBox'):
+            corner = np.array(item.Corner.Coordinates, dtype=float)
+            return corner + _box_corners(item.XDim, item.YDim, item.ZDim)
+
+        if item.is_a('IfcExtrudedAreaSolid'):
+            return self._extrusion_corners(item)
+
+        if item.is_a('IfcBooleanResult'):
+            # A difference or intersection never extends beyond its first operand
+            first = self._item_corners(item.FirstOperand)
+            if item.Operator != 'UNION' or first is None:
+                return first
+            second = self._item_corners(item.SecondOperand)
+            return None if second is None else np.vstack([first, second])
+
+        if item.is_a('IfcTessellatedFaceSet'):
+            return np.array(item.Coordinates.CoordList, dtype=float)
+
+        if item.is_a('IfcMappedItem'):
+            transformation = ifcopenshell.util.placement.get_mappeditem_transformation(item)
+            if transformation is None:
+                return None
+            corners = []
+            for mapped_item in item.MappingSource.MappedRepresentation.Items:
+                mapped_corners = self._item_corners(mapped_item)
+                if mapped_corners is None:
+                    return None
+                corners.append(mapped_corners)
+            return _transform(np.vstack(corners), transformation)
+
+        return None
+
+    def _extrusion_corners(self, solid: Any) -> Optional[np.ndarray]:
+        """Get the corners of the box swept by an extruded profile."""
+        position = (ifcopenshell.util.placement.get_axis2placement(solid.Position)
+                    if solid.Position else np.eye(4))
+
+        profiles = [solid.SweptArea]
+        if solid.is_a('IfcExtrudedAreaSolidTapered'):
+            profiles.append(solid.EndSweptArea)
+
+        profile_points = []
+        for profile in profiles:
+            points = self._profile_points(profile)
+            if points is None:
+                # The profile extent only matters when the profile plane is not horizontal
+                if np.any(np.abs(position[2, :2]) > 1e-9):
+                    return None
+                points = np.zeros((1, 2))
+            profile_points.append(points)
+        base = np.vstack(profile_points)
+
+        direction = np.array(solid.ExtrudedDirection.DirectionRatios, dtype=float)
+        extrusion = direction / np.linalg.norm(direction) * solid.Depth
+
+        base = np.column_stack([base, np.zeros(len(base))])
+        return _transform(np.vstack([base, base + extrusion]), position)
+
+    def _profile_points(self, profile: Any) -> Optional[np.ndarray]:
+        """Get 2D points whose bounding box contains a profile, None if unsupported."""
+        points = None
+
+        for profile_class, width_attribute, depth_attribute in CENTRED_PROFILE_DIMENSIONS:
+            if profile.is_a(profile_class):
+                half_width = getattr(profile, width_attribute) / 2.0
+                half_depth = getattr(profile, depth_attribute) / 2.0
+                points = np.array([(-half_width, -half_depth), (half_width, half_depth)])
+                break
+        else:
+            if profile.is_a('IfcCircleProfileDef'):
+                radius = profile.Radius
+                points = np.array([(-radius, -radius), (radius, radius)])
+            elif profile.is_a('IfcEllipseProfileDef'):
+                points = np.array([(-profile.SemiAxis1, -profile.SemiAxis2),
+                                   (profile.SemiAxis1, profile.SemiAxis2)])
+            elif profile.is_a('IfcArbitraryClosedProfileDef'):
+                points = self._curve_points(profile.OuterCurve)
+
+        if points is None:
+            return None
+
+        position = getattr(profile, 'Position', None)
+        if position is not None:
+            matrix = ifcopenshell.util.placement.get_axis2placement(position)
+            points = _transform(np.column_stack([points, np.zeros(len(points))]), matrix)[:, :2]
+        return points
+
+    def _curve_points(self, curve: Any) -> Optional[np.ndarray]:
+        """Get the vertices of a straight-segment profile curve, None if it may bulge."""
+        if curve.is_a('IfcPolyline'):
+            return np.array([point.Coordinates[:2] for point in curve.Points], dtype=float)
+
+        if curve.is_a('IfcIndexedPolyCurve'):
+            # Arc segments can bulge beyond their points
+            if any(segment.is_a('IfcArcIndex') for segment in curve.Segments or []):
+                return None
+            return np.array(curve.Points.CoordList, dtype=float)[:, :2]
+
+        return None
+
+
+def _box_corners(x_dim: float, y_dim: float, z_dim: float) -> np.ndarray:
+    """Get the eight corners of an axis-aligned box at the origin."""
+    return np.array([(x, y, z) for x in (0.0, x_dim) for y in (0.0, y_dim) for z in (0.0, z_dim)])
+
+
+def _transform(points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Apply a 4x4 transformation matrix to (k, 3) points."""
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
@@ -7,18 +7,24 @@ to implement the complete pipeline from IFC input to final output.
 
 import os
 import logging
+from dataclasses import replace
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
 import time
 
 from .config import ConfigurationManager, Config
 from .parsing import IFCParser, ElementFilter
-from .geometry import GeometryEngine, SectionProcessor, GeometryCache
+from .geometry import GeometryEngine, SectionProcessor, ZRangeFilter
 from .rendering import SVGRenderer, GeoJSONRenderer, ManifestGenerator, OutputCoordinator
-from .performance import PerformanceOptimizer, PerformanceMonitor
+from .performance import PerformanceOptimizer, PerformanceMonitor, ElementShardProcessor
+from .performance.element_sharding import section_element_at_heights, encode_polylines, decode_polylines
+from .performance.incremental import (
+    IncrementalState, ElementFingerprinter, config_fingerprint, STATE_FILENAME, FAILED_FINGERPRINT
+)
 from .errors import ErrorHandler, ProcessingError
-from .models import StoreyResult, ProcessingResult, Polyline2D, ManifestData
+from .models import StoreyResult, CutSection, ProcessingResult, Polyline2D, ManifestData
 
 
 class FloorPlanGenerator:
@@ -55,13 +61,18 @@ class FloorPlanGenerator:
         self.ifc_parser: Optional[IFCParser] = None
         self.element_filter: Optional[ElementFilter] = None
         self.geometry_engine: Optional[GeometryEngine] = None
-        self.geometry_cache: Optional[GeometryCache] = None
         self.section_processor: Optional[SectionProcessor] = None
+        self.z_range_filter: Optional[ZRangeFilter] = None
         self.svg_renderer: Optional[SVGRenderer] = None
         self.geojson_renderer: Optional[GeoJSONRenderer] = None
         self.manifest_generator: Optional[ManifestGenerator] = None
         self.output_coordinator: Optional[OutputCoordinator] = None
         self.performance_optimizer: Optional[PerformanceOptimizer] = None
+        self.element_processor: Optional[ElementShardProcessor] = None
+        self.element_fingerprinter: Optional[ElementFingerprinter] = None
+        
+        # State of the previous run for incremental regeneration
+        self.previous_state: Optional[IncrementalState] = None
         
         # Setup logging
         self._setup_logging()
@@ -69,6 +80,23 @@ class FloorPlanGenerator:
         # Processing state
         self.processing_errors: List[ProcessingError] = []
         self.processing_warnings: List[str] = []
+    
+    @classmethod
+    def from_config(cls, config: Config, verbose: bool = False) -> 'FloorPlanGenerator':
+        """
+        Create a generator from an already loaded configuration.
+        
+        Args:
+            config: Loaded configuration
+            verbose: Enable verbose logging
+            
+        Returns:
+            FloorPlanGenerator using the given configuration
+        """
+        generator = cls(config_path="", verbose=verbose)
+        generator.config = config
+        generator.config_manager.set_config(config)
+        return generator
         
     def _setup_logging(self):
         """Setup logging configuration based on verbosity level."""
@@ -136,18 +164,9 @@ class FloorPlanGenerator:
                 self.error_handler
             )
             
-            # Initialize geometry cache if enabled
-            if self.config.geometry.cache_geometry:
-                self.geometry_cache = GeometryCache(
-                    max_memory_mb=100.0,  # Default 100MB cache
-                    max_entries=5000,
-                    ttl_hours=24.0
-                )
-            
-            # Initialize geometry engine
+            # Initialize geometry engine; it owns the geometry cache when caching is enabled
             self.geometry_engine = GeometryEngine(
                 self.config.geometry,
-                self.geometry_cache,
                 self.error_handler
             )
             
@@ -157,6 +176,10 @@ class FloorPlanGenerator:
                 chain_tolerance=self.config.tolerances.chain_tol
             )
             
+            # Initialize Z-range prefilter; its estimates are in world coordinates
+            if self.config.geometry.z_prefilter and self.config.geometry.use_world_coords:
+                self.z_range_filter = ZRangeFilter(tolerance=self.config.tolerances.slice_tol)
+            
             # Initialize renderers
             self.svg_renderer = SVGRenderer(self.config.rendering)
             
@@ -172,6 +195,17 @@ class FloorPlanGenerator:
             if self.config.performance.multiprocessing:
                 self.performance_optimizer = PerformanceOptimizer(self.config)
             
+            # Initialize element shard processor if element-level multiprocessing enabled
+            if self.config.performance.element_multiprocessing:
+                self.element_processor = ElementShardProcessor(self.config)
+            
+            # Initialize element fingerprinting and load the previous run's state if incremental
+            if self.config.performance.incremental:
+                self.element_fingerprinter = ElementFingerprinter(
+                    include_openings=self.config.geometry.subtract_openings
+                )
+                self.previous_state = IncrementalState.load(self._state_path(), config_fingerprint(self.config))
+            
             self.logger.info("All components initialized successfully")
             return True
             
@@ -250,6 +284,10 @@ class FloorPlanGenerator:
             processing_time = time.time() - start_time
             output_summary = self._generate_output_files(successful_results, processing_time)
             
+            # Keep fingerprints, polylines and output hashes for the next incremental run
+            if self.config.performance.incremental:
+                self._save_incremental_state(successful_results, unit_scale)
+            
             # Create final result
             final_processing_time = time.time() - start_time
             self.logger.info(f"Processing completed in {final_processing_time:.2f} seconds")
@@ -266,8 +304,22 @@ class FloorPlanGenerator:
                         "elevation": storey.elevation,
                         "cut_height": storey.cut_height,
                         "element_count": storey.element_count,
+                        "skipped_element_count": storey.skipped_element_count,
+                        "reused_element_count": storey.reused_element_count,
+                        "outputs_reused": storey.outputs_reused,
                         "svg_file": storey.svg_file,
-                        "geojson_file": storey.geojson_file
+                        "geojson_file": storey.geojson_file,
+                        "binary_file": storey.binary_file,
+                        "additional_sections": [
+                            {
+                                "cut_height": section.cut_height,
+                                "element_count": section.element_count,
+                                "svg_file": section.svg_file,
+                                "geojson_file": section.geojson_file,
+                                "binary_file": section.binary_file
+                            }
+                            for section in storey.additional_sections
+                        ]
                     }
                     for storey in successful_results
                 ],
@@ -286,9 +338,13 @@ class FloorPlanGenerator:
             )
             
             # Log performance statistics
-            if self.geometry_cache:
-                cache_stats = self.geometry_cache.get_stats()
-                self.logger.info(f"Geometry cache stats: {cache_stats}")
+            if self.geometry_engine:
+                cache_stats = self.geometry_engine.get_cache_stats()
+                disk_stats = cache_stats.pop("disk_cache", None)
+                if cache_stats.get("cache_enabled"):
+                    self.logger.info(f"Geometry cache stats: {cache_stats}")
+                if disk_stats:
+                    self.logger.info(f"Disk geometry cache stats: {disk_stats}")
             
             return result
             
@@ -299,6 +355,12 @@ class FloorPlanGenerator:
             })
             self.processing_errors.append(error)
             return self._create_error_result(f"Processing failed: {e}")
+        
+        finally:
+            if self.element_processor:
+                self.element_processor.shutdown()
+            if self.geometry_engine:
+                self.geometry_engine.close_cache()
     
     def _process_storeys_sequential(self, ifc_file, storeys: List, unit_scale: float) -> List[Optional[StoreyResult]]:
         """Process storeys sequentially."""
@@ -312,17 +374,52 @@ class FloorPlanGenerator:
         return results
     
     def _process_storeys_parallel(self, ifc_file, storeys: List, unit_scale: float) -> List[Optional[StoreyResult]]:
-        """Process storeys in parallel using multiprocessing."""
-        self.logger.info(f"Processing {len(storeys)} storeys in parallel")
-        
-        # Use performance optimizer for parallel processing
-        return self.performance_optimizer.process_storeys_parallel(
-            ifc_file,
-            storeys,
-            unit_scale,
-            self.config,
-            self._process_single_storey
-        )
+        """
+        Process storeys in parallel worker processes.
+        
+        The open IFC file cannot be pickled, so workers receive only a
+        configuration snapshot in their initializer and the storey id per task.
+        Each worker opens the input file once and returns plain StoreyResults,
+        which are collected in storey order.
+        """
+        max_workers = self.performance_optimizer.multiprocessing_manager.get_performance_info()["max_workers"]
+        workers = max(1, min(max_workers, len(storeys)))
+        self.logger.info(f"Processing {len(storeys)} storeys in parallel with {workers} workers")
+        
+        results = []
+        errors = []
+        warnings = []
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_storey_worker,
+                initargs=(self.config, self.verbose)
+            ) as executor:
+                futures = [
+                    executor.submit(_process_storey_in_worker, storey.id(), index, unit_scale)
+                    for index, storey in enumerate(storeys)
+                ]
+                
+                for future in futures:
+                    result, records, section_records, storey_errors, storey_warnings = future.result()
+                    if result is not None:
+                        result = replace(result, polylines=decode_polylines(records), additional_sections=[
+                            replace(section, polylines=decode_polylines(section_polylines))
+                            for section, section_polylines in zip(result.additional_sections, section_records)
+                        ])
+                    results.append(result)
+                    errors.extend(storey_errors)
+                    warnings.extend(storey_warnings)
+                    
+        except Exception as e:
+            self.logger.error(f"Parallel storey processing failed: {e}")
+            self.logger.info("Falling back to sequential processing")
+            return self._process_storeys_sequential(ifc_file, storeys, unit_scale)
+        
+        self.processing_errors.extend(errors)
+        self.processing_warnings.extend(warnings)
+        return results
     
     def _process_single_storey(self, ifc_file, storey, storey_index: int, unit_scale: float) -> Optional[StoreyResult]:
         """
@@ -344,8 +441,9 @@ class FloorPlanGenerator:
             # Get storey elevation
             elevation = self._get_storey_elevation(storey, unit_scale)
             
-            # Get cut height for this storey
-            cut_height = self.config_manager.get_storey_cut_height(storey_name)
+            # Get cut heights for this storey, the primary cut height first
+            cut_heights = self.config_manager.get_storey_cut_heights(storey_name)
+            cut_height = cut_heights[0]
             
             self.logger.debug(f"Storey {storey_name}: elevation={elevation:.2f}m, cut_height={cut_height:.2f}m")
             
@@ -361,33 +459,26 @@ class FloorPlanGenerator:
                 self.processing_warnings.append(f"No elements remaining after filtering in storey: {storey_name}")
                 return None
             
-            self.logger.debug(f"Processing {len(filtered_elements)} elements in {storey_name}")
+            # Drop elements that lie entirely above or below every cut plane
+            skipped_count = 0
+            if self.z_range_filter:
+                filtered_elements, skipped_count = self.z_range_filter.filter_elements(
+                    filtered_elements, cut_heights, unit_scale
+                )
             
-            # Generate geometry and process sections
-            polylines = []
-            element_count = 0
+            self.logger.debug(f"Processing {len(filtered_elements)} elements in {storey_name} "
+                              f"({skipped_count} skipped by Z-range prefilter)")
             
-            for element in filtered_elements:
-                try:
-                    # Generate 3D geometry
-                    shape = self.geometry_engine.generate_shape(element)
-                    if not shape:
-                        continue
-                    
-                    # Create section at cut height
-                    element_guid = getattr(element, 'GlobalId', f'element_{element.id()}')
-                    ifc_class = element.is_a()
-                    section_polylines = self.section_processor.process_shape_section(
-                        shape, cut_height, ifc_class, element_guid
-                    )
-                    
-                    if section_polylines:
-                        polylines.extend(section_polylines)
-                        element_count += 1
-                        
-                except Exception as e:
-                    self.logger.warning(f"Failed to process element {element.id()}: {e}")
-                    continue
+            # Generate geometry once and section it at every cut height
+            fingerprints: Dict[str, str] = {}
+            reused_count = removed_count = 0
+            if self.element_fingerprinter:
+                sections, fingerprints, reused_count, removed_count = self._process_elements_incrementally(
+                    storey_name, filtered_elements, cut_heights, unit_scale
+                )
+            else:
+                sections = self._process_elements(filtered_elements, cut_heights)
+            polylines, element_count = sections[0]
             
             if not polylines:
                 error = self.error_handler.handle_error("EMPTY_CUT_RESULT", {
@@ -400,6 +491,20 @@ class FloorPlanGenerator:
             # Calculate bounds
             bounds = self._calculate_bounds(polylines)
             
+            additional_sections = []
+            for additional_height, (section_polylines, section_element_count) in zip(cut_heights[1:], sections[1:]):
+                if not section_polylines:
+                    self.processing_warnings.append(
+                        f"No section geometry at {additional_height:.2f}m in storey: {storey_name}"
+                    )
+                    continue
+                additional_sections.append(CutSection(
+                    cut_height=additional_height,
+                    polylines=section_polylines,
+                    bounds=self._calculate_bounds(section_polylines),
+                    element_count=section_element_count
+                ))
+            
             # Create storey result
             result = StoreyResult(
                 storey_name=storey_name,
@@ -408,7 +513,12 @@ class FloorPlanGenerator:
                 cut_height=cut_height,
                 polylines=polylines,
                 bounds=bounds,
-                element_count=element_count
+                element_count=element_count,
+                skipped_element_count=skipped_count,
+                additional_sections=additional_sections,
+                element_fingerprints=fingerprints,
+                reused_element_count=reused_count,
+                removed_element_count=removed_count
             )
             
             self.logger.debug(f"Storey {storey_name}: generated {len(polylines)} polylines from {element_count} elements")
@@ -423,6 +533,140 @@ class FloorPlanGenerator:
             self.processing_errors.append(error)
             return None
     
+    def _process_elements(self, elements: List, cut_heights: List[float],
+                          element_hashes: Optional[Dict[str, str]] = None,
+                          failed_guids: Optional[Set[str]] = None) -> List[Tuple[List[Polyline2D], int]]:
+        """
+        Generate geometry and section polylines for the elements of a storey.
+        
+        Each element is tessellated once and cut at every height. Large storeys
+        are sharded across worker processes when element-level multiprocessing
+        is enabled; the result is the same as sequential processing.
+        
+        Args:
+            elements: Filtered elements of the storey
+            cut_heights: Heights of the horizontal sections
+            element_hashes: Geometry hashes by element GUID, if already computed
+            failed_guids: Set that receives the GUIDs of elements whose sectioning failed
+            
+        Returns:
+            List of (polylines in element order, number of elements that produced polylines),
+            one per cut height
+        """
+        if self.element_processor and self.element_processor.should_shard(len(elements)):
+            try:
+                return self.element_processor.process_elements_at_heights(
+                    elements, cut_heights, element_hashes, failed_guids
+                )
+            except ProcessingError as e:
+                self.logger.error(f"Parallel element processing failed: {e}")
+                self.logger.info("Falling back to sequential element processing")
+        
+        return self._process_elements_sequential(elements, cut_heights, element_hashes, failed_guids)
+    
+    def _process_elements_incrementally(self, storey_name: str, elements: List, cut_heights: List[float],
+                                        unit_scale: float) -> Tuple[List[Tuple[List[Polyline2D], int]],
+                                                                    Dict[str, str], int, int]:
+        """
+        Section only the elements that changed since the previous run.
+        
+        Unchanged elements take their polylines from the previous run's state; the
+        merged polylines keep the element order of a full run. Elements whose
+        sectioning fails get a fingerprint that makes the next run section them again.
+        
+        Args:
+            storey_name: Name of the storey
+            elements: Filtered elements of the storey
+            cut_heights: Heights of the horizontal sections
+            unit_scale: Unit scale factor
+            
+        Returns:
+            Tuple of (sections as returned by _process_elements, element fingerprints by GUID,
+            number of reused elements, number of elements removed since the previous run)
+        """
+        # Hash each element once; the hash keys both the fingerprint and the geometry cache
+        element_hashes = {
+            element.GlobalId: self.element_fingerprinter.element_hash(element) for element in elements
+        }
+        if len(element_hashes) != len(elements):
+            self.logger.warning(f"Duplicate GUIDs in storey {storey_name}, sectioning all elements")
+            return self._process_elements(elements, cut_heights), {}, 0, 0
+        
+        fingerprints = {
+            element.GlobalId: self.element_fingerprinter.fingerprint(element, element_hashes[element.GlobalId])
+            for element in elements
+        }
+        
+        failed_guids: Set[str] = set()
+        state = self.previous_state
+        if state is None or state.unit_scale != unit_scale:
+            sections = self._process_elements(elements, cut_heights, element_hashes, failed_guids)
+            return sections, self._flag_failed(fingerprints, failed_guids), 0, 0
+        
+        reusable = state.reusable_polylines(storey_name, fingerprints)
+        changed = [element for element in elements if element.GlobalId not in reusable]
+        fresh = (self._process_elements(changed, cut_heights, element_hashes, failed_guids) if changed
+                 else [([], 0) for _ in cut_heights])
+        
+        sections = []
+        for cut_height, (fresh_polylines, _) in zip(cut_heights, fresh):
+            fresh_by_guid: Dict[str, List[Polyline2D]] = {}
+            for polyline in fresh_polylines:
+                fresh_by_guid.setdefault(polyline.element_guid, []).append(polyline)
+            
+            polylines = []
+            element_count = 0
+            for element in elements:
+                guid = element.GlobalId
+                if guid in reusable:
+                    element_polylines = decode_polylines(reusable[guid].get(cut_height, []))
+                else:
+                    element_polylines = fresh_by_guid.get(guid, [])
+                if element_polylines:
+                    polylines.extend(element_polylines)
+                    element_count += 1
+            sections.append((polylines, element_count))
+        
+        self.logger.debug(f"Storey {storey_name}: reused {len(reusable)} elements, "
+                          f"sectioned {len(changed)} changed or added elements")
+        removed_count = state.removed_count(storey_name, fingerprints)
+        return sections, self._flag_failed(fingerprints, failed_guids), len(reusable), removed_count
+    
+    def _flag_failed(self, fingerprints: Dict[str, str], failed_guids: Set[str]) -> Dict[str, str]:
+        """Replace the fingerprints of failed elements so the next run does not reuse them."""
+        for guid in failed_guids:
+            if guid in fingerprints:
+                fingerprints[guid] = FAILED_FINGERPRINT
+        return fingerprints
+    
+    def _process_elements_sequential(self, elements: List, cut_heights: List[float],
+                                     element_hashes: Optional[Dict[str, str]] = None,
+                                     failed_guids: Optional[Set[str]] = None
+                                     ) -> List[Tuple[List[Polyline2D], int]]:
+        """Generate geometry and section polylines for elements one at a time."""
+        polylines = [[] for _ in cut_heights]
+        element_counts = [0] * len(cut_heights)
+        
+        for element in elements:
+            try:
+                sections = section_element_at_heights(
+                    self.geometry_engine, self.section_processor, element, cut_heights,
+                    element_hashes.get(element.GlobalId) if element_hashes else None
+                )
+                
+                for height_index, section_polylines in enumerate(sections):
+                    if section_polylines:
+                        polylines[height_index].extend(section_polylines)
+                        element_counts[height_index] += 1
+                    
+            except Exception as e:
+                self.logger.warning(f"Failed to process element {element.id()}: {e}")
+                if failed_guids is not None:
+                    failed_guids.add(getattr(element, 'GlobalId', None))
+                continue
+        
+        return list(zip(polylines, element_counts))
+    
     def _get_storey_elevation(self, storey, unit_scale: float) -> float:
         """Get the elevation of a building storey."""
         try:
@@ -476,12 +720,15 @@ class FloorPlanGenerator:
             output_info = self.output_coordinator.generate_all_outputs(
                 storey_results,
                 self.config.input_path,
-                processing_time
+                processing_time,
+                previous_state=self.previous_state
             )
             
             self.logger.info(f"Generated {len(output_info.get('svg_files', []))} SVG files")
             if self.config.output.write_geojson:
                 self.logger.info(f"Generated {len(output_info.get('geojson_files', []))} GeoJSON files")
+            if self.config.output.write_binary:
+                self.logger.info(f"Generated {len(output_info.get('binary_files', []))} binary floor plan files")
             
             return output_info
             
@@ -493,6 +740,18 @@ class FloorPlanGenerator:
             self.processing_errors.append(error)
             return {"errors": [str(e)]}
     
+    def _state_path(self) -> str:
+        """Get the path of the incremental state file in the output directory."""
+        return os.path.join(self.config.output_dir, STATE_FILENAME)
+    
+    def _save_incremental_state(self, storey_results: List[StoreyResult], unit_scale: float) -> None:
+        """Save element fingerprints, polylines and output hashes for the next run."""
+        try:
+            state = IncrementalState.from_results(config_fingerprint(self.config), unit_scale, storey_results)
+            state.save(self._state_path())
+        except Exception as e:
+            self.logger.warning(f"Failed to save incremental state: {e}")
+    
     def _create_error_result(self, message: str) -> ProcessingResult:
         """Create a ProcessingResult for error cases."""
         return ProcessingResult(
@@ -513,4 +772,58 @@ class FloorPlanGenerator:
                 percentage = (current / total) * 100 if total > 0 else 0
                 self.logger.info(f"Progress: {current}/{total} ({percentage:.1f}%) - {message}")
         
-        return progress_callback
\ No newline at end of file
+        return progress_callback
+
+
+# Per-process generator and IFC file, created once by the pool initializer
+_storey_worker: Optional[FloorPlanGenerator] = None
+_storey_worker_file = None
+
+
+def _initialize_storey_worker(config: Config, verbose: bool) -> None:
+    """Open the IFC file and initialize the processing components once in a worker process."""
+    global _storey_worker, _storey_worker_file
+    
+    # The worker itself is the unit of parallelism, so it processes its storeys in-process
+    worker_config = replace(config, performance=replace(
+        config.performance, multiprocessing=False, element_multiprocessing=False
+    ))
+    
+    generator = FloorPlanGenerator.from_config(worker_config, verbose)
+    if not generator._initialize_components():
+        raise RuntimeError("Component initialization failed in storey worker")
+    
+    _storey_worker_file = generator.ifc_parser.open_file(worker_config.input_path)
+    _storey_worker = generator
+    
+    # Flush the worker's disk cache when the pool stops the process; forked workers
+    # leave through os._exit, which skips atexit hooks but runs these finalizers
+    Finalize(None, generator.geometry_engine.close_cache, exitpriority=10)
+
+
+def _process_storey_in_worker(storey_id: int, storey_index: int, unit_scale: float) -> Tuple:
+    """
+    Process one storey in a worker process.
+    
+    Returns:
+        Tuple of (storey result without polylines or None, encoded polylines,
+        encoded polylines per additional section, errors, warnings) produced
+        while processing the storey
+    """
+    generator = _storey_worker
+    generator.processing_errors = []
+    generator.processing_warnings = []
+    
+    storey = _storey_worker_file.by_id(storey_id)
+    result = generator._process_single_storey(_storey_worker_file, storey, storey_index, unit_scale)
+    
+    if result is None:
+        return None, [], [], generator.processing_errors, generator.processing_warnings
+    
+    # Polylines travel as compact coordinate records instead of pickled objects
+    section_records = [encode_polylines(section.polylines) for section in result.additional_sections]
+    stripped = replace(result, polylines=[], additional_sections=[
+        replace(section, polylines=[]) for section in result.additional_sections
+    ])
+    return (stripped, encode_polylines(result.polylines), section_records,
+            generator.processing_errors, generator.processing_warnings)
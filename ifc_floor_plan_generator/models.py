@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional, Any
 from datetime import datetime
 
+import numpy as np
+
 
 @dataclass
 class Polyline2D:
@@ -16,6 +18,9 @@ class Polyline2D:
     ifc_class: str
     element_guid: str
     is_closed: bool = False
+    # Packed copy of points, valid while points holds the same point tuples it was packed from
+    _coordinates: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _coordinates_points: Optional[list] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate polyline data after initialization."""
@@ -25,6 +30,49 @@ class Polyline2D:
             raise ValueError("Element GUID is required")
         if not self.ifc_class:
             raise ValueError("IFC class is required")
+    
+    @classmethod
+    def from_coordinates(cls, coordinates: np.ndarray, ifc_class: str, element_guid: str,
+                         is_closed: bool = False,
+                         points: Optional[List[Tuple[float, float]]] = None) -> 'Polyline2D':
+        """Create a polyline from an (n, 2) coordinate array, keeping the array packed.
+        
+        Args:
+            coordinates: (n, 2) float array of points
+            ifc_class: IFC class of the element
+            element_guid: GUID of the element
+            is_closed: Whether the polyline is closed
+            points: The same points as tuples, if the caller already has them
+            
+        Returns:
+            Polyline2D: Polyline whose coordinates property returns the given array
+        """
+        if points is None:
+            points = list(zip(coordinates[:, 0].tolist(), coordinates[:, 1].tolist()))
+        polyline = cls(points=points, ifc_class=ifc_class, element_guid=element_guid, is_closed=is_closed)
+        polyline._coordinates = coordinates
+        polyline._coordinates_points = list(points)
+        return polyline
+    
+    @property
+    def coordinates(self) -> np.ndarray:
+        """Get the points as a packed (n, 2) float64 array.
+        
+        The array is cached until the points change; do not modify it.
+        """
+        coordinates = self.cached_coordinates()
+        if coordinates is None:
+            coordinates = np.array(self.points, dtype=np.float64).reshape(-1, 2)
+            self._coordinates = coordinates
+            self._coordinates_points = list(self.points)
+        return coordinates
+    
+    def cached_coordinates(self) -> Optional[np.ndarray]:
+        """Get the packed coordinates if they are already available, without packing."""
+        # Point tuples are immutable, so comparing the snapshot mostly compares identities
+        if self._coordinates is not None and self._coordinates_points == self.points:
+            return self._coordinates
+        return None
 
 
 @dataclass
@@ -58,6 +106,25 @@ class BoundingBox:
         return ((self.min_x + self.max_x) / 2, (self.min_y + self.max_y) / 2)
 
 
+@dataclass
+class CutSection:
+    """Section of a storey at an additional cut height."""
+    cut_height: float
+    polylines: List[Polyline2D]
+    bounds: Dict[str, float]
+    element_count: int
+    svg_file: Optional[str] = None
+    geojson_file: Optional[str] = None
+    binary_file: Optional[str] = None
+    output_hash: Optional[str] = None  # Content hash of the output files (incremental runs)
+    outputs_reused: bool = False  # Output files kept from the previous run
+    
+    def __post_init__(self):
+        """Validate cut section after initialization."""
+        if self.element_count < 0:
+            raise ValueError("Element count cannot be negative")
+
+
 @dataclass
 class StoreyResult:
     """Results from processing a single building storey."""
@@ -70,6 +137,14 @@ class StoreyResult:
     element_count: int
     svg_file: Optional[str] = None
     geojson_file: Optional[str] = None
+    binary_file: Optional[str] = None
+    skipped_element_count: int = 0  # Elements dropped by the Z-range prefilter
+    additional_sections: List[CutSection] = field(default_factory=list)
+    element_fingerprints: Dict[str, str] = field(default_factory=dict)  # Sectioned elements by GUID (incremental runs)
+    reused_element_count: int = 0  # Elements whose polylines came from the previous run
+    removed_element_count: int = 0  # Elements of the previous run no longer in the storey
+    output_hash: Optional[str] = None  # Content hash of the output files (incremental runs)
+    outputs_reused: bool = False  # Output files kept from the previous run
     
     def __post_init__(self):
         """Validate storey result after initialization."""
@@ -77,6 +152,10 @@ class StoreyResult:
             raise ValueError("Storey name is required")
         if self.element_count < 0:
             raise ValueError("Element count cannot be negative")
+        if self.skipped_element_count < 0:
+            raise ValueError("Skipped element count cannot be negative")
+        if self.reused_element_count < 0 or self.removed_element_count < 0:
+            raise ValueError("Reused and removed element counts cannot be negative")
         if self.storey_index < 0:
             raise ValueError("Storey index cannot be negative")
 
@@ -171,11 +250,14 @@ class ProcessingResult:
 class StoreyConfig:
     """Configuration for a specific building storey."""
     cut_offset_m: float
+    additional_cut_offsets_m: Optional[List[float]] = None  # None inherits the global list
     
     def __post_init__(self):
         """Validate storey config after initialization."""
         if self.cut_offset_m < 0:
             raise ValueError("Cut offset must be non-negative")
+        if self.additional_cut_offsets_m and any(offset < 0 for offset in self.additional_cut_offsets_m):
+            raise ValueError("Additional cut offsets must be non-negative")
 
 
 @dataclass
@@ -217,6 +299,17 @@ class GeometryConfig:
     subtract_openings: bool = True
     sew_shells: bool = True
     cache_geometry: bool = True
+    section_backend: str = "occ"
+    z_prefilter: bool = True
+    disk_cache_dir: Optional[str] = None  # Persistent geometry cache, disabled when None
+    disk_cache_max_mb: float = 1024.0
+    
+    def __post_init__(self):
+        """Validate geometry config after initialization."""
+        if self.section_backend not in ("occ", "mesh"):
+            raise ValueError("Section backend must be 'occ' or 'mesh'")
+        if self.disk_cache_max_mb <= 0:
+            raise ValueError("Disk cache size must be positive")
 
 
 @dataclass
@@ -241,11 +334,14 @@ class RenderingConfig:
     background: Optional[str] = None
     invert_y: bool = True
     class_styles: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    coordinate_precision: int = 3  # Decimals of SVG coordinates
     
     def __post_init__(self):
         """Validate rendering config after initialization."""
         if self.default_linewidth_px <= 0:
             raise ValueError("Default linewidth must be positive")
+        if not 0 <= self.coordinate_precision <= 15:
+            raise ValueError("Coordinate precision must be between 0 and 15")
 
 
 @dataclass
@@ -255,6 +351,14 @@ class OutputConfig:
     geojson_filename_pattern: str = "{index:02d}_{storey_name}.geo.json"
     manifest_filename: str = "manifest.json"
     write_geojson: bool = True
+    write_binary: bool = False  # Compact binary floor plan per storey for web viewers
+    binary_filename_pattern: str = "{index:02d}_{storey_name}.fpb"
+    binary_coordinate_precision: int = 3  # Decimals kept in binary coordinates
+    
+    def __post_init__(self):
+        """Validate output config after initialization."""
+        if not 0 <= self.binary_coordinate_precision <= 9:
+            raise ValueError("Binary coordinate precision must be between 0 and 9")
 
 
 @dataclass
@@ -262,11 +366,19 @@ class PerformanceConfig:
     """Configuration for performance optimization."""
     multiprocessing: bool = False
     max_workers: Optional[int] = None
+    element_multiprocessing: bool = False
+    element_workers: Optional[int] = None
+    element_batch_size: int = 50
+    incremental: bool = False
     
     def __post_init__(self):
         """Validate performance config after initialization."""
         if self.max_workers is not None and self.max_workers <= 0:
             raise ValueError("Max workers must be positive")
+        if self.element_workers is not None and self.element_workers <= 0:
+            raise ValueError("Element workers must be positive")
+        if self.element_batch_size <= 0:
+            raise ValueError("Element batch size must be positive")
 
 
 @dataclass
@@ -275,6 +387,7 @@ class Config:
     input_path: str
     output_dir: str
     cut_offset_m: float
+    additional_cut_offsets_m: List[float] = field(default_factory=list)
     per_storey_overrides: Dict[str, StoreyConfig] = field(default_factory=dict)
     class_filters: ClassFilters = field(default_factory=ClassFilters)
     units: UnitsConfig = field(default_factory=UnitsConfig)
@@ -292,9 +405,24 @@ class Config:
             raise ValueError("Output directory is required")
         if self.cut_offset_m < 0:
             raise ValueError("Cut offset must be non-negative")
+        if any(offset < 0 for offset in self.additional_cut_offsets_m):
+            raise ValueError("Additional cut offsets must be non-negative")
     
     def get_storey_cut_height(self, storey_name: str) -> float:
         """Get the cut height for a specific storey, considering overrides."""
         if storey_name in self.per_storey_overrides:
             return self.per_storey_overrides[storey_name].cut_offset_m
-        return self.cut_offset_m
\ No newline at end of file
+        return self.cut_offset_m
+    
+    def get_storey_cut_heights(self, storey_name: str) -> List[float]:
+        """Get all cut heights for a specific storey, the primary cut height first."""
+        additional = self.additional_cut_offsets_m
+        override = self.per_storey_overrides.get(storey_name)
+        if override is not None and override.additional_cut_offsets_m is not None:
+            additional = override.additional_cut_offsets_m
+        
+        cut_heights = [self.get_storey_cut_height(storey_name)]
+        for offset in additional:
+            if offset not in cut_heights:
+                cut_heights.append(offset)
+        return cut_heights
\ No newline at end of file
@@ -1,30 +1,54 @@
 """
 Element filter for IFC Floor Plan Generator.
 
-Placeholder for ElementFilter class - to be implemented in task 4.
+Filters IFC elements by class according to the configured include/exclude rules.
 """
 
-from typing import List, Any
+from typing import List, Any, Optional
 from ..config.models import ClassFilters
+from ..errors.handler import ErrorHandler
 
 
 class ElementFilter:
     """Filters IFC elements based on class inclusion/exclusion rules."""
     
-    def __init__(self, class_filters: ClassFilters):
-        """Initialize element filter with class filters configuration."""
+    def __init__(self, class_filters: ClassFilters, error_handler: Optional[ErrorHandler] = None):
+        """Initialize element filter with class filters configuration.
+        
+        Args:
+            class_filters: Include/exclude rules for IFC classes
+            error_handler: Error handler for structured error reporting
+        """
         self.class_filters = class_filters
+        self.error_handler = error_handler or ErrorHandler()
     
     def filter_elements(self, elements: List[Any]) -> List[Any]:
         """Filter elements based on IFC class rules.
         
-        To be implemented in task 4.2.
+        Args:
+            elements: IFC elements to filter
+            
+        Returns:
+            List[Any]: Included elements in their original order
         """
-        raise NotImplementedError("To be implemented in task 4.2")
+        return [element for element in elements if self.should_include_element(element)]
     
     def should_include_element(self, element: Any) -> bool:
         """Check if element should be included based on its IFC class.
         
-        To be implemented in task 4.2.
+        Args:
+            element: IFC element to check
+            
+        Returns:
+            bool: True if the element's class passes the filters
         """
-        raise NotImplementedError("To be implemented in task 4.2")
\ No newline at end of file
+        try:
+            ifc_class = element.is_a()
+        except Exception as e:
+            self.error_handler.log_warning(
+                f"Could not determine IFC class of element: {e}",
+                {"element_type": type(element).__name__}
+            )
+            return False
+        
+        return self.class_filters.should_include_class(ifc_class)
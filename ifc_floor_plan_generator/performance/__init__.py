@@ -8,6 +8,8 @@ from .multiprocessing_manager import MultiprocessingManager
 from .worker_pool import WorkerPool, WorkerResult
 from .performance_monitor import PerformanceMonitor
 from .performance_optimizer import PerformanceOptimizer, OptimizationConfig, SharedCacheManager
+from .element_sharding import ElementShardProcessor
+from .incremental import IncrementalState, ElementFingerprinter
 
 __all__ = [
     "MultiprocessingManager",
@@ -16,5 +18,8 @@ __all__ = [
     "PerformanceMonitor",
     "PerformanceOptimizer",
     "OptimizationConfig",
-    "SharedCacheManager"
+    "SharedCacheManager",
+    "ElementShardProcessor",
+    "IncrementalState",
+    "ElementFingerprinter"
 ]
\ No newline at end of file
@@ -0,0 +1,399 @@
+"""
+Element-level parallel section cutting for IFC Floor Plan Generator.
+
+Splits the elements of one storey into shards that are tessellated and sectioned
+in worker processes, independent of storey-level multiprocessing.
+"""
+
+import logging
+import multiprocessing as mp
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.util import Finalize
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple
+
+from ..models import Config, Polyline2D
+from ..errors.exceptions import ProcessingError, EmptyCutResultError
+
+
+# Compact polyline record: (ifc_class, element_guid, is_closed, flat x/y coordinates)
+PolylineRecord = Tuple[str, str, bool, array]
+
+
+def encode_polylines(polylines: List[Polyline2D]) -> List[PolylineRecord]:
+    """Encode polylines as compact records for transfer between processes.
+
+    Args:
+        polylines: Polylines to encode
+
+    Returns:
+        List[PolylineRecord]: One record per polyline, coordinates packed as float64
+    """
+    records = []
+    for polyline in polylines:
+        coordinates = array('d')
+        for x, y in polyline.points:
+            coordinates.append(x)
+            coordinates.append(y)
+        records.append((polyline.ifc_class, polyline.element_guid, polyline.is_closed, coordinates))
+    return records
+
+
+def decode_polylines(records: List[PolylineRecord]) -> List[Polyline2D]:
+    """Decode records created by encode_polylines.
+
+    Args:
+        records: Compact polyline records
+
+    Returns:
+        List[Polyline2D]: Decoded polylines in record order
+    """
+    polylines = []
+    for ifc_class, element_guid, is_closed, coordinates in records:
+        points = list(zip(coordinates[0::2], coordinates[1::2]))
+        polylines.append(Polyline2D(
+            points=points,
+            ifc_class=ifc_class,
+            element_guid=element_guid,
+            is_closed=is_closed
+        ))
+    return polylines
+
+
+def section_element(geometry_engine, section_processor, element: Any, cut_height: float) -> List[Polyline2D]:
+    """Tessellate one element and cut it at the given height.
+
+    With the "mesh" section backend, elements without curved geometry are cut by
+    slicing their triangle mesh. Curved elements, and elements whose mesh cannot
+    be generated, are cut with OpenCASCADE.
+
+    Args:
+        geometry_engine: GeometryEngine used to generate the element shape
+        section_processor: SectionProcessor used to cut the shape
+        element: IFC element to section
+        cut_height: Height of the horizontal section
+
+    Returns:
+        List[Polyline2D]: Section polylines, empty if the element has no shape
+
+    Raises:
+        Exception: Any error raised by shape generation or sectioning
+    """
+    return section_element_at_heights(geometry_engine, section_processor, element, [cut_height])[0]
+
+
+def section_element_at_heights(geometry_engine, section_processor, element: Any,
+                               cut_heights: Sequence[float],
+                               element_hash: Optional[str] = None) -> List[List[Polyline2D]]:
+    """Tessellate one element once and cut it at several heights.
+
+    Args:
+        geometry_engine: GeometryEngine used to generate the element shape
+        section_processor: SectionProcessor used to cut the shape
+        element: IFC element to section
+        cut_heights: Heights of the horizontal sections
+        element_hash: Geometry hash of the element if already computed, passed to the
+            geometry engine so it does not hash the element again
+
+    Returns:
+        List[List[Polyline2D]]: Section polylines per cut height, empty where the
+        element has no shape or does not reach the plane
+
+    Raises:
+        Exception: Any error raised by shape generation or sectioning
+    """
+    element_guid = getattr(element, 'GlobalId', f'element_{element.id()}')
+    ifc_class = element.is_a()
+
+    if _use_mesh_backend(geometry_engine, element):
+        try:
+            mesh = geometry_engine.generate_mesh(element, element_hash=element_hash)
+        except Exception:
+            mesh = None
+        if mesh is not None:
+            return _section_at_heights(section_processor.process_mesh_section, mesh, cut_heights,
+                                       ifc_class, element_guid)
+
+    shape = geometry_engine.generate_shape(element, element_hash=element_hash)
+    if not shape:
+        return [[] for _ in cut_heights]
+
+    return _section_at_heights(section_processor.process_shape_section, shape, cut_heights,
+                               ifc_class, element_guid)
+
+
+def _section_at_heights(process_section, shape: Any, cut_heights: Sequence[float],
+                        ifc_class: str, element_guid: str) -> List[List[Polyline2D]]:
+    """Cut one generated shape at every height, treating empty cuts as no polylines.
+
+    A single cut height keeps the processor's EmptyCutResultError, so callers that
+    section at one height report elements that miss the plane as before.
+    """
+    if len(cut_heights) == 1:
+        return [process_section(shape, cut_heights[0], ifc_class, element_guid)]
+
+    sections = []
+    for cut_height in cut_heights:
+        try:
+            sections.append(process_section(shape, cut_height, ifc_class, element_guid))
+        except EmptyCutResultError:
+            sections.append([])
+    return sections
+
+
+def _use_mesh_backend(geometry_engine, element: Any) -> bool:
+    """Check if an element should be cut with the triangle-mesh slicer."""
+    geometry_config = getattr(geometry_engine, 'config', None)
+    if getattr(geometry_config, 'section_backend', 'occ') != 'mesh':
+        return False
+    return not geometry_engine.has_curved_geometry(element)
+
+
+# Per-process state, created once by the pool initializer
+_worker_file = None
+_worker_geometry_engine = None
+_worker_section_processor = None
+
+
+def _initialize_worker(input_path: str, config: Config) -> None:
+    """Open the IFC file and create the geometry components once in a worker process."""
+    global _worker_file, _worker_geometry_engine, _worker_section_processor
+
+    import ifcopenshell
+    from ..geometry.engine import GeometryEngine
+    from ..geometry.section_processor import SectionProcessor
+
+    _worker_file = ifcopenshell.open(input_path)
+    _worker_geometry_engine = GeometryEngine(config.geometry)
+    # Flush the worker's disk cache when the pool stops the process; forked workers
+    # leave through os._exit, which skips atexit hooks but runs these finalizers
+    Finalize(None, _worker_geometry_engine.close_cache, exitpriority=10)
+    _worker_section_processor = SectionProcessor(
+        slice_tolerance=config.tolerances.slice_tol,
+        chain_tolerance=config.tolerances.chain_tol
+    )
+
+
+def _section_shard(element_ids: List[int], cut_heights: Tuple[float, ...],
+                   element_hashes: Optional[List[Optional[str]]] = None
+                   ) -> Tuple[List[List[List[PolylineRecord]]], List[Tuple[int, str]]]:
+    """Section a shard of elements in a worker process.
+
+    Args:
+        element_ids: IFC entity ids of the elements in the shard
+        cut_heights: Heights of the horizontal sections
+        element_hashes: Precomputed geometry hashes in shard order, if known
+
+    Returns:
+        Tuple of (encoded polylines per element in shard order and per cut height,
+        failed element ids and messages)
+    """
+    results = []
+    failures = []
+
+    for index, element_id in enumerate(element_ids):
+        try:
+            element = _worker_file.by_id(element_id)
+            sections = section_element_at_heights(
+                _worker_geometry_engine, _worker_section_processor, element, cut_heights,
+                element_hashes[index] if element_hashes else None
+            )
+            results.append([encode_polylines(polylines) for polylines in sections])
+        except Exception as e:
+            results.append([[] for _ in cut_heights])
+            failures.append((element_id, str(e)))
+
+    return results, failures
+
+
+class ElementShardProcessor:
+    """Sections the elements of a storey in parallel worker processes.
+
+    IFC entities and OpenCASCADE shapes cannot be pickled, so each worker opens
+    the input file once and receives shards of entity ids. Workers return compact
+    polyline records which are merged in element order, making the result
+    identical to sectioning the elements one by one.
+    """
+
+    def __init__(self, config: Config):
+        """Initialize element shard processor with configuration.
+
+        Args:
+            config: Main configuration containing performance settings
+        """
+        self.config = config
+        self._logger = logging.getLogger(__name__)
+
+        self._max_workers = self._determine_worker_count()
+        self._batch_size = config.performance.element_batch_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self._logger.info(f"Element shard processor initialized: workers={self._max_workers}, "
+                          f"batch_size={self._batch_size}")
+
+    def _determine_worker_count(self) -> int:
+        """Determine number of element worker processes.
+
+        Returns:
+            int: Number of worker processes to use
+        """
+        if self.config.performance.element_workers is not None:
+            return max(1, self.config.performance.element_workers)
+
+        # Use 75% of available CPUs, minimum 1, maximum 8
+        return max(1, min(8, int(mp.cpu_count() * 0.75)))
+
+    def should_shard(self, element_count: int) -> bool:
+        """Check if a storey is large enough to be worth sharding.
+
+        Args:
+            element_count: Number of elements in the storey
+
+        Returns:
+            bool: True if the elements should be sectioned in worker processes
+        """
+        return self._max_workers > 1 and element_count >= 2 * self._batch_size
+
+    def create_shards(self, elements: List[Any]) -> List[List[int]]:
+        """Split elements into contiguous shards of entity ids.
+
+        Args:
+            elements: IFC elements in processing order
+
+        Returns:
+            List[List[int]]: Entity id shards in element order
+        """
+        element_ids = [element.id() for element in elements]
+        return [
+            element_ids[start:start + self._batch_size]
+            for start in range(0, len(element_ids), self._batch_size)
+        ]
+
+    def process_elements(self, elements: List[Any], cut_height: float) -> Tuple[List[Polyline2D], int]:
+        """Section elements in worker processes.
+
+        Args:
+            elements: IFC elements of one storey, in processing order
+            cut_height: Height of the horizontal section
+
+        Returns:
+            Tuple of (polylines in element order, number of elements that produced polylines)
+
+        Raises:
+            ProcessingError: If the worker pool fails
+        """
+        return self.process_elements_at_heights(elements, [cut_height])[0]
+
+    def process_elements_at_heights(self, elements: List[Any], cut_heights: Sequence[float],
+                                    element_hashes: Optional[Dict[str, str]] = None,
+                                    failed_guids: Optional[Set[str]] = None
+                                    ) -> List[Tuple[List[Polyline2D], int]]:
+        """Section elements at several heights in worker processes, tessellating each once.
+
+        Args:
+            elements: IFC elements of one storey, in processing order
+            cut_heights: Heights of the horizontal sections
+            element_hashes: Precomputed geometry hashes by element GUID, if known
+            failed_guids: Set that receives the GUIDs of elements whose sectioning failed
+
+        Returns:
+            List of (polylines in element order, number of elements that produced polylines),
+            one per cut height
+
+        Raises:
+            ProcessingError: If the worker pool fails
+        """
+        shards = self.create_shards(elements)
+        if element_hashes:
+            hashes = [element_hashes.get(getattr(element, 'GlobalId', None)) for element in elements]
+            hash_shards = [hashes[start:start + len(shard)]
+                           for start, shard in zip(range(0, len(hashes), self._batch_size), shards)]
+        else:
+            hash_shards = [None] * len(shards)
+
+        try:
+            executor = self._get_executor()
+            # map() yields shard results in submission order, which keeps the merge deterministic
+            shard_results = list(executor.map(_section_shard, shards, repeat(tuple(cut_heights)), hash_shards))
+        except Exception as e:
+            self.shutdown()
+            raise ProcessingError(
+                error_code="MULTIPROCESSING_ERROR",
+                message=f"Feil i parallell element-snitting: {str(e)}",
+                context={
+                    "max_workers": self._max_workers,
+                    "shard_count": len(shards),
+                    "element_count": len(elements),
+                    "error": str(e)
+                }
+            )
+
+        polylines_per_height = [[] for _ in cut_heights]
+        element_counts = [0] * len(cut_heights)
+
+        for element_sections, failures in shard_results:
+            for sections in element_sections:
+                for height_index, records in enumerate(sections):
+                    if records:
+                        polylines_per_height[height_index].extend(decode_polylines(records))
+                        element_counts[height_index] += 1
+
+            for element_id, message in failures:
+                self._logger.warning(f"Failed to process element {element_id}: {message}")
+
+            if failures and failed_guids is not None:
+                guids_by_id = {element.id(): getattr(element, 'GlobalId', None) for element in elements}
+                failed_guids.update(guids_by_id[element_id] for element_id, _ in failures)
+
+        self._logger.debug(f"Sectioned {len(elements)} elements at {len(cut_heights)} heights in "
+                           f"{len(shards)} shards: {sum(map(len, polylines_per_height))} polylines")
+        return list(zip(polylines_per_height, element_counts))
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the worker pool, starting it on first use.
+
+        The pool is kept for the whole run so every worker opens the IFC file once.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_initialize_worker,
+                initargs=(self.config.input_path, self.config)
+            )
+        return self._executor
+
+    def get_performance_info(self) -> Dict[str, Any]:
+        """Get information about element sharding configuration.
+
+        Returns:
+            Dict[str, Any]: Element sharding configuration information
+        """
+        return {
+            "element_workers": self._max_workers,
+            "element_batch_size": self._batch_size,
+            "pool_running": self._executor is not None
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            try:
+                self._executor.shutdown(wait=True)
+            except Exception as e:
+                self._logger.debug(f"Error during element pool shutdown: {e}")
+            self._executor = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the worker pool when pickled into a storey worker process."""
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.shutdown()
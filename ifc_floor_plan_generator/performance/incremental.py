@@ -0,0 +1,282 @@
+"""
+Incremental regeneration for IFC Floor Plan Generator.
+
+Keeps the per-element fingerprints and section polylines of the previous run
+next to its outputs, so that a new revision of the model only re-sections
+changed or added elements and only rewrites output files whose content changed.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import Config, StoreyResult
+from ..geometry.disk_cache import ElementGeometryHasher
+from .element_sharding import PolylineRecord, encode_polylines
+
+
+# Bump whenever the state layout or the meaning of a fingerprint changes
+STATE_FORMAT_VERSION = 2
+STATE_MAGIC = b"FPIS"
+STATE_FILENAME = "floorplan_state.bin"
+
+# Fingerprint stored for elements whose sectioning failed; it matches no element,
+# so the next run sections them again instead of reusing an empty result
+FAILED_FINGERPRINT = ""
+
+# Previous outputs by output name: (content hash, SVG path, GeoJSON path, binary path)
+OutputRecord = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+def config_fingerprint(config: Config) -> str:
+    """Hash the configuration that determines section polylines.
+
+    Rendering and output settings are left out; they are covered by the
+    content hash of each output file.
+
+    Args:
+        config: Configuration of the run
+
+    Returns:
+        str: Hex digest of the section-relevant configuration
+    """
+    geometry = replace(config.geometry, disk_cache_dir=None, disk_cache_max_mb=1024.0, cache_geometry=True)
+    relevant = (
+        STATE_FORMAT_VERSION,
+        config.cut_offset_m,
+        config.additional_cut_offsets_m,
+        sorted(config.per_storey_overrides.items()),
+        config.class_filters,
+        config.units,
+        geometry,
+        config.tolerances,
+    )
+    return hashlib.blake2b(repr(relevant).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ElementFingerprinter:
+    """Fingerprints elements by GUID, class and geometry-relevant attributes."""
+
+    def __init__(self, include_openings: bool = True):
+        """Initialize element fingerprinter.
+
+        Args:
+            include_openings: Include openings, for geometry with opening subtraction
+        """
+        self._hasher = ElementGeometryHasher(include_openings=include_openings)
+
+    def element_hash(self, element: Any) -> str:
+        """Get the geometry hash of an element, the part of its fingerprint after the GUID.
+
+        Args:
+            element: IFC element (IfcProduct or similar)
+
+        Returns:
+            str: Hex digest of the element's geometry-relevant attributes
+        """
+        return self._hasher.hash_element(element)
+
+    def fingerprint(self, element: Any, element_hash: Optional[str] = None) -> str:
+        """Get the fingerprint of an element.
+
+        Args:
+            element: IFC element (IfcProduct or similar)
+            element_hash: Geometry hash from element_hash(), if already computed
+
+        Returns:
+            str: Fingerprint that changes whenever the element's section can change
+        """
+        if element_hash is None:
+            element_hash = self._hasher.hash_element(element)
+        return f"{element.GlobalId}:{element_hash}"
+
+
+@dataclass
+class StoreyState:
+    """Elements and their section polylines of one storey in a previous run."""
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+    polylines: Dict[str, Dict[float, List[PolylineRecord]]] = field(default_factory=dict)
+
+
+class IncrementalState:
+    """State of a floor plan run that the next run can build on.
+
+    The state records, per storey, the fingerprint of every sectioned element and
+    the polylines it produced at each cut height, and, per output file set, the
+    content hash it was rendered from.
+    """
+
+    def __init__(self, config_hash: str, unit_scale: float,
+                 storeys: Optional[Dict[str, StoreyState]] = None,
+                 outputs: Optional[Dict[str, OutputRecord]] = None):
+        """Initialize incremental state.
+
+        Args:
+            config_hash: Fingerprint of the section-relevant configuration
+            unit_scale: Unit scale of the model the state was built from
+            storeys: Element state by storey name
+            outputs: Previous outputs by output name
+        """
+        self.config_hash = config_hash
+        self.unit_scale = unit_scale
+        self.storeys = storeys or {}
+        self.outputs = outputs or {}
+
+    @classmethod
+    def from_results(cls, config_hash: str, unit_scale: float,
+                     results: List[StoreyResult]) -> 'IncrementalState':
+        """Build the state of a finished run.
+
+        Args:
+            config_hash: Fingerprint of the section-relevant configuration
+            unit_scale: Unit scale of the processed model
+            results: Storey results with element fingerprints and output hashes
+
+        Returns:
+            IncrementalState: State for the next run
+        """
+        state = cls(config_hash, unit_scale)
+
+        for result in results:
+            sections = [(result.cut_height, result.polylines)]
+            sections.extend((section.cut_height, section.polylines) for section in result.additional_sections)
+
+            polylines: Dict[str, Dict[float, List[PolylineRecord]]] = defaultdict(dict)
+            for cut_height, section_polylines in sections:
+                for guid, records in _group_records(section_polylines).items():
+                    polylines[guid][cut_height] = records
+
+            state.storeys[result.storey_name] = StoreyState(
+                fingerprints=dict(result.element_fingerprints),
+                polylines={guid: polylines.get(guid, {}) for guid in result.element_fingerprints}
+            )
+
+            state._record_output(result.storey_name, result.output_hash, result.svg_file, result.geojson_file,
+                                 result.binary_file)
+            for section in result.additional_sections:
+                state._record_output(f"{result.storey_name} {section.cut_height:.2f}m", section.output_hash,
+                                     section.svg_file, section.geojson_file, section.binary_file)
+
+        return state
+
+    def _record_output(self, name: str, output_hash: Optional[str],
+                       svg_file: Optional[str], geojson_file: Optional[str], binary_file: Optional[str]) -> None:
+        """Record an output file set that was written or reused."""
+        if output_hash and svg_file:
+            self.outputs[name] = (output_hash, svg_file, geojson_file, binary_file)
+
+    def reusable_polylines(self, storey_name: str,
+                           fingerprints: Dict[str, str]) -> Dict[str, Dict[float, List[PolylineRecord]]]:
+        """Get the previous polylines of elements that have not changed.
+
+        Args:
+            storey_name: Name of the storey
+            fingerprints: Current fingerprints by element GUID
+
+        Returns:
+            Dict mapping unchanged element GUIDs to their polyline records by cut height
+        """
+        storey = self.storeys.get(storey_name)
+        if storey is None:
+            return {}
+
+        return {
+            guid: storey.polylines.get(guid, {})
+            for guid, fingerprint in fingerprints.items()
+            if storey.fingerprints.get(guid) == fingerprint
+        }
+
+    def removed_count(self, storey_name: str, fingerprints: Dict[str, str]) -> int:
+        """Count elements of the previous run that are gone from a storey.
+
+        Args:
+            storey_name: Name of the storey
+            fingerprints: Current fingerprints by element GUID
+
+        Returns:
+            int: Number of previously sectioned elements not present any more
+        """
+        storey = self.storeys.get(storey_name)
+        if storey is None:
+            return 0
+        return sum(1 for guid in storey.fingerprints if guid not in fingerprints)
+
+    def previous_output(self, name: str) -> Optional[OutputRecord]:
+        """Get the previous output file set of a storey or section.
+
+        Args:
+            name: Output name (storey name, with the cut height for additional sections)
+
+        Returns:
+            Tuple of (content hash, SVG path, GeoJSON path, binary path) or None
+        """
+        return self.outputs.get(name)
+
+    def save(self, path: str) -> None:
+        """Write the state file atomically.
+
+        Args:
+            path: Path of the state file
+        """
+        payload = {
+            "config_hash": self.config_hash,
+            "unit_scale": self.unit_scale,
+            "storeys": {name: (storey.fingerprints, storey.polylines) for name, storey in self.storeys.items()},
+            "outputs": self.outputs,
+        }
+        data = zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), 6)
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(STATE_MAGIC + bytes([STATE_FORMAT_VERSION]) + data)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str, config_hash: str) -> Optional['IncrementalState']:
+        """Read the state of a previous run.
+
+        Args:
+            path: Path of the state file
+            config_hash: Fingerprint of the current section-relevant configuration
+
+        Returns:
+            IncrementalState or None if there is no compatible state
+        """
+        logger = logging.getLogger(__name__)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            header_length = len(STATE_MAGIC) + 1
+            if data[:len(STATE_MAGIC)] != STATE_MAGIC or data[len(STATE_MAGIC)] != STATE_FORMAT_VERSION:
+                logger.info("Ignoring incremental state written by another version")
+                return None
+            payload = pickle.loads(zlib.decompress(data[header_length:]))
+        except Exception as e:
+            logger.warning(f"Could not read incremental state {path}: {e}")
+            return None
+
+        if payload["config_hash"] != config_hash:
+            logger.info("Configuration changed since the previous run, regenerating all storeys")
+            return None
+
+        storeys = {
+            name: StoreyState(fingerprints=fingerprints, polylines=polylines)
+            for name, (fingerprints, polylines) in payload["storeys"].items()
+        }
+        return cls(config_hash, payload["unit_scale"], storeys, payload["outputs"])
+
+
+def _group_records(polylines: List[Any]) -> Dict[str, List[PolylineRecord]]:
+    """Encode polylines grouped by element GUID, keeping their order."""
+    grouped: Dict[str, List[PolylineRecord]] = defaultdict(list)
+    for polyline, record in zip(polylines, encode_polylines(polylines)):
+        grouped[polyline.element_guid].append(record)
+    return grouped
@@ -1,11 +1,12 @@
 """
 Rendering module for IFC Floor Plan Generator.
 
-Provides SVG and GeoJSON output generation with configurable styling and output management.
+Provides SVG, GeoJSON and binary output generation with configurable styling and output management.
 """
 
 from .svg_renderer import SVGRenderer
 from .geojson_renderer import GeoJSONRenderer
+from .binary_renderer import BinaryRenderer, decode_binary_floor_plan
 from .manifest_generator import ManifestGenerator
 from .output_manager import OutputManager
 from .output_coordinator import OutputCoordinator
@@ -14,6 +15,8 @@ from .models import RenderStyle, StyleAttributes
 __all__ = [
     "SVGRenderer",
     "GeoJSONRenderer",
+    "BinaryRenderer",
+    "decode_binary_floor_plan",
     "ManifestGenerator",
     "OutputManager",
     "OutputCoordinator",
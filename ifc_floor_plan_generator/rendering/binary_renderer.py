@@ -0,0 +1,270 @@
+"""
+Binary renderer for IFC Floor Plan Generator.
+
+Renders polylines to a compact binary floor plan file for web viewers, as an
+alternative to GeoJSON. The semantic properties that GeoJSON repeats on every
+feature are stored once per IFC class in a shared property table, and
+coordinates are quantized to integers and delta encoded.
+
+File layout (little-endian):
+
+    magic "FPLB" | format version (uint8) | 3 reserved bytes
+    header length (uint32) | header (UTF-8 JSON)
+    property index per feature (uint32[feature_count])
+    flags per feature (uint8[feature_count], bit 0: closed)
+    point count per feature (uint32[feature_count])
+    element GUIDs (UTF-8, newline separated, guid_bytes long)
+    coordinates (coordinate_bytes long)
+
+The header holds the collection properties, the property table, the
+configuration info shared by all features, and the quantization step and
+origin. Coordinates are stored as x, y pairs of integers q, where
+value = origin + q * step, each as the zigzag varint encoded difference to
+the previous integer of the same axis over the whole file.
+"""
+
+import json
+import logging
+import struct
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from ..models import Polyline2D
+from ..errors.handler import ErrorHandler
+from ..errors.exceptions import ProcessingError
+from ..geometry.polyline_batch import pack_polylines
+from .geojson_renderer import GeoJSONRenderer
+
+if TYPE_CHECKING:
+    from ..models import Config
+
+
+BINARY_MAGIC = b"FPLB"
+BINARY_FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<4sB3xI")
+
+
+class BinaryRenderer:
+    """Renders polylines to the compact binary floor plan format."""
+
+    def __init__(self, config: Optional['Config'] = None):
+        """Initialize binary renderer with optional configuration.
+
+        Args:
+            config: Main configuration object containing output settings
+        """
+        self.config = config
+        self._logger = logging.getLogger(__name__)
+        self._error_handler = ErrorHandler()
+        # Semantic properties are the same as in GeoJSON output
+        self._geojson_renderer = GeoJSONRenderer(config)
+
+    def render_to_bytes(self, polylines: List[Polyline2D], metadata: Dict[str, Any]) -> bytes:
+        """Render polylines to a binary floor plan.
+
+        Polylines with fewer than 2 points are left out, as in GeoJSON output.
+
+        Args:
+            polylines: List of polylines to render
+            metadata: Additional metadata (storey info, etc.)
+
+        Returns:
+            bytes: Binary floor plan
+
+        Raises:
+            ProcessingError: If binary generation fails
+        """
+        try:
+            polylines = [polyline for polyline in polylines if len(polyline.points) >= 2]
+            storey_name = metadata.get("storey_name", "Unknown")
+            step = 10.0 ** -self.get_coordinate_precision()
+
+            # Shared property table, one entry per IFC class
+            property_ids: Dict[str, int] = {}
+            property_table = []
+            for polyline in polylines:
+                if polyline.ifc_class not in property_ids:
+                    property_ids[polyline.ifc_class] = len(property_table)
+                    property_table.append(self._geojson_renderer.validate_semantic_metadata(
+                        self._geojson_renderer.create_feature_properties(polyline.ifc_class, storey_name)
+                    ))
+
+            coordinates, offsets = pack_polylines(polylines)
+            origin = coordinates.min(axis=0) if len(coordinates) else np.zeros(2)
+            quantized = np.rint((coordinates - origin) / step).astype(np.int64)
+            deltas = np.diff(quantized, axis=0, prepend=np.zeros((1, 2), dtype=np.int64))
+            coordinate_bytes = _encode_varints(deltas.ravel())
+            guid_bytes = "\n".join(polyline.element_guid for polyline in polylines).encode('utf-8')
+
+            header = {
+                "properties": self._geojson_renderer.create_collection_properties(metadata),
+                "property_table": property_table,
+                "config_info": self._geojson_renderer.enhance_metadata_with_config(metadata).get("config_info", {}),
+                "feature_count": len(polylines),
+                "point_count": len(coordinates),
+                "quantization": {"step": step, "origin": origin.tolist()},
+                "guid_bytes": len(guid_bytes),
+                "coordinate_bytes": len(coordinate_bytes)
+            }
+            if self.config is not None:
+                cut_height = metadata.get("cut_height")
+                header["processing_config"] = {
+                    "cut_height": cut_height if cut_height is not None else self.config.get_storey_cut_height(storey_name),
+                    "tolerances": {
+                        "slice_tol": self.config.tolerances.slice_tol,
+                        "chain_tol": self.config.tolerances.chain_tol
+                    }
+                }
+            header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+            data = b"".join([
+                _PREAMBLE.pack(BINARY_MAGIC, BINARY_FORMAT_VERSION, len(header_bytes)),
+                header_bytes,
+                np.array([property_ids[polyline.ifc_class] for polyline in polylines], dtype='<u4').tobytes(),
+                np.array([polyline.is_closed for polyline in polylines], dtype=np.uint8).tobytes(),
+                np.diff(offsets).astype('<u4').tobytes(),
+                guid_bytes,
+                coordinate_bytes
+            ])
+
+            self._logger.debug(f"Rendered {len(polylines)} polylines to {len(data)} bytes of binary floor plan")
+            return data
+
+        except Exception as e:
+            self._logger.error(f"Binary rendering failed: {e}")
+            raise ProcessingError(
+                error_code="BINARY_RENDER_FAILED",
+                message=f"Binær rendering feilet: {str(e)}",
+                context={"error": str(e), "polyline_count": len(polylines)}
+            )
+
+    def render_and_save(self, polylines: List[Polyline2D], output_manager,
+                        storey_name: str, index: int, metadata: Dict[str, Any]) -> str:
+        """Render polylines to a binary floor plan and save to file.
+
+        Args:
+            polylines: List of polylines to render
+            output_manager: OutputManager instance for file operations
+            storey_name: Name of the storey for filename generation
+            index: Index for filename generation
+            metadata: Metadata for the floor plan
+
+        Returns:
+            str: Full path to the saved binary file
+
+        Raises:
+            WriteFailedError: If file writing fails
+            ProcessingError: If binary generation fails
+        """
+        content = self.render_to_bytes(polylines, metadata)
+        filename = output_manager.generate_binary_filename(storey_name, index)
+        file_path = output_manager.write_binary_file(content, filename)
+
+        self._logger.info(f"Rendered and saved binary floor plan: {file_path}")
+        return file_path
+
+    def should_generate_binary(self) -> bool:
+        """Check if binary generation is enabled in configuration.
+
+        Returns:
+            bool: True if binary files should be generated, False otherwise
+        """
+        if self.config is None:
+            return False
+
+        return self.config.output.write_binary
+
+    def get_coordinate_precision(self) -> int:
+        """Get the number of decimals kept in stored coordinates.
+
+        Returns:
+            int: Coordinate precision in decimals
+        """
+        if self.config is None:
+            return 3
+
+        return self.config.output.binary_coordinate_precision
+
+
+def decode_binary_floor_plan(data: bytes) -> Dict[str, Any]:
+    """Decode a binary floor plan, e.g. for checks or Python consumers.
+
+    Args:
+        data: Binary floor plan as written by BinaryRenderer
+
+    Returns:
+        Dict[str, Any]: Header fields plus a "features" list with element GUID,
+        closedness, property table index and (n, 2) coordinate array per feature
+
+    Raises:
+        ValueError: If the data is not a binary floor plan of a known version
+    """
+    magic, version, header_length = _PREAMBLE.unpack_from(data)
+    if magic != BINARY_MAGIC or version != BINARY_FORMAT_VERSION:
+        raise ValueError("Not a binary floor plan of a supported version")
+
+    position = _PREAMBLE.size
+    header = json.loads(data[position:position + header_length].decode('utf-8'))
+    position += header_length
+
+    count = header["feature_count"]
+    property_ids = np.frombuffer(data, dtype='<u4', count=count, offset=position)
+    position += 4 * count
+    flags = np.frombuffer(data, dtype=np.uint8, count=count, offset=position)
+    position += count
+    point_counts = np.frombuffer(data, dtype='<u4', count=count, offset=position)
+    position += 4 * count
+    guids = data[position:position + header["guid_bytes"]].decode('utf-8').split("\n") if count else []
+    position += header["guid_bytes"]
+
+    deltas = _decode_varints(data[position:position + header["coordinate_bytes"]]).reshape(-1, 2)
+    quantization = header["quantization"]
+    coordinates = np.cumsum(deltas, axis=0) * quantization["step"] + np.array(quantization["origin"])
+
+    offsets = np.concatenate([[0], np.cumsum(point_counts, dtype=np.int64)])
+    header["features"] = [
+        {
+            "element_guid": guids[i],
+            "is_closed": bool(flags[i] & 1),
+            "property_index": int(property_ids[i]),
+            "coordinates": coordinates[offsets[i]:offsets[i + 1]]
+        }
+        for i in range(count)
+    ]
+    return header
+
+
+def _encode_varints(values: np.ndarray) -> bytes:
+    """Zigzag varint encode signed integers, 7 bits per byte, least significant first."""
+    values = values.astype(np.int64)
+    encoded = ((values << 1) ^ (values >> 63)).view(np.uint64)
+
+    lengths = np.ones(len(encoded), dtype=np.int64)
+    for shift in range(7, 64, 7):
+        lengths += encoded >= (np.uint64(1) << np.uint64(shift))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+
+    output = np.zeros(int(ends[-1]) if len(ends) else 0, dtype=np.uint8)
+    for byte in range(int(lengths.max()) if len(lengths) else 0):
+        present = lengths > byte
+        chunk = (encoded[present] >> np.uint64(7 * byte)) & np.uint64(0x7F)
+        more = (lengths[present] > byte + 1).astype(np.uint64) << np.uint64(7)
+        output[starts[present] + byte] = (chunk | more).astype(np.uint8)
+    return output.tobytes()
+
+
+def _decode_varints(data: bytes) -> np.ndarray:
+    """Decode zigzag varints written by _encode_varints."""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if not len(raw):
+        return np.zeros(0, dtype=np.int64)
+
+    ends = np.flatnonzero(raw < 0x80)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    value_ids = np.repeat(np.arange(len(ends)), ends - starts + 1)
+    shifts = (np.arange(len(raw)) - starts[value_ids]).astype(np.uint64) * np.uint64(7)
+    parts = (raw & 0x7F).astype(np.uint64) << shifts
+    encoded = np.add.reduceat(parts, starts)
+    return (encoded >> np.uint64(1)).astype(np.int64) ^ -(encoded & np.uint64(1)).astype(np.int64)
@@ -125,7 +125,7 @@ class GeoJSONRenderer:
             geojson = {
                 "type": "FeatureCollection",
                 "features": [],
-                "properties": self._create_collection_properties(metadata)
+                "properties": self.create_collection_properties(metadata)
             }
             
             # Convert each polyline to a GeoJSON feature
@@ -246,7 +246,8 @@ class GeoJSONRenderer:
                 polyline.ifc_class, 
                 storey_name, 
                 polyline.element_guid,
-                additional_metadata
+                additional_metadata,
+                metadata.get("cut_height")
             )
             
             # Create feature
@@ -389,7 +390,7 @@ class GeoJSONRenderer:
         else:
             return "Øvrige elementer"
     
-    def _create_collection_properties(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def create_collection_properties(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Create properties for the GeoJSON FeatureCollection.
         
         Args:
@@ -419,7 +420,7 @@ class GeoJSONRenderer:
         return {
             "type": "FeatureCollection",
             "features": [],
-            "properties": self._create_collection_properties(metadata)
+            "properties": self.create_collection_properties(metadata)
         }
     
     def render_to_string(self, polylines: List[Polyline2D], metadata: Dict[str, Any], 
@@ -597,7 +598,8 @@ class GeoJSONRenderer:
         return properties
     
     def create_enhanced_feature_properties(self, ifc_class: str, storey_name: str, 
-                                         element_guid: str, additional_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                                         element_guid: str, additional_metadata: Optional[Dict[str, Any]] = None,
+                                         cut_height: Optional[float] = None) -> Dict[str, Any]:
         """Create enhanced feature properties with all required semantic metadata.
         
         This method ensures all required properties are included and validates the result.
@@ -607,6 +609,8 @@ class GeoJSONRenderer:
             storey_name: Name of the building storey
             element_guid: GUID of the element
             additional_metadata: Optional additional metadata to include
+            cut_height: Height the polylines were cut at; looked up from the
+                configured storey cut height if not given
             
         Returns:
             Dict[str, Any]: Complete and validated properties dictionary
@@ -624,7 +628,7 @@ class GeoJSONRenderer:
         # Add configuration-specific metadata if available
         if self.config is not None:
             properties["processing_config"] = {
-                "cut_height": self.config.get_storey_cut_height(storey_name),
+                "cut_height": cut_height if cut_height is not None else self.config.get_storey_cut_height(storey_name),
                 "tolerances": {
                     "slice_tol": self.config.tolerances.slice_tol,
                     "chain_tol": self.config.tolerances.chain_tol
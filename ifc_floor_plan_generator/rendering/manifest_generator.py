@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-from ..models import StoreyResult, ManifestData, Config
+from ..models import StoreyResult, ManifestData, Config, BoundingBox
 from ..errors.handler import ErrorHandler
 from ..errors.exceptions import ProcessingError
 
@@ -96,19 +96,23 @@ class ManifestGenerator:
             "name": storey.storey_name,
             "cut_height": storey.cut_height,
             "element_count": storey.element_count,
+            "skipped_element_count": storey.skipped_element_count,
             "polyline_count": len(storey.polylines)
         }
         
-        # Bounding box information
-        if storey.bounds:
+        # Bounding box information (the pipeline stores bounds as a plain dictionary)
+        bounds = storey.bounds
+        if isinstance(bounds, dict) and bounds:
+            bounds = BoundingBox(**bounds)
+        if bounds:
             metadata["bounds"] = {
-                "min_x": storey.bounds.min_x,
-                "min_y": storey.bounds.min_y,
-                "max_x": storey.bounds.max_x,
-                "max_y": storey.bounds.max_y,
-                "width": storey.bounds.width,
-                "height": storey.bounds.height,
-                "center": storey.bounds.center
+                "min_x": bounds.min_x,
+                "min_y": bounds.min_y,
+                "max_x": bounds.max_x,
+                "max_y": bounds.max_y,
+                "width": bounds.width,
+                "height": bounds.height,
+                "center": bounds.center
             }
         else:
             metadata["bounds"] = None
@@ -119,6 +123,8 @@ class ManifestGenerator:
             metadata["output_files"]["svg"] = storey.svg_file
         if storey.geojson_file:
             metadata["output_files"]["geojson"] = storey.geojson_file
+        if storey.binary_file:
+            metadata["output_files"]["binary"] = storey.binary_file
         
         # Polyline statistics
         if storey.polylines:
@@ -127,6 +133,35 @@ class ManifestGenerator:
         # IFC class distribution
         metadata["ifc_class_distribution"] = self._calculate_ifc_class_distribution(storey.polylines)
         
+        # Sections at additional cut heights
+        metadata["additional_sections"] = []
+        for section in storey.additional_sections:
+            section_files = {}
+            if section.svg_file:
+                section_files["svg"] = section.svg_file
+            if section.geojson_file:
+                section_files["geojson"] = section.geojson_file
+            if section.binary_file:
+                section_files["binary"] = section.binary_file
+            section_metadata = {
+                "cut_height": section.cut_height,
+                "element_count": section.element_count,
+                "polyline_count": len(section.polylines),
+                "output_files": section_files
+            }
+            if storey.element_fingerprints:
+                section_metadata["outputs_reused"] = section.outputs_reused
+            metadata["additional_sections"].append(section_metadata)
+        
+        # Reuse of the previous run (incremental runs only)
+        if storey.element_fingerprints:
+            metadata["incremental"] = {
+                "reused_element_count": storey.reused_element_count,
+                "resectioned_element_count": len(storey.element_fingerprints) - storey.reused_element_count,
+                "removed_element_count": storey.removed_element_count,
+                "outputs_reused": storey.outputs_reused
+            }
+        
         return metadata
     
     def create_config_snapshot(self, config: Config) -> Dict[str, Any]:
@@ -143,11 +178,13 @@ class ManifestGenerator:
             "input_path": config.input_path,
             "output_dir": config.output_dir,
             "cut_offset_m": config.cut_offset_m,
+            "additional_cut_offsets_m": list(config.additional_cut_offsets_m),
             
             # Per-storey overrides
             "per_storey_overrides": {
                 name: {
-                    "cut_offset_m": override.cut_offset_m
+                    "cut_offset_m": override.cut_offset_m,
+                    "additional_cut_offsets_m": override.additional_cut_offsets_m
                 }
                 for name, override in config.per_storey_overrides.items()
             },
@@ -169,7 +206,9 @@ class ManifestGenerator:
                 "use_world_coords": config.geometry.use_world_coords,
                 "subtract_openings": config.geometry.subtract_openings,
                 "sew_shells": config.geometry.sew_shells,
-                "cache_geometry": config.geometry.cache_geometry
+                "cache_geometry": config.geometry.cache_geometry,
+                "section_backend": config.geometry.section_backend,
+                "z_prefilter": config.geometry.z_prefilter
             },
             
             # Tolerances
@@ -192,13 +231,17 @@ class ManifestGenerator:
                 "svg_filename_pattern": config.output.svg_filename_pattern,
                 "geojson_filename_pattern": config.output.geojson_filename_pattern,
                 "manifest_filename": config.output.manifest_filename,
-                "write_geojson": config.output.write_geojson
+                "write_geojson": config.output.write_geojson,
+                "write_binary": config.output.write_binary,
+                "binary_filename_pattern": config.output.binary_filename_pattern,
+                "binary_coordinate_precision": config.output.binary_coordinate_precision
             },
             
             # Performance configuration
             "performance": {
                 "multiprocessing": config.performance.multiprocessing,
-                "max_workers": config.performance.max_workers
+                "max_workers": config.performance.max_workers,
+                "incremental": config.performance.incremental
             }
         }
         
@@ -349,6 +392,8 @@ class ManifestGenerator:
             return {
                 "total_storeys": 0,
                 "total_elements": 0,
+                "total_skipped_elements": 0,
+                "total_reused_elements": 0,
                 "total_polylines": 0,
                 "total_points": 0,
                 "ifc_classes_found": [],
@@ -356,6 +401,8 @@ class ManifestGenerator:
             }
         
         total_elements = sum(storey.element_count for storey in storeys)
+        total_skipped_elements = sum(storey.skipped_element_count for storey in storeys)
+        total_reused_elements = sum(storey.reused_element_count for storey in storeys)
         total_polylines = sum(len(storey.polylines) for storey in storeys)
         
         # Calculate total points
@@ -373,10 +420,14 @@ class ManifestGenerator:
                 output_files_count += 1
             if storey.geojson_file:
                 output_files_count += 1
+            if storey.binary_file:
+                output_files_count += 1
         
         return {
             "total_storeys": len(storeys),
             "total_elements": total_elements,
+            "total_skipped_elements": total_skipped_elements,
+            "total_reused_elements": total_reused_elements,
             "total_polylines": total_polylines,
             "total_points": total_points,
             "ifc_classes_found": sorted(list(all_ifc_classes)),
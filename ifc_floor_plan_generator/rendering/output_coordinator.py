@@ -1,19 +1,24 @@
 """
 Output coordinator for IFC Floor Plan Generator.
 
-Coordinates all output file generation including SVG, GeoJSON, and manifest files.
+Coordinates all output file generation including SVG, GeoJSON, binary, and manifest files.
 Ensures consistent filename patterns and unified pipeline integration.
 """
 
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from ..models import StoreyResult, Config
+import os
+from dataclasses import replace
+from typing import List, Dict, Any, Optional, Tuple
+from ..models import StoreyResult, CutSection, Config, BoundingBox
 from .svg_renderer import SVGRenderer
 from .geojson_renderer import GeoJSONRenderer
+from .binary_renderer import BinaryRenderer
 from .manifest_generator import ManifestGenerator
 from .output_manager import OutputManager
 from ..errors.handler import ErrorHandler
 from ..errors.exceptions import ProcessingError
+from ..performance.element_sharding import encode_polylines
 
 
 class OutputCoordinator:
@@ -32,6 +37,7 @@ class OutputCoordinator:
         # Initialize renderers and managers
         self.svg_renderer = SVGRenderer(config.rendering)
         self.geojson_renderer = GeoJSONRenderer(config)
+        self.binary_renderer = BinaryRenderer(config)
         self.manifest_generator = ManifestGenerator()
         self.output_manager = OutputManager(config)
     
@@ -39,14 +45,19 @@ class OutputCoordinator:
         self, 
         storeys: List[StoreyResult], 
         input_file: str,
-        processing_time: float
+        processing_time: float,
+        previous_state=None
     ) -> Dict[str, Any]:
         """Generate all output files for processed storeys.
         
+        In incremental mode, files whose content hash matches the previous run
+        are kept as they are instead of being rendered again.
+        
         Args:
             storeys: List of processed storey results
             input_file: Path to the input IFC file
             processing_time: Total processing time in seconds
+            previous_state: IncrementalState of the previous run, if any
             
         Returns:
             Dict[str, Any]: Summary of generated files and metadata
@@ -58,25 +69,35 @@ class OutputCoordinator:
             output_summary = {
                 "svg_files": [],
                 "geojson_files": [],
+                "binary_files": [],
                 "manifest_file": None,
+                "reused_files": [],
                 "total_files": 0,
                 "errors": []
             }
             
-            # Generate SVG and GeoJSON files for each storey
+            # Generate SVG, GeoJSON and binary files for each storey
             for index, storey in enumerate(storeys):
                 try:
-                    # Generate SVG file
-                    svg_file = self._generate_svg_for_storey(storey, index)
+                    # Generate SVG, GeoJSON and binary files (GeoJSON and binary are conditional)
+                    (svg_file, geojson_file, binary_file,
+                     storey.output_hash, storey.outputs_reused) = self._generate_files(
+                        storey, index, output_summary, previous_state
+                    )
                     if svg_file:
-                        output_summary["svg_files"].append(svg_file)
                         storey.svg_file = svg_file
-                    
-                    # Generate GeoJSON file (conditional)
-                    geojson_file = self._generate_geojson_for_storey(storey, index)
                     if geojson_file:
-                        output_summary["geojson_files"].append(geojson_file)
                         storey.geojson_file = geojson_file
+                    if binary_file:
+                        storey.binary_file = binary_file
+                    
+                    # Additional cut heights are written as separate files per height
+                    for section in storey.additional_sections:
+                        section_storey = self._section_as_storey(storey, section)
+                        (section.svg_file, section.geojson_file, section.binary_file,
+                         section.output_hash, section.outputs_reused) = self._generate_files(
+                            section_storey, index, output_summary, previous_state
+                        )
                         
                 except Exception as e:
                     error_msg = f"Failed to generate outputs for storey {storey.storey_name}: {e}"
@@ -98,6 +119,7 @@ class OutputCoordinator:
             output_summary["total_files"] = (
                 len(output_summary["svg_files"]) + 
                 len(output_summary["geojson_files"]) + 
+                len(output_summary["binary_files"]) + 
                 (1 if output_summary["manifest_file"] else 0)
             )
             
@@ -116,6 +138,121 @@ class OutputCoordinator:
                 }
             )
     
+    def _generate_files(self, storey: StoreyResult, index: int, output_summary: Dict[str, Any],
+                        previous_state=None) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str], bool]:
+        """Generate or reuse the SVG, GeoJSON and binary files of a storey or section.
+        
+        Args:
+            storey: StoreyResult to render
+            index: Index for filename generation
+            output_summary: Summary the file paths are added to
+            previous_state: IncrementalState of the previous run, if any
+            
+        Returns:
+            Tuple of (SVG path, GeoJSON path, binary path, content hash in incremental mode,
+            whether files were reused)
+        """
+        output_hash = None
+        if self.config.performance.incremental:
+            output_hash = self._output_hash(storey, index)
+            reused = self._previous_files(storey.storey_name, output_hash, previous_state)
+            if reused:
+                svg_file, geojson_file, binary_file = reused
+                output_summary["svg_files"].append(svg_file)
+                output_summary["reused_files"].append(svg_file)
+                if geojson_file:
+                    output_summary["geojson_files"].append(geojson_file)
+                    output_summary["reused_files"].append(geojson_file)
+                if binary_file:
+                    output_summary["binary_files"].append(binary_file)
+                    output_summary["reused_files"].append(binary_file)
+                self._logger.debug(f"Reusing unchanged outputs for storey {storey.storey_name}")
+                return svg_file, geojson_file, binary_file, output_hash, True
+        
+        svg_file = self._generate_svg_for_storey(storey, index)
+        if svg_file:
+            output_summary["svg_files"].append(svg_file)
+        geojson_file = self._generate_geojson_for_storey(storey, index)
+        if geojson_file:
+            output_summary["geojson_files"].append(geojson_file)
+        binary_file = self._generate_binary_for_storey(storey, index)
+        if binary_file:
+            output_summary["binary_files"].append(binary_file)
+        
+        # Only a complete set of files can be reused by the next run
+        complete = (svg_file
+                    and (geojson_file or not self.geojson_renderer.should_generate_geojson())
+                    and (binary_file or not self.binary_renderer.should_generate_binary()))
+        return svg_file, geojson_file, binary_file, output_hash if complete else None, False
+    
+    def _output_hash(self, storey: StoreyResult, index: int) -> str:
+        """Hash everything the output files of a storey are rendered from.
+        
+        Args:
+            storey: StoreyResult to render
+            index: Index for filename generation
+            
+        Returns:
+            str: Hex digest of the output content
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((
+            storey.storey_name, index, storey.cut_height, storey.element_count, sorted(storey.bounds.items()),
+            self.config.rendering, self.config.output, self.config.units
+        )).encode('utf-8'))
+        for ifc_class, element_guid, is_closed, coordinates in encode_polylines(storey.polylines):
+            digest.update(repr((ifc_class, element_guid, is_closed)).encode('utf-8'))
+            digest.update(coordinates.tobytes())
+        return digest.hexdigest()
+    
+    def _previous_files(self, name: str, output_hash: str,
+                        previous_state=None) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        """Get the previous run's files for unchanged output content.
+        
+        Args:
+            name: Output name of the storey or section
+            output_hash: Current content hash
+            previous_state: IncrementalState of the previous run, if any
+            
+        Returns:
+            Tuple of (SVG path, GeoJSON path, binary path) if the files can be reused, otherwise None
+        """
+        previous = previous_state.previous_output(name) if previous_state else None
+        if previous is None:
+            return None
+        
+        previous_hash, svg_file, geojson_file, binary_file = previous
+        if previous_hash != output_hash or not os.path.exists(svg_file):
+            return None
+        if self.geojson_renderer.should_generate_geojson() and not (geojson_file and os.path.exists(geojson_file)):
+            return None
+        if self.binary_renderer.should_generate_binary() and not (binary_file and os.path.exists(binary_file)):
+            return None
+        return svg_file, geojson_file, binary_file
+    
+    def _section_as_storey(self, storey: StoreyResult, section: CutSection) -> StoreyResult:
+        """Present an additional cut section as a storey result for rendering.
+        
+        Args:
+            storey: Storey the section belongs to
+            section: Section at an additional cut height
+            
+        Returns:
+            StoreyResult: Storey result named after the storey and the cut height
+        """
+        return replace(
+            storey,
+            storey_name=f"{storey.storey_name} {section.cut_height:.2f}m",
+            cut_height=section.cut_height,
+            polylines=section.polylines,
+            bounds=section.bounds,
+            element_count=section.element_count,
+            svg_file=None,
+            geojson_file=None,
+            binary_file=None,
+            additional_sections=[]
+        )
+    
     def _generate_svg_for_storey(self, storey: StoreyResult, index: int) -> Optional[str]:
         """Generate SVG file for a single storey.
         
@@ -131,9 +268,12 @@ class OutputCoordinator:
                 self._logger.debug(f"No polylines to render for storey {storey.storey_name}")
                 return None
             
-            # Set viewport based on storey bounds
-            if storey.bounds:
-                self.svg_renderer.set_viewport(storey.bounds)
+            # Set viewport based on storey bounds (the pipeline stores bounds as a plain dictionary)
+            bounds = storey.bounds
+            if isinstance(bounds, dict) and bounds:
+                bounds = BoundingBox(**bounds)
+            if bounds:
+                self.svg_renderer.set_viewport(bounds)
             
             # Create metadata for SVG
             metadata = {
@@ -206,6 +346,46 @@ class OutputCoordinator:
             self._logger.error(f"GeoJSON generation failed for storey {storey.storey_name}: {e}")
             return None
     
+    def _generate_binary_for_storey(self, storey: StoreyResult, index: int) -> Optional[str]:
+        """Generate binary floor plan file for a single storey (conditional).
+        
+        Args:
+            storey: StoreyResult containing storey data
+            index: Index for filename generation
+            
+        Returns:
+            Optional[str]: Path to generated binary file, or None if generation is disabled/fails
+        """
+        try:
+            if not self.binary_renderer.should_generate_binary():
+                return None
+            
+            if not storey.polylines:
+                self._logger.debug(f"No polylines to render for storey {storey.storey_name}")
+                return None
+            
+            metadata = {
+                "storey_name": storey.storey_name,
+                "cut_height": storey.cut_height,
+                "element_count": storey.element_count,
+                "created_at": "Generated by IFC Floor Plan Generator"
+            }
+            
+            binary_file = self.binary_renderer.render_and_save(
+                storey.polylines,
+                self.output_manager,
+                storey.storey_name,
+                index,
+                metadata
+            )
+            
+            self._logger.debug(f"Generated binary floor plan for storey {storey.storey_name}: {binary_file}")
+            return binary_file
+            
+        except Exception as e:
+            self._logger.error(f"Binary generation failed for storey {storey.storey_name}: {e}")
+            return None
+    
     def ensure_consistent_filenames(self, storeys: List[StoreyResult]) -> None:
         """Ensure all output files follow consistent filename patterns.
         
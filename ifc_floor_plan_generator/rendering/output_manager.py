@@ -8,12 +8,16 @@ import os
 import re
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional, TextIO
 from ..models import Config
 from ..errors.handler import ErrorHandler
 from ..errors.exceptions import WriteFailedError, ProcessingError
 
 
+# Write buffer of streamed output files
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+
 class OutputManager:
     """Manages file output operations including naming, path creation, and writing."""
     
@@ -74,6 +78,26 @@ class OutputManager:
         self._logger.debug(f"Generated GeoJSON filename: {filename}")
         return filename
     
+    def generate_binary_filename(self, storey_name: str, index: int) -> str:
+        """Generate binary floor plan filename using the configured pattern.
+        
+        Args:
+            storey_name: Name of the building storey
+            index: Index number for the storey
+            
+        Returns:
+            str: Generated filename following the pattern
+        """
+        sanitized_name = self.sanitize_filename(storey_name)
+        
+        filename = self.config.output.binary_filename_pattern.format(
+            index=index,
+            storey_name=sanitized_name
+        )
+        
+        self._logger.debug(f"Generated binary filename: {filename}")
+        return filename
+    
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename by replacing invalid characters.
         
@@ -164,6 +188,57 @@ class OutputManager:
                 original_error=e
             )
     
+    def write_svg_stream(self, filename: str, write: Callable[[TextIO], Any]) -> str:
+        """Write an SVG file by streaming content to a buffered file handle.
+        
+        The content is written to a temporary file that replaces the target only
+        when writing has finished, so a failure never leaves a truncated SVG.
+        
+        Args:
+            filename: Filename to write to
+            write: Callable that writes the SVG document to the given text stream
+            
+        Returns:
+            str: Full path to the written file
+            
+        Raises:
+            WriteFailedError: If file writing fails
+        """
+        full_path = self.get_full_path(filename)
+        temp_path = f"{full_path}.{os.getpid()}.tmp"
+        
+        try:
+            # Ensure parent directory exists
+            parent_dir = os.path.dirname(full_path)
+            if parent_dir and not os.path.exists(parent_dir):
+                os.makedirs(parent_dir, exist_ok=True)
+            
+            with open(temp_path, 'w', encoding='utf-8', buffering=STREAM_BUFFER_SIZE) as f:
+                write(f)
+            os.replace(temp_path, full_path)
+            
+            self._logger.info(f"Successfully wrote SVG file: {full_path}")
+            return full_path
+            
+        except ProcessingError:
+            # Rendering errors keep their own error code
+            self._remove_temp_file(temp_path)
+            raise
+        except Exception as e:
+            self._remove_temp_file(temp_path)
+            raise WriteFailedError(
+                file_path=full_path,
+                original_error=e
+            )
+    
+    def _remove_temp_file(self, temp_path: str) -> None:
+        """Remove a partially written temporary file, if any."""
+        try:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        except OSError as e:
+            self._logger.warning(f"Could not remove temporary file {temp_path}: {e}")
+    
     def write_geojson_file(self, geojson_content: str, filename: str) -> str:
         """Write GeoJSON content to file.
         
@@ -208,6 +283,39 @@ class OutputManager:
                 original_error=e
             )
     
+    def write_binary_file(self, content: bytes, filename: str) -> str:
+        """Write a binary floor plan to file.
+        
+        Args:
+            content: Binary floor plan
+            filename: Filename to write to
+            
+        Returns:
+            str: Full path to the written file
+            
+        Raises:
+            WriteFailedError: If file writing fails
+        """
+        full_path = self.get_full_path(filename)
+        
+        try:
+            # Ensure parent directory exists
+            parent_dir = os.path.dirname(full_path)
+            if parent_dir and not os.path.exists(parent_dir):
+                os.makedirs(parent_dir, exist_ok=True)
+            
+            with open(full_path, 'wb') as f:
+                f.write(content)
+            
+            self._logger.info(f"Successfully wrote binary floor plan: {full_path}")
+            return full_path
+            
+        except Exception as e:
+            raise WriteFailedError(
+                file_path=full_path,
+                original_error=e
+            )
+    
     def write_manifest_file(self, manifest_content: str, filename: Optional[str] = None) -> str:
         """Write manifest content to file.
         
@@ -313,6 +421,8 @@ class OutputManager:
             "geojson_pattern": self.config.output.geojson_filename_pattern,
             "manifest_filename": self.config.output.manifest_filename,
             "write_geojson": self.config.output.write_geojson,
+            "binary_pattern": self.config.output.binary_filename_pattern,
+            "write_binary": self.config.output.write_binary,
             "directory_exists": os.path.exists(self.config.output_dir),
             "write_permissions": self.check_write_permissions()
         }
@@ -324,9 +434,9 @@ class OutputManager:
             Dict with lists of existing files by type
         """
         if not os.path.exists(self.config.output_dir):
-            return {"svg": [], "geojson": [], "manifest": [], "other": []}
+            return {"svg": [], "geojson": [], "binary": [], "manifest": [], "other": []}
         
-        files = {"svg": [], "geojson": [], "manifest": [], "other": []}
+        files = {"svg": [], "geojson": [], "binary": [], "manifest": [], "other": []}
         
         try:
             for filename in os.listdir(self.config.output_dir):
@@ -336,6 +446,8 @@ class OutputManager:
                         files["svg"].append(filename)
                     elif filename.endswith('.geo.json') or filename.endswith('.geojson'):
                         files["geojson"].append(filename)
+                    elif filename.endswith('.fpb'):
+                        files["binary"].append(filename)
                     elif filename == self.config.output.manifest_filename:
                         files["manifest"].append(filename)
                     else:
@@ -4,16 +4,25 @@ SVG renderer for IFC Floor Plan Generator.
 Renders polylines to SVG format with configurable styling per IFC class.
 """
 
+import io
 import logging
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Iterable, Optional, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+
 from ..models import Polyline2D, BoundingBox
 from ..config.models import RenderingConfig
+from ..geometry.polyline_batch import pack_polylines
 from .models import StyleAttributes
 from ..errors.handler import ErrorHandler
 from ..errors.exceptions import ProcessingError
 
 
+# Polylines formatted per bulk formatting call while streaming
+POLYLINE_CHUNK_SIZE = 2000
+
+
 class SVGRenderer:
     """Renders polylines to SVG format with configurable styling."""
     
@@ -41,45 +50,71 @@ class SVGRenderer:
         Returns:
             str: Complete SVG document as string
             
+        Raises:
+            ProcessingError: If SVG generation fails
+        """
+        buffer = io.StringIO()
+        self.write_svg(polylines, buffer, metadata)
+        return buffer.getvalue()
+    
+    def write_svg(self, polylines: List[Polyline2D], stream: TextIO, metadata: Dict[str, Any]) -> int:
+        """Write polylines as an SVG document to a text stream.
+        
+        The document is written incrementally: the header, one CSS rule per IFC
+        class, and one group per IFC class whose polylines are formatted in chunks.
+        No document tree is built, so memory use does not grow with the storey.
+        
+        Args:
+            polylines: List of polylines to render
+            stream: Text stream to write to, typically a buffered file handle
+            metadata: Additional metadata for the SVG (title, description, etc.)
+            
+        Returns:
+            int: Number of polylines written
+            
         Raises:
             ProcessingError: If SVG generation fails
         """
         try:
             if not polylines:
                 self._logger.warning("No polylines to render")
-                return self._create_empty_svg(metadata)
+                self._write_empty_svg(stream, metadata)
+                return 0
             
             # Calculate bounding box if not set
             if self._viewport_bounds is None:
                 self._calculate_viewport_from_polylines(polylines)
             
-            # Create SVG root element
-            svg_root = self._create_svg_root()
+            # Polyline indices per IFC class, in order of first appearance
+            class_indices: Dict[str, List[int]] = {}
+            for i, polyline in enumerate(polylines):
+                if len(polyline.points) >= 2:
+                    class_indices.setdefault(polyline.ifc_class, []).append(i)
             
-            # Add metadata
-            self._add_svg_metadata(svg_root, metadata)
+            stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            stream.write(self._svg_open_tag() + "\n")
+            self._write_svg_metadata(stream, metadata)
+            self._write_class_styles(stream, class_indices)
             
             # Add background if configured
             if self.config.background:
-                self._add_background(svg_root)
+                stream.write(f'  <rect x="0" y="0" width="100%" height="100%" '
+                             f'fill={quoteattr(self.config.background)} id="background"/>\n')
             
-            # Create group for polylines
-            polylines_group = ET.SubElement(svg_root, "g")
-            polylines_group.set("id", "polylines")
+            written = 0
+            stream.write('  <g id="polylines">\n')
+            for ifc_class, indices in class_indices.items():
+                stream.write(f'    <g class={quoteattr(self._css_class(ifc_class))} '
+                             f'data-ifc-class={quoteattr(ifc_class)}>\n')
+                for start in range(0, len(indices), POLYLINE_CHUNK_SIZE):
+                    chunk = indices[start:start + POLYLINE_CHUNK_SIZE]
+                    stream.write(self._format_polylines(polylines, chunk))
+                    written += len(chunk)
+                stream.write('    </g>\n')
+            stream.write('  </g>\n</svg>\n')
             
-            # Render each polyline
-            for i, polyline in enumerate(polylines):
-                try:
-                    self._render_single_polyline(polylines_group, polyline, i)
-                except Exception as e:
-                    self._logger.warning(f"Failed to render polyline {i}: {e}")
-                    continue
-            
-            # Convert to string
-            svg_string = self._element_to_string(svg_root)
-            
-            self._logger.debug(f"Successfully rendered {len(polylines)} polylines to SVG")
-            return svg_string
+            self._logger.debug(f"Successfully rendered {written} polylines to SVG")
+            return written
             
         except Exception as e:
             self._logger.error(f"SVG rendering failed: {e}")
@@ -137,17 +172,14 @@ class SVGRenderer:
             
             self._logger.debug(f"Set viewport: {self._viewport_width}x{self._viewport_height}")
     
-    def _create_svg_root(self) -> ET.Element:
-        """Create SVG root element with proper attributes.
+    def _svg_open_tag(self) -> str:
+        """Create the SVG root start tag with proper attributes.
         
         Returns:
-            ET.Element: SVG root element
+            str: SVG start tag
         """
-        svg = ET.Element("svg")
-        svg.set("xmlns", "http://www.w3.org/2000/svg")
-        svg.set("version", "1.1")
-        svg.set("width", str(self._viewport_width))
-        svg.set("height", str(self._viewport_height))
+        attributes = (f'xmlns="http://www.w3.org/2000/svg" version="1.1" '
+                      f'width="{self._viewport_width}" height="{self._viewport_height}"')
         
         if self._viewport_bounds:
             # Set viewBox to show the content with margins
@@ -161,131 +193,87 @@ class SVGRenderer:
                 # Flip the viewBox for Y-inversion
                 viewbox_y = -(self._viewport_bounds.max_y + self._margin)
             
-            svg.set("viewBox", f"{viewbox_x} {viewbox_y} {viewbox_width} {viewbox_height}")
+            attributes += f' viewBox="{viewbox_x} {viewbox_y} {viewbox_width} {viewbox_height}"'
         
-        return svg
+        return f"<svg {attributes}>"
     
-    def _add_svg_metadata(self, svg_root: ET.Element, metadata: Dict[str, Any]) -> None:
-        """Add metadata elements to SVG.
+    def _write_svg_metadata(self, stream: TextIO, metadata: Dict[str, Any]) -> None:
+        """Write title, description and generator metadata elements.
         
         Args:
-            svg_root: SVG root element
+            stream: Text stream to write to
             metadata: Metadata dictionary
         """
-        # Add title if provided
         title = metadata.get("title", "IFC Floor Plan")
-        title_elem = ET.SubElement(svg_root, "title")
-        title_elem.text = title
-        
-        # Add description if provided
         description = metadata.get("description", "Generated by IFC Floor Plan Generator")
-        desc_elem = ET.SubElement(svg_root, "desc")
-        desc_elem.text = description
+        stream.write(f"  <title>{escape(str(title))}</title>\n")
+        stream.write(f"  <desc>{escape(str(description))}</desc>\n")
         
-        # Add generator metadata
-        metadata_group = ET.SubElement(svg_root, "metadata")
-        generator = ET.SubElement(metadata_group, "generator")
-        generator.text = "IFC Floor Plan Generator"
-        
-        # Add creation date if provided
+        stream.write("  <metadata>\n    <generator>IFC Floor Plan Generator</generator>\n")
         if "created_at" in metadata:
-            created = ET.SubElement(metadata_group, "created")
-            created.text = str(metadata["created_at"])
-    
-    def _add_background(self, svg_root: ET.Element) -> None:
-        """Add background rectangle to SVG.
-        
-        Args:
-            svg_root: SVG root element
-        """
-        background = ET.SubElement(svg_root, "rect")
-        background.set("x", "0")
-        background.set("y", "0")
-        background.set("width", "100%")
-        background.set("height", "100%")
-        background.set("fill", self.config.background)
-        background.set("id", "background")
+            stream.write(f"    <created>{escape(str(metadata['created_at']))}</created>\n")
+        stream.write("  </metadata>\n")
     
-    def _render_single_polyline(self, parent: ET.Element, polyline: Polyline2D, index: int) -> None:
-        """Render a single polyline to SVG.
+    def _write_class_styles(self, stream: TextIO, ifc_classes: Iterable[str]) -> None:
+        """Write one shared CSS rule per IFC class instead of per-element styles.
         
         Args:
-            parent: Parent SVG element
-            polyline: Polyline to render
-            index: Index of the polyline (for ID generation)
+            stream: Text stream to write to
+            ifc_classes: IFC classes present in the document
         """
-        if len(polyline.points) < 2:
+        if not ifc_classes:
             return
         
-        # Get styling for this IFC class
-        style = self.apply_styling(polyline.ifc_class)
-        
-        # Create polyline or polygon element based on whether it's closed
-        if polyline.is_closed and len(polyline.points) > 2:
-            element = ET.SubElement(parent, "polygon")
-            points_str = self._points_to_svg_polygon(polyline.points)
-            element.set("points", points_str)
-        else:
-            element = ET.SubElement(parent, "polyline")
-            points_str = self._points_to_svg_polyline(polyline.points)
-            element.set("points", points_str)
-        
-        # Set styling
-        element.set("style", style.to_svg_style())
-        
-        # Set ID and class for CSS styling
-        element.set("id", f"polyline_{index}")
-        element.set("class", f"ifc-{polyline.ifc_class.lower()}")
-        
-        # Add data attributes for metadata
-        element.set("data-ifc-class", polyline.ifc_class)
-        element.set("data-element-guid", polyline.element_guid)
+        stream.write("  <style>\n")
+        for ifc_class in ifc_classes:
+            style = self.apply_styling(ifc_class)
+            stream.write(escape(f"    .{self._css_class(ifc_class)} {{ {style.to_svg_style()} }}") + "\n")
+        stream.write("  </style>\n")
     
-    def _points_to_svg_polyline(self, points: List[Tuple[float, float]]) -> str:
-        """Convert points to SVG polyline points string.
-        
-        Args:
-            points: List of 2D points
-            
-        Returns:
-            str: SVG points string
-        """
-        transformed_points = self._transform_points_for_svg(points)
-        return " ".join(f"{x},{y}" for x, y in transformed_points)
+    def _css_class(self, ifc_class: str) -> str:
+        """Get the CSS class name for an IFC class."""
+        return f"ifc-{ifc_class.lower()}"
     
-    def _points_to_svg_polygon(self, points: List[Tuple[float, float]]) -> str:
-        """Convert points to SVG polygon points string.
+    def _format_polylines(self, polylines: List[Polyline2D], indices: List[int]) -> str:
+        """Format a chunk of polylines as SVG elements.
         
-        Args:
-            points: List of 2D points
-            
-        Returns:
-            str: SVG points string
-        """
-        transformed_points = self._transform_points_for_svg(points)
-        return " ".join(f"{x},{y}" for x, y in transformed_points)
-    
-    def _transform_points_for_svg(self, points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
-        """Transform points for SVG coordinate system.
+        Coordinates of the whole chunk are transformed, rounded and formatted in
+        bulk rather than point by point.
         
         Args:
-            points: Original points
+            polylines: All polylines of the document
+            indices: Indices of the polylines in the chunk (each with at least 2 points)
             
         Returns:
-            List[Tuple[float, float]]: Transformed points
+            str: SVG elements of the chunk, one per line
         """
-        if not self.config.invert_y or not self._viewport_bounds:
-            return points
+        coordinates, offsets = pack_polylines([polylines[i] for i in indices])
+        counts = np.diff(offsets).tolist()
+        total = len(coordinates)
         
         # Apply Y-inversion by flipping around the center Y coordinate
-        center_y = (self._viewport_bounds.min_y + self._viewport_bounds.max_y) / 2
-        transformed = []
-        
-        for x, y in points:
-            new_y = 2 * center_y - y
-            transformed.append((x, new_y))
+        if self.config.invert_y and self._viewport_bounds:
+            center_y = (self._viewport_bounds.min_y + self._viewport_bounds.max_y) / 2
+            coordinates[:, 1] = 2 * center_y - coordinates[:, 1]
+        
+        # Rounding first, then adding 0.0, avoids "-0.000" for values that round to zero
+        precision = self.config.coordinate_precision
+        coordinates = np.round(coordinates, precision) + 0.0
+        pairs = (f"%.{precision}f,%.{precision}f\n" * total % tuple(coordinates.ravel().tolist())).split("\n")
+        
+        lines = []
+        offset = 0
+        for i, count in zip(indices, counts):
+            polyline = polylines[i]
+            points = " ".join(pairs[offset:offset + count])
+            offset += count
+            
+            # Closed polylines are drawn as polygons
+            tag = "polygon" if polyline.is_closed and count > 2 else "polyline"
+            lines.append(f'      <{tag} id="polyline_{i}" data-element-guid={quoteattr(polyline.element_guid)} '
+                         f'points="{points}"/>\n')
         
-        return transformed
+        return "".join(lines)
     
     def _calculate_viewport_from_polylines(self, polylines: List[Polyline2D]) -> None:
         """Calculate viewport bounds from polylines.
@@ -293,96 +281,36 @@ class SVGRenderer:
         Args:
             polylines: List of polylines to calculate bounds from
         """
-        if not polylines:
-            return
-        
-        # Find bounding box of all points
-        all_x = []
-        all_y = []
+        min_x = min_y = float('inf')
+        max_x = max_y = float('-inf')
         
         for polyline in polylines:
-            for x, y in polyline.points:
-                all_x.append(x)
-                all_y.append(y)
-        
-        if all_x and all_y:
-            bounds = BoundingBox(
-                min_x=min(all_x),
-                min_y=min(all_y),
-                max_x=max(all_x),
-                max_y=max(all_y)
-            )
-            self.set_viewport(bounds)
+            if not polyline.points:
+                continue
+            xs, ys = zip(*polyline.points)
+            min_x = min(min_x, min(xs))
+            min_y = min(min_y, min(ys))
+            max_x = max(max_x, max(xs))
+            max_y = max(max_y, max(ys))
+        
+        if min_x <= max_x:
+            self.set_viewport(BoundingBox(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y))
     
-    def _create_empty_svg(self, metadata: Dict[str, Any]) -> str:
-        """Create an empty SVG document.
+    def _write_empty_svg(self, stream: TextIO, metadata: Dict[str, Any]) -> None:
+        """Write an empty SVG document.
         
         Args:
+            stream: Text stream to write to
             metadata: Metadata for the SVG
-            
-        Returns:
-            str: Empty SVG document
         """
-        svg = ET.Element("svg")
-        svg.set("xmlns", "http://www.w3.org/2000/svg")
-        svg.set("version", "1.1")
-        svg.set("width", "400")
-        svg.set("height", "300")
-        
-        self._add_svg_metadata(svg, metadata)
+        stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        stream.write('<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="400" height="300">\n')
+        self._write_svg_metadata(stream, metadata)
         
         # Add message about empty content
-        text = ET.SubElement(svg, "text")
-        text.set("x", "200")
-        text.set("y", "150")
-        text.set("text-anchor", "middle")
-        text.set("font-family", "Arial, sans-serif")
-        text.set("font-size", "16")
-        text.set("fill", "#666666")
-        text.text = "No geometry to display"
-        
-        return self._element_to_string(svg)
-    
-    def _element_to_string(self, element: ET.Element) -> str:
-        """Convert XML element to formatted string.
-        
-        Args:
-            element: XML element to convert
-            
-        Returns:
-            str: Formatted XML string
-        """
-        # Format the XML with proper indentation
-        self._indent_xml(element)
-        
-        # Convert to string
-        xml_str = ET.tostring(element, encoding='unicode', method='xml')
-        
-        # Add XML declaration
-        formatted_svg = '<?xml version="1.0" encoding="UTF-8"?>\n' + xml_str
-        
-        return formatted_svg
-    
-    def _indent_xml(self, elem: ET.Element, level: int = 0) -> None:
-        """Add proper indentation to XML elements.
-        
-        Args:
-            elem: XML element to indent
-            level: Current indentation level
-        """
-        indent = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = indent + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = indent
-            for child in elem:
-                self._indent_xml(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = indent
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = indent
+        stream.write('  <text x="200" y="150" text-anchor="middle" font-family="Arial, sans-serif" '
+                     'font-size="16" fill="#666666">No geometry to display</text>\n')
+        stream.write('</svg>\n')
     
     def set_viewport_dimensions(self, width: float, height: float) -> None:
         """Set custom viewport dimensions.
@@ -422,7 +350,8 @@ class SVGRenderer:
                        storey_name: str, index: int, metadata: Dict[str, Any]) -> str:
         """Render polylines to SVG and save to file.
         
-        This is a convenience method that combines rendering and file writing.
+        This is a convenience method that combines rendering and file writing;
+        the document is written to the file as it is rendered.
         
         Args:
             polylines: List of polylines to render
@@ -438,14 +367,13 @@ class SVGRenderer:
             WriteFailedError: If file writing fails
             ProcessingError: If SVG generation fails
         """
-        # Generate SVG content
-        svg_content = self.render_polylines(polylines, metadata)
-        
         # Generate filename
         filename = output_manager.generate_svg_filename(storey_name, index)
         
-        # Write to file
-        file_path = output_manager.write_svg_file(svg_content, filename)
+        # Stream the document straight to the file
+        file_path = output_manager.write_svg_stream(
+            filename, lambda stream: self.write_svg(polylines, stream, metadata)
+        )
         
         self._logger.info(f"Rendered and saved SVG: {file_path}")
         return file_path
\ No newline at end of file
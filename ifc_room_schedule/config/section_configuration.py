@@ -84,13 +84,18 @@ class ExportProfile:
             "finishes": SectionSettings(enabled=False, required=False),
             "openings": SectionSettings(enabled=False, required=False),
             "fixtures": SectionSettings(enabled=False, required=False),
-            "hse": SectionSettings(enabled=False, required=False)
+            "hse": SectionSettings(enabled=False, required=False),
+            "qa_qc": SectionSettings(enabled=False, required=False),
+            "interfaces": SectionSettings(enabled=False, required=False),
+            "logistics": SectionSettings(enabled=False, required=False),
+            "commissioning": SectionSettings(enabled=False, required=False)
         }
         
         # Adjust based on phase
         if self.phase == Phase.CORE:
             # Only core sections enabled
-            for section in ["performance_requirements", "finishes", "openings", "fixtures", "hse"]:
+            for section in ["performance_requirements", "finishes", "openings", "fixtures", "hse",
+                            "qa_qc", "interfaces", "logistics", "commissioning"]:
                 default_settings[section].enabled = False
         elif self.phase == Phase.ADVANCED:
             # Core + advanced sections enabled
@@ -231,7 +236,8 @@ class SectionConfiguration:
                 for name in [
                     "meta", "identification", "classification", "structure",
                     "geometry_enhanced", "ifc_metadata", "performance_requirements",
-                    "finishes", "openings", "fixtures", "hse"
+                    "finishes", "openings", "fixtures", "hse",
+                    "qa_qc", "interfaces", "logistics", "commissioning"
                 ]
             }
         )
@@ -432,6 +438,30 @@ class SectionConfiguration:
                 "description": "Health, safety and environmental requirements",
                 "priority": "medium",
                 "phase": "production"
+            },
+            "qa_qc": {
+                "name": "QA/QC",
+                "description": "Hold points, inspections and quality control",
+                "priority": "low",
+                "phase": "production"
+            },
+            "interfaces": {
+                "name": "Interfaces",
+                "description": "Trade interfaces and coordination",
+                "priority": "low",
+                "phase": "production"
+            },
+            "logistics": {
+                "name": "Logistics",
+                "description": "Site logistics and access",
+                "priority": "low",
+                "phase": "production"
+            },
+            "commissioning": {
+                "name": "Commissioning",
+                "description": "Commissioning tests and handover",
+                "priority": "low",
+                "phase": "production"
             }
         }
 
@@ -2,18 +2,24 @@
 Azure SQL Database Exporter
 
 Exports room schedule data to Azure SQL Database with proper schema creation
-and data normalization.
+and data normalization. Besides full exports, a synchronisation mode writes
+only the spaces and related rows that changed since the previous export of
+the same project.
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+from collections import Counter
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import json
 
 try:
-    import pyodbc
+    # pyodbc is loaded by SQLAlchemy when an mssql+pyodbc engine is created, so
+    # other engines (e.g. SQLite for local benchmarks) work without it
     import sqlalchemy
-    from sqlalchemy import create_engine, text, MetaData, Table, Column, String, Float, Integer, DateTime, Text, Boolean
+    from sqlalchemy import create_engine, text, select, func, bindparam, inspect, MetaData, Table, Column, String, Float, Integer, DateTime, Text, Boolean
+    from sqlalchemy.engine import make_url
     from sqlalchemy.orm import sessionmaker
     from sqlalchemy.exc import SQLAlchemyError
     SQL_AVAILABLE = True
@@ -30,16 +36,31 @@ sys.path.insert(0, str(project_root))
 from config.database_config import DatabaseConfig
 
 
+# Rows sent per executemany call; bounds statement size and driver buffers
+DEFAULT_INSERT_CHUNK_SIZE = 1000
+
+# Version of the table layout below; databases without a version table are version 1
+SCHEMA_VERSION = 2
+
+
+def _content_hash(value: Any) -> str:
+    """Hash JSON-serialisable content independently of key order."""
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
 class AzureSQLExporter:
     """Exports room schedule data to Azure SQL Database."""
     
-    def __init__(self, connection_string: str = None, use_default_config: bool = False):
+    def __init__(self, connection_string: str = None, use_default_config: bool = False,
+                 chunk_size: int = DEFAULT_INSERT_CHUNK_SIZE, fast_executemany: bool = True):
         """
         Initialize Azure SQL exporter.
         
         Args:
             connection_string: Azure SQL connection string (optional if using default config)
             use_default_config: Use default database configuration
+            chunk_size: Number of rows per bulk insert statement
+            fast_executemany: Use pyodbc's fast_executemany for mssql+pyodbc connections
         """
         if not SQL_AVAILABLE:
             raise ImportError(
@@ -65,6 +86,11 @@ class AzureSQLExporter:
                 "Either provide connection_string or set use_default_config=True"
             )
         
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.chunk_size = chunk_size
+        self.fast_executemany = fast_executemany
+        
         self.engine = None
         self.metadata = MetaData()
         
@@ -74,10 +100,18 @@ class AzureSQLExporter:
     def _define_schemas(self):
         """Define database table schemas."""
         
+        # Schema version table
+        self.schema_version_table = Table(
+            'schema_version', self.metadata,
+            Column('version', Integer, primary_key=True, autoincrement=False),
+            Column('applied_at', DateTime, default=datetime.utcnow)
+        )
+        
         # Projects table
         self.projects_table = Table(
             'projects', self.metadata,
             Column('id', Integer, primary_key=True, autoincrement=True),
+            Column('guid', String(255), index=True),  # IfcProject GlobalId, the key for synchronisation
             Column('name', String(255), nullable=False),
             Column('source_file', String(500)),
             Column('source_file_path', String(1000)),
@@ -101,6 +135,11 @@ class AzureSQLExporter:
             Column('elevation', Float),
             Column('processed', Boolean, default=False),
             Column('user_descriptions', Text),  # JSON string
+            Column('content_hash', String(64)),  # Hash of the space row
+            Column('quantities_hash', String(64)),  # Hashes of the related rows per table
+            Column('surfaces_hash', String(64)),
+            Column('boundaries_hash', String(64)),
+            Column('relationships_hash', String(64)),
             Column('created_at', DateTime, default=datetime.utcnow)
         )
         
@@ -180,6 +219,14 @@ class AzureSQLExporter:
             Column('ifc_relationship_type', String(100)),
             Column('created_at', DateTime, default=datetime.utcnow)
         )
+        
+        # Tables of related rows per space, by the spaces column holding their hash
+        self.child_tables = {
+            'quantities_hash': self.space_quantities_table,
+            'surfaces_hash': self.surfaces_table,
+            'boundaries_hash': self.space_boundaries_table,
+            'relationships_hash': self.relationships_table
+        }
     
     def connect(self) -> bool:
         """
@@ -189,7 +236,7 @@ class AzureSQLExporter:
             True if connection successful, False otherwise
         """
         try:
-            self.engine = create_engine(self.connection_string)
+            self.engine = create_engine(self.connection_string, **self._engine_options())
             # Test connection
             with self.engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
@@ -199,32 +246,91 @@ class AzureSQLExporter:
             self.logger.error(f"Failed to connect to Azure SQL Database: {e}")
             return False
     
+    def _engine_options(self) -> Dict[str, Any]:
+        """
+        Get dialect-specific engine options.
+        
+        Returns:
+            Keyword arguments for create_engine
+        """
+        url = make_url(self.connection_string)
+        if self.fast_executemany and url.get_backend_name() == 'mssql' and url.get_driver_name() == 'pyodbc':
+            # Sends executemany parameter sets as one array instead of one round trip per row
+            return {'fast_executemany': True}
+        return {}
+    
     def create_tables(self) -> bool:
         """
         Create database tables if they don't exist.
         
+        Nothing is created when the schema version table shows the current
+        version. Databases from before the version table get the columns that
+        were added since.
+        
         Returns:
             True if tables created successfully, False otherwise
         """
         try:
-            self.metadata.create_all(self.engine)
-            self.logger.info("Database tables created successfully")
+            with self.engine.begin() as conn:
+                version = self._schema_version(conn)
+                if version == SCHEMA_VERSION:
+                    self.logger.debug("Database schema is current")
+                    return True
+                if version > SCHEMA_VERSION:
+                    self.logger.error(f"Database schema version {version} is newer than supported version {SCHEMA_VERSION}")
+                    return False
+                
+                self.metadata.create_all(conn)
+                if version > 0:
+                    self._add_missing_columns(conn)
+                conn.execute(self.schema_version_table.insert().values(version=SCHEMA_VERSION))
+            
+            self.logger.info(f"Database tables created successfully (schema version {SCHEMA_VERSION})")
             return True
         except Exception as e:
             self.logger.error(f"Failed to create database tables: {e}")
             return False
     
-    def export_data(self, data: Dict[str, Any], project_name: str = None) -> bool:
+    def _schema_version(self, conn) -> int:
+        """Get the schema version of the database, 0 if it has no tables yet."""
+        table_names = inspect(conn).get_table_names()
+        if self.schema_version_table.name in table_names:
+            version = conn.execute(select(func.max(self.schema_version_table.c.version))).scalar()
+            return version or 0
+        return 1 if self.spaces_table.name in table_names else 0
+    
+    def _add_missing_columns(self, conn):
+        """Add columns that existing tables are missing."""
+        inspector = inspect(conn)
+        preparer = conn.dialect.identifier_preparer
+        for table in self.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    conn.execute(text(
+                        f"ALTER TABLE {preparer.format_table(table)} ADD {preparer.format_column(column)} "
+                        f"{column.type.compile(dialect=conn.dialect)}"
+                    ))
+                    self.logger.info(f"Added column {table.name}.{column.name}")
+    
+    def export_data(self, data: Dict[str, Any], project_name: str = None, sync: bool = False) -> bool:
         """
         Export room schedule data to Azure SQL Database.
         
         Args:
             data: Room schedule data dictionary
             project_name: Optional project name override
+            sync: Only write the differences to the previous export of the project (see sync_data)
             
         Returns:
             True if export successful, False otherwise
         """
+        if sync:
+            return self.sync_data(data, project_name) is not None
+        
+        if not self._check_space_guids(data.get('spaces', [])):
+            return False
+        
         if not self.engine:
             if not self.connect():
                 return False
@@ -237,13 +343,13 @@ class AzureSQLExporter:
                 # Insert project
                 project_id = self._insert_project(conn, data, project_name)
                 
-                # Insert spaces and related data
-                for space_data in data.get('spaces', []):
-                    space_id = self._insert_space(conn, project_id, space_data)
-                    self._insert_space_quantities(conn, space_id, space_data)
-                    self._insert_surfaces(conn, space_id, space_data)
-                    self._insert_space_boundaries(conn, space_id, space_data)
-                    self._insert_relationships(conn, space_id, space_data)
+                # Insert all spaces, then resolve their IDs in one query instead of per-row RETURNING
+                space_rows = [self._space_rows(project_id, space_data) for space_data in data.get('spaces', [])]
+                self._bulk_insert(conn, self.spaces_table, [record for record, _ in space_rows])
+                space_ids = self._space_ids(conn, project_id)
+                
+                # Insert related data table by table
+                self._insert_children(conn, [(space_ids[record['guid']], children) for record, children in space_rows])
             
             self.logger.info(f"Successfully exported data to Azure SQL Database")
             return True
@@ -252,26 +358,219 @@ class AzureSQLExporter:
             self.logger.error(f"Failed to export data: {e}")
             return False
     
+    def sync_data(self, data: Dict[str, Any], project_name: str = None,
+                  project_guid: str = None) -> Optional[Dict[str, int]]:
+        """
+        Synchronise the database with room schedule data.
+        
+        The project is matched by GUID and its spaces by space GUID. Spaces are
+        inserted, updated or deleted by comparing content hashes of the space
+        row and of each table of related rows, so only changed rows are written.
+        
+        Args:
+            data: Room schedule data dictionary
+            project_name: Optional project name override
+            project_guid: Project key; defaults to the metadata project_guid (the IfcProject GlobalId)
+            
+        Returns:
+            Counts of inserted, updated, deleted and unchanged spaces, or None if the sync failed
+        """
+        project_guid = project_guid or data.get('metadata', {}).get('project_guid')
+        if not project_guid:
+            self.logger.error("Cannot synchronise data without a project GUID (the IfcProject GlobalId)")
+            return None
+        
+        if not self._check_space_guids(data.get('spaces', [])):
+            return None
+        
+        if not self.engine:
+            if not self.connect():
+                return None
+        
+        if not self.create_tables():
+            return None
+        
+        try:
+            with self.engine.begin() as conn:
+                project_record = self._project_record(data, project_name, project_guid)
+                project_id = conn.execute(
+                    select(self.projects_table.c.id).where(self.projects_table.c.guid == project_record['guid'])
+                    .order_by(self.projects_table.c.id)
+                ).scalar()
+                if project_id is None:
+                    project_id = conn.execute(self.projects_table.insert().values(**project_record)).inserted_primary_key[0]
+                else:
+                    conn.execute(self.projects_table.update()
+                                 .where(self.projects_table.c.id == project_id).values(**project_record))
+                
+                hash_columns = ['content_hash'] + list(self.child_tables)
+                existing = {
+                    row.guid: row
+                    for row in conn.execute(
+                        select(self.spaces_table.c.id, self.spaces_table.c.guid,
+                               *[self.spaces_table.c[column] for column in hash_columns])
+                        .where(self.spaces_table.c.project_id == project_id)
+                    )
+                }
+                
+                inserted, updated, unchanged = [], [], 0
+                stale_children = {column: [] for column in self.child_tables}
+                new_children = []
+                for space_data in data.get('spaces', []):
+                    record, children = self._space_rows(project_id, space_data)
+                    row = existing.pop(record['guid'], None)
+                    if row is None:
+                        inserted.append((record, children))
+                        continue
+                    
+                    changed = [column for column in hash_columns if getattr(row, column) != record[column]]
+                    if not changed:
+                        unchanged += 1
+                        continue
+                    
+                    updated.append(dict(record, space_row_id=row.id))
+                    for column in changed:
+                        if column in self.child_tables:
+                            stale_children[column].append(row.id)
+                            new_children.append((row.id, {self.child_tables[column]: children[self.child_tables[column]]}))
+                
+                # Spaces no longer in the model, with all their related rows
+                deleted_ids = [row.id for row in existing.values()]
+                for table in self.child_tables.values():
+                    self._delete_where_in(conn, table, table.c.space_id, deleted_ids)
+                self._delete_where_in(conn, self.spaces_table, self.spaces_table.c.id, deleted_ids)
+                
+                # Changed spaces: rewrite the row and replace changed related rows
+                if updated:
+                    statement = (self.spaces_table.update()
+                                 .where(self.spaces_table.c.id == bindparam('space_row_id')))
+                    for start in range(0, len(updated), self.chunk_size):
+                        conn.execute(statement, updated[start:start + self.chunk_size])
+                for column, space_ids in stale_children.items():
+                    table = self.child_tables[column]
+                    self._delete_where_in(conn, table, table.c.space_id, space_ids)
+                
+                # New spaces
+                self._bulk_insert(conn, self.spaces_table, [record for record, _ in inserted])
+                if inserted:
+                    space_ids = self._space_ids(conn, project_id)
+                    new_children.extend((space_ids[record['guid']], children) for record, children in inserted)
+                self._insert_children(conn, new_children)
+            
+            summary = {
+                'inserted': len(inserted),
+                'updated': len(updated),
+                'deleted': len(deleted_ids),
+                'unchanged': unchanged
+            }
+            self.logger.info(f"Synchronised data with Azure SQL Database: {summary}")
+            return summary
+            
+        except Exception as e:
+            self.logger.error(f"Failed to synchronise data: {e}")
+            return None
+    
+    def _check_space_guids(self, spaces: List[Dict[str, Any]]) -> bool:
+        """
+        Check that every space has a GUID of its own.
+        
+        Related rows are attached to their space through the space GUID after the
+        bulk insert, so a missing or repeated GUID would attach them to the wrong space.
+        
+        Returns:
+            True if all space GUIDs are present and unique, False otherwise
+        """
+        guids = [space_data.get('guid') for space_data in spaces]
+        missing = sum(1 for guid in guids if not guid)
+        if missing:
+            self.logger.error(f"Cannot export {missing} space(s) without a GUID")
+            return False
+        if len(set(guids)) != len(guids):
+            duplicates = sorted(guid for guid, count in Counter(guids).items() if count > 1)
+            self.logger.error(f"Cannot export spaces with duplicate GUIDs: {', '.join(duplicates)}")
+            return False
+        return True
+    
+    def _bulk_insert(self, conn, table, rows: List[Dict[str, Any]]):
+        """Insert rows with one executemany call per chunk."""
+        for start in range(0, len(rows), self.chunk_size):
+            conn.execute(table.insert(), rows[start:start + self.chunk_size])
+        if rows:
+            self.logger.debug(f"Inserted {len(rows)} rows into {table.name}")
+    
+    def _delete_where_in(self, conn, table, column, values: List[Any]):
+        """Delete rows whose column is in values, one statement per chunk."""
+        for start in range(0, len(values), self.chunk_size):
+            conn.execute(table.delete().where(column.in_(values[start:start + self.chunk_size])))
+    
+    def _insert_children(self, conn, children_by_space: List[Tuple[int, Dict[Any, List[Dict[str, Any]]]]]):
+        """Insert related rows given as (space ID, rows by table) pairs, table by table."""
+        rows_by_table = {table: [] for table in self.child_tables.values()}
+        for space_id, children in children_by_space:
+            for table, rows in children.items():
+                rows_by_table[table].extend(dict(row, space_id=space_id) for row in rows)
+        
+        for table, rows in rows_by_table.items():
+            self._bulk_insert(conn, table, rows)
+    
+    def _space_ids(self, conn, project_id: int) -> Dict[str, int]:
+        """Get the IDs of a project's spaces by GUID."""
+        result = conn.execute(
+            select(self.spaces_table.c.guid, self.spaces_table.c.id)
+            .where(self.spaces_table.c.project_id == project_id)
+        )
+        return {guid: space_id for guid, space_id in result}
+    
     def _insert_project(self, conn, data: Dict[str, Any], project_name: str = None) -> int:
         """Insert project record and return project ID."""
+        result = conn.execute(self.projects_table.insert().values(**self._project_record(data, project_name)))
+        return result.inserted_primary_key[0]
+    
+    def _project_record(self, data: Dict[str, Any], project_name: str = None,
+                        project_guid: str = None) -> Dict[str, Any]:
+        """Build project record."""
         metadata = data.get('metadata', {})
         
-        project_data = {
+        return {
+            'guid': project_guid or metadata.get('project_guid'),
             'name': project_name or metadata.get('source_file', 'Unknown Project'),
             'source_file': metadata.get('source_file'),
             'source_file_path': metadata.get('source_file_path'),
             'export_date': datetime.fromisoformat(metadata.get('export_date', datetime.utcnow().isoformat())),
             'application_version': metadata.get('application_version')
         }
+    
+    def _space_rows(self, project_id: int,
+                    space_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[Any, List[Dict[str, Any]]]]:
+        """
+        Build space record with content hashes and its related rows.
         
-        result = conn.execute(self.projects_table.insert().values(**project_data))
-        return result.inserted_primary_key[0]
+        Returns:
+            Tuple of (space record, related rows by table without space_id)
+        """
+        children = {
+            self.space_quantities_table: [
+                record for record in [self._space_quantities_record(None, space_data)] if record
+            ],
+            self.surfaces_table: self._surface_records(None, space_data),
+            self.space_boundaries_table: self._space_boundary_records(None, space_data),
+            self.relationships_table: self._relationship_records(None, space_data)
+        }
+        for rows in children.values():
+            for row in rows:
+                del row['space_id']
+        
+        record = self._space_record(project_id, space_data)
+        record['content_hash'] = _content_hash({key: value for key, value in record.items() if key != 'project_id'})
+        for column, table in self.child_tables.items():
+            record[column] = _content_hash(children[table])
+        return record, children
     
-    def _insert_space(self, conn, project_id: int, space_data: Dict[str, Any]) -> int:
-        """Insert space record and return space ID."""
+    def _space_record(self, project_id: int, space_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build space record."""
         properties = space_data.get('properties', {})
         
-        space_record = {
+        return {
             'project_id': project_id,
             'guid': space_data.get('guid'),
             'name': properties.get('name'),
@@ -284,40 +583,38 @@ class AzureSQLExporter:
             'processed': properties.get('processed', False),
             'user_descriptions': json.dumps(properties.get('user_descriptions', {}))
         }
-        
-        result = conn.execute(self.spaces_table.insert().values(**space_record))
-        return result.inserted_primary_key[0]
     
-    def _insert_space_quantities(self, conn, space_id: int, space_data: Dict[str, Any]):
-        """Insert space quantities record."""
+    def _space_quantities_record(self, space_id: int, space_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build space quantities record, or None if the space has no quantities."""
         quantities = space_data.get('properties', {}).get('quantities', {})
         
-        if quantities:
-            quantities_record = {
-                'space_id': space_id,
-                'height': quantities.get('Height'),
-                'finish_ceiling_height': quantities.get('FinishCeilingHeight'),
-                'finish_floor_height': quantities.get('FinishFloorHeight'),
-                'gross_floor_area': quantities.get('GrossFloorArea'),
-                'net_floor_area': quantities.get('NetFloorArea'),
-                'gross_ceiling_area': quantities.get('GrossCeilingArea'),
-                'net_ceiling_area': quantities.get('NetCeilingArea'),
-                'gross_wall_area': quantities.get('GrossWallArea'),
-                'net_wall_area': quantities.get('NetWallArea'),
-                'gross_perimeter': quantities.get('GrossPerimeter'),
-                'net_perimeter': quantities.get('NetPerimeter'),
-                'gross_volume': quantities.get('GrossVolume'),
-                'net_volume': quantities.get('NetVolume')
-            }
-            
-            conn.execute(self.space_quantities_table.insert().values(**quantities_record))
+        if not quantities:
+            return None
+        
+        return {
+            'space_id': space_id,
+            'height': quantities.get('Height'),
+            'finish_ceiling_height': quantities.get('FinishCeilingHeight'),
+            'finish_floor_height': quantities.get('FinishFloorHeight'),
+            'gross_floor_area': quantities.get('GrossFloorArea'),
+            'net_floor_area': quantities.get('NetFloorArea'),
+            'gross_ceiling_area': quantities.get('GrossCeilingArea'),
+            'net_ceiling_area': quantities.get('NetCeilingArea'),
+            'gross_wall_area': quantities.get('GrossWallArea'),
+            'net_wall_area': quantities.get('NetWallArea'),
+            'gross_perimeter': quantities.get('GrossPerimeter'),
+            'net_perimeter': quantities.get('NetPerimeter'),
+            'gross_volume': quantities.get('GrossVolume'),
+            'net_volume': quantities.get('NetVolume')
+        }
     
-    def _insert_surfaces(self, conn, space_id: int, space_data: Dict[str, Any]):
-        """Insert surface records."""
+    def _surface_records(self, space_id: int, space_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build surface records."""
+        records = []
         for surface in space_data.get('surfaces', []):
             properties = surface.get('properties', {})
             
-            surface_record = {
+            records.append({
                 'space_id': space_id,
                 'surface_id': surface.get('id'),
                 'type': surface.get('type'),
@@ -327,14 +624,13 @@ class AzureSQLExporter:
                 'user_description': surface.get('user_description'),
                 'name': properties.get('name'),
                 'description': properties.get('description')
-            }
-            
-            conn.execute(self.surfaces_table.insert().values(**surface_record))
+            })
+        return records
     
-    def _insert_space_boundaries(self, conn, space_id: int, space_data: Dict[str, Any]):
-        """Insert space boundary records."""
-        for boundary in space_data.get('space_boundaries', []):
-            boundary_record = {
+    def _space_boundary_records(self, space_id: int, space_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build space boundary records."""
+        return [
+            {
                 'space_id': space_id,
                 'boundary_id': boundary.get('id'),
                 'guid': boundary.get('guid'),
@@ -357,13 +653,13 @@ class AzureSQLExporter:
                 'thermal_properties': json.dumps(boundary.get('thermal_properties', {})),
                 'material_properties': json.dumps(boundary.get('material_properties', {}))
             }
-            
-            conn.execute(self.space_boundaries_table.insert().values(**boundary_record))
+            for boundary in space_data.get('space_boundaries', [])
+        ]
     
-    def _insert_relationships(self, conn, space_id: int, space_data: Dict[str, Any]):
-        """Insert relationship records."""
-        for relationship in space_data.get('relationships', []):
-            relationship_record = {
+    def _relationship_records(self, space_id: int, space_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build relationship records."""
+        return [
+            {
                 'space_id': space_id,
                 'related_entity_guid': relationship.get('related_entity_guid'),
                 'related_entity_name': relationship.get('related_entity_name'),
@@ -371,8 +667,8 @@ class AzureSQLExporter:
                 'relationship_type': relationship.get('relationship_type'),
                 'ifc_relationship_type': relationship.get('ifc_relationship_type')
             }
-            
-            conn.execute(self.relationships_table.insert().values(**relationship_record))
+            for relationship in space_data.get('relationships', [])
+        ]
     
     def get_connection_string_template(self) -> str:
         """
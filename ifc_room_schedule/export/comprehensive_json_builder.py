@@ -8,13 +8,14 @@ that matches the template format.
 import json
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from datetime import datetime
 import logging
 
 from ..data.space_model import SpaceData
 from ..data.comprehensive_room_schedule_model import ComprehensiveRoomSchedule
 from ..mappers.comprehensive_room_mapper import ComprehensiveRoomMapper
+from .json_stream_writer import JsonStreamWriter, NdjsonStreamWriter
 
 
 class ComprehensiveJsonBuilder:
@@ -51,6 +52,25 @@ class ComprehensiveJsonBuilder:
         Returns:
             List of room schedule dictionaries
         """
+        return list(self.iter_comprehensive_json(spaces, project_info, user_data_per_space))
+    
+    def iter_comprehensive_json(
+        self, 
+        spaces: Iterable[SpaceData], 
+        project_info: Optional[Dict[str, Any]] = None,
+        user_data_per_space: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate the comprehensive JSON structure one space at a time.
+        
+        Args:
+            spaces: Space data; any iterable
+            project_info: Project-level information
+            user_data_per_space: User data keyed by space GUID
+            
+        Yields:
+            Room schedule dictionaries; spaces that fail to map are logged and skipped
+        """
         # Prepare IFC information
         ifc_info = {
             "file_name": Path(self.source_file).name if self.source_file else None,
@@ -58,22 +78,25 @@ class ComprehensiveJsonBuilder:
             "discipline": "ARK"  # Default, could be configurable
         }
         
-        # Map spaces to comprehensive schedules
-        schedules = self.mapper.map_multiple_spaces(
-            spaces, project_info, ifc_info, user_data_per_space
-        )
-        
-        # Convert to dictionaries
-        json_data = []
-        for schedule in schedules:
+        for space in spaces:
+            # Map space to comprehensive schedule
+            try:
+                space_user_data = user_data_per_space.get(space.guid) if user_data_per_space else None
+                schedule = self.mapper.map_space_to_comprehensive_schedule(
+                    space, project_info, ifc_info, space_user_data
+                )
+            except Exception as e:
+                self.logger.error(f"Error mapping space {space.guid}: {str(e)}")
+                continue
+            
+            # Convert to dictionary
             try:
                 schedule_dict = schedule.to_dict()
-                json_data.append(schedule_dict)
             except Exception as e:
                 self.logger.error(f"Error converting schedule to dict: {str(e)}")
                 continue
-        
-        return json_data
+            
+            yield schedule_dict
     
     def build_single_room_json(
         self, 
@@ -112,39 +135,53 @@ class ComprehensiveJsonBuilder:
         spaces: List[SpaceData],
         project_info: Optional[Dict[str, Any]] = None,
         user_data_per_space: Optional[Dict[str, Dict[str, Any]]] = None,
-        indent: int = 2
+        indent: int = 2,
+        ndjson: bool = False,
+        backend: str = "auto"
     ) -> bool:
         """
         Write comprehensive JSON file.
         
+        Rooms are written as they are mapped, so only one is held in memory.
+        
         Args:
             file_path: Output file path
-            spaces: List of space data
+            spaces: Space data; any iterable
             project_info: Project-level information
             user_data_per_space: User data keyed by space GUID
             indent: JSON indentation
+            ndjson: Write one room per line instead of a JSON array
+            backend: JSON serializer backend (auto, json, orjson)
             
         Returns:
             True if successful, False otherwise
         """
+        temp_path = str(file_path) + '.tmp'
         try:
-            # Build JSON structure
-            json_data = self.build_comprehensive_json_structure(
-                spaces, project_info, user_data_per_space
-            )
-            
             # Create output directory if it doesn't exist
             output_dir = Path(file_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Write JSON file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=indent, ensure_ascii=False)
+            # Write JSON file, replacing the target only once it is complete
+            rooms = self.iter_comprehensive_json(spaces, project_info, user_data_per_space)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                if ndjson:
+                    writer = NdjsonStreamWriter(f, backend)
+                    for room in rooms:
+                        writer.write(room)
+                else:
+                    with JsonStreamWriter(f, indent=indent, backend=backend) as writer:
+                        writer.begin_array()
+                        for room in rooms:
+                            writer.write(room)
+            os.replace(temp_path, file_path)
             
             self.logger.info(f"Successfully wrote comprehensive JSON file: {file_path}")
             return True
             
         except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             self.logger.error(f"Error writing comprehensive JSON file: {str(e)}")
             return False
     
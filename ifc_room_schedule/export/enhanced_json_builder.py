@@ -4,15 +4,15 @@ Enhanced JSON Builder
 Handles building enhanced JSON export structure with NS 8360/NS 3940 standards integration.
 """
 
-import json
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Tuple, Optional, Iterable, Callable, IO, Union
 from pathlib import Path
 
 from ..data.space_model import SpaceData
 from ..data.enhanced_room_schedule_model import EnhancedRoomScheduleData
+from ..config.section_configuration import SectionConfiguration, ExportProfile
 from ..mappers.meta_mapper import MetaMapper
 from ..mappers.enhanced_identification_mapper import EnhancedIdentificationMapper
 from ..mappers.ifc_metadata_mapper import IFCMetadataMapper
@@ -30,16 +30,50 @@ from ..mappers.logistics_mapper import LogisticsMapper
 from ..mappers.commissioning_mapper import CommissioningMapper
 from ..validation.ns8360_validator import NS8360Validator
 from ..validation.ns3940_validator import NS3940Validator
+from .json_stream_writer import JsonStreamWriter, NdjsonStreamWriter
 
 
 class EnhancedJsonBuilder:
     """Builds enhanced JSON export structure with NS standards integration."""
     
-    def __init__(self):
-        """Initialize the enhanced JSON builder."""
+    # Space sections in output order, with the SectionSettings name that
+    # enables each and the shared inputs it is built from
+    SPACE_SECTIONS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+        "identification": ("identification", ("parsed_name", "ns3940")),
+        "ifc_metadata": ("ifc_metadata", ("parsed_name",)),
+        "geometry": ("geometry_enhanced", ()),
+        "classification": ("classification", ("parsed_name", "ns3940")),
+        "performance_requirements": ("performance_requirements", ("room_type",)),
+        "finishes": ("finishes", ("room_type",)),
+        "openings": ("openings", ("room_type",)),
+        "fixtures_and_equipment": ("fixtures", ("room_type",)),
+        "hse_and_accessibility": ("hse", ("room_type",)),
+        "qa_qc": ("qa_qc", ("room_type",)),
+        "interfaces": ("interfaces", ("room_type",)),
+        "logistics_and_site": ("logistics", ("room_type",)),
+        "commissioning": ("commissioning", ("room_type",))
+    }
+    
+    # Inputs shared between space sections, with the inputs each is derived from
+    SPACE_INPUTS: Dict[str, Tuple[str, ...]] = {
+        "parsed_name": (),
+        "ns3940": ("parsed_name",),
+        "room_type": ("parsed_name", "ns3940")
+    }
+    
+    def __init__(self, section_configuration: Optional[SectionConfiguration] = None):
+        """
+        Initialize the enhanced JSON builder.
+        
+        Args:
+            section_configuration: Export profiles to resolve profile names in;
+                the predefined profiles if None
+        """
         self.source_file_path: Optional[str] = None
         self.ifc_version: Optional[str] = None
+        self.project_guid: Optional[str] = None
         self.application_version: str = "2.0.0"
+        self.section_configuration = section_configuration or SectionConfiguration()
         
         # Initialize mappers
         self.meta_mapper = MetaMapper()
@@ -65,6 +99,29 @@ class EnhancedJsonBuilder:
         # Initialize validators
         self.ns8360_validator = NS8360Validator()
         self.ns3940_validator = NS3940Validator()
+        
+        # Section and shared input builders, called with the space and its shared inputs
+        self.section_builders: Dict[str, Callable[[SpaceData, Dict[str, Any]], Any]] = {
+            "identification": self._build_identification_section,
+            "ifc_metadata": self._build_ifc_metadata_section,
+            "geometry": self._build_geometry_section,
+            "classification": self._build_classification_section,
+            "performance_requirements": self._build_performance_requirements_section,
+            "finishes": self._build_finishes_section,
+            "openings": self._build_openings_section,
+            "fixtures_and_equipment": self._build_fixtures_section,
+            "hse_and_accessibility": self._build_hse_section,
+            "qa_qc": self._build_qaqc_section,
+            "interfaces": self._build_interfaces_section,
+            "logistics_and_site": self._build_logistics_section,
+            "commissioning": self._build_commissioning_section
+        }
+        self.input_builders: Dict[str, Callable[[SpaceData, Dict[str, Any]], Any]] = {
+            "parsed_name": self._build_parsed_name_input,
+            "ns3940": self._build_ns3940_input,
+            "room_type": self._build_room_type_input
+        }
+        self._input_plans: Dict[Tuple[str, ...], List[str]] = {}
     
     def set_source_file(self, file_path: str) -> None:
         """Set the source IFC file path."""
@@ -74,16 +131,40 @@ class EnhancedJsonBuilder:
         """Set the IFC version."""
         self.ifc_version = version
     
+    def set_project_guid(self, guid: Optional[str]) -> None:
+        """Set the GlobalId of the IfcProject the spaces belong to."""
+        self.project_guid = guid
+    
+    def get_space_sections(self, export_profile: Union[str, ExportProfile] = "production") -> List[str]:
+        """
+        Get the space sections an export profile enables.
+        
+        Args:
+            export_profile: Export profile, or the name of one in the section
+                configuration; unknown names fall back to the core profile
+            
+        Returns:
+            Names of the enabled space sections in output order
+        """
+        profile = export_profile
+        if isinstance(export_profile, str):
+            profile = (self.section_configuration.get_profile(export_profile)
+                       or self.section_configuration.get_profile("core"))
+        
+        # Only sections the profile lists as enabled; get_enabled_sections omits unlisted ones
+        enabled = set(profile.get_enabled_sections())
+        return [section for section, (setting, _) in self.SPACE_SECTIONS.items() if setting in enabled]
+    
     def build_enhanced_json_structure(self, spaces: List[SpaceData], 
                                     ifc_file_metadata: Optional[Dict[str, Any]] = None,
-                                    export_profile: str = "production") -> Dict[str, Any]:
+                                    export_profile: Union[str, ExportProfile] = "production") -> Dict[str, Any]:
         """
         Build enhanced JSON structure with NS standards integration.
         
         Args:
             spaces: List of SpaceData objects to export
             ifc_file_metadata: Optional IFC file metadata
-            export_profile: Export profile (core, advanced, production)
+            export_profile: Export profile or profile name (core, advanced, production, minimal, ...)
             
         Returns:
             Enhanced JSON structure ready for export
@@ -93,40 +174,93 @@ class EnhancedJsonBuilder:
         
         # Build enhanced spaces data
         enhanced_spaces = []
-        compliance_stats = {
-            "total_spaces": len(spaces),
-            "ns8360_compliant": 0,
-            "ns3940_classified": 0,
-            "performance_requirements": 0
-        }
+        totals = self.new_export_totals()
+        sections = self.get_space_sections(export_profile)
         
         for space in spaces:
-            space_data = self._build_enhanced_space_dict(space, export_profile)
+            space_data = self._build_enhanced_space_dict(space, sections=sections)
             enhanced_spaces.append(space_data)
-            
-            # Update compliance statistics
-            if space_data.get("ns8360_compliance", {}).get("name_pattern_valid", False):
-                compliance_stats["ns8360_compliant"] += 1
-            
-            if space_data.get("classification", {}).get("ns3940"):
-                compliance_stats["ns3940_classified"] += 1
-            
-            if space_data.get("performance_requirements"):
-                compliance_stats["performance_requirements"] += 1
-        
-        # Generate enhanced summary
-        enhanced_summary = self._generate_enhanced_summary(spaces, compliance_stats)
+            self.add_space_to_totals(totals, space, space_data)
         
         # Build complete enhanced structure
         enhanced_json = {
             "metadata": enhanced_metadata,
             "spaces": enhanced_spaces,
-            "summary": enhanced_summary,
-            "ns_standards_compliance": self._generate_compliance_report(compliance_stats)
+            "summary": self.generate_enhanced_summary(totals),
+            "ns_standards_compliance": self._generate_compliance_report(totals["compliance_stats"])
         }
         
         return enhanced_json
     
+    def write_enhanced_json_stream(self, stream: IO[str], spaces: Iterable[SpaceData],
+                                   ifc_file_metadata: Optional[Dict[str, Any]] = None,
+                                   export_profile: Union[str, ExportProfile] = "production",
+                                   ndjson: bool = False,
+                                   backend: str = "auto",
+                                   validation_errors: Optional[List[str]] = None) -> int:
+        """
+        Write the enhanced JSON structure to a stream as the spaces are built.
+        
+        Metadata is written first, then each space, then the summary and the
+        compliance report from totals kept along the way, so no more than one
+        space is held in memory. With the json backend the output equals
+        build_enhanced_json_structure dumped with indent=2; orjson may format
+        some numbers differently.
+        
+        Args:
+            stream: Text stream to write to
+            spaces: SpaceData objects to export; any iterable
+            ifc_file_metadata: Optional IFC file metadata
+            export_profile: Export profile or profile name (core, advanced, production, minimal, ...)
+            ndjson: Write one {"type", "data"} record per line instead: metadata,
+                one per space, summary and ns_standards_compliance
+            backend: JSON serializer backend (auto, json, orjson)
+            validation_errors: List to collect validation errors in; no validation if None
+            
+        Returns:
+            Number of spaces written
+        """
+        enhanced_metadata = self._generate_enhanced_metadata(ifc_file_metadata)
+        if validation_errors is not None:
+            validation_errors.extend(self._validate_enhanced_metadata(enhanced_metadata))
+        
+        if ndjson:
+            ndjson_writer = NdjsonStreamWriter(stream, backend)
+            ndjson_writer.write_record("metadata", enhanced_metadata)
+            
+            def write_space(space_data: Dict[str, Any]) -> None:
+                ndjson_writer.write_record("space", space_data)
+        else:
+            writer = JsonStreamWriter(stream, indent=2, backend=backend)
+            writer.begin_object()
+            writer.write(enhanced_metadata, "metadata")
+            writer.begin_array("spaces")
+            write_space = writer.write
+        
+        totals = self.new_export_totals()
+        sections = self.get_space_sections(export_profile)
+        for space in spaces:
+            space_data = self._build_enhanced_space_dict(space, sections=sections)
+            if validation_errors is not None:
+                validation_errors.extend(
+                    self._validate_enhanced_space_data(space_data, totals["compliance_stats"]["total_spaces"])
+                )
+            self.add_space_to_totals(totals, space, space_data)
+            write_space(space_data)
+        
+        enhanced_summary = self.generate_enhanced_summary(totals)
+        compliance_report = self._generate_compliance_report(totals["compliance_stats"])
+        if ndjson:
+            ndjson_writer.write_record("summary", enhanced_summary)
+            ndjson_writer.write_record("ns_standards_compliance", compliance_report)
+        else:
+            writer.end()
+            writer.write(enhanced_summary, "summary")
+            writer.write(compliance_report, "ns_standards_compliance")
+            writer.close()
+        
+        return totals["compliance_stats"]["total_spaces"]
+    
     def _generate_enhanced_metadata(self, ifc_file_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate enhanced metadata with NS standards information."""
         # Use MetaMapper to generate metadata
@@ -150,11 +284,34 @@ class EnhancedJsonBuilder:
             "project_info": meta_data.project_info,
             "timestamps": meta_data.timestamps
         }
+        if self.project_guid:
+            enhanced_metadata["project_guid"] = self.project_guid
         
         return enhanced_metadata
     
-    def _build_enhanced_space_dict(self, space: SpaceData, export_profile: str) -> Dict[str, Any]:
-        """Build enhanced dictionary representation of a space."""
+    def _build_enhanced_space_dict(self, space: SpaceData,
+                                   export_profile: Union[str, ExportProfile] = "production",
+                                   sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Build enhanced dictionary representation of a space.
+        
+        Only the enabled sections are built, and the shared inputs they need,
+        such as the parsed name and NS 3940 classification, are built once.
+        
+        Args:
+            space: SpaceData to build
+            export_profile: Export profile or profile name, used if sections is None
+            sections: Names of the space sections to build
+            
+        Returns:
+            Dictionary with basic properties, the sections and the traditional sections
+        """
+        if sections is None:
+            sections = self.get_space_sections(export_profile)
+        else:
+            selected = set(sections)
+            sections = [section for section in self.SPACE_SECTIONS if section in selected]
+        
         # Basic space properties
         space_dict = {
             "guid": space.guid,
@@ -172,10 +329,64 @@ class EnhancedJsonBuilder:
             }
         }
         
-        # Add NS standards sections (always include basic sections)
-        # Identification section
-        identification = self.identification_mapper.map_identification(space, self.source_file_path)
-        space_dict["identification"] = {
+        # Shared inputs, each built after the inputs it is derived from
+        inputs: Dict[str, Any] = {}
+        for input_name in self._plan_space_inputs(sections):
+            inputs[input_name] = self.input_builders[input_name](space, inputs)
+        
+        # NS standards sections
+        for section in sections:
+            space_dict[section] = self.section_builders[section](space, inputs)
+        
+        # Add traditional sections (always included)
+        space_dict["surfaces"] = [self._build_surface_dict(surface) for surface in space.surfaces]
+        space_dict["space_boundaries"] = [self._build_space_boundary_dict(boundary) for boundary in space.space_boundaries]
+        space_dict["relationships"] = [self._build_relationship_dict(relationship) for relationship in space.relationships]
+        
+        return space_dict
+    
+    def _plan_space_inputs(self, sections: List[str]) -> List[str]:
+        """Get the shared inputs the sections need, each after the inputs it is derived from."""
+        key = tuple(sections)
+        if key not in self._input_plans:
+            plan: List[str] = []
+            
+            def add_input(input_name: str) -> None:
+                if input_name not in plan:
+                    for dependency in self.SPACE_INPUTS[input_name]:
+                        add_input(dependency)
+                    plan.append(input_name)
+            
+            for section in sections:
+                for input_name in self.SPACE_SECTIONS[section][1]:
+                    add_input(input_name)
+            self._input_plans[key] = plan
+        
+        return self._input_plans[key]
+    
+    def _build_parsed_name_input(self, space: SpaceData, inputs: Dict[str, Any]):
+        """Parse the NS 8360 space name."""
+        return self.identification_mapper.name_parser.parse(space.name)
+    
+    def _build_ns3940_input(self, space: SpaceData, inputs: Dict[str, Any]):
+        """Get the NS 3940 classification from the parsed name."""
+        return self.identification_mapper.classify_parsed_name(space, inputs["parsed_name"])
+    
+    def _build_room_type_input(self, space: SpaceData, inputs: Dict[str, Any]) -> str:
+        """Get the room type code the Phase 2B/2C mappers look up their defaults by."""
+        parsed_name = inputs["parsed_name"]
+        if parsed_name.is_valid and parsed_name.function_code:
+            return parsed_name.function_code
+        
+        classification = inputs["ns3940"]
+        return classification.function_code if classification else "111"
+    
+    def _build_identification_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build identification section."""
+        identification = self.identification_mapper.map_identification(
+            space, self.source_file_path, inputs["parsed_name"], inputs["ns3940"]
+        )
+        return {
             "project_id": identification.project_id,
             "project_name": identification.project_name,
             "building_id": identification.building_id,
@@ -187,10 +398,13 @@ class EnhancedJsonBuilder:
             "function": identification.function,
             "occupancy_type": identification.occupancy_type
         }
-        
-        # IFC metadata section
-        ifc_metadata = self.identification_mapper.map_ifc_metadata(space, self.source_file_path)
-        space_dict["ifc_metadata"] = {
+    
+    def _build_ifc_metadata_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build IFC metadata section."""
+        ifc_metadata = self.identification_mapper.map_ifc_metadata(
+            space, self.source_file_path, inputs["parsed_name"]
+        )
+        return {
             "space_global_id": ifc_metadata.space_global_id,
             "space_long_name": ifc_metadata.space_long_name,
             "space_number": ifc_metadata.space_number,
@@ -198,10 +412,11 @@ class EnhancedJsonBuilder:
             "parsed_name_components": ifc_metadata.parsed_name_components,
             "model_source": ifc_metadata.model_source
         }
-        
-        # Enhanced geometry section (always include)
+    
+    def _build_geometry_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build enhanced geometry section."""
         geometry = self.geometry_mapper.calculate_enhanced_geometry(space)
-        space_dict["geometry"] = {
+        return {
             "length_m": geometry.length_m,
             "width_m": geometry.width_m,
             "height_m": geometry.height_m,
@@ -222,10 +437,13 @@ class EnhancedJsonBuilder:
             "estimation_confidence": geometry.estimation_confidence,
             "estimation_method": geometry.estimation_method
         }
-        
-        # Enhanced classification section (always include)
-        classification = self.classification_mapper.map_classification(space)
-        space_dict["classification"] = {
+    
+    def _build_classification_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build enhanced classification section."""
+        classification = self.classification_mapper.map_classification(
+            space, inputs["parsed_name"], inputs["ns3940"]
+        )
+        return {
             "ns3940": classification.ns3940,
             "ns8360_compliance": classification.ns8360_compliance,
             "tfm": classification.tfm,
@@ -234,49 +452,46 @@ class EnhancedJsonBuilder:
             "overall_confidence": classification.overall_confidence,
             "classification_source": classification.classification_source
         }
-        
-        # Add advanced sections based on export profile
-        if export_profile in ["advanced", "production"]:
-            pass  # Advanced sections already included above
-            
-            # Phase 2B: Performance requirements section
-            if export_profile == "production":
-                # Use new Phase 2B mappers
-                performance_req = self.performance_requirements_mapper.extract_performance_requirements(space)
-                space_dict["performance_requirements"] = self._build_performance_requirements_dict(performance_req)
-                
-                # Add other Phase 2B sections
-                finishes = self.finishes_mapper.extract_surface_finishes(space)
-                space_dict["finishes"] = self._build_finishes_dict(finishes)
-                
-                openings = self.openings_mapper.extract_openings(space)
-                space_dict["openings"] = self._build_openings_dict(openings)
-                
-                fixtures = self.fixtures_mapper.extract_fixtures(space)
-                space_dict["fixtures_and_equipment"] = self._build_fixtures_dict(fixtures)
-                
-                hse = self.hse_mapper.extract_hse_requirements(space)
-                space_dict["hse_and_accessibility"] = self._build_hse_dict(hse)
-                
-                # Phase 2C: Advanced sections
-                qaqc = self.qaqc_mapper.extract_qa_qc_requirements(space)
-                space_dict["qa_qc"] = self._build_qaqc_dict(qaqc)
-                
-                interfaces = self.interfaces_mapper.extract_interfaces(space)
-                space_dict["interfaces"] = self._build_interfaces_dict(interfaces)
-                
-                logistics = self.logistics_mapper.extract_logistics(space)
-                space_dict["logistics_and_site"] = self._build_logistics_dict(logistics)
-                
-                commissioning = self.commissioning_mapper.extract_commissioning(space)
-                space_dict["commissioning"] = self._build_commissioning_dict(commissioning)
-        
-        # Add traditional sections (always included)
-        space_dict["surfaces"] = [self._build_surface_dict(surface) for surface in space.surfaces]
-        space_dict["space_boundaries"] = [self._build_space_boundary_dict(boundary) for boundary in space.space_boundaries]
-        space_dict["relationships"] = [self._build_relationship_dict(relationship) for relationship in space.relationships]
-        
-        return space_dict
+    
+    def _build_performance_requirements_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Phase 2B performance requirements section."""
+        return self._build_performance_requirements_dict(
+            self.performance_requirements_mapper.extract_performance_requirements(space, inputs["room_type"])
+        )
+    
+    def _build_finishes_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Phase 2B finishes section."""
+        return self._build_finishes_dict(self.finishes_mapper.extract_surface_finishes(space, inputs["room_type"]))
+    
+    def _build_openings_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Phase 2B openings section."""
+        return self._build_openings_dict(self.openings_mapper.extract_openings(space, inputs["room_type"]))
+    
+    def _build_fixtures_section(self, space: SpaceData, inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build Phase 2B fixtures and equipment section."""
+        return self._build_fixtures_dict(self.fixtures_mapper.extract_fixtures(space, inputs["room_type"]))
+    
+    def _build_hse_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Phase 2B HSE and accessibility section."""
+        return self._build_hse_dict(self.hse_mapper.extract_hse_requirements(space, inputs["room_type"]))
+    
+    def _build_qaqc_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Phase 2C QA/QC section."""
+        return self._build_qaqc_dict(self.qaqc_mapper.extract_qa_qc_requirements(space, inputs["room_type"]))
+    
+    def _build_interfaces_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Phase 2C interfaces section."""
+        return self._build_interfaces_dict(self.interfaces_mapper.extract_interfaces(space, inputs["room_type"]))
+    
+    def _build_logistics_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Phase 2C logistics and site section."""
+        return self._build_logistics_dict(self.logistics_mapper.extract_logistics(space, inputs["room_type"]))
+    
+    def _build_commissioning_section(self, space: SpaceData, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Phase 2C commissioning section."""
+        return self._build_commissioning_dict(
+            self.commissioning_mapper.extract_commissioning(space, inputs["room_type"])
+        )
     
     def _build_performance_requirements_dict(self, performance_req) -> Dict[str, Any]:
         """Build performance requirements dictionary."""
@@ -717,15 +932,81 @@ class EnhancedJsonBuilder:
             "ifc_relationship_type": relationship.ifc_relationship_type
         }
     
-    def _generate_enhanced_summary(self, spaces: List[SpaceData], compliance_stats: Dict[str, int]) -> Dict[str, Any]:
-        """Generate enhanced summary with NS standards statistics."""
+    def new_export_totals(self) -> Dict[str, Any]:
+        """
+        Create the running totals that the summary sections are generated from.
+        
+        Add each exported space with add_space_to_totals, then generate the
+        summary with generate_enhanced_summary.
+        
+        Returns:
+            Totals dictionary for an export with no spaces yet
+        """
+        return {
+            "compliance_stats": {
+                "total_spaces": 0,
+                "ns8360_compliant": 0,
+                "ns3940_classified": 0,
+                "performance_requirements": 0
+            },
+            "processed_spaces": 0,
+            "total_surface_area": 0.0,
+            "total_boundary_area": 0.0,
+            "room_type_distribution": {}
+        }
+    
+    def add_space_to_totals(self, totals: Dict[str, Any], space: SpaceData, space_data: Dict[str, Any]) -> None:
+        """
+        Add an exported space to the running totals.
+        
+        Args:
+            totals: Totals from new_export_totals
+            space: The exported space
+            space_data: The enhanced space dictionary written for it
+        """
+        compliance_stats = totals["compliance_stats"]
+        compliance_stats["total_spaces"] += 1
+        
+        # Update compliance statistics
+        if space_data.get("ns8360_compliance", {}).get("name_pattern_valid", False):
+            compliance_stats["ns8360_compliant"] += 1
+        
+        if space_data.get("classification", {}).get("ns3940"):
+            compliance_stats["ns3940_classified"] += 1
+        
+        if space_data.get("performance_requirements"):
+            compliance_stats["performance_requirements"] += 1
+        
+        if space.processed:
+            totals["processed_spaces"] += 1
+        totals["total_surface_area"] += space.get_total_surface_area()
+        totals["total_boundary_area"] += space.get_total_boundary_area()
+        
+        # Room type from the classification already in the space data
+        ns3940 = space_data.get("classification", {}).get("ns3940")
+        if ns3940 and ns3940.get("label"):
+            room_type = ns3940["label"]
+            totals["room_type_distribution"][room_type] = totals["room_type_distribution"].get(room_type, 0) + 1
+    
+    def generate_enhanced_summary(self, totals: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate enhanced summary with NS standards statistics from running totals.
+        
+        Args:
+            totals: Totals from new_export_totals with all exported spaces added
+            
+        Returns:
+            Summary section of the export
+        """
+        compliance_stats = totals["compliance_stats"]
+        
         # Basic summary
-        total_spaces = len(spaces)
-        processed_spaces = sum(1 for space in spaces if space.processed)
+        total_spaces = compliance_stats["total_spaces"]
+        processed_spaces = totals["processed_spaces"]
         
         # Calculate areas
-        total_surface_area = sum(space.get_total_surface_area() for space in spaces)
-        total_boundary_area = sum(space.get_total_boundary_area() for space in spaces)
+        total_surface_area = totals["total_surface_area"]
+        total_boundary_area = totals["total_boundary_area"]
         
         # NS standards compliance
         ns8360_compliance_percentage = (compliance_stats["ns8360_compliant"] / total_spaces * 100) if total_spaces > 0 else 0
@@ -733,13 +1014,7 @@ class EnhancedJsonBuilder:
         performance_requirements_percentage = (compliance_stats["performance_requirements"] / total_spaces * 100) if total_spaces > 0 else 0
         
         # Room type distribution
-        room_type_distribution = {}
-        for space in spaces:
-            # Try to get room type from classification
-            classification = self.classification_mapper.map_classification(space)
-            if classification.ns3940 and classification.ns3940.get("label"):
-                room_type = classification.ns3940["label"]
-                room_type_distribution[room_type] = room_type_distribution.get(room_type, 0) + 1
+        room_type_distribution = totals["room_type_distribution"]
         
         enhanced_summary = {
             "total_spaces": total_spaces,
@@ -819,11 +1094,7 @@ class EnhancedJsonBuilder:
         
         # Validate metadata
         if "metadata" in data:
-            metadata = data["metadata"]
-            if "ns_standards" not in metadata:
-                errors.append("Missing ns_standards in metadata")
-            if "export_date" not in metadata:
-                errors.append("Missing export_date in metadata")
+            errors.extend(self._validate_enhanced_metadata(data["metadata"]))
         
         # Validate spaces
         if "spaces" in data:
@@ -837,13 +1108,22 @@ class EnhancedJsonBuilder:
         
         return len(errors) == 0, errors
     
+    def _validate_enhanced_metadata(self, metadata: Dict[str, Any]) -> List[str]:
+        """Validate enhanced metadata."""
+        errors = []
+        if "ns_standards" not in metadata:
+            errors.append("Missing ns_standards in metadata")
+        if "export_date" not in metadata:
+            errors.append("Missing export_date in metadata")
+        return errors
+    
     def _validate_enhanced_space_data(self, space_data: Dict[str, Any], space_index: int) -> List[str]:
         """Validate enhanced space data."""
         errors = []
         prefix = f"Space {space_index}"
         
-        # Check required keys
-        required_keys = ["guid", "properties", "identification", "classification"]
+        # Check required keys; classification is left out by the minimal profile
+        required_keys = ["guid", "properties", "identification"]
         for key in required_keys:
             if key not in space_data:
                 errors.append(f"{prefix}: Missing required key {key}")
@@ -856,45 +1136,64 @@ class EnhancedJsonBuilder:
         
         return errors
     
-    def export_enhanced_json(self, spaces: List[SpaceData], filename: str,
+    def export_enhanced_json(self, spaces: Iterable[SpaceData], filename: str,
                            ifc_file_metadata: Optional[Dict[str, Any]] = None,
-                           export_profile: str = "production",
-                           validate: bool = True) -> Tuple[bool, List[str]]:
+                           export_profile: Union[str, ExportProfile] = "production",
+                           validate: bool = True,
+                           ndjson: bool = False,
+                           backend: str = "auto") -> Tuple[bool, List[str]]:
         """
         Complete enhanced export workflow with NS standards integration.
         
+        The file is streamed space by space (see write_enhanced_json_stream) and
+        only replaces an existing file once it is complete and valid.
+        
         Args:
-            spaces: List of SpaceData objects to export
+            spaces: SpaceData objects to export; any iterable
             filename: Output filename
             ifc_file_metadata: Optional IFC file metadata
-            export_profile: Export profile (core, advanced, production)
+            export_profile: Export profile or profile name (core, advanced, production, minimal, ...)
             validate: Whether to validate data before export
+            ndjson: Write newline-delimited JSON records instead of one document
+            backend: JSON serializer backend (auto, json, orjson)
             
         Returns:
             Tuple of (success, list_of_errors_or_messages)
         """
         try:
-            # Build enhanced JSON structure
-            json_data = self.build_enhanced_json_structure(spaces, ifc_file_metadata, export_profile)
+            validation_errors: List[str] = []
+            space_counts: List[int] = []
             
-            # Validate if requested
-            if validate:
-                is_valid, validation_errors = self.validate_enhanced_export_data(json_data)
-                if not is_valid:
-                    return False, validation_errors
+            def write_export(f: IO[str]) -> bool:
+                space_counts.append(self.write_enhanced_json_stream(
+                    f, spaces, ifc_file_metadata, export_profile, ndjson, backend,
+                    validation_errors if validate else None
+                ))
+                return not validation_errors
             
             # Write to file
-            success, write_message = self._write_enhanced_json_file(filename, json_data)
+            success, write_message = self._write_enhanced_json_file(filename, write_export)
+            if validation_errors:
+                return False, validation_errors
             if success:
-                return True, [f"Successfully exported {len(spaces)} spaces with NS standards to {filename}"]
+                return True, [f"Successfully exported {space_counts[0]} spaces with NS standards to {filename}"]
             else:
                 return False, [f"Failed to write enhanced JSON file: {write_message}"]
                 
         except Exception as e:
             return False, [f"Enhanced export failed: {str(e)}"]
     
-    def _write_enhanced_json_file(self, filename: str, data: Dict[str, Any], indent: int = 2) -> Tuple[bool, str]:
-        """Write enhanced JSON data to file with error handling."""
+    def _write_enhanced_json_file(self, filename: str, write: Callable[[IO[str]], bool]) -> Tuple[bool, str]:
+        """
+        Write enhanced JSON data to file with error handling.
+        
+        Args:
+            filename: Output filename
+            write: Writes the content to the open file; returns False to discard it
+            
+        Returns:
+            Tuple of (success, message)
+        """
         try:
             if not filename:
                 return False, "Filename cannot be empty"
@@ -915,17 +1214,18 @@ class EnhancedJsonBuilder:
             if free_space < 1024 * 1024:  # 1MB minimum
                 return False, f"Insufficient disk space. Available: {free_space / (1024*1024):.1f}MB"
             
-            # Validate JSON serialization
-            try:
-                json.dumps(data, indent=indent, ensure_ascii=False)
-            except (TypeError, ValueError) as e:
-                return False, f"Data cannot be serialized to JSON: {str(e)}"
-            
             # Write to temporary file first, then rename for atomic operation
             temp_filename = str(file_path) + '.tmp'
             try:
                 with open(temp_filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=indent, ensure_ascii=False)
+                    try:
+                        keep, message = write(f), "Export data is not valid"
+                    except (TypeError, ValueError) as e:
+                        keep, message = False, f"Data cannot be serialized to JSON: {str(e)}"
+                
+                if not keep:
+                    os.remove(temp_filename)
+                    return False, message
                 
                 # Atomic rename
                 if os.name == 'nt':  # Windows
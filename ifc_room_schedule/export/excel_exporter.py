@@ -2,16 +2,20 @@
 Excel Exporter
 
 Handles exporting room schedule data to Excel format using openpyxl.
+Large exports are streamed through write-only worksheets so memory use does
+not grow with the number of spaces.
 """
 
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from collections.abc import Sized
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
     from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
@@ -20,9 +24,55 @@ except ImportError:
 from ..data.space_model import SpaceData
 
 
+# Space count from which export_to_excel streams unless told otherwise
+STREAMING_SPACE_THRESHOLD = 1000
+
+# Rows held back per streamed sheet to size its columns; write-only
+# worksheets need column widths before the first row is written
+STREAMING_WIDTH_SAMPLE_ROWS = 500
+
+# Named styles registered on streamed workbooks
+HEADER_STYLE = "schedule_header"
+CELL_STYLE = "schedule_cell"
+TITLE_STYLE = "schedule_title"
+SECTION_STYLE = "schedule_section"
+LABEL_STYLE = "schedule_label"
+
+
+def _column_width(max_length: int) -> int:
+    """Get the column width for the longest value in a column."""
+    # Set minimum width and maximum width
+    return min(max(max_length + 2, 10), 50)
+
+
 class ExcelExporter:
     """Exports room schedule data to Excel format."""
     
+    SPACES_HEADERS = [
+        'GUID', 'Name', 'Long Name', 'Description', 'Object Type',
+        'Zone Category', 'Number', 'Elevation', 'Processed',
+        'Height', 'Finish Floor Height', 'Finish Ceiling Height',
+        'Total Surface Area (m²)', 'Total Boundary Area (m²)', 'User Description'
+    ]
+    
+    SURFACES_HEADERS = [
+        'Space GUID', 'Space Name', 'Surface ID', 'Surface Type',
+        'Area (m²)', 'Material', 'IFC Type', 'User Description'
+    ]
+    
+    BOUNDARIES_HEADERS = [
+        'Space GUID', 'Space Name', 'Boundary GUID', 'Boundary Name',
+        'Physical/Virtual', 'Internal/External', 'Surface Type', 'Orientation',
+        'Area (m²)', 'Related Element GUID', 'Related Element Name', 'Related Element Type',
+        'Adjacent Space GUID', 'Adjacent Space Name', 'Boundary Level', 'Display Label',
+        'User Description'
+    ]
+    
+    RELATIONSHIPS_HEADERS = [
+        'Space GUID', 'Space Name', 'Related Entity GUID', 'Related Entity Name',
+        'Related Entity Description', 'Relationship Type', 'IFC Relationship Type'
+    ]
+    
     def __init__(self):
         """Initialize the Excel exporter."""
         if not OPENPYXL_AVAILABLE:
@@ -63,16 +113,20 @@ class ExcelExporter:
     def export_to_excel(self, spaces: List[SpaceData], filename: str,
                        include_surfaces: bool = True,
                        include_boundaries: bool = True,
-                       include_relationships: bool = True) -> Tuple[bool, str]:
+                       include_relationships: bool = True,
+                       streaming: Optional[bool] = None) -> Tuple[bool, str]:
         """
         Export space data to Excel format.
         
         Args:
-            spaces: List of SpaceData objects to export
+            spaces: SpaceData objects to export, as a list or any other iterable
             filename: Output Excel filename
             include_surfaces: Whether to include surface data
             include_boundaries: Whether to include boundary data
             include_relationships: Whether to include relationship data
+            streaming: Write rows through write-only worksheets as the spaces are
+                iterated; defaults to True from STREAMING_SPACE_THRESHOLD spaces
+                and for iterables without a length
             
         Returns:
             Tuple of (success, message)
@@ -136,27 +190,39 @@ class ExcelExporter:
             except OSError as e:
                 return False, f"File system error: {str(e)}"
             
-            # Create workbook
-            wb = Workbook()
-            
-            # Remove default sheet
-            wb.remove(wb.active)
+            if streaming is None:
+                # Iterables without a length may only be iterable once, as the streaming path needs
+                streaming = not isinstance(spaces, Sized) or len(spaces) >= STREAMING_SPACE_THRESHOLD
+            elif not streaming and not isinstance(spaces, Sized):
+                spaces = list(spaces)
             
             # Create sheets with error handling
             try:
-                self._create_overview_sheet(wb, spaces)
-                self._create_spaces_sheet(wb, spaces)
-                
-                if include_surfaces:
-                    self._create_surfaces_sheet(wb, spaces)
-                
-                if include_boundaries:
-                    self._create_boundaries_sheet(wb, spaces)
-                
-                if include_relationships:
-                    self._create_relationships_sheet(wb, spaces)
-                
-                self._create_summary_sheet(wb, spaces)
+                if streaming:
+                    wb, space_count = self._create_streaming_workbook(
+                        spaces, include_surfaces, include_boundaries, include_relationships
+                    )
+                else:
+                    # Create workbook
+                    wb = Workbook()
+                    
+                    # Remove default sheet
+                    wb.remove(wb.active)
+                    
+                    self._create_overview_sheet(wb, spaces)
+                    self._create_spaces_sheet(wb, spaces)
+                    
+                    if include_surfaces:
+                        self._create_surfaces_sheet(wb, spaces)
+                    
+                    if include_boundaries:
+                        self._create_boundaries_sheet(wb, spaces)
+                    
+                    if include_relationships:
+                        self._create_relationships_sheet(wb, spaces)
+                    
+                    self._create_summary_sheet(wb, spaces)
+                    space_count = len(spaces)
                 
             except Exception as e:
                 return False, f"Error creating Excel sheets: {str(e)}"
@@ -172,7 +238,7 @@ class ExcelExporter:
                         os.remove(file_path)
                 os.rename(temp_filename, filename)
                 
-                return True, f"Successfully exported {len(spaces)} spaces to {Path(filename).name}"
+                return True, f"Successfully exported {space_count} spaces to {Path(filename).name}"
                 
             except Exception as e:
                 # Clean up temp file
@@ -190,6 +256,79 @@ class ExcelExporter:
         except Exception as e:
             return False, f"Excel export failed: {str(e)}"
     
+    def _space_row(self, space: SpaceData) -> List[Any]:
+        """Get the Spaces sheet row of a space."""
+        quantities = space.quantities or {}
+        user_desc = space.user_descriptions.get('space', '') if space.user_descriptions else ''
+        
+        return [
+            space.guid,
+            space.name or '',
+            space.long_name or '',
+            space.description or '',
+            space.object_type or '',
+            space.zone_category or '',
+            space.number or '',
+            space.elevation or 0.0,
+            'Yes' if space.processed else 'No',
+            quantities.get('Height', ''),
+            quantities.get('FinishFloorHeight', ''),
+            quantities.get('FinishCeilingHeight', ''),
+            round(space.get_total_surface_area(), 2),
+            round(space.get_total_boundary_area(), 2),
+            user_desc
+        ]
+    
+    def _surface_rows(self, space: SpaceData) -> Iterator[List[Any]]:
+        """Generate the Surfaces sheet rows of a space."""
+        for surface in space.surfaces:
+            yield [
+                space.guid,
+                space.name or '',
+                surface.id,
+                surface.type or '',
+                round(surface.area, 2) if surface.area else 0.0,
+                surface.material or '',
+                surface.ifc_type or '',
+                surface.user_description or ''
+            ]
+    
+    def _boundary_rows(self, space: SpaceData) -> Iterator[List[Any]]:
+        """Generate the Space Boundaries sheet rows of a space."""
+        for boundary in space.space_boundaries:
+            yield [
+                space.guid,
+                space.name or '',
+                boundary.guid,
+                boundary.name or '',
+                boundary.physical_or_virtual_boundary or '',
+                boundary.internal_or_external_boundary or '',
+                boundary.boundary_surface_type or '',
+                boundary.boundary_orientation or '',
+                round(boundary.calculated_area, 2) if boundary.calculated_area else 0.0,
+                boundary.related_building_element_guid or '',
+                boundary.related_building_element_name or '',
+                boundary.related_building_element_type or '',
+                boundary.adjacent_space_guid or '',
+                boundary.adjacent_space_name or '',
+                boundary.boundary_level or 1,
+                boundary.display_label or '',
+                boundary.user_description or ''
+            ]
+    
+    def _relationship_rows(self, space: SpaceData) -> Iterator[List[Any]]:
+        """Generate the Relationships sheet rows of a space."""
+        for relationship in space.relationships:
+            yield [
+                space.guid,
+                space.name or '',
+                relationship.related_entity_guid,
+                relationship.related_entity_name or '',
+                relationship.related_entity_description or '',
+                relationship.relationship_type or '',
+                relationship.ifc_relationship_type or ''
+            ]
+    
     def _create_overview_sheet(self, wb: Workbook, spaces: List[SpaceData]) -> None:
         """Create overview sheet with metadata and summary."""
         ws = wb.create_sheet("Overview", 0)
@@ -258,16 +397,8 @@ class ExcelExporter:
         """Create spaces data sheet."""
         ws = wb.create_sheet("Spaces")
         
-        # Headers
-        headers = [
-            'GUID', 'Name', 'Long Name', 'Description', 'Object Type',
-            'Zone Category', 'Number', 'Elevation', 'Processed',
-            'Height', 'Finish Floor Height', 'Finish Ceiling Height',
-            'Total Surface Area (m²)', 'Total Boundary Area (m²)', 'User Description'
-        ]
-        
         # Write headers
-        for col, header in enumerate(headers, 1):
+        for col, header in enumerate(self.SPACES_HEADERS, 1):
             cell = ws.cell(row=1, column=col, value=header)
             cell.font = self.header_font
             cell.fill = self.header_fill
@@ -276,28 +407,7 @@ class ExcelExporter:
         
         # Write data
         for row, space in enumerate(spaces, 2):
-            quantities = space.quantities or {}
-            user_desc = space.user_descriptions.get('space', '') if space.user_descriptions else ''
-            
-            data = [
-                space.guid,
-                space.name or '',
-                space.long_name or '',
-                space.description or '',
-                space.object_type or '',
-                space.zone_category or '',
-                space.number or '',
-                space.elevation or 0.0,
-                'Yes' if space.processed else 'No',
-                quantities.get('Height', ''),
-                quantities.get('FinishFloorHeight', ''),
-                quantities.get('FinishCeilingHeight', ''),
-                round(space.get_total_surface_area(), 2),
-                round(space.get_total_boundary_area(), 2),
-                user_desc
-            ]
-            
-            for col, value in enumerate(data, 1):
+            for col, value in enumerate(self._space_row(space), 1):
                 cell = ws.cell(row=row, column=col, value=value)
                 cell.border = self.border
         
@@ -308,14 +418,8 @@ class ExcelExporter:
         """Create surfaces data sheet."""
         ws = wb.create_sheet("Surfaces")
         
-        # Headers
-        headers = [
-            'Space GUID', 'Space Name', 'Surface ID', 'Surface Type',
-            'Area (m²)', 'Material', 'IFC Type', 'User Description'
-        ]
-        
         # Write headers
-        for col, header in enumerate(headers, 1):
+        for col, header in enumerate(self.SURFACES_HEADERS, 1):
             cell = ws.cell(row=1, column=col, value=header)
             cell.font = self.header_font
             cell.fill = self.header_fill
@@ -325,18 +429,7 @@ class ExcelExporter:
         # Write data
         row = 2
         for space in spaces:
-            for surface in space.surfaces:
-                data = [
-                    space.guid,
-                    space.name or '',
-                    surface.id,
-                    surface.type or '',
-                    round(surface.area, 2) if surface.area else 0.0,
-                    surface.material or '',
-                    surface.ifc_type or '',
-                    surface.user_description or ''
-                ]
-                
+            for data in self._surface_rows(space):
                 for col, value in enumerate(data, 1):
                     cell = ws.cell(row=row, column=col, value=value)
                     cell.border = self.border
@@ -349,17 +442,8 @@ class ExcelExporter:
         """Create space boundaries data sheet."""
         ws = wb.create_sheet("Space Boundaries")
         
-        # Headers
-        headers = [
-            'Space GUID', 'Space Name', 'Boundary GUID', 'Boundary Name',
-            'Physical/Virtual', 'Internal/External', 'Surface Type', 'Orientation',
-            'Area (m²)', 'Related Element GUID', 'Related Element Name', 'Related Element Type',
-            'Adjacent Space GUID', 'Adjacent Space Name', 'Boundary Level', 'Display Label',
-            'User Description'
-        ]
-        
         # Write headers
-        for col, header in enumerate(headers, 1):
+        for col, header in enumerate(self.BOUNDARIES_HEADERS, 1):
             cell = ws.cell(row=1, column=col, value=header)
             cell.font = self.header_font
             cell.fill = self.header_fill
@@ -369,27 +453,7 @@ class ExcelExporter:
         # Write data
         row = 2
         for space in spaces:
-            for boundary in space.space_boundaries:
-                data = [
-                    space.guid,
-                    space.name or '',
-                    boundary.guid,
-                    boundary.name or '',
-                    boundary.physical_or_virtual_boundary or '',
-                    boundary.internal_or_external_boundary or '',
-                    boundary.boundary_surface_type or '',
-                    boundary.boundary_orientation or '',
-                    round(boundary.calculated_area, 2) if boundary.calculated_area else 0.0,
-                    boundary.related_building_element_guid or '',
-                    boundary.related_building_element_name or '',
-                    boundary.related_building_element_type or '',
-                    boundary.adjacent_space_guid or '',
-                    boundary.adjacent_space_name or '',
-                    boundary.boundary_level or 1,
-                    boundary.display_label or '',
-                    boundary.user_description or ''
-                ]
-                
+            for data in self._boundary_rows(space):
                 for col, value in enumerate(data, 1):
                     cell = ws.cell(row=row, column=col, value=value)
                     cell.border = self.border
@@ -402,14 +466,8 @@ class ExcelExporter:
         """Create relationships data sheet."""
         ws = wb.create_sheet("Relationships")
         
-        # Headers
-        headers = [
-            'Space GUID', 'Space Name', 'Related Entity GUID', 'Related Entity Name',
-            'Related Entity Description', 'Relationship Type', 'IFC Relationship Type'
-        ]
-        
         # Write headers
-        for col, header in enumerate(headers, 1):
+        for col, header in enumerate(self.RELATIONSHIPS_HEADERS, 1):
             cell = ws.cell(row=1, column=col, value=header)
             cell.font = self.header_font
             cell.fill = self.header_fill
@@ -419,17 +477,7 @@ class ExcelExporter:
         # Write data
         row = 2
         for space in spaces:
-            for relationship in space.relationships:
-                data = [
-                    space.guid,
-                    space.name or '',
-                    relationship.related_entity_guid,
-                    relationship.related_entity_name or '',
-                    relationship.related_entity_description or '',
-                    relationship.relationship_type or '',
-                    relationship.ifc_relationship_type or ''
-                ]
-                
+            for data in self._relationship_rows(space):
                 for col, value in enumerate(data, 1):
                     cell = ws.cell(row=row, column=col, value=value)
                     cell.border = self.border
@@ -527,6 +575,145 @@ class ExcelExporter:
         # Auto-adjust column widths
         self._auto_adjust_columns(ws)
     
+    def _create_streaming_workbook(self, spaces: Iterable[SpaceData],
+                                   include_surfaces: bool = True,
+                                   include_boundaries: bool = True,
+                                   include_relationships: bool = True) -> Tuple[Workbook, int]:
+        """
+        Create a write-only workbook with the same sheets as the regular export.
+        
+        Spaces are iterated once. Their rows go straight to the data sheets, and
+        the statistics for the overview and summary sheets are summed along the way.
+        
+        Returns:
+            Tuple of (workbook ready to save, number of spaces written)
+        """
+        wb = Workbook(write_only=True)
+        self._add_named_styles(wb)
+        
+        # Sheets are created in their final order; the overview is written last
+        overview = _StreamingSheet(wb, "Overview")
+        data_sheets = [(_StreamingSheet(wb, "Spaces"), self.SPACES_HEADERS, lambda space: [self._space_row(space)])]
+        if include_surfaces:
+            data_sheets.append((_StreamingSheet(wb, "Surfaces"), self.SURFACES_HEADERS, self._surface_rows))
+        if include_boundaries:
+            data_sheets.append((_StreamingSheet(wb, "Space Boundaries"), self.BOUNDARIES_HEADERS,
+                                self._boundary_rows))
+        if include_relationships:
+            data_sheets.append((_StreamingSheet(wb, "Relationships"), self.RELATIONSHIPS_HEADERS,
+                                self._relationship_rows))
+        summary = _StreamingSheet(wb, "Summary")
+        
+        for sheet, headers, _ in data_sheets:
+            sheet.append(headers, HEADER_STYLE)
+        
+        totals = {
+            'spaces': 0, 'processed': 0, 'surfaces': 0, 'boundaries': 0, 'relationships': 0,
+            'surface_area': 0.0, 'boundary_area': 0.0
+        }
+        surface_area_by_type: Dict[str, float] = {}
+        boundary_area_by_type: Dict[str, float] = {}
+        for space in spaces:
+            for sheet, _, rows in data_sheets:
+                for row in rows(space):
+                    sheet.append(row, CELL_STYLE)
+            
+            totals['spaces'] += 1
+            totals['processed'] += 1 if space.processed else 0
+            totals['surfaces'] += len(space.surfaces)
+            totals['boundaries'] += len(space.space_boundaries)
+            totals['relationships'] += len(space.relationships)
+            totals['surface_area'] += space.get_total_surface_area()
+            totals['boundary_area'] += space.get_total_boundary_area()
+            for surface_type, area in space.get_surface_area_by_type().items():
+                surface_area_by_type[surface_type] = surface_area_by_type.get(surface_type, 0.0) + area
+            for boundary_type, area in space.get_boundary_area_by_type().items():
+                boundary_area_by_type[boundary_type] = boundary_area_by_type.get(boundary_type, 0.0) + area
+        
+        for sheet, _, _ in data_sheets:
+            sheet.close()
+        
+        self._write_streaming_overview(overview, totals)
+        self._write_streaming_summary(summary, totals, surface_area_by_type, boundary_area_by_type)
+        return wb, totals['spaces']
+    
+    def _add_named_styles(self, wb: Workbook) -> None:
+        """Register the cell styles of the export on a workbook."""
+        wb.add_named_style(NamedStyle(name=HEADER_STYLE, font=self.header_font, fill=self.header_fill,
+                                      alignment=self.center_alignment, border=self.border))
+        wb.add_named_style(NamedStyle(name=CELL_STYLE, border=self.border))
+        wb.add_named_style(NamedStyle(name=TITLE_STYLE, font=Font(bold=True, size=16, color="2F5597")))
+        wb.add_named_style(NamedStyle(name=SECTION_STYLE, font=self.section_font, fill=self.section_fill))
+        wb.add_named_style(NamedStyle(name=LABEL_STYLE, font=Font(bold=True)))
+    
+    def _write_streaming_overview(self, sheet: '_StreamingSheet', totals: Dict[str, Any]) -> None:
+        """Write the overview sheet of a streamed workbook."""
+        sheet.append(["IFC Room Schedule Export"], TITLE_STYLE)
+        sheet.merge(4)
+        sheet.append([])
+        
+        sheet.append(["Export Information"], SECTION_STYLE)
+        sheet.merge(4)
+        metadata = [
+            ("Export Date:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            ("Application Version:", self.application_version),
+            ("Total Spaces:", totals['spaces']),
+            ("Processed Spaces:", totals['processed'])
+        ]
+        
+        if self.source_file_path:
+            metadata.insert(2, ("Source File:", Path(self.source_file_path).name))
+        
+        for label, value in metadata:
+            sheet.append_labelled(label, value)
+        
+        sheet.append([])
+        sheet.append(["Quick Statistics"], SECTION_STYLE)
+        sheet.merge(4)
+        stats = [
+            ("Total Surfaces:", totals['surfaces']),
+            ("Total Boundaries:", totals['boundaries']),
+            ("Total Relationships:", totals['relationships']),
+            ("Total Surface Area (m²):", round(totals['surface_area'], 2)),
+            ("Total Boundary Area (m²):", round(totals['boundary_area'], 2))
+        ]
+        
+        for label, value in stats:
+            sheet.append_labelled(label, value)
+        sheet.close()
+    
+    def _write_streaming_summary(self, sheet: '_StreamingSheet', totals: Dict[str, Any],
+                                 surface_area_by_type: Dict[str, float],
+                                 boundary_area_by_type: Dict[str, float]) -> None:
+        """Write the summary sheet of a streamed workbook."""
+        sheet.append(["Summary Statistics"], TITLE_STYLE)
+        sheet.merge(2)
+        sheet.append([])
+        
+        sheet.append(["Basic Statistics"], SECTION_STYLE)
+        sheet.merge(2)
+        basic_stats = [
+            ("Total Spaces", totals['spaces']),
+            ("Processed Spaces", totals['processed']),
+            ("Total Surfaces", totals['surfaces']),
+            ("Total Boundaries", totals['boundaries']),
+            ("Total Relationships", totals['relationships']),
+            ("Total Surface Area (m²)", round(totals['surface_area'], 2)),
+            ("Total Boundary Area (m²)", round(totals['boundary_area'], 2))
+        ]
+        
+        for label, value in basic_stats:
+            sheet.append_labelled(label, value)
+        
+        for title, areas in (("Surface Areas by Type (m²)", surface_area_by_type),
+                             ("Boundary Areas by Type (m²)", boundary_area_by_type)):
+            sheet.append([])
+            sheet.append([title], SECTION_STYLE)
+            sheet.merge(2)
+            for area_type, area in areas.items():
+                sheet.append_labelled(area_type, round(area, 2))
+        sheet.close()
+    
     def _auto_adjust_columns(self, ws) -> None:
         """Auto-adjust column widths based on content."""
         for column in ws.columns:
@@ -540,6 +727,89 @@ class ExcelExporter:
                 except:
                     pass
             
-            # Set minimum width and maximum width
-            adjusted_width = min(max(max_length + 2, 10), 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
\ No newline at end of file
+            ws.column_dimensions[column_letter].width = _column_width(max_length)
+
+
+class _StreamingSheet:
+    """
+    Write-only worksheet that sizes its columns from running max lengths.
+    
+    Write-only worksheets need column widths before the first row is written,
+    so the first rows are held back until the sample is full or the sheet is
+    closed. Later rows are written as they are appended.
+    """
+    
+    def __init__(self, wb: Workbook, title: str, sample_rows: Optional[int] = None):
+        """
+        Create the sheet.
+        
+        Args:
+            wb: Write-only workbook with the named styles registered
+            title: Sheet title
+            sample_rows: Rows to hold back for sizing the columns, default STREAMING_WIDTH_SAMPLE_ROWS
+        """
+        self.worksheet = wb.create_sheet(title)
+        self.sample_rows = sample_rows or STREAMING_WIDTH_SAMPLE_ROWS
+        self.max_lengths: List[int] = []
+        self.row_count = 0
+        self._pending: Optional[List[Tuple[List[Any], List[Optional[str]]]]] = []
+    
+    def append(self, values: List[Any], style: Optional[str] = None) -> None:
+        """Append a row with all cells in a named style, or unstyled."""
+        self._append(values, [style] * len(values))
+    
+    def append_labelled(self, label: str, value: Any) -> None:
+        """Append a bold label and its value."""
+        self._append([label, value], [LABEL_STYLE, None])
+    
+    def merge(self, columns: int) -> None:
+        """Merge the first columns of the last appended row."""
+        # Merged columns are sized like empty ones
+        self.max_lengths.extend([0] * (columns - len(self.max_lengths)))
+        self.worksheet.merged_cells.add(f"A{self.row_count}:{get_column_letter(columns)}{self.row_count}")
+    
+    def close(self) -> None:
+        """Write the rows still held back."""
+        if self._pending is not None:
+            self._flush()
+    
+    def _append(self, values: List[Any], styles: List[Optional[str]]) -> None:
+        """Append a row with a named style, or None, per cell."""
+        max_lengths = self.max_lengths
+        for col, value in enumerate(values):
+            length = len(str(value))
+            if col == len(max_lengths):
+                max_lengths.append(length)
+            elif length > max_lengths[col]:
+                max_lengths[col] = length
+        self.row_count += 1
+        
+        if self._pending is None:
+            self._write(values, styles)
+            return
+        
+        self._pending.append((values, styles))
+        if len(self._pending) >= self.sample_rows:
+            self._flush()
+    
+    def _flush(self) -> None:
+        """Fix the column widths and write the held back rows."""
+        for col, max_length in enumerate(self.max_lengths, 1):
+            self.worksheet.column_dimensions[get_column_letter(col)].width = _column_width(max_length)
+        
+        pending, self._pending = self._pending, None
+        for values, styles in pending:
+            self._write(values, styles)
+    
+    def _write(self, values: List[Any], styles: List[Optional[str]]) -> None:
+        """Write a row to the worksheet."""
+        self.worksheet.append([
+            value if style is None else self._cell(value, style)
+            for value, style in zip(values, styles)
+        ])
+    
+    def _cell(self, value: Any, style: str) -> 'WriteOnlyCell':
+        """Create a cell in a named style."""
+        cell = WriteOnlyCell(self.worksheet, value=value)
+        cell.style = style
+        return cell
\ No newline at end of file
@@ -24,6 +24,7 @@ class JsonBuilder:
         """Initialize the JSON builder."""
         self.source_file_path: Optional[str] = None
         self.ifc_version: Optional[str] = None
+        self.project_guid: Optional[str] = None
         self.application_version: str = "1.0.0"
     
     def set_source_file(self, file_path: str) -> None:
@@ -34,6 +35,10 @@ class JsonBuilder:
         """Set the IFC version."""
         self.ifc_version = version
     
+    def set_project_guid(self, guid: Optional[str]) -> None:
+        """Set the GlobalId of the IfcProject the spaces belong to."""
+        self.project_guid = guid
+    
     def build_json_structure(self, spaces: List[SpaceData], metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Build complete JSON structure from space data.
@@ -88,6 +93,9 @@ class JsonBuilder:
         if self.ifc_version:
             metadata["ifc_version"] = self.ifc_version
         
+        if self.project_guid:
+            metadata["project_guid"] = self.project_guid
+        
         if additional_metadata:
             metadata.update(additional_metadata)
         
@@ -0,0 +1,192 @@
+"""
+JSON Stream Writer
+
+Writes JSON documents incrementally, so exports can emit each space as soon
+as it is built instead of holding the whole document in memory. Values are
+serialized with orjson when it is installed and with the json module otherwise.
+"""
+
+import json
+from typing import Any, IO, List, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+BACKENDS = ("auto", "json", "orjson")
+
+
+def _select_backend(backend: str, indent: Optional[int]) -> str:
+    """Resolve the serializer backend for an indentation."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{backend}', expected one of {', '.join(BACKENDS)}")
+
+    # orjson only writes compact output or two-space indentation
+    orjson_indent = indent in (None, 2)
+    if backend == "auto":
+        return "orjson" if ORJSON_AVAILABLE and orjson_indent else "json"
+    if backend == "orjson":
+        if not ORJSON_AVAILABLE:
+            raise ImportError("orjson is required for the orjson backend. Install with: pip install orjson")
+        if not orjson_indent:
+            raise ValueError("The orjson backend only supports indent=2 or no indentation")
+    return backend
+
+
+class JsonStreamWriter:
+    """
+    Writes one JSON document piece by piece.
+
+    Containers are opened with begin_object/begin_array and closed with end;
+    write serializes a complete value. Commas, keys and indentation are
+    handled by the writer. With the json backend the output matches json.dump
+    of the whole document with the same indentation. orjson writes the same
+    data but may format some numbers differently (1e16, not 1e+16), and it
+    serializes datetimes, which json rejects.
+    """
+
+    def __init__(self, stream: IO[str], indent: Optional[int] = 2, backend: str = "auto"):
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Text stream to write to
+            indent: Spaces per indentation level, or None for compact output
+            backend: Serializer backend: auto, json or orjson
+        """
+        self.stream = stream
+        self.indent = indent or None
+        self.backend = _select_backend(backend, self.indent)
+
+        # Open containers as [closing character, number of items written]
+        self._stack: List[List[Any]] = []
+        self._root_started = False
+
+    def __enter__(self) -> 'JsonStreamWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Leave a failed document unterminated rather than closing it as if complete
+        if exc_type is None:
+            self.close()
+
+    @property
+    def depth(self) -> int:
+        """Number of open containers."""
+        return len(self._stack)
+
+    def begin_object(self, key: Optional[str] = None) -> None:
+        """Open an object, as a member of the enclosing object if key is given."""
+        self._begin("{", "}", key)
+
+    def begin_array(self, key: Optional[str] = None) -> None:
+        """Open an array, as a member of the enclosing object if key is given."""
+        self._begin("[", "]", key)
+
+    def write(self, value: Any, key: Optional[str] = None) -> None:
+        """Write a complete value, as a member of the enclosing object if key is given."""
+        text = serialize_json(value, self.indent, self.backend)
+        self._start_item(key)
+        if self.indent and self._stack:
+            text = text.replace("\n", "\n" + " " * (self.indent * len(self._stack)))
+        self.stream.write(text)
+
+    def end(self) -> None:
+        """Close the innermost open container."""
+        if not self._stack:
+            raise ValueError("No open JSON container to end")
+
+        closing, count = self._stack.pop()
+        if count and self.indent:
+            self.stream.write("\n" + " " * (self.indent * len(self._stack)))
+        self.stream.write(closing)
+
+    def close(self) -> None:
+        """Close all open containers and end the document with a newline."""
+        while self._stack:
+            self.end()
+        if self._root_started:
+            self.stream.write("\n")
+
+    def _begin(self, opening: str, closing: str, key: Optional[str]) -> None:
+        """Open a container."""
+        self._start_item(key)
+        self.stream.write(opening)
+        self._stack.append([closing, 0])
+
+    def _start_item(self, key: Optional[str]) -> None:
+        """Write the separator, indentation and key before a value."""
+        if not self._stack:
+            if self._root_started:
+                raise ValueError("A JSON document has a single root value")
+            if key is not None:
+                raise ValueError("The root value of a JSON document has no key")
+            self._root_started = True
+            return
+
+        container = self._stack[-1]
+        in_object = container[0] == "}"
+        if in_object and key is None:
+            raise ValueError("Object members need a key")
+        if not in_object and key is not None:
+            raise ValueError("Array items have no key")
+
+        if container[1]:
+            self.stream.write(",")
+        container[1] += 1
+        if self.indent:
+            self.stream.write("\n" + " " * (self.indent * len(self._stack)))
+        if in_object:
+            self.stream.write(json.dumps(key, ensure_ascii=False) + (": " if self.indent else ":"))
+
+
+class NdjsonStreamWriter:
+    """
+    Writes newline-delimited JSON, one compact value per line.
+
+    Documents with several sections are written as records of the form
+    {"type": ..., "data": ...} so consumers can dispatch on each line.
+    """
+
+    def __init__(self, stream: IO[str], backend: str = "auto"):
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Text stream to write to
+            backend: Serializer backend: auto, json or orjson
+        """
+        self.stream = stream
+        self.backend = _select_backend(backend, None)
+
+    def write(self, value: Any) -> None:
+        """Write a value as one line."""
+        self.stream.write(serialize_json(value, None, self.backend) + "\n")
+
+    def write_record(self, record_type: str, data: Any) -> None:
+        """Write a typed record as one line."""
+        self.write({"type": record_type, "data": data})
+
+
+def serialize_json(value: Any, indent: Optional[int] = None, backend: str = "auto") -> str:
+    """
+    Serialize a value to JSON text.
+
+    Args:
+        value: JSON-serializable value
+        indent: Spaces per indentation level, or None for compact output
+        backend: Serializer backend: auto, json or orjson
+
+    Returns:
+        JSON text without a trailing newline
+    """
+    backend = _select_backend(backend, indent)
+    if backend == "orjson":
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(value, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(value, indent=indent, ensure_ascii=False)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
@@ -118,18 +118,20 @@ class CommissioningMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def extract_commissioning(self, space: SpaceData) -> CommissioningData:
+    def extract_commissioning(self, space: SpaceData, room_type: Optional[str] = None) -> CommissioningData:
         """
         Extract commissioning from space data.
         
         Args:
             space: SpaceData to extract commissioning from
+            room_type: NS 3940 room type code, derived from the space name if not given
             
         Returns:
             CommissioningData with extracted commissioning information
         """
         # Get room type for default requirements
-        room_type = self._get_room_type(space)
+        if room_type is None:
+            room_type = self._get_room_type(space)
         
         # Extract tests
         tests = self._extract_tests(space, room_type)
@@ -8,8 +8,8 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
 from ..data.space_model import SpaceData
-from ..parsers.ns8360_name_parser import NS8360NameParser
-from .ns3940_classifier import NS3940Classifier
+from ..parsers.ns8360_name_parser import NS8360NameParser, NS8360ParsedName
+from .ns3940_classifier import NS3940Classifier, RoomClassification
 from ..validation.ns8360_validator import NS8360Validator
 from ..validation.ns3940_validator import NS3940Validator
 
@@ -52,32 +52,39 @@ class EnhancedClassificationMapper:
         self.ns8360_validator = NS8360Validator()
         self.ns3940_validator = NS3940Validator()
     
-    def map_classification(self, space: SpaceData) -> EnhancedClassificationData:
+    def map_classification(self, space: SpaceData,
+                           parsed_name: Optional[NS8360ParsedName] = None,
+                           classification: Optional[RoomClassification] = None) -> EnhancedClassificationData:
         """
         Map space to enhanced classification with NS 3940 structured data.
         
         Args:
             space: SpaceData to map
+            parsed_name: Parsed space name, parsed from space.name if not given
+            classification: NS 3940 classification of the name; only used with parsed_name
             
         Returns:
             EnhancedClassificationData with comprehensive classification
         """
         # Parse NS 8360 compliant name
-        parsed_name = self.name_parser.parse(space.name)
+        name_given = parsed_name is not None
+        if not name_given:
+            parsed_name = self.name_parser.parse(space.name)
         
         # Get NS 3940 classification
-        classification = None
         source = "unknown"
         confidence = 0.0
         
         if parsed_name.is_valid and parsed_name.function_code:
             # Direct classification from parsed function code
-            classification = self.classifier.classify_from_code(parsed_name.function_code)
+            if not name_given:
+                classification = self.classifier.classify_from_code(parsed_name.function_code)
             source = "parsed_from_name"
             confidence = parsed_name.confidence
         else:
             # Fallback: infer from name
-            classification = self.classifier.classify_from_name(space.name)
+            if not name_given:
+                classification = self.classifier.classify_from_name(space.name)
             source = "inferred_from_name"
             confidence = classification.confidence if classification else 0.0
         
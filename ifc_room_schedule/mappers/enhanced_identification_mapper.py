@@ -9,8 +9,8 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from ..data.space_model import SpaceData
-from ..parsers.ns8360_name_parser import NS8360NameParser
-from .ns3940_classifier import NS3940Classifier
+from ..parsers.ns8360_name_parser import NS8360NameParser, NS8360ParsedName
+from .ns3940_classifier import NS3940Classifier, RoomClassification
 
 
 @dataclass
@@ -88,27 +88,27 @@ class EnhancedIdentificationMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def map_identification(self, space: SpaceData, ifc_file_name: str = None) -> IdentificationData:
+    def map_identification(self, space: SpaceData, ifc_file_name: str = None,
+                           parsed_name: Optional[NS8360ParsedName] = None,
+                           classification: Optional[RoomClassification] = None) -> IdentificationData:
         """
         Map space to identification section using Norwegian standards.
         
         Args:
             space: SpaceData to map
             ifc_file_name: Name of source IFC file
+            parsed_name: Parsed space name, parsed from space.name if not given
+            classification: NS 3940 classification of the name; only used with parsed_name
             
         Returns:
             IdentificationData with mapped values
         """
-        # Parse NS 8360 compliant name
-        parsed_name = self.name_parser.parse(space.name)
-        
-        # Get NS 3940 classification
-        classification = None
-        if parsed_name.is_valid and parsed_name.function_code:
-            classification = self.classifier.classify_from_code(parsed_name.function_code)
-        else:
-            # Fallback: infer from name
-            classification = self.classifier.classify_from_name(space.name)
+        if parsed_name is None:
+            # Parse NS 8360 compliant name
+            parsed_name = self.name_parser.parse(space.name)
+            
+            # Get NS 3940 classification
+            classification = self.classify_parsed_name(space, parsed_name)
         
         # Extract project hierarchy
         project_id = self._extract_project_id(space, ifc_file_name)
@@ -146,18 +146,21 @@ class EnhancedIdentificationMapper:
             }
         )
     
-    def map_ifc_metadata(self, space: SpaceData, ifc_file_name: str = None) -> IFCMetadata:
+    def map_ifc_metadata(self, space: SpaceData, ifc_file_name: str = None,
+                         parsed_name: Optional[NS8360ParsedName] = None) -> IFCMetadata:
         """
         Map IFC metadata with NS 8360 compliance tracking.
         
         Args:
             space: SpaceData to map
             ifc_file_name: Name of source IFC file
+            parsed_name: Parsed space name, parsed from space.name if not given
             
         Returns:
             IFCMetadata with enhanced data
         """
-        parsed_name = self.name_parser.parse(space.name)
+        if parsed_name is None:
+            parsed_name = self.name_parser.parse(space.name)
         
         # Build parsed components dict
         parsed_components = None
@@ -237,6 +240,24 @@ class EnhancedIdentificationMapper:
             ns8360_compliance=ns8360_compliance
         )
     
+    def classify_parsed_name(self, space: SpaceData,
+                             parsed_name: NS8360ParsedName) -> Optional[RoomClassification]:
+        """
+        Get the NS 3940 classification of a space from its parsed name.
+        
+        Args:
+            space: SpaceData the name belongs to
+            parsed_name: Parsed space name
+            
+        Returns:
+            RoomClassification from the function code, or inferred from the name
+        """
+        if parsed_name.is_valid and parsed_name.function_code:
+            return self.classifier.classify_from_code(parsed_name.function_code)
+        
+        # Fallback: infer from name
+        return self.classifier.classify_from_name(space.name)
+    
     def _extract_project_id(self, space: SpaceData, ifc_file_name: str = None) -> str:
         """Extract or generate project ID."""
         # Try to extract from file name
@@ -99,18 +99,20 @@ class FinishesMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def extract_surface_finishes(self, space: SpaceData) -> FinishesData:
+    def extract_surface_finishes(self, space: SpaceData, room_type: Optional[str] = None) -> FinishesData:
         """
         Extract surface finishes from space data.
         
         Args:
             space: SpaceData to extract finishes from
+            room_type: NS 3940 room type code, derived from the space name if not given
             
         Returns:
             FinishesData with extracted finish information
         """
         # Get room type for default finishes
-        room_type = self._get_room_type(space)
+        if room_type is None:
+            room_type = self._get_room_type(space)
         
         # Extract floor finishes
         floor_finish = self._extract_floor_finishes(space, room_type)
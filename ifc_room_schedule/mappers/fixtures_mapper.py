@@ -91,18 +91,20 @@ class FixturesMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def extract_fixtures(self, space: SpaceData) -> FixturesData:
+    def extract_fixtures(self, space: SpaceData, room_type: Optional[str] = None) -> FixturesData:
         """
         Extract fixtures from space data.
         
         Args:
             space: SpaceData to extract fixtures from
+            room_type: NS 3940 room type code, derived from the space name if not given
             
         Returns:
             FixturesData with extracted fixture information
         """
         # Get room type for default fixtures
-        room_type = self._get_room_type(space)
+        if room_type is None:
+            room_type = self._get_room_type(space)
         
         # Extract fixtures from space relationships
         fixtures = self._extract_fixtures_from_relationships(space, room_type)
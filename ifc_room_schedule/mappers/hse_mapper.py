@@ -107,18 +107,20 @@ class HSEMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def extract_hse_requirements(self, space: SpaceData) -> HSEData:
+    def extract_hse_requirements(self, space: SpaceData, room_type: Optional[str] = None) -> HSEData:
         """
         Extract HSE requirements from space data.
         
         Args:
             space: SpaceData to extract HSE requirements from
+            room_type: NS 3940 room type code, derived from the space name if not given
             
         Returns:
             HSEData with extracted HSE information
         """
         # Get room type for default requirements
-        room_type = self._get_room_type(space)
+        if room_type is None:
+            room_type = self._get_room_type(space)
         
         # Extract universal design requirements
         universal_design = self._extract_universal_design(space, room_type)
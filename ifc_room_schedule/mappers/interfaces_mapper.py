@@ -115,18 +115,20 @@ class InterfacesMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def extract_interfaces(self, space: SpaceData) -> InterfacesData:
+    def extract_interfaces(self, space: SpaceData, room_type: Optional[str] = None) -> InterfacesData:
         """
         Extract interfaces from space data.
         
         Args:
             space: SpaceData to extract interfaces from
+            room_type: NS 3940 room type code, derived from the space name if not given
             
         Returns:
             InterfacesData with extracted interface information
         """
         # Get room type for default requirements
-        room_type = self._get_room_type(space)
+        if room_type is None:
+            room_type = self._get_room_type(space)
         
         # Extract adjacent rooms
         adjacent_rooms = self._extract_adjacent_rooms(space, room_type)
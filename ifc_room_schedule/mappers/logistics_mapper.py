@@ -168,18 +168,20 @@ class LogisticsMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def extract_logistics(self, space: SpaceData) -> LogisticsData:
+    def extract_logistics(self, space: SpaceData, room_type: Optional[str] = None) -> LogisticsData:
         """
         Extract logistics from space data.
         
         Args:
             space: SpaceData to extract logistics from
+            room_type: NS 3940 room type code, derived from the space name if not given
             
         Returns:
             LogisticsData with extracted logistics information
         """
         # Get room type for default requirements
-        room_type = self._get_room_type(space)
+        if room_type is None:
+            room_type = self._get_room_type(space)
         
         # Extract access route
         access_route = self._extract_access_route(space, room_type)
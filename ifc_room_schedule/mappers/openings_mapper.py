@@ -90,18 +90,20 @@ class OpeningsMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def extract_openings(self, space: SpaceData) -> OpeningsData:
+    def extract_openings(self, space: SpaceData, room_type: Optional[str] = None) -> OpeningsData:
         """
         Extract openings from space data.
         
         Args:
             space: SpaceData to extract openings from
+            room_type: NS 3940 room type code, derived from the space name if not given
             
         Returns:
             OpeningsData with extracted opening information
         """
         # Get room type for default openings
-        room_type = self._get_room_type(space)
+        if room_type is None:
+            room_type = self._get_room_type(space)
         
         # Extract doors
         doors = self._extract_doors(space, room_type)
@@ -145,18 +145,20 @@ class PerformanceRequirementsMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def extract_performance_requirements(self, space: SpaceData) -> PerformanceRequirements:
+    def extract_performance_requirements(self, space: SpaceData, room_type: Optional[str] = None) -> PerformanceRequirements:
         """
         Extract performance requirements from space data.
         
         Args:
             space: SpaceData to extract requirements from
+            room_type: NS 3940 room type code, derived from the space name if not given
             
         Returns:
             PerformanceRequirements with extracted data
         """
         # Get room type for default requirements
-        room_type = self._get_room_type(space)
+        if room_type is None:
+            room_type = self._get_room_type(space)
         
         # Extract fire requirements
         fire_req = self._extract_fire_requirements(space, room_type)
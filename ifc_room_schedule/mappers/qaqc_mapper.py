@@ -104,18 +104,20 @@ class QAQCMapper:
         self.name_parser = NS8360NameParser()
         self.classifier = NS3940Classifier()
     
-    def extract_qa_qc_requirements(self, space: SpaceData) -> QAQCData:
+    def extract_qa_qc_requirements(self, space: SpaceData, room_type: Optional[str] = None) -> QAQCData:
         """
         Extract QA/QC requirements from space data.
         
         Args:
             space: SpaceData to extract QA/QC requirements from
+            room_type: NS 3940 room type code, derived from the space name if not given
             
         Returns:
             QAQCData with extracted QA/QC information
         """
         # Get room type for default requirements
-        room_type = self._get_room_type(space)
+        if room_type is None:
+            room_type = self._get_room_type(space)
         
         # Extract hold points
         hold_points = self._extract_hold_points(space, room_type)
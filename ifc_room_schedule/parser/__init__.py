@@ -9,5 +9,9 @@ from .ifc_space_extractor import IfcSpaceExtractor
 from .ifc_surface_extractor import IfcSurfaceExtractor
 from .ifc_space_boundary_parser import IfcSpaceBoundaryParser
 from .ifc_relationship_parser import IfcRelationshipParser
+from .model_index import ModelIndex
+from .parse_cache import ParseCache
+from .property_cache import PropertyCache
+from .step_scanner import StepScanner, StepScanResult
 
-__all__ = ['IfcFileReader', 'IfcSpaceExtractor', 'IfcSurfaceExtractor', 'IfcSpaceBoundaryParser', 'IfcRelationshipParser']
\ No newline at end of file
+__all__ = ['IfcFileReader', 'IfcSpaceExtractor', 'IfcSurfaceExtractor', 'IfcSpaceBoundaryParser', 'IfcRelationshipParser', 'ModelIndex', 'ParseCache', 'PropertyCache', 'StepScanner', 'StepScanResult']
\ No newline at end of file
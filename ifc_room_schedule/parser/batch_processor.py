@@ -6,9 +6,10 @@ and streaming export capabilities.
 """
 
 import json
+import logging
 import os
 import gc
-from typing import List, Dict, Any, Optional, Iterator, Callable
+from typing import List, Dict, Any, Optional, Iterator, Callable, Tuple
 from pathlib import Path
 from datetime import datetime
 import threading
@@ -17,6 +18,7 @@ import time
 
 from ..data.space_model import SpaceData
 from ..export.enhanced_json_builder import EnhancedJsonBuilder
+from ..export.json_stream_writer import JsonStreamWriter, NdjsonStreamWriter
 from ..analysis.data_quality_analyzer import DataQualityAnalyzer
 
 
@@ -35,6 +37,7 @@ class BatchProcessor:
         self.chunk_size = chunk_size
         self.builder = EnhancedJsonBuilder()
         self.analyzer = DataQualityAnalyzer()
+        self.logger = logging.getLogger(__name__)
         
         # Performance monitoring
         self.processing_stats = {
@@ -108,15 +111,24 @@ class BatchProcessor:
                                spaces: List[SpaceData], 
                                output_path: str,
                                export_profile: str = "production",
-                               progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
+                               progress_callback: Optional[Callable] = None,
+                               ndjson: bool = False,
+                               backend: str = "auto") -> Dict[str, Any]:
         """
         Process spaces with streaming export to reduce memory usage.
         
+        Metadata is written first, then each chunk of spaces as it is built, then
+        a summary from running totals, so only one space is held in memory.
+        
         Args:
             spaces: List of spaces to process
             output_path: Output file path
             export_profile: Export profile to use
             progress_callback: Optional progress callback function
+            ndjson: Write one {"type", "data"} record per line: metadata, one per
+                space, and summary
+            backend: JSON serializer backend (auto, json, orjson); orjson only
+                writes NDJSON, as the JSON document is indented by four spaces
             
         Returns:
             Processing statistics
@@ -130,28 +142,34 @@ class BatchProcessor:
             # Create chunks
             chunks = self._create_chunks(spaces, self.chunk_size)
             
+            metadata = {
+                "generated_at": datetime.now().isoformat(),
+                "total_spaces": len(spaces),
+                "export_profile": export_profile
+            }
+            totals = self.builder.new_export_totals()
+            
             # Stream write to file
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write('{\n')
-                f.write('  "metadata": {\n')
-                f.write(f'    "generated_at": "{datetime.now().isoformat()}",\n')
-                f.write(f'    "total_spaces": {len(spaces)},\n')
-                f.write(f'    "export_profile": "{export_profile}"\n')
-                f.write('  },\n')
-                f.write('  "spaces": [\n')
+                if ndjson:
+                    ndjson_writer = NdjsonStreamWriter(f, backend)
+                    ndjson_writer.write_record("metadata", metadata)
+                    
+                    def write_space(space_data: Dict[str, Any]) -> None:
+                        ndjson_writer.write_record("space", space_data)
+                else:
+                    # orjson only writes two-space indentation, so this uses the json backend
+                    writer = JsonStreamWriter(f, indent=4, backend=backend)
+                    writer.begin_object()
+                    writer.write(metadata, "metadata")
+                    writer.begin_array("spaces")
+                    write_space = writer.write
                 
-                first_chunk = True
                 for i, chunk in enumerate(chunks):
-                    # Process chunk
-                    chunk_data = self._process_chunk(chunk, export_profile)
-                    
-                    # Write chunk data
-                    for j, space_data in enumerate(chunk_data):
-                        if not first_chunk or j > 0:
-                            f.write(',\n')
-                        
-                        json.dump(space_data, f, indent=4, ensure_ascii=False)
-                        first_chunk = False
+                    # Process chunk and write its spaces
+                    for space, space_data in self._iter_processed_chunk(chunk, export_profile):
+                        self.builder.add_space_to_totals(totals, space, space_data)
+                        write_space(space_data)
                     
                     # Update statistics
                     self.processing_stats["processed_spaces"] += len(chunk)
@@ -168,8 +186,13 @@ class BatchProcessor:
                     # Yield control
                     time.sleep(0.001)
                 
-                f.write('\n  ]\n')
-                f.write('}\n')
+                summary = self.builder.generate_enhanced_summary(totals)
+                if ndjson:
+                    ndjson_writer.write_record("summary", summary)
+                else:
+                    writer.end()
+                    writer.write(summary, "summary")
+                    writer.close()
             
             # Final statistics
             self.processing_stats["processing_time"] = time.time() - start_time
@@ -279,20 +302,22 @@ class BatchProcessor:
     
     def _process_chunk(self, chunk: List[SpaceData], export_profile: str) -> List[Dict[str, Any]]:
         """Process a chunk of spaces."""
-        chunk_data = []
-        
+        return [space_data for _, space_data in self._iter_processed_chunk(chunk, export_profile)]
+    
+    def _iter_processed_chunk(self, chunk: List[SpaceData],
+                              export_profile: str) -> Iterator[Tuple[SpaceData, Dict[str, Any]]]:
+        """Generate (space, enhanced space data) pairs for a chunk, skipping failed spaces."""
         for space in chunk:
             try:
                 # Build enhanced space data
                 space_data = self.builder._build_enhanced_space_dict(space, export_profile)
-                chunk_data.append(space_data)
                 
             except Exception as e:
                 # Log error but continue processing
-                print(f"Error processing space {space.name}: {str(e)}")
+                self.logger.error(f"Error processing space {space.name}: {str(e)}")
                 continue
-        
-        return chunk_data
+            
+            yield space, space_data
     
     def _worker_thread(self, input_queue: queue.Queue, output_queue: queue.Queue, 
                       export_profile: str, thread_id: int):
@@ -310,7 +335,7 @@ class BatchProcessor:
             except queue.Empty:
                 continue
             except Exception as e:
-                print(f"Worker thread {thread_id} error: {str(e)}")
+                self.logger.error(f"Worker thread {thread_id} error: {str(e)}")
                 output_queue.put([])
     
     def _manage_memory(self):
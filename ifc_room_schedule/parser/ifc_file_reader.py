@@ -6,7 +6,7 @@ Enhanced with detailed logging, structured error reporting, and performance opti
 """
 
 import os
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import ifcopenshell
 import ifcopenshell.util.element
 from ..utils.enhanced_logging import (
@@ -14,17 +14,29 @@ from ..utils.enhanced_logging import (
 )
 from .optimized_ifc_parser import OptimizedIFCParser, CacheConfig
 from .performance_monitor import PerformanceMonitor
+from .parse_cache import ParseCache
+from .step_scanner import StepScanResult, prescan_file
+from ..data.space_model import SpaceData
+from ..visualization.geometry_models import FloorGeometry
 # from .batch_processor import BatchProcessor, BatchConfig  # Moved to avoid circular import
 
 
+SUPPORTED_SCHEMAS = ['IFC2X3', 'IFC4', 'IFC4X1', 'IFC4X3']
+
+
 class IfcFileReader:
     """Handles IFC file loading and validation using IfcOpenShell with performance optimizations."""
 
-    def __init__(self, enable_optimizations: bool = True):
+    def __init__(self, enable_optimizations: bool = True, enable_parse_cache: bool = True,
+                 parse_cache_directory: Optional[str] = None):
         self.ifc_file = None
         self.file_path = None
+        self.scan_result: Optional[StepScanResult] = None
         self.enable_optimizations = enable_optimizations
         
+        # Extracted spaces are cached on disk by file content
+        self.parse_cache = ParseCache(parse_cache_directory) if enable_parse_cache else None
+        
         # Initialize performance components if optimizations are enabled
         if self.enable_optimizations:
             self.optimized_parser = OptimizedIFCParser(
@@ -64,6 +76,7 @@ class IfcFileReader:
         
         try:
             enhanced_logger.logger.info(f"Starting IFC file validation: {file_path}")
+            self.scan_result = None
             
             # Input validation with enhanced error reporting
             if not file_path or not file_path.strip():
@@ -184,6 +197,18 @@ class IfcFileReader:
                         return False, (f"File is extremely large ({size_mb:.1f}MB). "
                                        f"Files over 500MB are not supported due to memory limitations.")
                 else:
+                    # Pre-scan larger files so empty models are rejected before parsing
+                    self.scan_result = prescan_file(file_path)
+                    if self.scan_result is not None:
+                        enhanced_logger.logger.info(
+                            f"Pre-scan ({self.scan_result.schema}): {self.scan_result.total_entities:,} entities, "
+                            f"{self.scan_result.space_count} spaces, {self.scan_result.storey_count} storeys "
+                            f"in {self.scan_result.scan_time_seconds:.2f}s"
+                        )
+                        if self.scan_result.space_count == 0:
+                            enhanced_logger.finish_operation_timing(operation_id)
+                            return False, self._report_no_spaces()
+                    
                     # Enhanced memory check for larger files using psutil
                     try:
                         import psutil
@@ -294,7 +319,8 @@ class IfcFileReader:
                 
                 # Use optimized parser if available
                 if self.enable_optimizations and self.optimized_parser:
-                    success, message = self.optimized_parser.load_file_optimized(file_path)
+                    success, message = self.optimized_parser.load_file_optimized(file_path, self.scan_result)
+                    self.scan_result = self.optimized_parser.get_scan_result() or self.scan_result
                     if success:
                         self.ifc_file = self.optimized_parser.ifc_file
                         self.file_path = file_path
@@ -513,22 +539,8 @@ class IfcFileReader:
                     self.ifc_file = None
                     self.file_path = None
                     enhanced_logger.finish_operation_timing(space_validation_start)
-                    
-                    error_report = enhanced_logger.create_error_report(
-                        ErrorCategory.VALIDATION, ErrorSeverity.HIGH,
-                        "No Spaces Found", "IFC file contains no IfcSpace entities",
-                        user_guidance="This application requires IFC files with room/space data for generating room schedules.",
-                        recovery_suggestions=[
-                            "Ensure spaces/rooms are included in the IFC export",
-                            "Check IFC export settings to include space boundaries",
-                            "Verify the model contains room/space objects",
-                            "Try exporting with 'Include Spaces' option enabled",
-                            "Use an IFC file that contains architectural space data"
-                        ]
-                    )
                     enhanced_logger.finish_operation_timing(operation_id)
-                    return False, ("No IfcSpace entities found in the file. "
-                                  "This application requires IFC files with room/space data.")
+                    return False, self._report_no_spaces()
                 
                 enhanced_logger.logger.info(f"Found {len(spaces)} IfcSpace entities")
                 
@@ -623,7 +635,7 @@ class IfcFileReader:
             
             # Get additional file statistics for detailed logging
             try:
-                total_entities = len(self.ifc_file)
+                total_entities = self._count_total_entities()
                 building_elements = len(self.ifc_file.by_type("IfcBuildingElement"))
                 enhanced_logger.logger.info(f"IFC file statistics: {total_entities} total entities, {building_elements} building elements")
             except:
@@ -741,12 +753,47 @@ class IfcFileReader:
             enhanced_logger.finish_operation_timing(operation_id)
             return False, f"Unexpected error loading IFC file: {str(e)}"
 
-    def validate_file(self, file_path: str) -> Tuple[bool, str]:
+    def _report_no_spaces(self) -> str:
+        """Report a file without IfcSpace entities and return the user message."""
+        enhanced_logger.create_error_report(
+            ErrorCategory.VALIDATION, ErrorSeverity.HIGH,
+            "No Spaces Found", "IFC file contains no IfcSpace entities",
+            user_guidance="This application requires IFC files with room/space data for generating room schedules.",
+            recovery_suggestions=[
+                "Ensure spaces/rooms are included in the IFC export",
+                "Check IFC export settings to include space boundaries",
+                "Verify the model contains room/space objects",
+                "Try exporting with 'Include Spaces' option enabled",
+                "Use an IFC file that contains architectural space data"
+            ]
+        )
+        return ("No IfcSpace entities found in the file. "
+                "This application requires IFC files with room/space data.")
+
+    def _count_total_entities(self) -> int:
+        """Count the entities in the loaded file, using the pre-scan if len() is unsupported."""
+        try:
+            return len(self.ifc_file)
+        except TypeError:
+            if self.scan_result is None or self.scan_result.file_path != self.file_path:
+                self.scan_result = prescan_file(self.file_path) if self.file_path else None
+            if self.scan_result is None:
+                raise
+            return self.scan_result.total_entities
+
+    def validate_file(self, file_path: str, scan_result: Optional[StepScanResult] = None,
+                      open_file: bool = True) -> Tuple[bool, str]:
         """
-        Validate an IFC file without loading it into memory.
+        Validate an IFC file.
+
+        A pre-scan rejects unsupported schemas and models without spaces before
+        the file is opened; files that pass are then opened with IfcOpenShell.
 
         Args:
             file_path: Path to the IFC file
+            scan_result: Pre-scan of the file (scanned here if not given)
+            open_file: Open the file to check that it parses; callers that open it
+                themselves right after can skip this
 
         Returns:
             Tuple of (is_valid: bool, message: str)
@@ -759,12 +806,23 @@ class IfcFileReader:
             if not file_path.lower().endswith(('.ifc', '.ifcxml')):
                 return False, "Not an IFC file format"
 
+            # Reject from the pre-scan without building the model
+            if scan_result is None or scan_result.file_path != file_path:
+                scan_result = prescan_file(file_path)
+            if scan_result is not None and scan_result.schema:
+                if scan_result.schema not in SUPPORTED_SCHEMAS:
+                    return False, f"Unsupported IFC schema: {scan_result.schema}"
+                if scan_result.space_count == 0:
+                    return False, "No IfcSpace entities found"
+                if not open_file:
+                    return True, f"Valid IFC file (Schema: {scan_result.schema})"
+
             # Try to open and do basic validation
             test_file = ifcopenshell.open(file_path)
 
             # Check IFC schema version
             schema = test_file.schema
-            if schema not in ['IFC2X3', 'IFC4', 'IFC4X1', 'IFC4X3']:
+            if schema not in SUPPORTED_SCHEMAS:
                 return False, f"Unsupported IFC schema: {schema}"
 
             # Check for required entities
@@ -776,13 +834,21 @@ class IfcFileReader:
         except Exception as e:
             return False, f"Invalid IFC file: {str(e)}"
 
-    def get_file_info(self) -> Optional[dict]:
+    def get_file_info(self, file_path: Optional[str] = None) -> Optional[dict]:
         """
         Get information about the loaded IFC file.
 
+        Args:
+            file_path: Path of an IFC file to pre-scan instead. The file is not
+                parsed, so project and application details are taken from the
+                STEP header only.
+
         Returns:
             Dictionary with file information or None if no file loaded
         """
+        if file_path is not None:
+            return self._get_prescanned_file_info(file_path)
+
         if not self.ifc_file:
             return None
 
@@ -791,7 +857,7 @@ class IfcFileReader:
             info = {
                 'file_path': self.file_path,
                 'schema': self.ifc_file.schema,
-                'total_entities': len(self.ifc_file),
+                'total_entities': self._count_total_entities(),
                 'spaces_count': len(self.ifc_file.by_type("IfcSpace")),
                 'building_elements': len(
                     self.ifc_file.by_type("IfcBuildingElement")
@@ -803,6 +869,7 @@ class IfcFileReader:
             if projects:
                 project = projects[0]
                 info['project_name'] = getattr(project, 'Name', 'Unknown')
+                info['project_guid'] = getattr(project, 'GlobalId', None)
                 info['project_description'] = getattr(
                     project, 'Description', ''
                 )
@@ -821,6 +888,117 @@ class IfcFileReader:
         except Exception as e:
             return {'error': f"Error getting file info: {str(e)}"}
 
+    def load_cached_spaces(self, file_path: str, extraction: str = "full") -> Optional[List[SpaceData]]:
+        """
+        Load previously extracted spaces for an IFC file from the parse cache.
+
+        On a hit the IFC file itself is not opened; the reader only remembers the path.
+
+        Args:
+            file_path: Path to the IFC file
+            extraction: Name of the extraction pipeline that produced the spaces
+
+        Returns:
+            List of SpaceData or None if the file is not cached
+        """
+        if not self.parse_cache or not file_path or not os.path.isfile(file_path):
+            return None
+
+        spaces = self.parse_cache.load(file_path, extraction)
+        if spaces is not None:
+            self.file_path = file_path
+        return spaces
+
+    def store_cached_spaces(self, spaces: List[SpaceData], extraction: str = "full",
+                            file_path: Optional[str] = None) -> bool:
+        """
+        Store extracted spaces in the parse cache.
+
+        Args:
+            spaces: Spaces extracted from the file
+            extraction: Name of the extraction pipeline that produced the spaces
+            file_path: Path to the IFC file (default: the loaded file)
+
+        Returns:
+            True if the spaces were stored, False otherwise
+        """
+        file_path = file_path or self.file_path
+        if not self.parse_cache or not file_path or not os.path.isfile(file_path):
+            return False
+
+        return self.parse_cache.store(file_path, spaces, extraction)
+
+    def load_cached_floor_geometry(self, file_path: str) -> Optional[Dict[str, FloorGeometry]]:
+        """
+        Load previously extracted floor geometry for an IFC file from the parse cache.
+
+        Args:
+            file_path: Path to the IFC file
+
+        Returns:
+            Floor geometries keyed by floor ID or None if the file is not cached
+        """
+        if not self.parse_cache or not file_path or not os.path.isfile(file_path):
+            return None
+
+        return self.parse_cache.load_floor_geometry(file_path)
+
+    def store_cached_floor_geometry(self, floor_geometries: Dict[str, FloorGeometry],
+                                    file_path: Optional[str] = None) -> bool:
+        """
+        Store extracted floor geometry in the parse cache.
+
+        Args:
+            floor_geometries: Floor geometries keyed by floor ID
+            file_path: Path to the IFC file (default: the loaded file)
+
+        Returns:
+            True if the geometry was stored, False otherwise
+        """
+        file_path = file_path or self.file_path
+        if not self.parse_cache or not file_path or not os.path.isfile(file_path):
+            return False
+
+        return self.parse_cache.store_floor_geometry(file_path, floor_geometries)
+
+    def _get_prescanned_file_info(self, file_path: str) -> Optional[dict]:
+        """Get file information from a pre-scan of an unloaded IFC file."""
+        scan_result = prescan_file(file_path)
+        if scan_result is None:
+            return None
+
+        header = scan_result.header
+        return {
+            'file_path': file_path,
+            'schema': scan_result.schema,
+            'total_entities': scan_result.total_entities,
+            'spaces_count': scan_result.space_count,
+            'storeys_count': scan_result.storey_count,
+            'building_elements': scan_result.get_count("IfcBuildingElement", include_subtypes=True),
+            'created_by': header.get('originating_system') or 'Unknown',
+            'version': header.get('preprocessor_version') or 'Unknown',
+            'project_guid': scan_result.project_guid,
+            'prescanned': True
+        }
+
+    def get_project_guid(self, file_path: Optional[str] = None) -> Optional[str]:
+        """
+        Get the GlobalId of the IfcProject, which identifies the model across revisions.
+
+        Args:
+            file_path: Path of an IFC file to pre-scan if no file is loaded
+                (default: the path of the last cached or loaded file)
+
+        Returns:
+            The project GlobalId or None if it cannot be found
+        """
+        if self.ifc_file is not None:
+            projects = self.ifc_file.by_type("IfcProject")
+            return getattr(projects[0], 'GlobalId', None) if projects else None
+
+        scan_result = prescan_file(file_path or self.file_path)
+        return scan_result.project_guid if scan_result else None
+
     def is_loaded(self) -> bool:
         """Check if an IFC file is currently loaded."""
         return self.ifc_file is not None
@@ -833,6 +1011,7 @@ class IfcFileReader:
         """Close the currently loaded IFC file."""
         self.ifc_file = None
         self.file_path = None
+        self.scan_result = None
         
         # Clean up performance components
         if self.enable_optimizations:
@@ -917,6 +1096,9 @@ class IfcFileReader:
             processing_stats = self.batch_processor.get_processing_stats()
             metrics["processing_stats"] = processing_stats
         
+        if self.parse_cache:
+            metrics["parse_cache_stats"] = self.parse_cache.get_stats()
+        
         return metrics
     
     def optimize_performance(self):
@@ -8,20 +8,27 @@ from typing import List, Dict, Optional, Any
 import ifcopenshell
 from ..utils.enhanced_logging import enhanced_logger
 from ..data.relationship_model import RelationshipData
+from .model_index import ModelIndex
+from .property_cache import PropertyCache
 
 
 class IfcRelationshipParser:
     """Extracts relationships between IFC spaces and other entities."""
 
-    def __init__(self, ifc_file=None):
+    def __init__(self, ifc_file=None, model_index: Optional[ModelIndex] = None,
+                 property_cache: Optional[PropertyCache] = None):
         """
         Initialize the relationship parser.
         
         Args:
             ifc_file: IfcOpenShell file object (optional)
+            model_index: Shared relationship index for the file (optional)
+            property_cache: Shared property set decode cache (optional)
         """
         self.ifc_file = ifc_file
         self.logger = enhanced_logger.logger
+        self.model_index = model_index
+        self.property_cache = property_cache or PropertyCache(ifc_file)
         self._relationships_cache = {}
 
     def set_ifc_file(self, ifc_file) -> None:
@@ -33,6 +40,19 @@ class IfcRelationshipParser:
         """
         self.ifc_file = ifc_file
         self._relationships_cache = {}  # Clear cache when file changes
+        self.property_cache.set_ifc_file(ifc_file)
+        if self.model_index is not None and not self.model_index.is_for_file(ifc_file):
+            self.model_index = None
+
+    def set_model_index(self, model_index: Optional[ModelIndex]) -> None:
+        """
+        Set the shared relationship index used for per-space lookups.
+        
+        Args:
+            model_index: ModelIndex built for the current IFC file
+        """
+        self.model_index = model_index
+        self._relationships_cache = {}
 
     def get_space_relationships(self, space_guid: str) -> List[RelationshipData]:
         """
@@ -121,18 +141,41 @@ class IfcRelationshipParser:
 
     def _find_entity_by_guid(self, guid: str):
         """Find an IFC entity by its GlobalId."""
+        if self.model_index is not None:
+            space_entity = self.model_index.get_space(guid)
+            if space_entity is not None:
+                return space_entity
         try:
             return self.ifc_file.by_guid(guid)
         except Exception:
             return None
 
+    def _get_boundary_relationships(self, space_entity) -> List[Any]:
+        """Get the IfcRelSpaceBoundary relationships of a space."""
+        if self.model_index is not None:
+            return self.model_index.get_space_boundaries(getattr(space_entity, 'GlobalId', ''))
+        return getattr(space_entity, 'BoundedBy', [])
+
     def _extract_containment_relationships(self, space_entity) -> List[RelationshipData]:
         """Extract containment relationships (IfcRelContainedInSpatialStructure)."""
         relationships = []
         
         try:
+            if self.model_index is not None:
+                space_guid = getattr(space_entity, 'GlobalId', '')
+                containing_rels = self.model_index.get_containing_structures(space_guid)
+                contained_elements = self.model_index.get_contained_elements(space_guid)
+            else:
+                containing_rels = getattr(space_entity, 'ContainedInStructure', [])
+                contained_elements = [
+                    related_element
+                    for rel in getattr(space_entity, 'ContainsElements', [])
+                    if rel.is_a('IfcRelContainedInSpatialStructure')
+                    for related_element in rel.RelatedElements
+                ]
+
             # Check what contains this space
-            for rel in getattr(space_entity, 'ContainedInStructure', []):
+            for rel in containing_rels:
                 if rel.is_a('IfcRelContainedInSpatialStructure'):
                     relating_structure = rel.RelatingStructure
                     if relating_structure:
@@ -145,16 +188,14 @@ class IfcRelationshipParser:
                             relationships.append(rel_data)
 
             # Check what this space contains
-            for rel in getattr(space_entity, 'ContainsElements', []):
-                if rel.is_a('IfcRelContainedInSpatialStructure'):
-                    for related_element in rel.RelatedElements:
-                        rel_data = self._create_relationship_data(
-                            related_element,
-                            "Contains",
-                            "IfcRelContainedInSpatialStructure"
-                        )
-                        if rel_data:
-                            relationships.append(rel_data)
+            for related_element in contained_elements:
+                rel_data = self._create_relationship_data(
+                    related_element,
+                    "Contains",
+                    "IfcRelContainedInSpatialStructure"
+                )
+                if rel_data:
+                    relationships.append(rel_data)
 
         except Exception as e:
             self.logger.warning(f"Error extracting containment relationships: {e}")
@@ -167,7 +208,7 @@ class IfcRelationshipParser:
         
         try:
             # Get space boundaries to find adjacent spaces
-            for rel in getattr(space_entity, 'BoundedBy', []):
+            for rel in self._get_boundary_relationships(space_entity):
                 if rel.is_a('IfcRelSpaceBoundary'):
                     # Check for 2nd level boundaries (space-to-space)
                     if hasattr(rel, 'CorrespondingBoundary') and rel.CorrespondingBoundary:
@@ -253,7 +294,14 @@ class IfcRelationshipParser:
         
         try:
             # Check what defines this space (property sets, type definitions)
-            for rel in getattr(space_entity, 'IsDefinedBy', []):
+            if self.model_index is not None:
+                defining_rels = self.model_index.get_property_definitions(
+                    getattr(space_entity, 'GlobalId', '')
+                )
+            else:
+                defining_rels = getattr(space_entity, 'IsDefinedBy', [])
+
+            for rel in defining_rels:
                 if rel.is_a('IfcRelDefinesByProperties'):
                     property_definition = rel.RelatingPropertyDefinition
                     if property_definition:
@@ -385,7 +433,7 @@ class IfcRelationshipParser:
             second_level_relationships = []
 
             # Extract boundary relationships with level differentiation
-            for rel in getattr(space_entity, 'BoundedBy', []):
+            for rel in self._get_boundary_relationships(space_entity):
                 if rel.is_a('IfcRelSpaceBoundary'):
                     # 1st level: space-to-building-element relationships
                     building_element = rel.RelatedBuildingElement
@@ -487,25 +535,7 @@ class IfcRelationshipParser:
         properties = {}
         
         try:
-            for prop in getattr(property_set, 'HasProperties', []):
-                prop_name = getattr(prop, 'Name', '')
-                
-                if prop.is_a('IfcPropertySingleValue'):
-                    nominal_value = getattr(prop, 'NominalValue', None)
-                    if nominal_value:
-                        properties[prop_name] = nominal_value.wrappedValue
-                elif prop.is_a('IfcPropertyEnumeratedValue'):
-                    enumeration_values = getattr(prop, 'EnumerationValues', [])
-                    if enumeration_values:
-                        properties[prop_name] = [val.wrappedValue for val in enumeration_values]
-                elif prop.is_a('IfcPropertyBoundedValue'):
-                    upper_bound = getattr(prop, 'UpperBoundValue', None)
-                    lower_bound = getattr(prop, 'LowerBoundValue', None)
-                    if upper_bound or lower_bound:
-                        properties[prop_name] = {
-                            'upper_bound': upper_bound.wrappedValue if upper_bound else None,
-                            'lower_bound': lower_bound.wrappedValue if lower_bound else None
-                        }
+            properties.update(self.property_cache.get_properties(property_set))
 
         except Exception as e:
             self.logger.warning(f"Error extracting properties from property set: {e}")
@@ -12,20 +12,27 @@ import ifcopenshell.util.unit
 from ..utils.enhanced_logging import enhanced_logger
 import ifcopenshell.geom
 from ..data.space_boundary_model import SpaceBoundaryData
+from .model_index import ModelIndex
+from .property_cache import PropertyCache
 
 
 class IfcSpaceBoundaryParser:
     """Extracts and processes IfcSpaceBoundary entities from IFC files."""
 
-    def __init__(self, ifc_file=None):
+    def __init__(self, ifc_file=None, model_index: Optional[ModelIndex] = None,
+                 property_cache: Optional[PropertyCache] = None):
         """
         Initialize the space boundary parser.
 
         Args:
             ifc_file: IfcOpenShell file object (optional)
+            model_index: Shared relationship index for the file (optional)
+            property_cache: Shared property set decode cache (optional)
         """
         self.ifc_file = ifc_file
         self.logger = enhanced_logger.logger
+        self.model_index = model_index
+        self.property_cache = property_cache or PropertyCache(ifc_file)
         self._boundaries_cache = None
         self._geometry_settings = None
 
@@ -39,6 +46,18 @@ class IfcSpaceBoundaryParser:
         self.ifc_file = ifc_file
         self._boundaries_cache = None  # Clear cache when file changes
         self._geometry_settings = None
+        self.property_cache.set_ifc_file(ifc_file)
+        if self.model_index is not None and not self.model_index.is_for_file(ifc_file):
+            self.model_index = None
+
+    def set_model_index(self, model_index: Optional[ModelIndex]) -> None:
+        """
+        Set the shared relationship index used for per-space lookups.
+
+        Args:
+            model_index: ModelIndex built for the current IFC file
+        """
+        self.model_index = model_index
 
     def extract_space_boundaries(self, space_guid: Optional[str] = None) -> List[SpaceBoundaryData]:
         """
@@ -58,6 +77,10 @@ class IfcSpaceBoundaryParser:
             raise ValueError("No IFC file loaded. Use set_ifc_file() first.")
 
         try:
+            if space_guid and self.model_index is not None:
+                # The index already grouped the boundaries by space in one pass
+                return self._extract_boundaries_from_index(space_guid)
+
             # Get all IfcRelSpaceBoundary entities (IFC4 schema)
             ifc_boundaries = self.ifc_file.by_type("IfcRelSpaceBoundary")
 
@@ -99,6 +122,31 @@ class IfcSpaceBoundaryParser:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+    def _extract_boundaries_from_index(self, space_guid: str) -> List[SpaceBoundaryData]:
+        """
+        Extract the boundaries of a single space using the shared model index.
+
+        Args:
+            space_guid: The GlobalId of the space
+
+        Returns:
+            List of SpaceBoundaryData objects for the space
+        """
+        boundaries = []
+        for ifc_boundary in self.model_index.get_space_boundaries(space_guid):
+            try:
+                boundary_data = self._extract_boundary_properties(ifc_boundary)
+                if boundary_data:
+                    boundaries.append(boundary_data)
+            except Exception as e:
+                self.logger.error(
+                    f"Error extracting boundary {getattr(ifc_boundary, 'GlobalId', 'Unknown')}: {e}"
+                )
+                continue
+
+        self.logger.debug(f"Extracted {len(boundaries)} space boundaries for space {space_guid} from model index")
+        return boundaries
+
     def get_boundaries_for_space(self, space_guid: str) -> List[SpaceBoundaryData]:
         """
         Get all boundaries for a specific space.
@@ -305,18 +353,12 @@ class IfcSpaceBoundaryParser:
                 return 0.0
 
             # Check element quantities
-            for rel in getattr(related_element, 'IsDefinedBy', []):
-                if rel.is_a('IfcRelDefinesByProperties'):
-                    prop_def = rel.RelatingPropertyDefinition
-                    if prop_def.is_a('IfcElementQuantity'):
-                        for quantity in prop_def.Quantities:
-                            if quantity.is_a('IfcQuantityArea'):
-                                quantity_name = getattr(quantity, 'Name', '').lower()
-                                # Look for area-related quantities
-                                if any(keyword in quantity_name for keyword in ['area', 'areal', 'surface']):
-                                    area_value = getattr(quantity, 'AreaValue', 0)
-                                    if area_value and area_value > 0:
-                                        return float(area_value)
+            for quantity_name, quantity_class, value in self.property_cache.get_element_quantities(related_element):
+                if quantity_class == 'IfcQuantityArea':
+                    # Look for area-related quantities
+                    if any(keyword in quantity_name.lower() for keyword in ['area', 'areal', 'surface']):
+                        if value > 0:
+                            return value
 
             return 0.0
 
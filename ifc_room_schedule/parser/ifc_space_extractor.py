@@ -10,21 +10,24 @@ import ifcopenshell.util.element
 import ifcopenshell.util.unit
 from ..data.space_model import SpaceData
 from ..utils.enhanced_logging import enhanced_logger
+from .property_cache import PropertyCache
 
 
 class IfcSpaceExtractor:
     """Extracts IfcSpace entities and their properties from IFC files."""
 
-    def __init__(self, ifc_file=None):
+    def __init__(self, ifc_file=None, property_cache: Optional[PropertyCache] = None):
         """
         Initialize the space extractor.
         
         Args:
             ifc_file: IfcOpenShell file object (optional)
+            property_cache: Shared property set decode cache (optional)
         """
         self.ifc_file = ifc_file
         self.logger = enhanced_logger.logger
         self._spaces_cache = None
+        self.property_cache = property_cache or PropertyCache(ifc_file)
 
     def set_ifc_file(self, ifc_file) -> None:
         """
@@ -35,6 +38,7 @@ class IfcSpaceExtractor:
         """
         self.ifc_file = ifc_file
         self._spaces_cache = None  # Clear cache when file changes
+        self.property_cache.set_ifc_file(ifc_file)
 
     def extract_spaces(self) -> List[SpaceData]:
         """
@@ -231,27 +235,8 @@ class IfcSpaceExtractor:
         
         try:
             # Get quantity sets
-            for relationship in getattr(ifc_space, 'IsDefinedBy', []):
-                if relationship.is_a('IfcRelDefinesByProperties'):
-                    property_definition = relationship.RelatingPropertyDefinition
-                    
-                    if property_definition.is_a('IfcElementQuantity'):
-                        for quantity in property_definition.Quantities:
-                            quantity_name = getattr(quantity, 'Name', '')
-                            
-                            # Extract different types of quantities
-                            if quantity.is_a('IfcQuantityLength'):
-                                quantities[quantity_name] = float(quantity.LengthValue or 0)
-                            elif quantity.is_a('IfcQuantityArea'):
-                                quantities[quantity_name] = float(quantity.AreaValue or 0)
-                            elif quantity.is_a('IfcQuantityVolume'):
-                                quantities[quantity_name] = float(quantity.VolumeValue or 0)
-                            elif quantity.is_a('IfcQuantityCount'):
-                                quantities[quantity_name] = float(quantity.CountValue or 0)
-                            elif quantity.is_a('IfcQuantityWeight'):
-                                quantities[quantity_name] = float(quantity.WeightValue or 0)
-                            elif quantity.is_a('IfcQuantityTime'):
-                                quantities[quantity_name] = float(quantity.TimeValue or 0)
+            for quantity_name, _, value in self.property_cache.get_element_quantities(ifc_space):
+                quantities[quantity_name] = value
 
         except Exception as e:
             self.logger.warning(f"Error extracting quantities: {e}")
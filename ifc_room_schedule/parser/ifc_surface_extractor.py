@@ -10,20 +10,27 @@ import ifcopenshell.util.element
 import ifcopenshell.util.unit
 from ..utils.enhanced_logging import enhanced_logger
 from ..data.surface_model import SurfaceData
+from .model_index import ModelIndex
+from .property_cache import PropertyCache
 
 
 class IfcSurfaceExtractor:
     """Extracts surface data associated with IFC spaces."""
 
-    def __init__(self, ifc_file=None):
+    def __init__(self, ifc_file=None, model_index: Optional[ModelIndex] = None,
+                 property_cache: Optional[PropertyCache] = None):
         """
         Initialize the surface extractor.
         
         Args:
             ifc_file: IfcOpenShell file object (optional)
+            model_index: Shared relationship index for the file (optional)
+            property_cache: Shared property set decode cache (optional)
         """
         self.ifc_file = ifc_file
         self.logger = enhanced_logger.logger
+        self.model_index = model_index
+        self.property_cache = property_cache or PropertyCache(ifc_file)
 
     def set_ifc_file(self, ifc_file) -> None:
         """
@@ -33,6 +40,18 @@ class IfcSurfaceExtractor:
             ifc_file: IfcOpenShell file object
         """
         self.ifc_file = ifc_file
+        self.property_cache.set_ifc_file(ifc_file)
+        if self.model_index is not None and not self.model_index.is_for_file(ifc_file):
+            self.model_index = None
+
+    def set_model_index(self, model_index: Optional[ModelIndex]) -> None:
+        """
+        Set the shared relationship index used for per-space lookups.
+        
+        Args:
+            model_index: ModelIndex built for the current IFC file
+        """
+        self.model_index = model_index
 
     def extract_surfaces_for_space(self, space_guid: str) -> List[SurfaceData]:
         """
@@ -79,6 +98,10 @@ class IfcSurfaceExtractor:
 
     def _find_space_by_guid(self, space_guid: str):
         """Find an IFC space by its GUID."""
+        if self.model_index is not None:
+            ifc_space = self.model_index.get_space(space_guid)
+            if ifc_space is not None:
+                return ifc_space
         try:
             return self.ifc_file.by_guid(space_guid)
         except:
@@ -90,7 +113,12 @@ class IfcSurfaceExtractor:
         
         try:
             # Get space boundaries
-            for rel in getattr(ifc_space, 'BoundedBy', []):
+            if self.model_index is not None:
+                boundary_rels = self.model_index.get_space_boundaries(ifc_space.GlobalId)
+            else:
+                boundary_rels = getattr(ifc_space, 'BoundedBy', [])
+
+            for rel in boundary_rels:
                 if rel.is_a('IfcRelSpaceBoundary'):
                     boundary = rel.RelatedBuildingElement
                     if boundary:
@@ -128,13 +156,21 @@ class IfcSurfaceExtractor:
         
         try:
             # Check containment relationships
-            for rel in getattr(ifc_space, 'ContainsElements', []):
-                if rel.is_a('IfcRelContainedInSpatialStructure'):
-                    for element in rel.RelatedElements:
-                        if self._is_surface_element(element):
-                            surface_data = self._create_surface_from_element(element, ifc_space.GlobalId)
-                            if surface_data:
-                                surfaces.append(surface_data)
+            if self.model_index is not None:
+                contained_elements = self.model_index.get_contained_elements(ifc_space.GlobalId)
+            else:
+                contained_elements = [
+                    element
+                    for rel in getattr(ifc_space, 'ContainsElements', [])
+                    if rel.is_a('IfcRelContainedInSpatialStructure')
+                    for element in rel.RelatedElements
+                ]
+
+            for element in contained_elements:
+                if self._is_surface_element(element):
+                    surface_data = self._create_surface_from_element(element, ifc_space.GlobalId)
+                    if surface_data:
+                        surfaces.append(surface_data)
                                 
         except Exception as e:
             self.logger.warning(f"Error extracting surfaces from containment: {e}")
@@ -267,17 +303,11 @@ class IfcSurfaceExtractor:
     def _get_area_from_quantities(self, element) -> float:
         """Get area from IFC quantity sets."""
         try:
-            for rel in getattr(element, 'IsDefinedBy', []):
-                if rel.is_a('IfcRelDefinesByProperties'):
-                    prop_def = rel.RelatingPropertyDefinition
-                    
-                    if prop_def.is_a('IfcElementQuantity'):
-                        for quantity in prop_def.Quantities:
-                            if quantity.is_a('IfcQuantityArea'):
-                                quantity_name = getattr(quantity, 'Name', '').lower()
-                                # Look for area-related quantities
-                                if any(keyword in quantity_name for keyword in ['area', 'areal', 'surface']):
-                                    return float(quantity.AreaValue or 0)
+            for quantity_name, quantity_class, value in self.property_cache.get_element_quantities(element):
+                if quantity_class == 'IfcQuantityArea':
+                    # Look for area-related quantities
+                    if any(keyword in quantity_name.lower() for keyword in ['area', 'areal', 'surface']):
+                        return value
                                     
         except Exception as e:
             self.logger.debug(f"Error getting area from quantities: {e}")
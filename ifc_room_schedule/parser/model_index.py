@@ -0,0 +1,219 @@
+"""
+IFC Model Index
+
+Single-pass relationship index over an IFC model, shared by the room schedule parsers.
+"""
+
+from typing import List, Dict, Any
+from ..utils.enhanced_logging import enhanced_logger
+
+
+class ModelIndex:
+    """
+    Relationship index built once per loaded IFC file.
+
+    The parsers otherwise walk every IfcRelSpaceBoundary (or every inverse
+    attribute) once per space, which makes extraction O(spaces x relationships).
+    The index visits each relationship once and answers the per-space lookups
+    from dictionaries.
+    """
+
+    def __init__(self, ifc_file=None):
+        """
+        Initialize the model index.
+
+        Args:
+            ifc_file: IfcOpenShell file object (optional). The index is built
+                immediately when a file is given.
+        """
+        self.ifc_file = None
+        self.logger = enhanced_logger.logger
+        self._reset()
+
+        if ifc_file is not None:
+            self.build(ifc_file)
+
+    def _reset(self) -> None:
+        """Clear all index tables."""
+        self._is_built = False
+        self._spaces: Dict[str, Any] = {}
+        self._space_boundaries: Dict[str, List[Any]] = {}
+        self._space_definitions: Dict[str, List[Any]] = {}
+        self._space_contained_in: Dict[str, List[Any]] = {}
+        self._space_contains: Dict[str, List[Any]] = {}
+        self._relationship_count = 0
+
+    @property
+    def is_built(self) -> bool:
+        """Check whether the index has been built."""
+        return self._is_built
+
+    def is_for_file(self, ifc_file) -> bool:
+        """Check whether the index was built for the given IFC file."""
+        return self._is_built and self.ifc_file is ifc_file
+
+    def build(self, ifc_file) -> None:
+        """
+        Build the index with a single pass over the relevant relationships.
+
+        Args:
+            ifc_file: IfcOpenShell file object
+
+        Raises:
+            ValueError: If no IFC file is given
+            RuntimeError: If the index cannot be built
+        """
+        if ifc_file is None:
+            raise ValueError("No IFC file given. Cannot build model index.")
+
+        self._reset()
+        self.ifc_file = ifc_file
+
+        operation_id = enhanced_logger.start_operation_timing("build_model_index")
+
+        try:
+            spaces = ifc_file.by_type("IfcSpace")
+            for space in spaces:
+                guid = getattr(space, 'GlobalId', '')
+                if guid:
+                    self._spaces[guid] = space
+
+            # Space boundaries are indexed from the relationship list rather than from
+            # the BoundedBy inverse so that file order is preserved.
+            for boundary in ifc_file.by_type("IfcRelSpaceBoundary"):
+                self._relationship_count += 1
+                self._index_space_boundary(boundary)
+
+            # Everything else hangs off the space, so the inverse attributes give
+            # each relationship exactly once without scanning the whole file.
+            for guid, space in self._spaces.items():
+                self._index_space_inverses(guid, space)
+
+            self._is_built = True
+
+            enhanced_logger.finish_operation_timing(operation_id)
+            self.logger.info(
+                f"Built model index: {len(self._spaces)} spaces, "
+                f"{self._relationship_count} relationships"
+            )
+
+        except Exception as e:
+            enhanced_logger.finish_operation_timing(operation_id)
+            self._reset()
+            error_msg = f"Failed to build model index: {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+    def _index_space_boundary(self, boundary) -> None:
+        """Add a single IfcRelSpaceBoundary to the index."""
+        space = getattr(boundary, 'RelatingSpace', None)
+        space_guid = getattr(space, 'GlobalId', '') if space else ''
+        if not space_guid:
+            return
+
+        self._space_boundaries.setdefault(space_guid, []).append(boundary)
+
+    def _index_space_inverses(self, space_guid: str, space) -> None:
+        """Index the inverse relationships of a single space."""
+        definitions = []
+        for rel in getattr(space, 'IsDefinedBy', None) or []:
+            self._relationship_count += 1
+            definitions.append(rel)
+        if definitions:
+            self._space_definitions[space_guid] = definitions
+
+        contained_in = []
+        for rel in getattr(space, 'ContainedInStructure', None) or []:
+            self._relationship_count += 1
+            if rel.is_a('IfcRelContainedInSpatialStructure'):
+                contained_in.append(rel)
+        if contained_in:
+            self._space_contained_in[space_guid] = contained_in
+
+        contains = []
+        for rel in getattr(space, 'ContainsElements', None) or []:
+            self._relationship_count += 1
+            if rel.is_a('IfcRelContainedInSpatialStructure'):
+                contains.extend(rel.RelatedElements or [])
+        if contains:
+            self._space_contains[space_guid] = contains
+
+    def get_space(self, space_guid: str):
+        """
+        Get an IfcSpace entity by GUID.
+
+        Args:
+            space_guid: The GlobalId of the space
+
+        Returns:
+            IfcSpace entity or None if not indexed
+        """
+        return self._spaces.get(space_guid)
+
+    def get_spaces(self) -> List[Any]:
+        """Get all indexed IfcSpace entities in file order."""
+        return list(self._spaces.values())
+
+    def get_space_boundaries(self, space_guid: str) -> List[Any]:
+        """
+        Get the IfcRelSpaceBoundary entities whose RelatingSpace is the given space.
+
+        Args:
+            space_guid: The GlobalId of the space
+
+        Returns:
+            List of IfcRelSpaceBoundary entities in file order
+        """
+        return self._space_boundaries.get(space_guid, [])
+
+    def get_property_definitions(self, space_guid: str) -> List[Any]:
+        """
+        Get the IfcRelDefines relationships (properties and types) of a space.
+
+        Args:
+            space_guid: The GlobalId of the space
+
+        Returns:
+            List of IfcRelDefinesByProperties / IfcRelDefinesByType entities
+        """
+        return self._space_definitions.get(space_guid, [])
+
+    def get_containing_structures(self, space_guid: str) -> List[Any]:
+        """
+        Get the IfcRelContainedInSpatialStructure relationships containing a space.
+
+        Args:
+            space_guid: The GlobalId of the space
+
+        Returns:
+            List of IfcRelContainedInSpatialStructure entities
+        """
+        return self._space_contained_in.get(space_guid, [])
+
+    def get_contained_elements(self, space_guid: str) -> List[Any]:
+        """
+        Get the elements spatially contained in a space.
+
+        Args:
+            space_guid: The GlobalId of the space
+
+        Returns:
+            List of IFC element entities
+        """
+        return self._space_contains.get(space_guid, [])
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Get index size statistics.
+
+        Returns:
+            Dictionary with index statistics
+        """
+        return {
+            'spaces': len(self._spaces),
+            'relationships_visited': self._relationship_count,
+            'spaces_with_boundaries': len(self._space_boundaries),
+            'boundaries': sum(len(b) for b in self._space_boundaries.values()),
+            'spaces_with_definitions': len(self._space_definitions),
+            'spaces_with_containment': len(self._space_contained_in) + len(self._space_contains)
+        }
@@ -16,6 +16,14 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
 from ..utils.enhanced_logging import enhanced_logger
+from .step_scanner import StepScanResult, prescan_file
+from .property_cache import PropertyCache
+
+
+# Entity count thresholds used instead of file size when a pre-scan is available
+# (roughly 10MB and 100MB of typical IFC-SPF records)
+MEDIUM_FILE_ENTITIES = 125_000
+LARGE_FILE_ENTITIES = 1_250_000
 
 
 @dataclass
@@ -46,11 +54,14 @@ class CacheConfig:
 class OptimizedIFCParser:
     """High-performance IFC parser with caching and optimization."""
     
-    def __init__(self, cache_config: Optional[CacheConfig] = None):
+    def __init__(self, cache_config: Optional[CacheConfig] = None,
+                 property_cache: Optional[PropertyCache] = None):
         """Initialize optimized IFC parser."""
         self.cache_config = cache_config or CacheConfig()
         self.ifc_file = None
         self.file_path = None
+        self.scan_result: Optional[StepScanResult] = None
+        self.property_cache = property_cache or PropertyCache()
         self._cache = {}
         self._cache_timestamps = {}
         self._lock = threading.RLock()
@@ -67,12 +78,14 @@ class OptimizedIFCParser:
             processing_rate_mb_per_second=0.0
         )
     
-    def load_file_optimized(self, file_path: str) -> Tuple[bool, str]:
+    def load_file_optimized(self, file_path: str,
+                            scan_result: Optional[StepScanResult] = None) -> Tuple[bool, str]:
         """
         Load IFC file with performance optimizations.
         
         Args:
             file_path: Path to IFC file
+            scan_result: Pre-scan of the file (scanned here if not given)
             
         Returns:
             Tuple of (success, message)
@@ -89,10 +102,23 @@ class OptimizedIFCParser:
             file_size_mb = file_size / (1024 * 1024)
             self.metrics.file_size_mb = file_size_mb
             
-            # Choose parsing strategy based on file size
-            if file_size_mb < 10:
-                return self._load_small_file(file_path, operation_id)
+            if scan_result is None or scan_result.file_path != file_path:
+                scan_result = prescan_file(file_path)
+            self.scan_result = scan_result
+            
+            # Choose parsing strategy based on entity count, or file size without a pre-scan
+            if scan_result is not None:
+                size_class = self._classify_by_entities(scan_result.total_entities)
+            elif file_size_mb < 10:
+                size_class = "small"
             elif file_size_mb < 100:
+                size_class = "medium"
+            else:
+                size_class = "large"
+            
+            if size_class == "small":
+                return self._load_small_file(file_path, operation_id)
+            elif size_class == "medium":
                 return self._load_medium_file(file_path, operation_id)
             else:
                 return self._load_large_file(file_path, operation_id)
@@ -101,6 +127,32 @@ class OptimizedIFCParser:
             enhanced_logger.finish_operation_timing(operation_id)
             return False, f"Error loading file: {str(e)}"
     
+    def get_scan_result(self) -> Optional[StepScanResult]:
+        """Get the pre-scan of the most recently loaded file."""
+        return self.scan_result
+    
+    def _classify_by_entities(self, entity_count: int) -> str:
+        """Classify a file as small, medium or large by its entity count."""
+        if entity_count < MEDIUM_FILE_ENTITIES:
+            return "small"
+        elif entity_count < LARGE_FILE_ENTITIES:
+            return "medium"
+        return "large"
+    
+    def _has_no_spaces(self) -> bool:
+        """Check whether the pre-scan already shows that the file has no spaces."""
+        return self.scan_result is not None and self.scan_result.space_count == 0
+    
+    def _count_entities(self) -> int:
+        """Count entities in the loaded file, preferring the pre-scan."""
+        if self.scan_result is not None and self.scan_result.file_path == self.file_path:
+            return self.scan_result.total_entities
+        try:
+            return len(self.ifc_file)
+        except TypeError:
+            # Newer IfcOpenShell file objects do not support len()
+            return 0
+    
     def _validate_file_basic(self, file_path: str) -> bool:
         """Basic file validation."""
         if not os.path.exists(file_path):
@@ -116,8 +168,14 @@ class OptimizedIFCParser:
         start_time = time.time()
         
         try:
+            # Don't parse a file the pre-scan shows has nothing to extract
+            if self._has_no_spaces():
+                enhanced_logger.finish_operation_timing(operation_id)
+                return False, "No IfcSpace entities found"
+            
             self.ifc_file = ifcopenshell.open(file_path)
             self.file_path = file_path
+            self.property_cache.set_ifc_file(self.ifc_file)
             
             # Quick validation
             spaces = self.ifc_file.by_type("IfcSpace")
@@ -128,7 +186,7 @@ class OptimizedIFCParser:
             parsing_time = time.time() - start_time
             self.metrics.parsing_time_seconds = parsing_time
             self.metrics.spaces_found = len(spaces)
-            self.metrics.entities_processed = len(self.ifc_file)
+            self.metrics.entities_processed = self._count_entities()
             self.metrics.processing_rate_mb_per_second = self.metrics.file_size_mb / parsing_time
             
             enhanced_logger.finish_operation_timing(operation_id)
@@ -143,9 +201,15 @@ class OptimizedIFCParser:
         start_time = time.time()
         
         try:
+            # Don't parse a file the pre-scan shows has nothing to extract
+            if self._has_no_spaces():
+                enhanced_logger.finish_operation_timing(operation_id)
+                return False, "No IfcSpace entities found"
+            
             # Load with memory optimization
             self.ifc_file = ifcopenshell.open(file_path)
             self.file_path = file_path
+            self.property_cache.set_ifc_file(self.ifc_file)
             
             # Pre-cache frequently accessed entities
             self._precache_entities()
@@ -159,7 +223,7 @@ class OptimizedIFCParser:
             parsing_time = time.time() - start_time
             self.metrics.parsing_time_seconds = parsing_time
             self.metrics.spaces_found = len(spaces)
-            self.metrics.entities_processed = len(self.ifc_file)
+            self.metrics.entities_processed = self._count_entities()
             self.metrics.processing_rate_mb_per_second = self.metrics.file_size_mb / parsing_time
             
             enhanced_logger.finish_operation_timing(operation_id)
@@ -174,9 +238,15 @@ class OptimizedIFCParser:
         start_time = time.time()
         
         try:
+            # Don't parse a file the pre-scan shows has nothing to extract
+            if self._has_no_spaces():
+                enhanced_logger.finish_operation_timing(operation_id)
+                return False, "No IfcSpace entities found"
+            
             # Load with minimal memory footprint
             self.ifc_file = ifcopenshell.open(file_path)
             self.file_path = file_path
+            self.property_cache.set_ifc_file(self.ifc_file)
             
             # Use lazy loading for large files
             self._enable_lazy_loading()
@@ -190,7 +260,7 @@ class OptimizedIFCParser:
             parsing_time = time.time() - start_time
             self.metrics.parsing_time_seconds = parsing_time
             self.metrics.spaces_found = spaces_count
-            self.metrics.entities_processed = len(self.ifc_file)
+            self.metrics.entities_processed = self._count_entities()
             self.metrics.processing_rate_mb_per_second = self.metrics.file_size_mb / parsing_time
             
             enhanced_logger.finish_operation_timing(operation_id)
@@ -257,16 +327,11 @@ class OptimizedIFCParser:
     
     def _count_spaces_efficiently(self) -> int:
         """Count spaces without loading all data."""
-        try:
-            # Use a more efficient method to count spaces
-            count = 0
-            for entity in self.ifc_file:
-                if entity.is_a("IfcSpace"):
-                    count += 1
-            return count
-        except Exception:
-            # Fallback to standard method
-            return len(self.ifc_file.by_type("IfcSpace"))
+        if self.scan_result is not None and self.scan_result.file_path == self.file_path:
+            return self.scan_result.space_count
+        
+        # The by_type index is cheaper than visiting every entity
+        return len(self.ifc_file.by_type("IfcSpace"))
     
     def get_spaces_batch(self, batch_size: int = 100) -> Iterator[List[Any]]:
         """
@@ -357,9 +422,8 @@ class OptimizedIFCParser:
                         prop_set_props = {}
                         
                         if hasattr(prop_def, 'HasProperties'):
-                            for prop in prop_def.HasProperties:
-                                if hasattr(prop, 'Name') and hasattr(prop, 'NominalValue'):
-                                    prop_set_props[prop.Name] = str(prop.NominalValue)
+                            for name, value in self.property_cache.get_properties(prop_def).items():
+                                prop_set_props[name] = str(value)
                         
                         properties[prop_set_name] = prop_set_props
         except Exception:
@@ -444,7 +508,8 @@ class OptimizedIFCParser:
                 "cache_hits": self.metrics.cache_hits,
                 "cache_misses": self.metrics.cache_misses,
                 "hit_ratio": self.metrics.cache_hits / (self.metrics.cache_hits + self.metrics.cache_misses) if (self.metrics.cache_hits + self.metrics.cache_misses) > 0 else 0,
-                "memory_usage_mb": self._estimate_cache_memory_usage()
+                "memory_usage_mb": self._estimate_cache_memory_usage(),
+                "property_cache": self.property_cache.get_statistics()
             }
     
     def _estimate_cache_memory_usage(self) -> float:
@@ -483,6 +548,8 @@ class OptimizedIFCParser:
         self.clear_cache()
         self.ifc_file = None
         self.file_path = None
+        self.scan_result = None
+        self.property_cache.set_ifc_file(None)
 
 
 # Example usage and testing
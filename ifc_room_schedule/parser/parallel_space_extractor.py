@@ -0,0 +1,257 @@
+"""
+Parallel Space Extractor
+
+Process-pool space extraction where every worker opens the IFC file once and
+extracts a contiguous slice of the model's IfcSpace entities.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+import ifcopenshell
+
+from ..data.space_model import SpaceData
+from ..utils.enhanced_logging import enhanced_logger
+from .ifc_space_extractor import IfcSpaceExtractor
+from .ifc_surface_extractor import IfcSurfaceExtractor
+from .ifc_space_boundary_parser import IfcSpaceBoundaryParser
+from .ifc_relationship_parser import IfcRelationshipParser
+from .model_index import ModelIndex
+from .property_cache import PropertyCache
+from .parse_cache import encode_space_records, decode_space_records
+from .step_scanner import StepScanResult, prescan_file
+
+
+class SpaceSliceExtractor:
+    """
+    Extracts slices of a model's spaces from one opened IFC file.
+
+    Slices are index ranges into ``by_type("IfcSpace")``, which lists spaces in the
+    same order every time the file is opened, so slices extracted in different
+    processes can be concatenated into the serial result.
+    """
+
+    def __init__(self, ifc_file, include_details: bool = False):
+        """
+        Initialize the slice extractor.
+
+        Args:
+            ifc_file: IfcOpenShell file object
+            include_details: Also extract surfaces, space boundaries and relationships
+        """
+        self.ifc_file = ifc_file
+        self.include_details = include_details
+        self.logger = enhanced_logger.logger
+        self.ifc_spaces = ifc_file.by_type("IfcSpace")
+        self.property_cache = PropertyCache(ifc_file)
+        self.space_extractor = IfcSpaceExtractor(ifc_file, property_cache=self.property_cache)
+
+        if include_details:
+            model_index = ModelIndex(ifc_file)
+            self.surface_extractor = IfcSurfaceExtractor(ifc_file, model_index=model_index,
+                                                         property_cache=self.property_cache)
+            self.boundary_parser = IfcSpaceBoundaryParser(ifc_file, model_index=model_index,
+                                                          property_cache=self.property_cache)
+            self.relationship_parser = IfcRelationshipParser(ifc_file, model_index=model_index,
+                                                             property_cache=self.property_cache)
+
+    def extract(self, start: int, end: Optional[int]) -> Tuple[List[SpaceData], List[Tuple[str, str]]]:
+        """
+        Extract the spaces in an index range.
+
+        Args:
+            start: Index of the first space
+            end: Index after the last space, or None for all remaining spaces
+
+        Returns:
+            Tuple of (extracted spaces, failed extractions)
+        """
+        spaces, failed_extractions = self.space_extractor._extract_spaces_batch(
+            self.ifc_spaces[start:end], start
+        )
+
+        if self.include_details:
+            for space in spaces:
+                self._extract_details(space, failed_extractions)
+
+        return spaces, failed_extractions
+
+    def _extract_details(self, space: SpaceData, failed_extractions: List[Tuple[str, str]]) -> None:
+        """Attach surfaces, boundaries and relationships to a space."""
+        try:
+            for surface in self.surface_extractor.extract_surfaces_for_space(space.guid):
+                space.add_surface(surface)
+        except Exception as e:
+            self.logger.error(f"Error extracting surfaces for space {space.guid}: {e}")
+            failed_extractions.append((space.guid, f"Surfaces: {e}"))
+
+        try:
+            for boundary in self.boundary_parser.extract_space_boundaries(space.guid):
+                space.add_space_boundary(boundary)
+        except Exception as e:
+            self.logger.error(f"Error extracting boundaries for space {space.guid}: {e}")
+            failed_extractions.append((space.guid, f"Boundaries: {e}"))
+
+        try:
+            for relationship in self.relationship_parser.get_space_relationships(space.guid):
+                space.add_relationship(relationship)
+        except Exception as e:
+            self.logger.error(f"Error extracting relationships for space {space.guid}: {e}")
+            failed_extractions.append((space.guid, f"Relationships: {e}"))
+
+
+# Per-process extractor, created once by the pool initializer
+_worker_extractor: Optional[SpaceSliceExtractor] = None
+
+
+def _initialize_worker(file_path: str, include_details: bool) -> None:
+    """Open the IFC file once in a worker process."""
+    global _worker_extractor
+    _worker_extractor = SpaceSliceExtractor(ifcopenshell.open(file_path), include_details)
+
+
+def _extract_slice(start: int, end: Optional[int]) -> Tuple[List[tuple], List[Tuple[str, str]]]:
+    """Extract a slice in a worker process and return it as picklable records."""
+    spaces, failed_extractions = _worker_extractor.extract(start, end)
+    return encode_space_records(spaces), failed_extractions
+
+
+class ParallelSpaceExtractor:
+    """
+    Extracts SpaceData from an IFC file using a pool of worker processes.
+
+    IfcOpenShell entity access holds the GIL, so threads cannot speed up
+    extraction. Each worker process instead opens the file once, extracts slices
+    of spaces and returns them as plain records that are merged in slice order.
+    The result is identical to a serial extraction of the same file.
+    """
+
+    def __init__(self, workers: Optional[int] = None, include_details: bool = False,
+                 slices_per_worker: int = 4, min_spaces_per_worker: int = 25):
+        """
+        Initialize the parallel extractor.
+
+        Args:
+            workers: Number of worker processes (default: CPU count)
+            include_details: Also extract surfaces, space boundaries and relationships
+            slices_per_worker: Slices queued per worker, for load balancing
+            min_spaces_per_worker: Smallest amount of work worth a separate process
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.include_details = include_details
+        self.slices_per_worker = max(1, slices_per_worker)
+        self.min_spaces_per_worker = max(1, min_spaces_per_worker)
+        self.logger = enhanced_logger.logger
+
+        self.stats: Dict[str, Any] = {}
+
+    def extract_spaces(self, file_path: str, scan_result: Optional[StepScanResult] = None) -> List[SpaceData]:
+        """
+        Extract all spaces from an IFC file.
+
+        Args:
+            file_path: Path to the IFC file
+            scan_result: Pre-scan of the file (scanned here if not given)
+
+        Returns:
+            List of SpaceData in model order
+
+        Raises:
+            ValueError: If the file does not exist
+            RuntimeError: If extraction fails
+            MemoryError: If a worker runs out of memory
+        """
+        if not file_path or not os.path.isfile(file_path):
+            raise ValueError(f"IFC file not found: {file_path}")
+
+        operation_id = enhanced_logger.start_operation_timing("parallel_space_extraction", file_path)
+        start_time = time.time()
+
+        try:
+            space_count = self._count_spaces(file_path, scan_result)
+            workers = self._get_worker_count(space_count)
+
+            if workers <= 1:
+                spaces, failed_extractions = self._extract_serial(file_path)
+            else:
+                spaces, failed_extractions = self._extract_parallel(file_path, space_count, workers)
+
+            if failed_extractions:
+                self.logger.warning(f"Failed to extract {len(failed_extractions)} items from {len(spaces)} spaces")
+                for space_id, error in failed_extractions[:5]:
+                    self.logger.debug(f"  - {space_id}: {error}")
+
+            self.stats = {
+                'spaces': len(spaces),
+                'failed_extractions': len(failed_extractions),
+                'workers': workers,
+                'extraction_time': time.time() - start_time
+            }
+            enhanced_logger.finish_operation_timing(operation_id)
+            self.logger.info(
+                f"Extracted {len(spaces)} spaces with {workers} worker(s) in {self.stats['extraction_time']:.2f}s"
+            )
+            return spaces
+
+        except MemoryError:
+            enhanced_logger.finish_operation_timing(operation_id)
+            raise
+        except Exception as e:
+            enhanced_logger.finish_operation_timing(operation_id)
+            error_msg = f"Failed to extract spaces in parallel: {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics of the last extraction."""
+        return dict(self.stats)
+
+    def _count_spaces(self, file_path: str, scan_result: Optional[StepScanResult] = None) -> Optional[int]:
+        """Count spaces with the pre-scanner, or None if the file cannot be pre-scanned."""
+        if scan_result is None or scan_result.file_path != file_path:
+            scan_result = prescan_file(file_path)
+        # Workers slice by_type("IfcSpace"), which includes subtypes
+        return scan_result.get_count("IfcSpace", include_subtypes=True) if scan_result is not None else None
+
+    def _get_worker_count(self, space_count: Optional[int]) -> int:
+        """Limit the worker count so every worker has enough spaces to pay for opening the file."""
+        if space_count is None:
+            return 1
+        return max(1, min(self.workers, space_count // self.min_spaces_per_worker))
+
+    def _create_slices(self, space_count: int, workers: int) -> List[Tuple[int, Optional[int]]]:
+        """
+        Split the space index range into contiguous slices.
+
+        The pre-scan count is only an estimate of len(by_type("IfcSpace")), so the
+        last slice is open-ended and picks up any spaces beyond it.
+        """
+        slice_count = min(space_count, workers * self.slices_per_worker)
+        bounds = [space_count * i // slice_count for i in range(slice_count + 1)]
+        bounds[-1] = None
+        return [(bounds[i], bounds[i + 1]) for i in range(slice_count)]
+
+    def _extract_serial(self, file_path: str) -> Tuple[List[SpaceData], List[Tuple[str, str]]]:
+        """Extract all spaces in this process."""
+        extractor = SpaceSliceExtractor(ifcopenshell.open(file_path), self.include_details)
+        return extractor.extract(0, len(extractor.ifc_spaces))
+
+    def _extract_parallel(self, file_path: str, space_count: int,
+                          workers: int) -> Tuple[List[SpaceData], List[Tuple[str, str]]]:
+        """Extract slices in worker processes and merge them in slice order."""
+        slices = self._create_slices(space_count, workers)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker,
+                                 initargs=(file_path, self.include_details)) as executor:
+            futures = [executor.submit(_extract_slice, start, end) for start, end in slices]
+
+            spaces: List[SpaceData] = []
+            failed_extractions: List[Tuple[str, str]] = []
+            for future in futures:
+                records, slice_failures = future.result()
+                spaces.extend(decode_space_records(records))
+                failed_extractions.extend(slice_failures)
+
+        return spaces, failed_extractions
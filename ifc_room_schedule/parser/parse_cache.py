@@ -0,0 +1,490 @@
+"""
+Parse Cache
+
+Persistent, content-addressed cache of extracted room schedule data.
+"""
+
+import os
+import json
+import pickle
+import hashlib
+import zlib
+from dataclasses import fields
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from ..data.space_model import SpaceData
+from ..data.surface_model import SurfaceData
+from ..data.space_boundary_model import SpaceBoundaryData
+from ..data.relationship_model import RelationshipData
+from ..visualization.geometry_models import Point2D, Polygon2D, ArrayPolygon2D, FloorLevel, FloorGeometry
+from ..utils.enhanced_logging import enhanced_logger
+
+
+# Bump whenever extraction changes what ends up in SpaceData for the same file
+PARSER_VERSION = "1"
+
+CACHE_MAGIC = b"RSPC"
+CACHE_FORMAT_VERSION = 1
+CACHE_FILE_EXTENSION = ".rspc"
+FLOOR_GEOMETRY_EXTRACTION = "floor_geometry"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _field_names(model) -> Tuple[str, ...]:
+    """Get the dataclass field names of a model in declaration order."""
+    return tuple(f.name for f in fields(model))
+
+
+SPACE_FIELDS = _field_names(SpaceData)
+SURFACE_FIELDS = _field_names(SurfaceData)
+BOUNDARY_FIELDS = _field_names(SpaceBoundaryData)
+RELATIONSHIP_FIELDS = _field_names(RelationshipData)
+
+# Nested model lists are encoded separately from the plain space fields
+_SPACE_NESTED_FIELDS = ('surfaces', 'space_boundaries', 'relationships')
+_SPACE_PLAIN_FIELDS = tuple(name for name in SPACE_FIELDS if name not in _SPACE_NESTED_FIELDS)
+
+
+def encode_space_records(spaces: List[SpaceData]) -> List[tuple]:
+    """
+    Flatten spaces into picklable field tuples.
+
+    Args:
+        spaces: Spaces to encode
+
+    Returns:
+        One record per space: (space fields, surfaces, boundaries, relationships)
+    """
+    records = []
+    for space in spaces:
+        records.append((
+            tuple(getattr(space, name) for name in _SPACE_PLAIN_FIELDS),
+            [tuple(getattr(s, name) for name in SURFACE_FIELDS) for s in space.surfaces],
+            [tuple(getattr(b, name) for name in BOUNDARY_FIELDS) for b in space.space_boundaries],
+            [tuple(getattr(r, name) for name in RELATIONSHIP_FIELDS) for r in space.relationships],
+        ))
+    return records
+
+
+def decode_space_records(records: List[tuple]) -> List[SpaceData]:
+    """
+    Rebuild spaces from records produced by encode_space_records.
+
+    Args:
+        records: Encoded space records
+
+    Returns:
+        List of SpaceData
+    """
+    spaces = []
+    for space_values, surfaces, boundaries, relationships in records:
+        values = dict(zip(_SPACE_PLAIN_FIELDS, space_values))
+        values['surfaces'] = [SurfaceData(*s) for s in surfaces]
+        values['space_boundaries'] = [SpaceBoundaryData(*b) for b in boundaries]
+        values['relationships'] = [RelationshipData(*r) for r in relationships]
+        spaces.append(SpaceData(**values))
+    return spaces
+
+
+def encode_floor_geometry_records(floor_geometries: Dict[str, FloorGeometry]) -> List[tuple]:
+    """
+    Flatten floor geometries into picklable records.
+
+    The spatial index is left out; it is rebuilt on first use.
+
+    Args:
+        floor_geometries: Floor geometries keyed by floor ID
+
+    Returns:
+        One record per floor: (floor ID, level, room polygons, building outline, bounds)
+    """
+    return [
+        (floor_id, geometry.level, geometry.room_polygons, geometry.building_outline, geometry.bounds)
+        for floor_id, geometry in floor_geometries.items()
+    ]
+
+
+def decode_floor_geometry_records(records: List[tuple]) -> Dict[str, FloorGeometry]:
+    """
+    Rebuild floor geometries from records produced by encode_floor_geometry_records.
+
+    Args:
+        records: Encoded floor records
+
+    Returns:
+        Floor geometries keyed by floor ID, in their original order
+    """
+    return {
+        floor_id: FloorGeometry(level=level, room_polygons=room_polygons,
+                                building_outline=building_outline, bounds=bounds)
+        for floor_id, level, room_polygons, building_outline, bounds in records
+    }
+
+
+def _signature(layout: tuple) -> str:
+    """Hash a model layout."""
+    return hashlib.blake2b(repr(layout).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _schema_signature() -> str:
+    """Hash of the model layouts, so cache files written for other layouts are never decoded."""
+    return _signature((SPACE_FIELDS, SURFACE_FIELDS, BOUNDARY_FIELDS, RELATIONSHIP_FIELDS))
+
+
+def _geometry_schema_signature() -> str:
+    """Hash of the floor geometry model layouts."""
+    return _signature((
+        _field_names(FloorGeometry), _field_names(FloorLevel), _field_names(Polygon2D),
+        _field_names(Point2D), ArrayPolygon2D.__slots__
+    ))
+
+
+class ParseCache:
+    """
+    On-disk cache of extracted SpaceData graphs keyed by IFC file content.
+
+    Entries are addressed by a hash of the file contents combined with the parser
+    version and the data model layout, so a renamed or copied file still hits and
+    any change to the file or to extraction misses. Each entry stores the complete
+    space graph (surfaces, space boundaries and relationships) as field tuples in a
+    compressed binary file. The 2D floor geometry of a file is cached alongside,
+    so a warm open can skip the IFC file entirely.
+    """
+
+    def __init__(self, cache_directory: Optional[str] = None, max_disk_mb: int = 1024):
+        """
+        Initialize the parse cache.
+
+        Args:
+            cache_directory: Directory for cache files (default: ~/.romskjema_cache/parse)
+            max_disk_mb: Maximum total size of cache files in MB
+        """
+        self.cache_directory = cache_directory or os.path.join(
+            os.path.expanduser("~"), ".romskjema_cache", "parse"
+        )
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+        self.logger = enhanced_logger.logger
+        self.schema_signature = _schema_signature()
+        self.geometry_schema_signature = _geometry_schema_signature()
+
+        # Content hashes keyed by absolute path, valid while size and mtime are unchanged
+        self._hash_index: Optional[Dict[str, List[Any]]] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @property
+    def hash_index_path(self) -> str:
+        """Path of the file holding remembered content hashes."""
+        return os.path.join(self.cache_directory, "file_hashes.json")
+
+    def get_file_hash(self, file_path: str) -> str:
+        """
+        Get the content hash of a file.
+
+        The hash is remembered together with the file's size and modification time,
+        so unchanged files are only read once.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest of the file contents
+        """
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        hash_index = self._load_hash_index()
+
+        remembered = hash_index.get(abs_path)
+        if remembered and remembered[0] == stat.st_size and remembered[1] == stat.st_mtime_ns:
+            return remembered[2]
+
+        digest = hashlib.blake2b(digest_size=20)
+        with open(abs_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        file_hash = digest.hexdigest()
+
+        hash_index[abs_path] = [stat.st_size, stat.st_mtime_ns, file_hash]
+        self._save_hash_index()
+        return file_hash
+
+    def get_cache_key(self, file_hash: str, extraction: str = "full") -> str:
+        """
+        Build the cache key for a file hash.
+
+        Args:
+            file_hash: Content hash of the IFC file
+            extraction: Name of the extraction pipeline that produced the spaces
+
+        Returns:
+            Cache key
+        """
+        return f"{file_hash}-{extraction}-v{PARSER_VERSION}-{self.schema_signature}"
+
+    def get_cache_path(self, cache_key: str) -> str:
+        """Get the path of the cache file for a key."""
+        return os.path.join(self.cache_directory, cache_key + CACHE_FILE_EXTENSION)
+
+    def load(self, file_path: str, extraction: str = "full") -> Optional[List[SpaceData]]:
+        """
+        Load the cached spaces for an IFC file.
+
+        Args:
+            file_path: Path to the IFC file
+            extraction: Name of the extraction pipeline that produced the spaces
+
+        Returns:
+            List of SpaceData or None if the file is not cached
+        """
+        spaces = self._read_entry(file_path, extraction, self.decode_spaces)
+        if spaces is not None:
+            self.logger.info(f"Loaded {len(spaces)} spaces from parse cache: {os.path.basename(file_path)}")
+        return spaces
+
+    def store(self, file_path: str, spaces: List[SpaceData], extraction: str = "full") -> bool:
+        """
+        Store the extracted spaces for an IFC file.
+
+        Args:
+            file_path: Path to the IFC file the spaces were extracted from
+            spaces: Extracted spaces
+            extraction: Name of the extraction pipeline that produced the spaces
+
+        Returns:
+            True if the spaces were stored, False otherwise
+        """
+        return self._write_entry(file_path, extraction, lambda: self.encode_spaces(spaces),
+                                 f"{len(spaces)} spaces")
+
+    def load_floor_geometry(self, file_path: str) -> Optional[Dict[str, FloorGeometry]]:
+        """
+        Load the cached floor geometry for an IFC file.
+
+        Args:
+            file_path: Path to the IFC file
+
+        Returns:
+            Floor geometries keyed by floor ID or None if the file is not cached
+        """
+        floor_geometries = self._read_entry(file_path, FLOOR_GEOMETRY_EXTRACTION, self.decode_floor_geometry)
+        if floor_geometries is not None:
+            self.logger.info(
+                f"Loaded geometry for {len(floor_geometries)} floors from parse cache: "
+                f"{os.path.basename(file_path)}"
+            )
+        return floor_geometries
+
+    def store_floor_geometry(self, file_path: str, floor_geometries: Dict[str, FloorGeometry]) -> bool:
+        """
+        Store the extracted floor geometry for an IFC file.
+
+        Args:
+            file_path: Path to the IFC file the geometry was extracted from
+            floor_geometries: Floor geometries keyed by floor ID
+
+        Returns:
+            True if the geometry was stored, False otherwise
+        """
+        return self._write_entry(file_path, FLOOR_GEOMETRY_EXTRACTION,
+                                 lambda: self.encode_floor_geometry(floor_geometries),
+                                 f"geometry for {len(floor_geometries)} floors")
+
+    def encode_spaces(self, spaces: List[SpaceData]) -> bytes:
+        """
+        Encode spaces into the binary cache format.
+
+        Args:
+            spaces: Spaces to encode
+
+        Returns:
+            Encoded bytes
+        """
+        return self._encode(encode_space_records(spaces), self.schema_signature)
+
+    def decode_spaces(self, data: bytes) -> List[SpaceData]:
+        """
+        Decode spaces from the binary cache format.
+
+        Args:
+            data: Encoded bytes
+
+        Returns:
+            List of SpaceData
+
+        Raises:
+            ValueError: If the data is not a compatible cache file
+        """
+        return decode_space_records(self._decode(data, self.schema_signature))
+
+    def encode_floor_geometry(self, floor_geometries: Dict[str, FloorGeometry]) -> bytes:
+        """
+        Encode floor geometries into the binary cache format.
+
+        Args:
+            floor_geometries: Floor geometries keyed by floor ID
+
+        Returns:
+            Encoded bytes
+        """
+        return self._encode(encode_floor_geometry_records(floor_geometries), self.geometry_schema_signature)
+
+    def decode_floor_geometry(self, data: bytes) -> Dict[str, FloorGeometry]:
+        """
+        Decode floor geometries from the binary cache format.
+
+        Args:
+            data: Encoded bytes
+
+        Returns:
+            Floor geometries keyed by floor ID
+
+        Raises:
+            ValueError: If the data is not a compatible cache file
+        """
+        return decode_floor_geometry_records(self._decode(data, self.geometry_schema_signature))
+
+    def _encode(self, records: Any, signature: str) -> bytes:
+        """Compress records behind a header naming the model layout they were written for."""
+        payload = zlib.compress(pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL), 6)
+        header = CACHE_MAGIC + bytes([CACHE_FORMAT_VERSION]) + signature.encode('ascii')
+        return header + payload
+
+    def _decode(self, data: bytes, signature: str) -> Any:
+        """Check the header written by _encode and decompress the records."""
+        signature = signature.encode('ascii')
+        header_length = len(CACHE_MAGIC) + 1 + len(signature)
+
+        if (data[:len(CACHE_MAGIC)] != CACHE_MAGIC
+                or data[len(CACHE_MAGIC)] != CACHE_FORMAT_VERSION
+                or data[len(CACHE_MAGIC) + 1:header_length] != signature):
+            raise ValueError("Incompatible parse cache file")
+
+        return pickle.loads(zlib.decompress(data[header_length:]))
+
+    def _read_entry(self, file_path: str, extraction: str, decode: Callable[[bytes], Any]) -> Any:
+        """Read and decode the cache entry of a file, counting the hit or miss."""
+        try:
+            cache_path = self.get_cache_path(self.get_cache_key(self.get_file_hash(file_path), extraction))
+            if not os.path.exists(cache_path):
+                self.misses += 1
+                return None
+
+            with open(cache_path, 'rb') as f:
+                value = decode(f.read())
+
+            self.hits += 1
+            return value
+
+        except Exception as e:
+            self.misses += 1
+            self.logger.warning(f"Could not read parse cache for {file_path}: {e}")
+            return None
+
+    def _write_entry(self, file_path: str, extraction: str, encode: Callable[[], bytes],
+                     description: str) -> bool:
+        """Encode and atomically write the cache entry of a file."""
+        try:
+            data = encode()
+            cache_path = self.get_cache_path(self.get_cache_key(self.get_file_hash(file_path), extraction))
+
+            os.makedirs(self.cache_directory, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, cache_path)
+
+            self.stores += 1
+            self.logger.info(
+                f"Stored {description} in parse cache ({len(data) / 1024:.1f} KB): "
+                f"{os.path.basename(file_path)}"
+            )
+            self._evict_if_needed()
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"Could not write parse cache for {file_path}: {e}")
+            return False
+
+    def clear(self) -> None:
+        """Remove all cache files."""
+        if not os.path.isdir(self.cache_directory):
+            return
+
+        for name in os.listdir(self.cache_directory):
+            if name.endswith(CACHE_FILE_EXTENSION):
+                try:
+                    os.remove(os.path.join(self.cache_directory, name))
+                except OSError:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        total = self.hits + self.misses
+        entries = self._list_cache_files()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'hit_ratio': self.hits / total if total > 0 else 0.0,
+            'entries': len(entries),
+            'disk_usage_mb': sum(size for _, size, _ in entries) / (1024 * 1024),
+            'parser_version': PARSER_VERSION
+        }
+
+    def _list_cache_files(self) -> List[Tuple[str, int, float]]:
+        """List cache files as (path, size, mtime)."""
+        if not os.path.isdir(self.cache_directory):
+            return []
+
+        entries = []
+        for name in os.listdir(self.cache_directory):
+            if name.endswith(CACHE_FILE_EXTENSION):
+                path = os.path.join(self.cache_directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        """Remove the oldest cache files until the cache fits in max_disk_mb."""
+        entries = self._list_cache_files()
+        total_size = sum(size for _, size, _ in entries)
+
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total_size <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                pass
+
+    def _load_hash_index(self) -> Dict[str, List[Any]]:
+        """Load the remembered content hashes."""
+        if self._hash_index is None:
+            try:
+                with open(self.hash_index_path, 'r', encoding='utf-8') as f:
+                    self._hash_index = json.load(f)
+            except (OSError, ValueError):
+                self._hash_index = {}
+        return self._hash_index
+
+    def _save_hash_index(self) -> None:
+        """Persist the remembered content hashes."""
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            temp_path = f"{self.hash_index_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._hash_index, f)
+            os.replace(temp_path, self.hash_index_path)
+        except OSError as e:
+            self.logger.debug(f"Could not save parse cache hash index: {e}")
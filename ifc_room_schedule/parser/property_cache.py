@@ -0,0 +1,197 @@
+"""
+IFC Property Cache
+
+Id-keyed decode cache for property sets and element quantities, shared by the
+room schedule parsers.
+"""
+
+from typing import List, Dict, Any, Tuple
+from ..utils.enhanced_logging import enhanced_logger
+
+
+# Quantity classes and the attribute holding their value, in lookup order
+QUANTITY_VALUE_ATTRIBUTES = (
+    ('IfcQuantityLength', 'LengthValue'),
+    ('IfcQuantityArea', 'AreaValue'),
+    ('IfcQuantityVolume', 'VolumeValue'),
+    ('IfcQuantityCount', 'CountValue'),
+    ('IfcQuantityWeight', 'WeightValue'),
+    ('IfcQuantityTime', 'TimeValue'),
+)
+
+
+class PropertyCache:
+    """
+    Decoded property sets and quantities, keyed by IFC entity id.
+
+    Property definitions are usually shared: a wall bounding 20 rooms is reached
+    from every one of them, and each parser walks IsDefinedBy on its own. The
+    cache decodes every IfcPropertySet / IfcElementQuantity once per file and
+    hands the same result to all parsers. Returned values are shared and must
+    not be modified by callers.
+    """
+
+    def __init__(self, ifc_file=None):
+        """
+        Initialize the property cache.
+
+        Args:
+            ifc_file: IfcOpenShell file object the cached entities belong to (optional)
+        """
+        self.ifc_file = ifc_file
+        self.logger = enhanced_logger.logger
+        self.clear()
+
+    def set_ifc_file(self, ifc_file) -> None:
+        """
+        Set the IFC file the cached entities belong to.
+
+        Entity ids are only unique within a file, so the cache is cleared when
+        a different file is set.
+
+        Args:
+            ifc_file: IfcOpenShell file object
+        """
+        if ifc_file is not self.ifc_file:
+            self.clear()
+        self.ifc_file = ifc_file
+
+    def clear(self) -> None:
+        """Remove all cached entries and reset the counters."""
+        self._property_sets: Dict[Any, Dict[str, Any]] = {}
+        self._quantity_sets: Dict[Any, List[Tuple[str, str, float]]] = {}
+        self._element_quantities: Dict[Any, List[Tuple[str, str, float]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_properties(self, property_set) -> Dict[str, Any]:
+        """
+        Get the decoded properties of an IfcPropertySet.
+
+        Args:
+            property_set: IfcPropertySet entity
+
+        Returns:
+            Dictionary of property names and values. Single values are unwrapped,
+            enumerated values become lists and bounded values become
+            {'upper_bound', 'lower_bound'} dictionaries.
+        """
+        key = property_set.id()
+        properties = self._property_sets.get(key)
+        if properties is not None:
+            self.hits += 1
+            return properties
+
+        self.misses += 1
+        properties = self._decode_properties(property_set)
+        self._property_sets[key] = properties
+        return properties
+
+    def get_quantities(self, element_quantity) -> List[Tuple[str, str, float]]:
+        """
+        Get the decoded quantities of an IfcElementQuantity.
+
+        Args:
+            element_quantity: IfcElementQuantity entity
+
+        Returns:
+            List of (name, quantity class, value) tuples in set order
+        """
+        key = element_quantity.id()
+        quantities = self._quantity_sets.get(key)
+        if quantities is not None:
+            self.hits += 1
+            return quantities
+
+        self.misses += 1
+        quantities = self._decode_quantities(element_quantity)
+        self._quantity_sets[key] = quantities
+        return quantities
+
+    def get_element_quantities(self, element) -> List[Tuple[str, str, float]]:
+        """
+        Get all quantities assigned to an element through IfcRelDefinesByProperties.
+
+        Args:
+            element: IFC object entity (space, wall, slab, ...)
+
+        Returns:
+            List of (name, quantity class, value) tuples over all quantity sets
+        """
+        key = element.id()
+        quantities = self._element_quantities.get(key)
+        if quantities is not None:
+            self.hits += 1
+            return quantities
+
+        self.misses += 1
+        quantities = []
+        for rel in getattr(element, 'IsDefinedBy', []):
+            if rel.is_a('IfcRelDefinesByProperties'):
+                property_definition = rel.RelatingPropertyDefinition
+                if property_definition.is_a('IfcElementQuantity'):
+                    quantities.extend(self.get_quantities(property_definition))
+
+        self._element_quantities[key] = quantities
+        return quantities
+
+    def _decode_properties(self, property_set) -> Dict[str, Any]:
+        """Decode the HasProperties of a property set."""
+        properties = {}
+
+        for prop in getattr(property_set, 'HasProperties', None) or []:
+            prop_name = getattr(prop, 'Name', '')
+
+            try:
+                if prop.is_a('IfcPropertySingleValue'):
+                    nominal_value = getattr(prop, 'NominalValue', None)
+                    if nominal_value:
+                        properties[prop_name] = nominal_value.wrappedValue
+                elif prop.is_a('IfcPropertyEnumeratedValue'):
+                    enumeration_values = getattr(prop, 'EnumerationValues', [])
+                    if enumeration_values:
+                        properties[prop_name] = [val.wrappedValue for val in enumeration_values]
+                elif prop.is_a('IfcPropertyBoundedValue'):
+                    upper_bound = getattr(prop, 'UpperBoundValue', None)
+                    lower_bound = getattr(prop, 'LowerBoundValue', None)
+                    if upper_bound or lower_bound:
+                        properties[prop_name] = {
+                            'upper_bound': upper_bound.wrappedValue if upper_bound else None,
+                            'lower_bound': lower_bound.wrappedValue if lower_bound else None
+                        }
+            except Exception as e:
+                # Skip the malformed property but keep the rest of the set
+                self.logger.debug(f"Error decoding property {prop_name}: {e}")
+
+        return properties
+
+    def _decode_quantities(self, element_quantity) -> List[Tuple[str, str, float]]:
+        """Decode the Quantities of an element quantity set."""
+        quantities = []
+
+        for quantity in getattr(element_quantity, 'Quantities', None) or []:
+            quantity_name = getattr(quantity, 'Name', '')
+            for quantity_class, value_attribute in QUANTITY_VALUE_ATTRIBUTES:
+                if quantity.is_a(quantity_class):
+                    value = float(getattr(quantity, value_attribute, 0) or 0)
+                    quantities.append((quantity_name, quantity_class, value))
+                    break
+
+        return quantities
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache size and hit statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'property_sets': len(self._property_sets),
+            'quantity_sets': len(self._quantity_sets),
+            'elements': len(self._element_quantities)
+        }
@@ -0,0 +1,285 @@
+"""
+STEP Scanner
+
+Streaming pre-scanner for IFC-SPF (ISO 10303-21) files that reads the header and
+counts entity instances without building an IfcOpenShell model.
+"""
+
+import os
+import re
+import mmap
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Callable
+
+from ..utils.enhanced_logging import enhanced_logger
+
+
+SPF_MAGIC = b"ISO-10303-21"
+SCAN_CHUNK_SIZE = 16 * 1024 * 1024
+
+# An instance record starts a line (or follows the previous record on the same line):
+#   #123=IFCWALL('guid',...);
+_RECORD_PATTERN = re.compile(
+    rb"(?:^|;)[ \t\r\n]*#\d+[ \t]*=[ \t]*([A-Za-z][A-Za-z0-9_]*)[ \t]*\(",
+    re.MULTILINE
+)
+# The GlobalId is the first argument of the (single) IfcProject instance
+_PROJECT_PATTERN = re.compile(
+    rb"(?:^|;)[ \t\r\n]*#\d+[ \t]*=[ \t]*IFCPROJECT[ \t]*\([ \t\r\n]*'([^']*)'",
+    re.MULTILINE | re.IGNORECASE
+)
+_DATA_SECTION_PATTERN = re.compile(rb"ENDSEC[ \t\r\n]*;[ \t\r\n]*DATA[ \t\r\n]*(?:\([^)]*\))?[ \t\r\n]*;")
+_HEADER_ENTITY_PATTERN = re.compile(r"(FILE_DESCRIPTION|FILE_NAME|FILE_SCHEMA)\s*\((.*?)\)\s*;", re.DOTALL)
+
+
+@dataclass
+class StepScanResult:
+    """Statistics gathered by a pre-scan of an IFC-SPF file."""
+
+    file_path: str
+    file_size_bytes: int
+    schema: str
+    header: Dict[str, Any] = field(default_factory=dict)
+    entity_counts: Dict[str, int] = field(default_factory=dict)
+    total_entities: int = 0
+    project_guid: Optional[str] = None
+    scan_time_seconds: float = 0.0
+
+    def __post_init__(self):
+        self._subtype_cache: Dict[str, List[str]] = {}
+
+    @property
+    def space_count(self) -> int:
+        """Number of IfcSpace instances."""
+        return self.get_count("IfcSpace")
+
+    @property
+    def storey_count(self) -> int:
+        """Number of IfcBuildingStorey instances."""
+        return self.get_count("IfcBuildingStorey")
+
+    def get_count(self, entity_type: str, include_subtypes: bool = False) -> int:
+        """
+        Get the number of instances of an entity type.
+
+        Args:
+            entity_type: IFC entity name (case-insensitive), e.g. "IfcWall"
+            include_subtypes: Also count instances of subtypes, like by_type() does.
+                Requires the IfcOpenShell schema definitions; falls back to the exact
+                type count when they are not available.
+
+        Returns:
+            Instance count
+        """
+        if not include_subtypes:
+            return self.entity_counts.get(entity_type.upper(), 0)
+
+        return sum(self.entity_counts.get(name, 0) for name in self._get_type_names(entity_type))
+
+    def _get_type_names(self, entity_type: str) -> List[str]:
+        """Get the upper-case names of an entity type and all of its subtypes."""
+        key = entity_type.upper()
+        if key in self._subtype_cache:
+            return self._subtype_cache[key]
+
+        names = [key]
+        try:
+            import ifcopenshell.ifcopenshell_wrapper as wrapper
+            declaration = wrapper.schema_by_name(self.schema).declaration_by_name(entity_type)
+
+            names = []
+            pending = [declaration]
+            while pending:
+                current = pending.pop()
+                names.append(current.name().upper())
+                pending.extend(current.subtypes())
+        except Exception:
+            pass
+
+        self._subtype_cache[key] = names
+        return names
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for reporting."""
+        return {
+            'file_path': self.file_path,
+            'file_size_bytes': self.file_size_bytes,
+            'schema': self.schema,
+            'header': self.header,
+            'total_entities': self.total_entities,
+            'spaces_count': self.space_count,
+            'storeys_count': self.storey_count,
+            'entity_counts': dict(self.entity_counts),
+            'project_guid': self.project_guid,
+            'scan_time_seconds': self.scan_time_seconds
+        }
+
+
+class StepScanner:
+    """
+    Memory-mapped, record-based scanner for IFC-SPF files.
+
+    The scanner only looks at the start of each instance record (#id=TYPE(), so it
+    runs in a small fraction of a full parse and needs almost no memory. It is meant
+    for choosing a loading strategy and estimating work before the model is opened.
+    """
+
+    def __init__(self, chunk_size: int = SCAN_CHUNK_SIZE):
+        """
+        Initialize the scanner.
+
+        Args:
+            chunk_size: Approximate number of bytes matched per step
+        """
+        self.chunk_size = chunk_size
+        self.logger = enhanced_logger.logger
+
+    def scan(self, file_path: str,
+             progress_callback: Optional[Callable[[int, int], None]] = None) -> StepScanResult:
+        """
+        Scan an IFC-SPF file.
+
+        Args:
+            file_path: Path to the .ifc file
+            progress_callback: Optional callback receiving (bytes_scanned, total_bytes)
+
+        Returns:
+            StepScanResult with header and entity statistics
+
+        Raises:
+            ValueError: If the file is empty or not an IFC-SPF file
+            OSError: If the file cannot be read
+        """
+        start_time = time.time()
+        file_size = os.path.getsize(file_path)
+        if file_size == 0:
+            raise ValueError(f"File is empty: {file_path}")
+
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if not data[:64].lstrip(b"\xef\xbb\xbf \t\r\n").startswith(SPF_MAGIC):
+                    raise ValueError(f"Not an IFC-SPF file: {file_path}")
+
+                data_match = _DATA_SECTION_PATTERN.search(data)
+                if data_match is None:
+                    raise ValueError(f"No DATA section found: {file_path}")
+
+                header = self._parse_header(data[:data_match.start()].decode('latin-1'))
+                # Start on the ';' of DATA; so a record on the same line is still found
+                entity_counts = self._count_entities(data, data_match.end() - 1, file_size, progress_callback)
+                project_match = _PROJECT_PATTERN.search(data, data_match.end() - 1)
+                project_guid = project_match.group(1).decode('latin-1') if project_match else None
+
+        schema_identifiers = header.get('schema_identifiers') or []
+        result = StepScanResult(
+            file_path=file_path,
+            file_size_bytes=file_size,
+            schema=schema_identifiers[0].upper() if schema_identifiers else "",
+            header=header,
+            entity_counts=entity_counts,
+            total_entities=sum(entity_counts.values()),
+            project_guid=project_guid,
+            scan_time_seconds=time.time() - start_time
+        )
+
+        self.logger.debug(
+            f"Pre-scanned {os.path.basename(file_path)}: {result.total_entities} entities, "
+            f"{result.space_count} spaces, {result.storey_count} storeys "
+            f"({result.schema}) in {result.scan_time_seconds:.2f}s"
+        )
+        return result
+
+    def _count_entities(self, data, position: int, file_size: int,
+                        progress_callback: Optional[Callable[[int, int], None]]) -> Dict[str, int]:
+        """Count instance records per entity type from a position to the end of the file."""
+        counts = Counter()
+
+        while position < file_size:
+            # Chunks end on a line break so no record start is split between chunks
+            end = data.find(b"\n", min(position + self.chunk_size, file_size))
+            end = file_size if end == -1 else end + 1
+
+            counts.update(_RECORD_PATTERN.findall(data, position, end))
+            position = end
+
+            if progress_callback:
+                progress_callback(position, file_size)
+
+        return {name.decode('ascii').upper(): count for name, count in counts.items()}
+
+    def _parse_header(self, header_text: str) -> Dict[str, Any]:
+        """Parse the FILE_DESCRIPTION, FILE_NAME and FILE_SCHEMA header entities."""
+        header: Dict[str, Any] = {}
+
+        for name, arguments in _HEADER_ENTITY_PATTERN.findall(header_text):
+            values = [self._parse_value(token) for token in self._split_arguments(arguments)]
+
+            if name == 'FILE_DESCRIPTION':
+                header['description'] = values[0] if values else []
+                header['implementation_level'] = values[1] if len(values) > 1 else None
+            elif name == 'FILE_NAME':
+                keys = ['name', 'time_stamp', 'author', 'organization',
+                        'preprocessor_version', 'originating_system', 'authorization']
+                header.update(zip(keys, values))
+            elif name == 'FILE_SCHEMA':
+                header['schema_identifiers'] = values[0] if values else []
+
+        return header
+
+    def _split_arguments(self, text: str) -> List[str]:
+        """Split a STEP argument list on top-level commas."""
+        tokens = []
+        depth = 0
+        in_string = False
+        current = []
+
+        for char in text:
+            if char == "'":
+                in_string = not in_string
+            elif not in_string:
+                if char == '(':
+                    depth += 1
+                elif char == ')':
+                    depth -= 1
+                elif char == ',' and depth == 0:
+                    tokens.append(''.join(current).strip())
+                    current = []
+                    continue
+            current.append(char)
+
+        if current:
+            tokens.append(''.join(current).strip())
+        return tokens
+
+    def _parse_value(self, token: str) -> Any:
+        """Parse a header argument into a string, list or None."""
+        if token.startswith('(') and token.endswith(')'):
+            return [self._parse_value(t) for t in self._split_arguments(token[1:-1]) if t]
+        if token.startswith("'") and token.endswith("'") and len(token) >= 2:
+            # Doubled quotes ('') escape a single quote inside STEP strings
+            return token[1:-1].replace("''", "'")
+        if token in ('$', '*'):
+            return None
+        return token
+
+
+def prescan_file(file_path: str) -> Optional[StepScanResult]:
+    """
+    Pre-scan an IFC-SPF file, for loaders that can work without the statistics.
+
+    Args:
+        file_path: Path to the IFC file
+
+    Returns:
+        StepScanResult or None if the file cannot be pre-scanned (e.g. IFCXML)
+    """
+    if not file_path or not file_path.lower().endswith('.ifc'):
+        return None
+
+    try:
+        return StepScanner().scan(file_path)
+    except Exception as e:
+        enhanced_logger.logger.debug(f"Pre-scan skipped for {file_path}: {e}")
+        return None
@@ -538,7 +538,8 @@ class EnhancedExportDialog(QDialog):
             # Use first space for preview
             if self.spaces:
                 preview_data = builder._build_enhanced_space_dict(
-                    self.spaces[0], config.get("export_profile", "production")
+                    self.spaces[0], config.get("export_profile", "production"),
+                    sections=selected_sections or None
                 )
                 
                 # Filter selected sections
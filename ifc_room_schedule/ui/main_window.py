@@ -24,6 +24,8 @@ from ..parser.ifc_space_extractor import IfcSpaceExtractor
 from ..parser.ifc_surface_extractor import IfcSurfaceExtractor
 from ..parser.ifc_space_boundary_parser import IfcSpaceBoundaryParser
 from ..parser.ifc_relationship_parser import IfcRelationshipParser
+from ..parser.model_index import ModelIndex
+from ..parser.property_cache import PropertyCache
 from ..utils.enhanced_logging import (
     enhanced_logger, ErrorCategory, ErrorSeverity, MemoryErrorAnalyzer
 )
@@ -289,15 +291,20 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.logger = enhanced_logger.logger  # Use enhanced logger
         self.ifc_reader = IfcFileReader()
-        self.space_extractor = IfcSpaceExtractor()
-        self.surface_extractor = IfcSurfaceExtractor()
-        self.boundary_parser = IfcSpaceBoundaryParser()
-        self.relationship_parser = IfcRelationshipParser()
+        # Property sets are decoded once and shared by all parsers
+        self.property_cache = PropertyCache()
+        self.space_extractor = IfcSpaceExtractor(property_cache=self.property_cache)
+        self.surface_extractor = IfcSurfaceExtractor(property_cache=self.property_cache)
+        self.boundary_parser = IfcSpaceBoundaryParser(property_cache=self.property_cache)
+        self.relationship_parser = IfcRelationshipParser(property_cache=self.property_cache)
         self.geometry_extractor = GeometryExtractor()
+        self.model_index = None
         self.current_file_path = None
         self.spaces = []
         self.floor_geometry = None
         self.floor_geometries = {}
+        # True while the current file's data was served from the parse cache without opening it
+        self.loaded_from_cache = False
         
         # Enhanced error handling state with detailed tracking
         self.error_count = 0
@@ -507,7 +514,7 @@ class MainWindow(QMainWindow):
     def clear_temporary_error_status(self):
         """Clear temporary error status and restore normal status."""
         self.status_bar.setStyleSheet("")  # Reset to default style
-        if self.ifc_reader.is_loaded():
+        if self.has_loaded_file():
             self.status_bar.showMessage("Ready")
         else:
             self.status_bar.showMessage("Ready to load IFC file...")
@@ -1696,6 +1703,7 @@ class MainWindow(QMainWindow):
         try:
             # Reset operation tracking
             self.current_file_path = None
+            self.loaded_from_cache = False
             if hasattr(self, 'current_operation_id'):
                 self.current_operation_id = None
             if hasattr(self, 'operation_start_time'):
@@ -2768,6 +2776,10 @@ class MainWindow(QMainWindow):
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
         try:
+            # Files extracted before are served from the parse cache without being opened
+            if self.load_file_from_cache(file_path):
+                return
+            
             # Categorize file size for smart loading strategy
             file_category, file_size_bytes, file_size_string = self.categorize_file_size(file_path)
             
@@ -2900,6 +2912,59 @@ class MainWindow(QMainWindow):
         finally:
             self.progress_bar.setVisible(False)
     
+    def load_file_from_cache(self, file_path: str) -> bool:
+        """
+        Load a previously extracted file from the parse cache without opening it.
+        
+        Only used when both the spaces and the floor geometry of the exact file
+        contents are cached; otherwise the file is loaded normally.
+        
+        Args:
+            file_path: Path to the IFC file
+            
+        Returns:
+            True if the file was loaded from the cache, False otherwise
+        """
+        try:
+            floor_geometries = self.ifc_reader.load_cached_floor_geometry(file_path)
+            if floor_geometries is None:
+                return False
+            
+            spaces = self.ifc_reader.load_cached_spaces(file_path)
+            if not spaces:
+                return False
+            
+            self.logger.info(f"Loading {len(spaces)} spaces from parse cache: {file_path}")
+            
+            # Drop any previously opened model so extractors never see a stale file
+            if self.ifc_reader.is_loaded():
+                self.ifc_reader.close_file()
+                self.relationship_parser.clear_cache()
+            self.ifc_reader.file_path = file_path
+            
+            self.current_file_path = file_path
+            self.loaded_from_cache = True
+            self.spaces = spaces
+            self.floor_geometries = floor_geometries
+            self.floor_geometry = next(iter(floor_geometries.values()), None)
+            
+            self.update_file_info()
+            self.update_ui_state(True)
+            self.finalize_space_extraction()
+            self.ifc_file_loaded.emit(file_path)
+            self.status_bar.showMessage(f"✅ Loaded {len(self.spaces)} spaces from cache")
+            return True
+            
+        except Exception as e:
+            # A broken cache entry must never prevent loading the file itself
+            self.logger.warning(f"Could not load {file_path} from parse cache: {e}")
+            self.loaded_from_cache = False
+            return False
+    
+    def has_loaded_file(self) -> bool:
+        """Check if a file is loaded, either opened or served from the parse cache."""
+        return self.ifc_reader.is_loaded() or self.loaded_from_cache
+    
     def load_file_directly(self, file_path: str):
         """
         Load small files directly without threading to avoid overhead.
@@ -2914,6 +2979,7 @@ class MainWindow(QMainWindow):
             success, load_message = self.ifc_reader.load_file(file_path)
             
             if success:
+                self.loaded_from_cache = False
                 self.current_file_path = file_path
                 self.update_file_info()
                 self.update_ui_state(True)  # Enable file-related actions
@@ -2983,6 +3049,7 @@ class MainWindow(QMainWindow):
             success, load_message = self.ifc_reader.load_file(file_path)
             
             if success:
+                self.loaded_from_cache = False
                 self.update_file_info()
                 self.update_ui_state(True)  # Enable file-related actions
                 self.status_bar.showMessage("File loaded successfully. Extracting spaces...")
@@ -3029,7 +3096,7 @@ class MainWindow(QMainWindow):
     
     def update_file_info(self):
         """Update the UI with information about the loaded file."""
-        if not self.ifc_reader.is_loaded() or not self.current_file_path:
+        if not self.has_loaded_file() or not self.current_file_path:
             self.file_label.setText("No IFC file loaded")
             self.welcome_label.setText("Welcome to IFC Room Schedule\n\nSelect an IFC file to begin analyzing spaces...")
             self.main_splitter.setVisible(False)
@@ -3092,15 +3159,27 @@ class MainWindow(QMainWindow):
             self.boundary_parser.set_ifc_file(self.ifc_reader.get_ifc_file())
             self.relationship_parser.set_ifc_file(self.ifc_reader.get_ifc_file())
             
-            # Extract spaces
-            self.spaces = self.space_extractor.extract_spaces()
+            # Reuse the full space graph if this exact file was extracted before
+            cached_spaces = self.ifc_reader.load_cached_spaces(self.ifc_reader.file_path)
             
-            if self.spaces:
-                # Extract surfaces, boundaries, and relationships for each space
-                self.extract_surfaces_for_spaces_with_error_handling()
-                self.extract_boundaries_for_spaces_with_error_handling()
-                self.extract_relationships_for_spaces_with_error_handling()
+            if cached_spaces is not None:
+                self.spaces = cached_spaces
+            else:
+                # Index relationships once so per-space lookups don't rescan the file
+                self.build_model_index()
                 
+                # Extract spaces
+                self.spaces = self.space_extractor.extract_spaces()
+                
+                if self.spaces:
+                    # Extract surfaces, boundaries, and relationships for each space
+                    self.extract_surfaces_for_spaces_with_error_handling()
+                    self.extract_boundaries_for_spaces_with_error_handling()
+                    self.extract_relationships_for_spaces_with_error_handling()
+                    
+                    self.ifc_reader.store_cached_spaces(self.spaces)
+            
+            if self.spaces:
                 # Extract floor geometry for 2D visualization
                 self.extract_floor_geometry()
                 
@@ -3152,6 +3231,20 @@ class MainWindow(QMainWindow):
                 ))
             raise e
     
+    def build_model_index(self):
+        """Build the shared relationship index and hand it to the parsers."""
+        try:
+            model_index = ModelIndex(self.ifc_reader.get_ifc_file())
+        except Exception as e:
+            # Parsers fall back to walking the relationships themselves
+            self.logger.warning(f"Could not build model index, using per-space lookups: {e}")
+            model_index = None
+        
+        self.model_index = model_index
+        self.surface_extractor.set_model_index(model_index)
+        self.boundary_parser.set_model_index(model_index)
+        self.relationship_parser.set_model_index(model_index)
+    
     def finalize_space_extraction(self):
         """Finalize space extraction in the main thread."""
         try:
@@ -3377,8 +3470,9 @@ class MainWindow(QMainWindow):
 
     def close_file(self):
         """Close the currently loaded IFC file."""
-        if self.ifc_reader.is_loaded():
+        if self.has_loaded_file():
             self.ifc_reader.close_file()
+            self.loaded_from_cache = False
             self.current_file_path = None
             self.spaces = []
             
@@ -3553,7 +3647,7 @@ class MainWindow(QMainWindow):
         
     def refresh_view(self):
         """Refresh the current view."""
-        if self.ifc_reader.is_loaded():
+        if self.has_loaded_file():
             # Refresh space list
             self.space_list_widget.refresh_spaces()
             
@@ -4059,6 +4153,9 @@ class MainWindow(QMainWindow):
                 
                 total_rooms = sum(geom.get_room_count() for geom in floor_geometries.values())
                 self.logger.info(f"Successfully extracted geometry for {len(floor_geometries)} floors with {total_rooms} total rooms")
+                
+                # Lets the next open of this file skip the IFC file entirely
+                self.ifc_reader.store_cached_floor_geometry(floor_geometries)
             else:
                 self.floor_geometries = {}
                 self.floor_geometry = None
@@ -6,12 +6,13 @@ for the IFC Room Schedule application, including geometric data extraction,
 rendering, and user interaction components.
 """
 
-from .geometry_models import Point2D, Polygon2D, FloorLevel, FloorGeometry
+from .geometry_models import Point2D, Polygon2D, ArrayPolygon2D, FloorLevel, FloorGeometry
 from .geometry_extractor import GeometryExtractor, GeometryExtractionError
 
 __all__ = [
     'Point2D',
     'Polygon2D', 
+    'ArrayPolygon2D',
     'FloorLevel',
     'FloorGeometry',
     'GeometryExtractor',
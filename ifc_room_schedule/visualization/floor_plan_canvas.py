@@ -235,6 +235,9 @@ class FloorPlanCanvas(QWidget):
     COLOR_SELECTION_BORDER = QColor(0, 120, 215, 255)
     COLOR_HOVER_BORDER = QColor(0, 120, 215, 150)
     
+    # Rooms this close to the viewport edge (in pixels) are still drawn
+    VISIBLE_MARGIN_PIXELS = 20
+    
     def __init__(self, parent=None):
         """Initialize the floor plan canvas."""
         super().__init__(parent)
@@ -837,22 +840,12 @@ class FloorPlanCanvas(QWidget):
         if not room_guids or not self.floor_geometry:
             return
         
-        # Find bounds of selected rooms
-        room_polygons = [
-            self.room_lookup[guid] for guid in room_guids 
-            if guid in self.room_lookup
-        ]
-        
-        if not room_polygons:
+        # Combined bounds of the selected rooms from the floor's spatial index
+        room_bounds = self.floor_geometry.get_rooms_bounds(room_guids)
+        if not room_bounds:
             return
         
-        # Calculate combined bounds
-        all_bounds = [polygon.get_bounds() for polygon in room_polygons]
-        
-        min_x = min(bounds[0] for bounds in all_bounds)
-        min_y = min(bounds[1] for bounds in all_bounds)
-        max_x = max(bounds[2] for bounds in all_bounds)
-        max_y = max(bounds[3] for bounds in all_bounds)
+        min_x, min_y, max_x, max_y = room_bounds
         
         # Add some padding
         padding = 2.0
@@ -908,12 +901,9 @@ class FloorPlanCanvas(QWidget):
         # Transform widget point to floor plan coordinates
         floor_point = self._widget_to_floor_coordinates(widget_point)
         
-        # Check each room polygon
-        for polygon in self.floor_geometry.room_polygons:
-            if polygon.contains_point(floor_point):
-                return polygon.space_guid
-        
-        return None
+        # Only rooms whose bounding box contains the point are tested
+        polygon = self.floor_geometry.find_room_at_point(floor_point)
+        return polygon.space_guid if polygon else None
     
     def paintEvent(self, event: QPaintEvent) -> None:
         """Handle paint events to render the floor plan."""
@@ -1144,22 +1134,20 @@ class FloorPlanCanvas(QWidget):
         visible_rect = self._get_visible_floor_rect()
         self.logger.debug(f"Visible rect: {visible_rect.x():.1f}, {visible_rect.y():.1f}, {visible_rect.width():.1f}, {visible_rect.height():.1f}")
         
-        # Simple bounds checking - could be optimized with spatial indexing
-        self.visible_rooms = []
         total_rooms = len(self.floor_geometry.room_polygons)
         
-        for i, polygon in enumerate(self.floor_geometry.room_polygons):
-            bounds = polygon.get_bounds()
-            room_rect = QRectF(bounds[0], bounds[1], bounds[2] - bounds[0], bounds[3] - bounds[1])
-            
-            # Log first few rooms for debugging
-            if i < 3:
-                self.logger.debug(f"Room {i} ({polygon.space_name}): bounds=({bounds[0]:.1f}, {bounds[1]:.1f}, {bounds[2]:.1f}, {bounds[3]:.1f})")
-                self.logger.debug(f"Room rect: {room_rect.x():.1f}, {room_rect.y():.1f}, {room_rect.width():.1f}, {room_rect.height():.1f}")
-                self.logger.debug(f"Intersects visible: {visible_rect.intersects(room_rect)}")
-            
-            # Include all rooms for now to ensure visibility
-            self.visible_rooms.append(polygon)
+        if visible_rect.isEmpty():
+            # Without a valid view transform nothing can be culled
+            self.visible_rooms = list(self.floor_geometry.room_polygons)
+        else:
+            # Pad by a few pixels so outlines and labels at the edges are not clipped
+            margin = self.VISIBLE_MARGIN_PIXELS / max(self.zoom_level, 1e-6)
+            self.visible_rooms = self.floor_geometry.find_rooms_in_bounds((
+                visible_rect.left() - margin,
+                visible_rect.top() - margin,
+                visible_rect.right() + margin,
+                visible_rect.bottom() + margin
+            ))
         
         self.logger.debug(f"Updated visible rooms: {len(self.visible_rooms)}/{total_rooms} rooms visible")
     
@@ -1735,6 +1723,6 @@ class FloorPlanCanvas(QWidget):
     def _polygon_to_qt(self, polygon: Polygon2D) -> QPolygonF:
         """Convert Polygon2D to Qt QPolygonF."""
         qt_polygon = QPolygonF()
-        for point in polygon.points:
-            qt_polygon.append(QPointF(point.x, point.y))
+        for x, y in polygon.to_tuples():
+            qt_polygon.append(QPointF(x, y))
         return qt_polygon
\ No newline at end of file
@@ -6,9 +6,12 @@ including space boundaries, floor levels, and coordinate transformations.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import os
+from typing import Dict, List, Optional, Tuple, Any, Set, FrozenSet
 import math
 
+import numpy as np
+
 try:
     import ifcopenshell
     import ifcopenshell.geom
@@ -16,7 +19,7 @@ try:
 except ImportError:
     IFC_AVAILABLE = False
 
-from .geometry_models import Point2D, Polygon2D, FloorLevel, FloorGeometry
+from .geometry_models import Point2D, Polygon2D, ArrayPolygon2D, FloorLevel, FloorGeometry
 from ..data.space_model import SpaceData
 
 
@@ -32,8 +35,30 @@ class GeometryExtractionError(Exception):
 class GeometryExtractor:
     """Extracts 2D geometric data from IFC files for floor plan visualization."""
     
-    def __init__(self):
-        """Initialize the geometry extractor."""
+    # Settings used for batch meshing; must match _extract_polygon_with_ifcopenshell
+    BATCH_GEOMETRY_SETTINGS = {"USE_WORLD_COORDS": True, "INCLUDE_CURVES": True}
+    
+    # Settings cascade tried per space when no batch geometry is available
+    SPACE_GEOMETRY_SETTINGS = [
+        {"USE_WORLD_COORDS": True, "WELD_VERTICES": True, "USE_BREP_DATA": True},
+        {"USE_WORLD_COORDS": True, "WELD_VERTICES": False, "USE_BREP_DATA": True},
+        {"USE_WORLD_COORDS": False, "WELD_VERTICES": True, "USE_BREP_DATA": False},
+        {"USE_WORLD_COORDS": True, "WELD_VERTICES": True, "USE_BREP_DATA": False},
+    ]
+    
+    def __init__(self, batch_geometry: bool = True, geometry_threads: Optional[int] = None,
+                 compact_polygons: Optional[bool] = None):
+        """
+        Initialize the geometry extractor.
+        
+        Args:
+            batch_geometry: Mesh spaces in bulk with ifcopenshell.geom.iterator
+                before falling back to per-space shape creation
+            geometry_threads: Worker threads for the batch iterator (default: CPU count)
+            compact_polygons: Store floor room polygons as array-backed
+                ArrayPolygon2D instead of Point2D lists (default: only for
+                large models, which use progressive loading)
+        """
         self.logger = logging.getLogger(__name__)
         
         if not IFC_AVAILABLE:
@@ -41,6 +66,22 @@ class GeometryExtractor:
                 "IfcOpenShell is required for geometry extraction. "
                 "Install with: pip install ifcopenshell"
             )
+        
+        self.batch_geometry = batch_geometry
+        self.geometry_threads = max(1, geometry_threads or os.cpu_count() or 1)
+        self.compact_polygons = compact_polygons
+        self._use_compact_polygons = bool(compact_polygons)
+        self._geometry_settings_cache: Dict[Tuple, Any] = {}
+        self._batch_shapes: Dict[str, Any] = {}
+        self._batch_attempted: Set[str] = set()
+        self._batch_settings_supported = True
+        
+        # Storey membership, built once per file by _build_storey_membership
+        self._membership_file = None
+        self._spaces_by_guid: Dict[str, Any] = {}
+        self._storey_space_guids: Dict[Any, Dict[str, None]] = {}
+        self._storeys_with_elements: Set[Any] = set()
+        self._placement_storeys: Dict[Any, FrozenSet[Any]] = {}
     
     def extract_floor_geometry(self, ifc_file, progress_callback=None) -> Dict[str, FloorGeometry]:
         """
@@ -67,12 +108,23 @@ class GeometryExtractor:
             
             # Determine if progressive loading is needed
             use_progressive_loading = total_spaces > 100 or total_storeys > 10
+            self._use_compact_polygons = (
+                use_progressive_loading if self.compact_polygons is None else self.compact_polygons
+            )
             
-            if use_progressive_loading:
-                self.logger.info("Using progressive loading for large IFC file")
-                return self._extract_geometry_progressive(ifc_file, progress_callback)
-            else:
-                return self._extract_geometry_standard(ifc_file, progress_callback)
+            self.clear_batch_geometry()
+            try:
+                if use_progressive_loading:
+                    # Batches are meshed per storey to keep peak memory bounded
+                    self.logger.info("Using progressive loading for large IFC file")
+                    return self._extract_geometry_progressive(ifc_file, progress_callback)
+                else:
+                    if progress_callback:
+                        progress_callback("Meshing space geometry", 0)
+                    self.prefetch_space_geometry(ifc_file)
+                    return self._extract_geometry_standard(ifc_file, progress_callback)
+            finally:
+                self.clear_batch_geometry()
             
         except GeometryExtractionError:
             raise
@@ -205,6 +257,115 @@ class GeometryExtractor:
                 raise
             raise GeometryExtractionError(f"Progressive extraction failed: {str(e)}", "extraction_error")
     
+    def prefetch_space_geometry(self, ifc_file, spaces: Optional[List[Any]] = None) -> int:
+        """
+        Mesh spaces in bulk using ifcopenshell.geom.iterator on multiple threads.
+        
+        The resulting triangulations are kept until clear_batch_geometry() is called
+        and are used by the per-space extraction methods instead of create_shape.
+        Spaces the iterator cannot mesh fall back to the per-space settings cascade.
+        
+        Args:
+            ifc_file: Loaded IFC file object
+            spaces: IfcSpace entities to mesh (default: all spaces in the file)
+            
+        Returns:
+            Number of spaces meshed by the iterator
+        """
+        if not self.batch_geometry or not self._batch_settings_supported:
+            return 0
+        if not isinstance(ifc_file, ifcopenshell.file):
+            return 0
+        
+        try:
+            if spaces is None:
+                spaces = ifc_file.by_type("IfcSpace")
+            
+            pending = [
+                space for space in spaces
+                if getattr(space, 'GlobalId', None) and space.GlobalId not in self._batch_attempted
+            ]
+            if not pending:
+                return 0
+            
+            self._batch_attempted.update(space.GlobalId for space in pending)
+            
+            try:
+                settings = self._get_geometry_settings(self.BATCH_GEOMETRY_SETTINGS, strict=True)
+            except AttributeError as e:
+                # Settings differ between IfcOpenShell versions; don't retry per storey
+                self._batch_settings_supported = False
+                self.logger.info(f"Batch geometry not supported by this IfcOpenShell version: {e}")
+                return 0
+            
+            iterator = ifcopenshell.geom.iterator(
+                settings, ifc_file, self.geometry_threads, include=pending
+            )
+            
+            meshed = 0
+            if iterator.initialize():
+                while True:
+                    shape = iterator.get()
+                    guid = getattr(shape, 'guid', None)
+                    geometry = getattr(shape, 'geometry', None)
+                    if guid in self._batch_attempted and geometry is not None and geometry.verts:
+                        self._batch_shapes[guid] = geometry
+                        meshed += 1
+                    if not iterator.next():
+                        break
+            
+            self.logger.info(
+                f"Batch meshed {meshed}/{len(pending)} spaces using {self.geometry_threads} threads"
+            )
+            return meshed
+            
+        except Exception as e:
+            self.logger.warning(f"Batch geometry extraction failed, using per-space extraction: {e}")
+            return 0
+    
+    def clear_batch_geometry(self, space_guids: Optional[List[str]] = None) -> None:
+        """
+        Release batch meshed geometry.
+        
+        Args:
+            space_guids: Spaces to release (default: all)
+        """
+        if space_guids is None:
+            self._batch_shapes.clear()
+            self._batch_attempted.clear()
+            return
+        
+        for space_guid in space_guids:
+            self._batch_shapes.pop(space_guid, None)
+            self._batch_attempted.discard(space_guid)
+    
+    def _get_batch_geometry(self, space_guid: str):
+        """Get the batch meshed geometry for a space, if any."""
+        return self._batch_shapes.get(space_guid)
+    
+    def _is_batch_meshed(self, space_guid: str) -> bool:
+        """Check whether the batch iterator produced geometry for a space."""
+        return space_guid in self._batch_shapes
+    
+    def _get_geometry_settings(self, config: Dict[str, bool], strict: bool = False):
+        """
+        Get (cached) ifcopenshell.geom settings for a settings configuration.
+        
+        Args:
+            config: Mapping of settings attribute names to values
+            strict: Raise AttributeError for settings this IfcOpenShell version
+                doesn't support instead of skipping them
+        """
+        key = (strict,) + tuple(sorted(config.items()))
+        settings = self._geometry_settings_cache.get(key)
+        if settings is None:
+            settings = ifcopenshell.geom.settings()
+            for name, value in config.items():
+                if strict or hasattr(settings, name):
+                    settings.set(getattr(settings, name), value)
+            self._geometry_settings_cache[key] = settings
+        return settings
+    
     def get_floor_levels(self, ifc_file) -> List[FloorLevel]:
         """
         Extract floor levels from IFC file with enhanced detection and grouping.
@@ -219,6 +380,9 @@ class GeometryExtractor:
             floor_levels = []
             processed_storeys = set()
             
+            # Resolve every space's storey once instead of rescanning per storey
+            self._build_storey_membership(ifc_file)
+            
             # Get all IfcBuildingStorey entities
             storeys = ifc_file.by_type("IfcBuildingStorey")
             self.logger.info(f"Found {len(storeys)} building storeys in IFC file")
@@ -460,6 +624,9 @@ class GeometryExtractor:
                 if hasattr(space, 'GlobalId') and space.GlobalId in floor_level.spaces:
                     space_entities[space.GlobalId] = space
             
+            # Mesh the storey's spaces in one multi-threaded pass (no-op if already done)
+            self.prefetch_space_geometry(ifc_file, list(space_entities.values()))
+            
             # Track processed spaces to avoid duplicates
             processed_spaces = set()
             
@@ -514,7 +681,7 @@ class GeometryExtractor:
                 # Create floor geometry with enhanced metadata
                 floor_geometry = FloorGeometry(
                     level=floor_level,
-                    room_polygons=room_polygons
+                    room_polygons=self._finalize_room_polygons(room_polygons)
                 )
                 
                 # Add extraction metadata
@@ -533,11 +700,36 @@ class GeometryExtractor:
             self.logger.error(f"Failed to extract enhanced floor level geometry: {e}")
             return None
     
+    def _finalize_room_polygons(self, room_polygons: List[Polygon2D]) -> List[Polygon2D]:
+        """
+        Convert extracted room polygons to the configured storage type.
+        
+        Args:
+            room_polygons: Validated polygons for one floor
+            
+        Returns:
+            The polygons unchanged, or as ArrayPolygon2D when compact polygons are in use
+        """
+        if not self._use_compact_polygons:
+            return room_polygons
+        # Mesh-based polygons are already built as arrays; only fallbacks need converting
+        return [
+            polygon if isinstance(polygon, ArrayPolygon2D) else ArrayPolygon2D.from_polygon(polygon)
+            for polygon in room_polygons
+        ]
+    
     def _extract_floor_level_geometry_memory_efficient(self, ifc_file, floor_level: FloorLevel) -> Optional[FloorGeometry]:
         """Extract geometry for a floor level with memory-efficient processing."""
         try:
             room_polygons = []
             
+            # Mesh this storey's spaces in one multi-threaded pass
+            storey_spaces = [
+                space for space in ifc_file.by_type("IfcSpace")
+                if getattr(space, 'GlobalId', None) in floor_level.spaces
+            ]
+            self.prefetch_space_geometry(ifc_file, storey_spaces)
+            
             # Process spaces in smaller batches to reduce memory usage
             batch_size = 20  # Process 20 spaces at a time
             total_spaces = len(floor_level.spaces)
@@ -566,10 +758,12 @@ class GeometryExtractor:
                 # Clear batch data to free memory
                 batch_polygons.clear()
             
+            self.clear_batch_geometry(floor_level.spaces)
+            
             if room_polygons:
                 return FloorGeometry(
                     level=floor_level,
-                    room_polygons=room_polygons
+                    room_polygons=self._finalize_room_polygons(room_polygons)
                 )
             
             return None
@@ -848,9 +1042,9 @@ class GeometryExtractor:
             
             # Get all valid spaces in the file
             all_spaces = set()
-            for space in ifc_file.by_type("IfcSpace"):
-                if hasattr(space, 'GlobalId') and self._validate_space_for_floor_plan(space):
-                    all_spaces.add(space.GlobalId)
+            for space_guid, space in self._get_storey_membership(ifc_file).items():
+                if self._validate_space_for_floor_plan(space):
+                    all_spaces.add(space_guid)
             
             # Find orphaned spaces
             orphaned_spaces = all_spaces - assigned_spaces
@@ -888,7 +1082,7 @@ class GeometryExtractor:
             
             for space_guid in orphaned_spaces:
                 # Get space entity and its elevation
-                space_entity = self._get_space_by_guid(ifc_file, space_guid)
+                space_entity = self._spaces_by_guid.get(space_guid)
                 if space_entity:
                     space_elevation = self._extract_space_elevation(space_entity)
                     
@@ -920,32 +1114,63 @@ class GeometryExtractor:
             self.logger.error(f"Failed to handle orphaned spaces: {e}")
             return floor_levels
     
-    def _get_spaces_on_storey_enhanced(self, ifc_file, storey) -> List[str]:
-        """Get all space GUIDs on a building storey with enhanced detection."""
+    def _build_storey_membership(self, ifc_file) -> None:
+        """
+        Map building storeys to their spaces with one pass over the model.
+        
+        Spaces belong to a storey through aggregation, spatial containment or a
+        placement chain that passes through the storey's placement. Placement
+        chains are shared by all spaces on a storey, so their storeys are
+        memoised per placement.
+        """
+        self._membership_file = ifc_file
+        self._spaces_by_guid = {}
+        self._storey_space_guids = {}
+        self._storeys_with_elements = set()
+        self._placement_storeys = {}
+        
         try:
-            space_guids = set()  # Use set to automatically handle duplicates
+            for space in ifc_file.by_type("IfcSpace"):
+                if hasattr(space, 'GlobalId'):
+                    self._spaces_by_guid.setdefault(space.GlobalId, space)
             
             # Method 1: IfcRelAggregates relationships (decomposition)
             for rel in ifc_file.by_type("IfcRelAggregates"):
-                if hasattr(rel, 'RelatingObject') and rel.RelatingObject == storey:
-                    if hasattr(rel, 'RelatedObjects'):
-                        for obj in rel.RelatedObjects:
-                            if obj.is_a("IfcSpace") and hasattr(obj, 'GlobalId'):
-                                space_guids.add(obj.GlobalId)
+                for obj in getattr(rel, 'RelatedObjects', None) or []:
+                    if obj.is_a("IfcSpace") and hasattr(obj, 'GlobalId'):
+                        self._add_storey_space(rel.RelatingObject, obj.GlobalId)
             
             # Method 2: IfcRelContainedInSpatialStructure (spatial containment)
             for rel in ifc_file.by_type("IfcRelContainedInSpatialStructure"):
-                if hasattr(rel, 'RelatingStructure') and rel.RelatingStructure == storey:
-                    if hasattr(rel, 'RelatedElements'):
-                        for element in rel.RelatedElements:
-                            if element.is_a("IfcSpace") and hasattr(element, 'GlobalId'):
-                                space_guids.add(element.GlobalId)
+                for element in getattr(rel, 'RelatedElements', None) or []:
+                    if element.is_a("IfcSpace") and hasattr(element, 'GlobalId'):
+                        self._add_storey_space(rel.RelatingStructure, element.GlobalId)
+                    elif element.is_a() in ["IfcWall", "IfcSlab", "IfcColumn", "IfcBeam", "IfcDoor", "IfcWindow"]:
+                        self._storeys_with_elements.add(rel.RelatingStructure)
             
-            # Method 3: Check spaces that reference this storey in their placement
-            all_spaces = ifc_file.by_type("IfcSpace")
-            for space in all_spaces:
-                if hasattr(space, 'GlobalId') and self._is_space_on_storey(space, storey):
-                    space_guids.add(space.GlobalId)
+            # Method 3: Spaces whose placement hierarchy references a storey
+            for space_guid, space in self._spaces_by_guid.items():
+                for storey in self._get_space_placement_storeys(space):
+                    self._add_storey_space(storey, space_guid)
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to build storey membership: {e}")
+    
+    def _add_storey_space(self, storey, space_guid: str) -> None:
+        """Record a space on a storey, keeping first-seen order."""
+        self._storey_space_guids.setdefault(storey, {})[space_guid] = None
+    
+    def _get_storey_membership(self, ifc_file) -> Dict[str, Any]:
+        """Get the spaces by GUID, building the membership map if it is for another file."""
+        if self._membership_file is not ifc_file:
+            self._build_storey_membership(ifc_file)
+        return self._spaces_by_guid
+    
+    def _get_spaces_on_storey_enhanced(self, ifc_file, storey) -> List[str]:
+        """Get all space GUIDs on a building storey with enhanced detection."""
+        try:
+            self._get_storey_membership(ifc_file)
+            space_guids = self._storey_space_guids.get(storey, {})
             
             # Method 4: Validate spaces have valid geometry or properties
             validated_spaces = []
@@ -963,45 +1188,59 @@ class GeometryExtractor:
     
     def _is_space_on_storey(self, space, storey) -> bool:
         """Check if a space belongs to a specific storey based on placement hierarchy."""
+        return storey in self._get_space_placement_storeys(space)
+    
+    def _get_space_placement_storeys(self, space) -> FrozenSet[Any]:
+        """Get the storeys referenced by the placement hierarchy above a space."""
         try:
-            # Check if space's placement hierarchy references the storey
-            if hasattr(space, 'ObjectPlacement') and space.ObjectPlacement:
-                return self._placement_references_storey(space.ObjectPlacement, storey)
-            return False
+            placement = getattr(space, 'ObjectPlacement', None)
+            parent_placement = getattr(placement, 'PlacementRelTo', None) if placement else None
+            if parent_placement:
+                return self._resolve_placement_storeys(parent_placement)
+            return frozenset()
             
         except Exception as e:
             self.logger.debug(f"Failed to check space-storey relationship: {e}")
-            return False
+            return frozenset()
     
-    def _placement_references_storey(self, placement, target_storey) -> bool:
-        """Recursively check if placement hierarchy references target storey."""
-        try:
-            # Check current placement
-            if hasattr(placement, 'PlacementRelTo') and placement.PlacementRelTo:
-                parent_placement = placement.PlacementRelTo
-                
-                # Check if parent placement belongs to target storey
-                if hasattr(parent_placement, 'PlacesObject') and parent_placement.PlacesObject:
-                    for obj in parent_placement.PlacesObject:
-                        if obj == target_storey:
-                            return True
-                
-                # Recurse up the hierarchy
-                return self._placement_references_storey(parent_placement, target_storey)
-            
-            return False
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to check placement hierarchy: {e}")
-            return False
+    def _resolve_placement_storeys(self, placement) -> FrozenSet[Any]:
+        """
+        Get the storeys placed by a placement or any placement it is relative to.
+        
+        The chain is walked iteratively and every placement on it is memoised, so
+        each placement in the model is resolved once.
+        """
+        chain = []
+        visited = set()
+        storeys: FrozenSet[Any] = frozenset()
+        
+        current = placement
+        while current:
+            key = current.id()
+            if key in self._placement_storeys:
+                storeys = self._placement_storeys[key]
+                break
+            if key in visited:
+                break
+            visited.add(key)
+            placed_storeys = [
+                obj for obj in getattr(current, 'PlacesObject', None) or []
+                if obj.is_a("IfcBuildingStorey")
+            ]
+            chain.append((key, placed_storeys))
+            current = getattr(current, 'PlacementRelTo', None)
+        
+        for key, placed_storeys in reversed(chain):
+            if placed_storeys:
+                storeys = storeys.union(placed_storeys)
+            self._placement_storeys[key] = storeys
+        
+        return storeys
     
     def _get_space_by_guid(self, ifc_file, space_guid: str):
         """Get space entity by GUID."""
         try:
-            for space in ifc_file.by_type("IfcSpace"):
-                if hasattr(space, 'GlobalId') and space.GlobalId == space_guid:
-                    return space
-            return None
+            return self._get_storey_membership(ifc_file).get(space_guid)
             
         except Exception as e:
             self.logger.debug(f"Failed to get space by GUID {space_guid}: {e}")
@@ -1034,15 +1273,9 @@ class GeometryExtractor:
     def _storey_has_building_elements(self, ifc_file, storey) -> bool:
         """Check if storey contains building elements (walls, slabs, etc.)."""
         try:
-            # Check for building elements contained in this storey
-            for rel in ifc_file.by_type("IfcRelContainedInSpatialStructure"):
-                if hasattr(rel, 'RelatingStructure') and rel.RelatingStructure == storey:
-                    if hasattr(rel, 'RelatedElements'):
-                        for element in rel.RelatedElements:
-                            if element.is_a() in ["IfcWall", "IfcSlab", "IfcColumn", "IfcBeam", "IfcDoor", "IfcWindow"]:
-                                return True
-            
-            return False
+            # Containment was recorded while building the storey membership
+            self._get_storey_membership(ifc_file)
+            return storey in self._storeys_with_elements
             
         except Exception as e:
             self.logger.debug(f"Failed to check building elements on storey: {e}")
@@ -1219,35 +1452,26 @@ class GeometryExtractor:
     def _extract_with_ifcopenshell_geom(self, ifc_space, space_guid: str, space_name: str) -> Optional[Polygon2D]:
         """Extract geometry using ifcopenshell.geom with multiple settings."""
         try:
-            # Try different geometry settings with more comprehensive options
-            settings_configs = [
-                {"USE_WORLD_COORDS": True, "WELD_VERTICES": True, "USE_BREP_DATA": True},
-                {"USE_WORLD_COORDS": True, "WELD_VERTICES": False, "USE_BREP_DATA": True},
-                {"USE_WORLD_COORDS": False, "WELD_VERTICES": True, "USE_BREP_DATA": False},
-                {"USE_WORLD_COORDS": True, "WELD_VERTICES": True, "USE_BREP_DATA": False},
-            ]
+            # Spaces meshed by the batch iterator are tried first, with the same checks as the cascade
+            if self._is_batch_meshed(space_guid):
+                polygon = self.convert_to_2d_coordinates(
+                    self._get_batch_geometry(space_guid), space_guid, space_name
+                )
+                if polygon and self._validate_polygon(polygon) and not self._is_template_polygon(polygon):
+                    return polygon
+                self.logger.debug(f"Batch geometry rejected for space {space_guid}, trying geometry settings")
             
-            for config in settings_configs:
+            # Try different geometry settings with more comprehensive options
+            for config in self.SPACE_GEOMETRY_SETTINGS:
                 try:
-                    settings = ifcopenshell.geom.settings()
-                    for key, value in config.items():
-                        if hasattr(settings, key):
-                            settings.set(getattr(settings, key), value)
+                    settings = self._get_geometry_settings(config)
                     
                     shape = ifcopenshell.geom.create_shape(settings, ifc_space)
                     if shape and shape.geometry:
                         polygon = self.convert_to_2d_coordinates(shape.geometry, space_guid, space_name)
-                        if polygon and self._validate_polygon(polygon):
-                            # Check if this is a meaningful geometry (not just a fallback-like rectangle)
-                            area = polygon.get_area()
-                            bounds = polygon.get_bounds()
-                            width = bounds[2] - bounds[0]
-                            height = bounds[3] - bounds[1]
-                            
-                            # Skip if it looks like a generic template (dimensions now in meters)
-                            if not (abs(width - 13.7) < 0.1 and abs(height - 5.6) < 0.1 and abs(area - 77.7) < 0.1):
-                                self.logger.debug(f"Successfully extracted geometry with config: {config} (area: {area:.1f} m², dims: {width:.1f}x{height:.1f}m)")
-                                return polygon
+                        if polygon and self._validate_polygon(polygon) and not self._is_template_polygon(polygon):
+                            self.logger.debug(f"Successfully extracted geometry with config: {config} (area: {polygon.get_area():.1f} m²)")
+                            return polygon
                         
                 except Exception as e:
                     self.logger.debug(f"Failed with config {config}: {e}")
@@ -1259,6 +1483,16 @@ class GeometryExtractor:
             self.logger.debug(f"Failed ifcopenshell geometry extraction: {e}")
             return None
     
+    def _is_template_polygon(self, polygon: Polygon2D) -> bool:
+        """Check if a polygon looks like a generic template rather than meaningful geometry."""
+        area = polygon.get_area()
+        bounds = polygon.get_bounds()
+        width = bounds[2] - bounds[0]
+        height = bounds[3] - bounds[1]
+        
+        # Dimensions in meters
+        return abs(width - 13.7) < 0.1 and abs(height - 5.6) < 0.1 and abs(area - 77.7) < 0.1
+    
     def _extract_from_representation_items(self, ifc_space, space_guid: str, space_name: str) -> Optional[Polygon2D]:
         """Extract geometry from space representation items."""
         try:
@@ -1520,17 +1754,17 @@ class GeometryExtractor:
     def _extract_polygon_with_ifcopenshell(self, ifc_space, space_guid: str, space_name: str) -> Optional[Polygon2D]:
         """Extract 2D polygon using IfcOpenShell geometry processing."""
         try:
-            # Create geometry settings for 2D extraction
-            settings = ifcopenshell.geom.settings()
-            settings.set(settings.USE_WORLD_COORDS, True)
-            settings.set(settings.INCLUDE_CURVES, True)
-            
-            # Extract 3D geometry
-            shape = ifcopenshell.geom.create_shape(settings, ifc_space)
-            if not shape:
-                return None
-            
-            geometry = shape.geometry
+            geometry = self._get_batch_geometry(space_guid)
+            if geometry is None:
+                # Create geometry settings for 2D extraction
+                settings = self._get_geometry_settings(self.BATCH_GEOMETRY_SETTINGS, strict=True)
+                
+                # Extract 3D geometry
+                shape = ifcopenshell.geom.create_shape(settings, ifc_space)
+                if not shape:
+                    return None
+                
+                geometry = shape.geometry
             if not hasattr(geometry, 'verts') or not geometry.verts:
                 return None
             
@@ -1570,6 +1804,9 @@ class GeometryExtractor:
             if len(boundary_points) < 3:
                 return None
             
+            if self._use_compact_polygons:
+                return self._create_array_polygon(boundary_points, space_guid, space_name)
+            
             # Convert to Point2D objects (coordinates might be in meters already)
             polygon_points = []
             for x, y in boundary_points:
@@ -1594,6 +1831,17 @@ class GeometryExtractor:
             self.logger.debug(f"IfcOpenShell polygon extraction failed: {e}")
             return None
     
+    def _create_array_polygon(self, boundary_points: List[Tuple[float, float]],
+                              space_guid: str, space_name: str) -> ArrayPolygon2D:
+        """Build a compact polygon straight from projected boundary coordinates."""
+        coordinates = np.array(boundary_points, dtype=np.float64)
+        
+        # Same unit heuristic as the Point2D path: very large values are millimetres
+        in_millimetres = (np.abs(coordinates) > 1000).any(axis=1)
+        coordinates[in_millimetres] /= 1000.0
+        
+        return ArrayPolygon2D(coordinates, space_guid, space_name)
+    
     def _find_2d_boundary(self, points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
         """Find the boundary/convex hull of 2D points."""
         try:
@@ -1783,11 +2031,19 @@ class GeometryExtractor:
     def _validate_polygon(self, polygon: Polygon2D) -> bool:
         """Validate that a polygon is suitable for floor plan display."""
         try:
-            if not polygon or not polygon.points:
+            if not polygon:
                 return False
             
+            # Array polygons are checked without expanding them into Point2D objects
+            if isinstance(polygon, ArrayPolygon2D):
+                point_count = len(polygon.coordinates)
+            else:
+                if not polygon.points:
+                    return False
+                point_count = len(polygon.points)
+            
             # Check minimum number of points
-            if len(polygon.points) < 4:  # At least 3 points + closing point
+            if point_count < 4:  # At least 3 points + closing point
                 return False
             
             # Check for reasonable area (in square meters)
@@ -1805,7 +2061,10 @@ class GeometryExtractor:
                 self.logger.debug(f"Polygon dimensions {width:.2f}x{height:.2f} m are outside reasonable range")
                 return False
             
-            # Check for valid coordinates (no NaN or infinite values)
+            # Check for valid coordinates (no NaN or infinite values);
+            # ArrayPolygon2D already rejects them on construction
+            if isinstance(polygon, ArrayPolygon2D):
+                return True
             for point in polygon.points:
                 if (math.isnan(point.x) or math.isnan(point.y) or 
                     math.isinf(point.x) or math.isinf(point.y)):
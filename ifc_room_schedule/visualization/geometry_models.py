@@ -6,9 +6,11 @@ data extracted from IFC files for floor plan visualization.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Iterable, Union
 import math
 
+import numpy as np
+
 
 @dataclass
 class Point2D:
@@ -184,6 +186,173 @@ class Polygon2D:
         return f"Polygon2D({self.space_name}, {len(self.points)} points)"
 
 
+class ArrayPolygon2D:
+    """
+    Compact polygon backed by a contiguous float64 coordinate array.
+
+    Drop-in alternative to Polygon2D for large floors: coordinates are held in
+    a single read-only (n, 2) array instead of n Point2D objects, bounds, area
+    and centroid are computed once on first use, and point-in-polygon tests are
+    vectorised over the edges. The Polygon2D API is kept; ``points`` builds
+    Point2D objects on demand for code that still iterates them.
+    """
+
+    __slots__ = ('coordinates', 'space_guid', 'space_name',
+                 '_points', '_bounds', '_area', '_centroid')
+
+    def __init__(self, coordinates: Union[np.ndarray, Iterable[Tuple[float, float]]],
+                 space_guid: str, space_name: str):
+        """
+        Initialize the polygon.
+
+        Args:
+            coordinates: Sequence of (x, y) pairs or an (n, 2) array
+            space_guid: GUID of the space the polygon outlines
+            space_name: Display name of the space
+        """
+        coords = np.array(coordinates, dtype=np.float64)
+        if coords.size == 0:
+            raise ValueError("Polygon must have at least one point")
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError("Polygon coordinates must be (x, y) pairs")
+        if len(coords) < 3:
+            raise ValueError("Polygon must have at least 3 points")
+        if not np.isfinite(coords).all():
+            raise ValueError("Point coordinates must be finite")
+        if not space_guid:
+            raise ValueError("Polygon must have a valid space GUID")
+
+        # Ensure polygon is closed
+        if not np.array_equal(coords[0], coords[-1]):
+            coords = np.vstack((coords, coords[:1]))
+
+        coords.flags.writeable = False
+        self.coordinates = coords
+        self.space_guid = space_guid
+        self.space_name = space_name or f"Space {space_guid[:8]}"
+        self._points: Optional[List[Point2D]] = None
+        self._bounds: Optional[Tuple[float, float, float, float]] = None
+        self._area: Optional[float] = None
+        self._centroid: Optional[Point2D] = None
+
+    @classmethod
+    def from_polygon(cls, polygon: Polygon2D) -> 'ArrayPolygon2D':
+        """Create a compact copy of a Polygon2D."""
+        return cls(polygon.to_tuples(), polygon.space_guid, polygon.space_name)
+
+    @property
+    def points(self) -> List[Point2D]:
+        """Closed ring as Point2D objects, built on first access."""
+        if self._points is None:
+            self._points = [Point2D(x, y) for x, y in self.coordinates.tolist()]
+        return self._points
+
+    def get_bounds(self) -> Tuple[float, float, float, float]:
+        """Get bounding box as (min_x, min_y, max_x, max_y)."""
+        if self._bounds is None:
+            min_x, min_y = self.coordinates.min(axis=0).tolist()
+            max_x, max_y = self.coordinates.max(axis=0).tolist()
+            self._bounds = (min_x, min_y, max_x, max_y)
+        return self._bounds
+
+    def _signed_area_terms(self) -> np.ndarray:
+        """Per-edge shoelace cross products of the closed ring."""
+        x = self.coordinates[:, 0]
+        y = self.coordinates[:, 1]
+        return x[:-1] * y[1:] - x[1:] * y[:-1]
+
+    def get_centroid(self) -> Point2D:
+        """Calculate polygon centroid using the shoelace formula."""
+        if self._centroid is None:
+            cross = self._signed_area_terms()
+            area = cross.sum() * 0.5
+
+            if abs(area) < 1e-10:  # Very small area, use simple average
+                avg_x, avg_y = self.coordinates.mean(axis=0).tolist()
+                self._centroid = Point2D(avg_x, avg_y)
+            else:
+                x = self.coordinates[:, 0]
+                y = self.coordinates[:, 1]
+                cx = ((x[:-1] + x[1:]) * cross).sum() / (6.0 * area)
+                cy = ((y[:-1] + y[1:]) * cross).sum() / (6.0 * area)
+                self._centroid = Point2D(float(cx), float(cy))
+        return self._centroid
+
+    def get_area(self) -> float:
+        """Calculate polygon area using the shoelace formula."""
+        if self._area is None:
+            self._area = float(abs(self._signed_area_terms().sum()) * 0.5)
+        return self._area
+
+    def contains_point(self, point: Point2D) -> bool:
+        """Check if point is inside polygon using ray casting algorithm."""
+        min_x, min_y, max_x, max_y = self.get_bounds()
+        if not (min_x <= point.x <= max_x and min_y <= point.y <= max_y):
+            return False
+        return bool(self.contains_points(np.array([[point.x, point.y]]))[0])
+
+    def contains_points(self, points: Union[np.ndarray, Iterable[Tuple[float, float]]]) -> np.ndarray:
+        """
+        Ray casting test for many points at once.
+
+        Args:
+            points: Sequence of (x, y) pairs or an (m, 2) array
+
+        Returns:
+            Boolean array of length m, True where the point is inside
+        """
+        query = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        px = query[:, 0:1]
+        py = query[:, 1:2]
+
+        # Edge i runs from vertex i to vertex i-1, matching Polygon2D
+        xi = self.coordinates[:-1, 0]
+        yi = self.coordinates[:-1, 1]
+        xj = np.roll(xi, 1)
+        yj = np.roll(yi, 1)
+
+        straddles = (yi > py) != (yj > py)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = (xj - xi) * (py - yi) / (yj - yi) + xi
+        crossings = straddles & (px < x_cross)
+
+        return (np.count_nonzero(crossings, axis=1) % 2) == 1
+
+    def translate(self, dx: float, dy: float) -> 'ArrayPolygon2D':
+        """Return a new polygon translated by dx, dy."""
+        return ArrayPolygon2D(self.coordinates + (dx, dy), self.space_guid, self.space_name)
+
+    def scale(self, factor: float, origin: Optional[Point2D] = None) -> 'ArrayPolygon2D':
+        """Return a new polygon scaled by factor around origin."""
+        if origin is None:
+            origin = self.get_centroid()
+
+        offset = np.array((origin.x, origin.y))
+        scaled = offset + (self.coordinates - offset) * factor
+        return ArrayPolygon2D(scaled, self.space_guid, self.space_name)
+
+    def to_tuples(self) -> List[Tuple[float, float]]:
+        """Convert points to list of tuples."""
+        return [(x, y) for x, y in self.coordinates.tolist()]
+
+    def to_polygon(self) -> Polygon2D:
+        """Convert back to a Point2D-based Polygon2D."""
+        return Polygon2D([Point2D(x, y) for x, y in self.coordinates.tolist()],
+                         self.space_guid, self.space_name)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArrayPolygon2D):
+            return NotImplemented
+        return (self.space_guid == other.space_guid and
+                self.space_name == other.space_name and
+                np.array_equal(self.coordinates, other.coordinates))
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return f"ArrayPolygon2D({self.space_name}, {len(self.coordinates)} points)"
+
+
 @dataclass
 class FloorLevel:
     """Represents a building floor/level with associated spaces."""
@@ -228,6 +397,125 @@ class FloorLevel:
         return f"FloorLevel({self.name}, {self.get_space_count()} spaces)"
 
 
+class RoomSpatialIndex:
+    """
+    Uniform grid over the bounding boxes of a floor's room polygons.
+    
+    Bounding boxes are computed once when the index is built. Point and
+    rectangle queries only look at the grid cells they touch, so hit-testing
+    and viewport culling do not depend on the number of rooms on the floor.
+    Query results keep the order of the polygon list.
+    """
+    
+    # Rooms covering more cells than this are kept in a list checked by every query
+    MAX_CELLS_PER_ROOM = 64
+    
+    def __init__(self, polygons: List['Polygon2D'], cell_size: Optional[float] = None):
+        """
+        Build the index.
+        
+        Args:
+            polygons: Room polygons to index
+            cell_size: Grid cell size in floor units (default: average room extent)
+        """
+        self.polygons = list(polygons)
+        self.room_bounds: List[Tuple[float, float, float, float]] = [
+            polygon.get_bounds() for polygon in self.polygons
+        ]
+        self.cell_size = cell_size or self._default_cell_size()
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._oversized: List[int] = []
+        
+        for index, bounds in enumerate(self.room_bounds):
+            min_cx, min_cy, max_cx, max_cy = self._cell_range(bounds)
+            if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > self.MAX_CELLS_PER_ROOM:
+                self._oversized.append(index)
+                continue
+            for cx in range(min_cx, max_cx + 1):
+                for cy in range(min_cy, max_cy + 1):
+                    self._cells.setdefault((cx, cy), []).append(index)
+    
+    def _default_cell_size(self) -> float:
+        """Use the average room extent so a typical room touches a few cells."""
+        if not self.room_bounds:
+            return 1.0
+        
+        total_extent = sum(
+            max(bounds[2] - bounds[0], bounds[3] - bounds[1]) for bounds in self.room_bounds
+        )
+        return max(total_extent / len(self.room_bounds), 1e-6)
+    
+    def _cell_range(self, bounds: Tuple[float, float, float, float]) -> Tuple[int, int, int, int]:
+        """Get the grid cells (min_cx, min_cy, max_cx, max_cy) covered by a bounding box."""
+        return (
+            math.floor(bounds[0] / self.cell_size),
+            math.floor(bounds[1] / self.cell_size),
+            math.floor(bounds[2] / self.cell_size),
+            math.floor(bounds[3] / self.cell_size)
+        )
+    
+    def query_point(self, x: float, y: float) -> List['Polygon2D']:
+        """Get polygons whose bounding box contains the point."""
+        candidates = self._cells.get(
+            (math.floor(x / self.cell_size), math.floor(y / self.cell_size)), []
+        )
+        indices = sorted(set(candidates).union(self._oversized))
+        
+        return [
+            self.polygons[index] for index in indices
+            if self._bounds_contain(self.room_bounds[index], x, y)
+        ]
+    
+    def query_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List['Polygon2D']:
+        """Get polygons whose bounding box intersects the rectangle."""
+        min_cx, min_cy, max_cx, max_cy = self._cell_range((min_x, min_y, max_x, max_y))
+        
+        # A viewport larger than the grid is cheaper to answer with a plain scan
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self._cells):
+            indices = range(len(self.polygons))
+        else:
+            candidates = set(self._oversized)
+            for cx in range(min_cx, max_cx + 1):
+                for cy in range(min_cy, max_cy + 1):
+                    candidates.update(self._cells.get((cx, cy), ()))
+            indices = sorted(candidates)
+        
+        return [
+            self.polygons[index] for index in indices
+            if self._bounds_intersect(self.room_bounds[index], min_x, min_y, max_x, max_y)
+        ]
+    
+    def get_combined_bounds(self, space_guids: List[str]) -> Optional[Tuple[float, float, float, float]]:
+        """Get the bounding box of all polygons of the given spaces, or None if none match."""
+        guids = set(space_guids)
+        matching = [
+            bounds for polygon, bounds in zip(self.polygons, self.room_bounds)
+            if polygon.space_guid in guids
+        ]
+        if not matching:
+            return None
+        
+        return (
+            min(bounds[0] for bounds in matching),
+            min(bounds[1] for bounds in matching),
+            max(bounds[2] for bounds in matching),
+            max(bounds[3] for bounds in matching)
+        )
+    
+    def get_room_count(self) -> int:
+        """Get the number of indexed polygons."""
+        return len(self.polygons)
+    
+    @staticmethod
+    def _bounds_contain(bounds: Tuple[float, float, float, float], x: float, y: float) -> bool:
+        return bounds[0] <= x <= bounds[2] and bounds[1] <= y <= bounds[3]
+    
+    @staticmethod
+    def _bounds_intersect(bounds: Tuple[float, float, float, float],
+                          min_x: float, min_y: float, max_x: float, max_y: float) -> bool:
+        return bounds[0] <= max_x and bounds[2] >= min_x and bounds[1] <= max_y and bounds[3] >= min_y
+
+
 @dataclass
 class FloorGeometry:
     """Complete geometric data for a building floor."""
@@ -236,6 +524,7 @@ class FloorGeometry:
     room_polygons: List[Polygon2D] = field(default_factory=list)
     building_outline: Optional[Polygon2D] = None
     bounds: Optional[Tuple[float, float, float, float]] = None
+    _spatial_index: Optional[RoomSpatialIndex] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Calculate bounds and validate data."""
@@ -283,13 +572,32 @@ class FloorGeometry:
             if polygon.space_guid in space_guids
         ]
     
+    def get_spatial_index(self) -> RoomSpatialIndex:
+        """Get the spatial index of the room polygons, building it on first use."""
+        if (self._spatial_index is None or
+                self._spatial_index.get_room_count() != len(self.room_polygons)):
+            self._spatial_index = RoomSpatialIndex(self.room_polygons)
+        return self._spatial_index
+    
+    def invalidate_spatial_index(self) -> None:
+        """Discard the spatial index after room polygons were replaced or changed."""
+        self._spatial_index = None
+    
     def find_room_at_point(self, point: Point2D) -> Optional[Polygon2D]:
         """Find room polygon containing the given point."""
-        for polygon in self.room_polygons:
+        for polygon in self.get_spatial_index().query_point(point.x, point.y):
             if polygon.contains_point(point):
                 return polygon
         return None
     
+    def find_rooms_in_bounds(self, bounds: Tuple[float, float, float, float]) -> List[Polygon2D]:
+        """Find room polygons whose bounding box intersects (min_x, min_y, max_x, max_y)."""
+        return self.get_spatial_index().query_rect(*bounds)
+    
+    def get_rooms_bounds(self, space_guids: List[str]) -> Optional[Tuple[float, float, float, float]]:
+        """Get the combined bounding box of the given rooms, or None if none are on this floor."""
+        return self.get_spatial_index().get_combined_bounds(space_guids)
+    
     def get_total_area(self) -> float:
         """Calculate total area of all rooms on this floor."""
         return sum(polygon.get_area() for polygon in self.room_polygons)
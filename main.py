@@ -9,7 +9,6 @@ data quality analysis, and advanced export capabilities.
 import sys
 import os
 import argparse
-import json
 import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -23,6 +22,8 @@ from ifc_room_schedule.parser.ifc_space_extractor import IfcSpaceExtractor
 from ifc_room_schedule.export.enhanced_json_builder import EnhancedJsonBuilder
 from ifc_room_schedule.analysis.data_quality_analyzer import DataQualityAnalyzer
 from ifc_room_schedule.parser.batch_processor import BatchProcessor
+from ifc_room_schedule.parser.parallel_space_extractor import ParallelSpaceExtractor
+from ifc_room_schedule.parser.step_scanner import prescan_file
 from ifc_room_schedule.utils.caching_manager import CachingManager, CacheConfig
 from ifc_room_schedule.export.csv_exporter import CsvExporter
 from ifc_room_schedule.export.excel_exporter import ExcelExporter
@@ -49,6 +50,8 @@ class RomskjemaGenerator:
         self.excel_exporter = ExcelExporter()
         self.pdf_exporter = PdfExporter()
         self.sql_exporter = None  # Initialized when needed
+        self.azure_sync = False  # Write only changes since the previous Azure SQL export
+        self.azure_project_guid = None  # Project key for Azure SQL; the IfcProject GlobalId if None
     
     def process_ifc_file(self, 
                         ifc_path: str, 
@@ -58,7 +61,8 @@ class RomskjemaGenerator:
                         batch_mode: bool = False,
                         chunk_size: int = 100,
                         azure_connection_string: str = None,
-                        azure_table_name: str = "room_schedule") -> Dict[str, Any]:
+                        azure_table_name: str = "room_schedule",
+                        workers: int = 1) -> Dict[str, Any]:
         """
         Process IFC file and generate room schedule.
         
@@ -66,11 +70,12 @@ class RomskjemaGenerator:
             ifc_path: Path to IFC file
             output_path: Path for output file
             export_profile: Export profile (core, advanced, production)
-            export_format: Export format (json, csv, excel, pdf, azure-sql)
+            export_format: Export format (json, ndjson, csv, excel, pdf, azure-sql)
             batch_mode: Enable batch processing
             chunk_size: Chunk size for batch processing
             azure_connection_string: Azure SQL connection string (required for azure-sql export)
             azure_table_name: Azure SQL table name for export
+            workers: Number of worker processes for space extraction
             
         Returns:
             Processing statistics
@@ -81,16 +86,38 @@ class RomskjemaGenerator:
         start_time = time.time()
         
         try:
-            # Load IFC file
-            print(f"Loading IFC file: {ifc_path}")
-            success, message = self.ifc_reader.load_file(ifc_path)
-            if not success:
-                return {"error": f"Failed to load IFC file: {message}"}
-            
-            # Extract spaces
-            self.space_extractor.set_ifc_file(self.ifc_reader.get_ifc_file())
-            spaces = self.space_extractor.extract_spaces()
-            print(f"Loaded {len(spaces)} spaces")
+            # Reuse spaces extracted from an identical file if available
+            spaces = self.ifc_reader.load_cached_spaces(ifc_path, extraction="spaces")
+            if spaces is not None:
+                print(f"Loaded {len(spaces)} spaces from cache: {ifc_path}")
+            elif workers > 1:
+                # Extract spaces in worker processes that each open the file, so
+                # only the pre-scan checks run here and its result sizes the work
+                scan_result = prescan_file(ifc_path)
+                is_valid, message = self.ifc_reader.validate_file(ifc_path, scan_result, open_file=False)
+                if not is_valid:
+                    return {"error": f"Failed to load IFC file: {message}"}
+                
+                print(f"Extracting spaces from {ifc_path} with {workers} workers")
+                spaces = ParallelSpaceExtractor(workers=workers).extract_spaces(ifc_path, scan_result)
+                print(f"Loaded {len(spaces)} spaces")
+                
+                if spaces:
+                    self.ifc_reader.store_cached_spaces(spaces, extraction="spaces", file_path=ifc_path)
+            else:
+                # Load IFC file
+                print(f"Loading IFC file: {ifc_path}")
+                success, message = self.ifc_reader.load_file(ifc_path)
+                if not success:
+                    return {"error": f"Failed to load IFC file: {message}"}
+                
+                # Extract spaces
+                self.space_extractor.set_ifc_file(self.ifc_reader.get_ifc_file())
+                spaces = self.space_extractor.extract_spaces()
+                print(f"Loaded {len(spaces)} spaces")
+                
+                if spaces:
+                    self.ifc_reader.store_cached_spaces(spaces, extraction="spaces")
             
             if not spaces:
                 print("Warning: No spaces found in IFC file")
@@ -101,6 +128,14 @@ class RomskjemaGenerator:
             quality_report = self.quality_analyzer.analyze_spaces_quality(spaces)
             self._print_quality_report(quality_report)
             
+            if export_format == "azure-sql":
+                # Key the project by its IfcProject GlobalId, which stays the same across revisions
+                project_guid = self.azure_project_guid or self.ifc_reader.get_project_guid(ifc_path)
+                if self.azure_sync and not project_guid:
+                    return {"error": "Azure SQL sync needs the IfcProject GlobalId; "
+                                     "the file has none, so pass --azure-project-guid"}
+                self.json_builder.set_project_guid(project_guid)
+            
             # Process spaces
             if batch_mode and len(spaces) > chunk_size:
                 print(f"Processing {len(spaces)} spaces in batch mode (chunk size: {chunk_size})")
@@ -132,18 +167,16 @@ class RomskjemaGenerator:
                          azure_table_name: str = "room_schedule") -> Dict[str, Any]:
         """Process spaces in standard mode."""
         try:
-            if export_format == "json":
-                # Build enhanced JSON structure
-                enhanced_data = self.json_builder.build_enhanced_json_structure(
-                    spaces=spaces,
-                    export_profile=export_profile
-                )
-                
-                # Write to file
+            if export_format in ("json", "ndjson"):
+                # Stream the enhanced JSON structure to file space by space
                 with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(enhanced_data, f, indent=2, ensure_ascii=False)
+                    self.json_builder.write_enhanced_json_stream(
+                        f, spaces,
+                        export_profile=export_profile,
+                        ndjson=export_format == "ndjson"
+                    )
                 
-                return {"success": True, "format": "json"}
+                return {"success": True, "format": export_format}
             
             elif export_format == "csv":
                 success = self.csv_exporter.export_to_csv(spaces, output_path)
@@ -179,7 +212,10 @@ class RomskjemaGenerator:
                     table_name = azure_table_name or "room_schedule"
                     
                     # Export to Azure SQL
-                    success = self.sql_exporter.export_data(enhanced_data, table_name)
+                    if self.azure_sync:
+                        success = self.sql_exporter.sync_data(enhanced_data, table_name) is not None
+                    else:
+                        success = self.sql_exporter.export_data(enhanced_data, table_name)
                     return {"success": success, "format": "azure-sql"}
                     
                 except Exception as e:
@@ -281,6 +317,12 @@ class RomskjemaGenerator:
             input_name = Path(args.input).stem
             output_path = f"{input_name}_room_schedule.{args.format}"
         
+        if getattr(args, 'no_cache', False):
+            self.ifc_reader.parse_cache = None
+        
+        self.azure_sync = getattr(args, 'azure_sync', False)
+        self.azure_project_guid = getattr(args, 'azure_project_guid', None)
+        
         # Validate Azure SQL parameters if needed
         if args.format == "azure-sql":
             if not args.azure_connection_string:
@@ -296,7 +338,8 @@ class RomskjemaGenerator:
             batch_mode=args.batch,
             chunk_size=args.chunk_size,
             azure_connection_string=getattr(args, 'azure_connection_string', None),
-            azure_table_name=getattr(args, 'azure_table_name', None)
+            azure_table_name=getattr(args, 'azure_table_name', None),
+            workers=getattr(args, 'workers', 1)
         )
         
         if "error" in stats:
@@ -327,10 +370,14 @@ Examples:
   # Batch processing for large files
   python main.py --input large_building.ifc --output room_schedule.json --batch --chunk-size 200
   
+  # Parallel space extraction for large files
+  python main.py --input large_building.ifc --output room_schedule.json --workers 8
+  
   # Export to different formats
   python main.py --input building.ifc --output room_schedule.csv --format csv
   python main.py --input building.ifc --output room_schedule.xlsx --format excel
   python main.py --input building.ifc --output room_schedule.pdf --format pdf
+  python main.py --input building.ifc --output room_schedule.ndjson --format ndjson
   
   # Export to Azure SQL (using default configuration)
   python main.py --input building.ifc --format azure-sql
@@ -338,6 +385,9 @@ Examples:
   # Export to Azure SQL (with custom connection)
   python main.py --input building.ifc --format azure-sql --azure-connection-string "Server=..." --azure-table-name "rooms"
   
+  # Synchronise Azure SQL with a new model revision (only changed spaces are written)
+  python main.py --input building.ifc --format azure-sql --azure-sync
+  
   # GUI mode
   python main.py --gui
         """
@@ -362,7 +412,7 @@ Examples:
     
     parser.add_argument(
         "--format", "-f",
-        choices=["json", "csv", "excel", "pdf", "azure-sql"],
+        choices=["json", "ndjson", "csv", "excel", "pdf", "azure-sql"],
         default="json",
         help="Export format (default: json)"
     )
@@ -380,6 +430,19 @@ Examples:
         help="Chunk size for batch processing (default: 100)"
     )
     
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Worker processes for space extraction (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse the IFC file instead of using cached spaces"
+    )
+    
     parser.add_argument(
         "--gui",
         action="store_true",
@@ -397,6 +460,17 @@ Examples:
         help="Azure SQL table name (default: room_schedule)"
     )
     
+    parser.add_argument(
+        "--azure-sync",
+        action="store_true",
+        help="Only insert, update or delete spaces that changed since the previous Azure SQL export of the project"
+    )
+    
+    parser.add_argument(
+        "--azure-project-guid",
+        help="Azure SQL project key (default: the GlobalId of the IfcProject in the input file)"
+    )
+    
     parser.add_argument(
         "--version", "-v",
         action="store_true",
@@ -0,0 +1,236 @@
+"""
+Test cases for the sync mode of the Azure SQL exporter.
+
+Runs the exporter against a local SQLite database to check that a sync only
+writes the spaces and related rows that changed, and that databases from
+before the schema version table are upgraded.
+"""
+
+import copy
+
+from sqlalchemy import create_engine, func, select, text
+
+from ifc_room_schedule.export.azure_sql_exporter import SCHEMA_VERSION
+
+from tests.test_azure_sql_bulk_export import create_export_data, create_exporter, count_statements
+
+
+def written_statements(statements):
+    """Get the statements that write to the database."""
+    return [statement for statement in statements if statement.split()[0] in ("INSERT", "UPDATE", "DELETE")]
+
+
+def written_table(statement):
+    """Get the table an INSERT, UPDATE or DELETE statement writes to."""
+    words = statement.split()
+    return (words[1] if words[0] == "UPDATE" else words[2]).strip('"')
+
+
+def count_rows(exporter, table):
+    """Count the rows of a table."""
+    with exporter.engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(table)).scalar()
+
+
+class TestSync:
+    """Test cases for sync_data."""
+
+    def test_first_sync_inserts_everything(self, tmp_path):
+        """Test that a sync into an empty database inserts all spaces."""
+        exporter = create_exporter(tmp_path)
+
+        summary = exporter.sync_data(create_export_data(10))
+
+        assert summary == {'inserted': 10, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+        assert count_rows(exporter, exporter.surfaces_table) == 40
+
+    def test_unchanged_sync_writes_only_the_project(self, tmp_path):
+        """Test that syncing the same data again leaves the spaces alone."""
+        exporter = create_exporter(tmp_path)
+        data = create_export_data(20)
+        exporter.sync_data(data)
+        statements = count_statements(exporter.engine)
+
+        summary = exporter.sync_data(data)
+
+        assert summary == {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 20}
+        assert [statement.split()[0] for statement in written_statements(statements)] == ["UPDATE"]
+        assert count_rows(exporter, exporter.projects_table) == 1
+
+    def test_changed_surface_replaces_only_that_space_surfaces(self, tmp_path):
+        """Test that a changed surface rewrites one space and its surfaces only."""
+        exporter = create_exporter(tmp_path)
+        data = create_export_data(20)
+        exporter.sync_data(data)
+        changed = copy.deepcopy(data)
+        changed['spaces'][3]['surfaces'][1]['area'] = 7.5
+        statements = count_statements(exporter.engine)
+
+        summary = exporter.sync_data(changed)
+
+        assert summary == {'inserted': 0, 'updated': 1, 'deleted': 0, 'unchanged': 19}
+        tables = sorted(written_table(statement) for statement in written_statements(statements))
+        assert tables == ["projects", "spaces", "surfaces", "surfaces"]
+        with exporter.engine.connect() as conn:
+            areas = conn.execute(
+                select(exporter.surfaces_table.c.area)
+                .join(exporter.spaces_table, exporter.spaces_table.c.id == exporter.surfaces_table.c.space_id)
+                .where(exporter.spaces_table.c.guid == "SPACE_00003")
+                .order_by(exporter.surfaces_table.c.surface_id)
+            ).scalars().all()
+        assert areas == [5.0, 7.5, 5.0, 5.0]
+        assert count_rows(exporter, exporter.space_boundaries_table) == 80
+
+    def test_changed_space_row_keeps_related_rows(self, tmp_path):
+        """Test that a renamed space is updated without touching its related rows."""
+        exporter = create_exporter(tmp_path)
+        data = create_export_data(5)
+        exporter.sync_data(data)
+        changed = copy.deepcopy(data)
+        changed['spaces'][0]['properties']['long_name'] = "Office"
+        statements = count_statements(exporter.engine)
+
+        summary = exporter.sync_data(changed)
+
+        assert summary['updated'] == 1
+        tables = [written_table(statement) for statement in written_statements(statements)]
+        assert tables == ["projects", "spaces"]
+        with exporter.engine.connect() as conn:
+            assert conn.execute(select(exporter.spaces_table.c.long_name)
+                                .where(exporter.spaces_table.c.guid == "SPACE_00000")).scalar() == "Office"
+
+    def test_removed_and_added_spaces(self, tmp_path):
+        """Test that removed spaces are deleted with their related rows and new ones inserted."""
+        exporter = create_exporter(tmp_path)
+        data = create_export_data(10)
+        exporter.sync_data(data)
+        changed = copy.deepcopy(data)
+        del changed['spaces'][2:4]
+        changed['spaces'].extend(create_export_data(12)['spaces'][10:])
+
+        summary = exporter.sync_data(changed)
+
+        assert summary == {'inserted': 2, 'updated': 0, 'deleted': 2, 'unchanged': 8}
+        with exporter.engine.connect() as conn:
+            guids = conn.execute(select(exporter.spaces_table.c.guid)).scalars().all()
+        assert sorted(guids) == sorted(space['guid'] for space in changed['spaces'])
+        for table in exporter.child_tables.values():
+            with exporter.engine.connect() as conn:
+                orphans = conn.execute(
+                    select(func.count()).select_from(table)
+                    .where(table.c.space_id.not_in(select(exporter.spaces_table.c.id)))
+                ).scalar()
+            assert orphans == 0
+        assert count_rows(exporter, exporter.surfaces_table) == 40
+
+    def test_renamed_revision_syncs_into_the_same_project(self, tmp_path):
+        """Test that the project is matched by its GUID, not its file name."""
+        exporter = create_exporter(tmp_path)
+        data = create_export_data(5)
+        exporter.sync_data(data)
+        renamed = copy.deepcopy(data)
+        renamed['metadata']['source_file'] = "model_rev2.ifc"
+
+        summary = exporter.sync_data(renamed)
+
+        assert summary == {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 5}
+        assert count_rows(exporter, exporter.projects_table) == 1
+
+    def test_sync_without_project_guid_is_refused(self, tmp_path):
+        """Test that a sync without a project GUID writes nothing."""
+        exporter = create_exporter(tmp_path)
+        data = create_export_data(3)
+        del data['metadata']['project_guid']
+
+        assert exporter.sync_data(data) is None
+        assert exporter.sync_data(data, project_guid="2O2Fr$t4X7Zf8NOew3FLOH") is not None
+
+    def test_spaces_without_unique_guids_are_refused(self, tmp_path):
+        """Test that missing or duplicate space GUIDs are rejected before anything is written."""
+        exporter = create_exporter(tmp_path)
+        exporter.create_tables()
+        statements = count_statements(exporter.engine)
+        duplicated = create_export_data(3)
+        duplicated['spaces'][2]['guid'] = duplicated['spaces'][0]['guid']
+        missing = create_export_data(3)
+        missing['spaces'][1]['guid'] = None
+
+        for data in (duplicated, missing):
+            assert exporter.sync_data(data) is None
+            assert not exporter.export_data(data)
+
+        assert written_statements(statements) == []
+
+    def test_exports_of_projects_with_the_same_file_name(self, tmp_path):
+        """Test that full exports of different projects sharing a file name are kept apart."""
+        exporter = create_exporter(tmp_path)
+        first, other = create_export_data(3), create_export_data(3)
+        for data in (first, other):
+            del data['metadata']['project_guid']
+        for space in other['spaces']:
+            space['guid'] = "OTHER_" + space['guid']
+
+        assert exporter.export_data(first)
+        assert exporter.export_data(other)
+        assert count_rows(exporter, exporter.projects_table) == 2
+
+    def test_export_data_sync_flag(self, tmp_path):
+        """Test that export_data can run a sync."""
+        exporter = create_exporter(tmp_path)
+        data = create_export_data(3)
+
+        assert exporter.export_data(data, sync=True)
+        assert exporter.export_data(data, sync=True)
+        assert count_rows(exporter, exporter.spaces_table) == 3
+
+
+class TestSchemaVersion:
+    """Test cases for schema versioning."""
+
+    def test_current_schema_is_not_recreated(self, tmp_path):
+        """Test that create_tables does nothing once the schema is current."""
+        exporter = create_exporter(tmp_path)
+        assert exporter.create_tables()
+        statements = count_statements(exporter.engine)
+
+        assert exporter.create_tables()
+
+        assert written_statements(statements) == []
+        assert not [statement for statement in statements if statement.startswith("CREATE")]
+        assert count_rows(exporter, exporter.schema_version_table) == 1
+
+    def test_version_one_database_is_upgraded(self, tmp_path):
+        """Test that tables created before versioning get the new columns and can be synced."""
+        path = tmp_path / "v1.db"
+        engine = create_engine(f"sqlite:///{path}")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE projects (id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+                "source_file VARCHAR(255), source_file_path TEXT, export_date DATETIME NOT NULL, "
+                "application_version VARCHAR(50), created_at DATETIME)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE spaces (id INTEGER PRIMARY KEY, project_id INTEGER NOT NULL, "
+                "guid VARCHAR(50) NOT NULL UNIQUE, name VARCHAR(255), long_name VARCHAR(255), "
+                "description TEXT, object_type VARCHAR(255), zone_category VARCHAR(255), "
+                "number VARCHAR(50), elevation FLOAT, processed BOOLEAN, created_at DATETIME)"
+            ))
+        engine.dispose()
+        exporter = create_exporter(tmp_path, name="v1.db")
+
+        assert exporter.create_tables()
+        assert exporter.sync_data(create_export_data(4))['inserted'] == 4
+
+        with exporter.engine.connect() as conn:
+            assert conn.execute(select(exporter.schema_version_table.c.version)).scalars().all() == [SCHEMA_VERSION]
+            assert None not in conn.execute(select(exporter.spaces_table.c.content_hash)).scalars().all()
+
+    def test_newer_schema_is_rejected(self, tmp_path):
+        """Test that a database from a newer version is not modified."""
+        exporter = create_exporter(tmp_path)
+        exporter.create_tables()
+        with exporter.engine.begin() as conn:
+            conn.execute(exporter.schema_version_table.insert().values(version=SCHEMA_VERSION + 1))
+
+        assert not exporter.create_tables()
+        assert exporter.sync_data(create_export_data(1)) is None
@@ -0,0 +1,151 @@
+"""
+Unit tests for binary floor plan output.
+
+Covers the round trip of polylines through the binary format, the shared
+property table, the size against GeoJSON, and writing the files alongside SVG
+and GeoJSON with references in the manifest.
+"""
+
+import pytest
+import sys
+import os
+import json
+import random
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ifc_floor_plan_generator.models import Config, OutputConfig, Polyline2D, StoreyResult
+from ifc_floor_plan_generator.rendering.binary_renderer import (
+    BinaryRenderer, decode_binary_floor_plan, _encode_varints, _decode_varints
+)
+from ifc_floor_plan_generator.rendering.geojson_renderer import GeoJSONRenderer
+from ifc_floor_plan_generator.rendering.output_coordinator import OutputCoordinator
+
+
+def make_config(tmp_path, precision=3):
+    """Create a configuration with binary output enabled."""
+    return Config(
+        input_path="model.ifc",
+        output_dir=str(tmp_path),
+        cut_offset_m=1.05,
+        output=OutputConfig(write_geojson=True, write_binary=True, binary_coordinate_precision=precision)
+    )
+
+
+def sample_polylines(count=50, seed=3):
+    """Create walls, doors and slabs with random outlines."""
+    rng = random.Random(seed)
+    classes = ["IfcWall", "IfcDoor", "IfcSlab"]
+    polylines = []
+    for i in range(count):
+        x, y = rng.uniform(-50, 50), rng.uniform(-50, 50)
+        points = [(x + rng.uniform(0, 5), y + rng.uniform(0, 5)) for _ in range(rng.randint(2, 12))]
+        polylines.append(Polyline2D(points=points, ifc_class=classes[i % 3], element_guid=f"GUID_{i:04d}",
+                                    is_closed=i % 2 == 0 and len(points) > 2))
+    return polylines
+
+
+class TestBinaryRenderer:
+    """Test cases for BinaryRenderer."""
+
+    def test_round_trip_within_quantization(self, tmp_path):
+        """Test that decoded features keep order, GUIDs, closedness and coordinates."""
+        polylines = sample_polylines()
+
+        decoded = decode_binary_floor_plan(
+            BinaryRenderer(make_config(tmp_path)).render_to_bytes(polylines, {"storey_name": "Level 0"})
+        )
+
+        assert decoded["feature_count"] == len(polylines)
+        assert decoded["properties"]["storey_name"] == "Level 0"
+        for polyline, feature in zip(polylines, decoded["features"]):
+            assert feature["element_guid"] == polyline.element_guid
+            assert feature["is_closed"] == polyline.is_closed
+            assert decoded["property_table"][feature["property_index"]]["ifc_class"] == polyline.ifc_class
+            np.testing.assert_allclose(feature["coordinates"], polyline.points, atol=0.5e-3 + 1e-9)
+
+    def test_section_cut_height_in_header(self, tmp_path):
+        """Test that the header reports the cut height of the rendered section."""
+        decoded = decode_binary_floor_plan(
+            BinaryRenderer(make_config(tmp_path)).render_to_bytes(
+                sample_polylines(3), {"storey_name": "Level 0 0.30m", "cut_height": 0.3})
+        )
+
+        assert decoded["processing_config"]["cut_height"] == 0.3
+
+    def test_properties_are_stored_once_per_class(self, tmp_path):
+        """Test that the property table matches the GeoJSON semantic properties per IFC class."""
+        config = make_config(tmp_path)
+
+        decoded = decode_binary_floor_plan(
+            BinaryRenderer(config).render_to_bytes(sample_polylines(), {"storey_name": "Level 0"})
+        )
+
+        assert [entry["ifc_class"] for entry in decoded["property_table"]] == ["IfcWall", "IfcDoor", "IfcSlab"]
+        geojson = GeoJSONRenderer(config).render_polylines(sample_polylines(), {"storey_name": "Level 0"})
+        door = geojson["features"][1]["properties"]
+        for key, value in decoded["property_table"][1].items():
+            assert door[key] == value
+
+    def test_much_smaller_than_geojson(self, tmp_path):
+        """Test that the binary file is an order of magnitude smaller than compact GeoJSON."""
+        config = make_config(tmp_path)
+        polylines = sample_polylines(count=2000)
+
+        binary = BinaryRenderer(config).render_to_bytes(polylines, {"storey_name": "Level 0"})
+        geojson = GeoJSONRenderer(config).render_to_string(polylines, {"storey_name": "Level 0"}, indent=None)
+
+        assert len(binary) * 10 < len(geojson.encode('utf-8'))
+
+    def test_empty_storey(self, tmp_path):
+        """Test that no polylines give a valid file without features."""
+        decoded = decode_binary_floor_plan(BinaryRenderer(make_config(tmp_path)).render_to_bytes([], {}))
+
+        assert decoded["feature_count"] == 0
+        assert decoded["features"] == []
+
+    def test_varints_round_trip(self):
+        """Test zigzag varints over small, negative and 64-bit values."""
+        values = np.array([0, 1, -1, 63, -64, 64, 300, -300, 2 ** 40, -(2 ** 62), 2 ** 63 - 1, -(2 ** 63)])
+
+        np.testing.assert_array_equal(_decode_varints(_encode_varints(values)), values)
+        assert len(_encode_varints(np.array([0, 1, -1, 63, -64]))) == 5
+
+    def test_invalid_precision_rejected(self):
+        """Test that the binary coordinate precision is validated."""
+        with pytest.raises(ValueError):
+            OutputConfig(binary_coordinate_precision=10)
+
+
+class TestBinaryOutputFiles:
+    """Test binary files in the output pipeline."""
+
+    def test_written_alongside_svg_and_geojson(self, tmp_path):
+        """Test that the coordinator writes binary files and the manifest references them."""
+        config = make_config(tmp_path)
+        storey = StoreyResult(storey_name="Level 0", storey_index=0, elevation=0.0, cut_height=1.05,
+                              polylines=sample_polylines(), bounds={}, element_count=50)
+
+        summary = OutputCoordinator(config).generate_all_outputs([storey], "model.ifc", 1.0)
+
+        assert summary["binary_files"] == [storey.binary_file]
+        assert storey.binary_file.endswith("00_Level 0.fpb")
+        with open(storey.binary_file, 'rb') as f:
+            assert decode_binary_floor_plan(f.read())["feature_count"] == 50
+        with open(summary["manifest_file"]) as f:
+            manifest = json.load(f)
+        assert manifest["storeys"][0]["output_files"]["binary"] == storey.binary_file
+
+    def test_disabled_by_default(self, tmp_path):
+        """Test that no binary files are written unless enabled."""
+        config = Config(input_path="model.ifc", output_dir=str(tmp_path), cut_offset_m=1.05)
+        storey = StoreyResult(storey_name="Level 0", storey_index=0, elevation=0.0, cut_height=1.05,
+                              polylines=sample_polylines(), bounds={}, element_count=50)
+
+        summary = OutputCoordinator(config).generate_all_outputs([storey], "model.ifc", 1.0)
+
+        assert summary["binary_files"] == []
+        assert storey.binary_file is None
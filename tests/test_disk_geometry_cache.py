@@ -0,0 +1,203 @@
+"""
+Unit tests for the persistent geometry cache.
+
+Covers mesh serialisation, the SQLite store with revision keys and size-based
+eviction, readers in worker processes, structural element hashing, and reuse of
+cached meshes by the geometry engine across runs.
+"""
+
+import pytest
+import sys
+import os
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ifcopenshell
+import ifcopenshell.api
+
+from ifc_floor_plan_generator.geometry import engine as engine_module
+from ifc_floor_plan_generator.geometry.engine import GeometryEngine
+from ifc_floor_plan_generator.geometry.disk_cache import (
+    DiskGeometryCache, ElementGeometryHasher, KIND_MESH, encode_mesh, decode_mesh
+)
+from ifc_floor_plan_generator.geometry.mesh_slicer import TriangleMesh
+from ifc_floor_plan_generator.models import GeometryConfig
+
+
+def create_wall_file(height=3.0, padding=0, with_opening=False):
+    """Create a model with one wall, optionally after unrelated entities that shift ids."""
+    ifc_file = ifcopenshell.api.run("project.create_file", version="IFC4")
+    for i in range(padding):
+        ifc_file.createIfcCartesianPoint((float(i), 0.0, 0.0))
+    ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcProject", name="Project")
+    ifcopenshell.api.run("unit.assign_unit", ifc_file, length={"is_metric": True, "raw": "METERS"})
+    model = ifcopenshell.api.run("context.add_context", ifc_file, context_type="Model")
+    body = ifcopenshell.api.run("context.add_context", ifc_file, context_type="Model",
+                                context_identifier="Body", target_view="MODEL_VIEW", parent=model)
+
+    wall = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcWall", name="Wall")
+    wall.GlobalId = "0WallGuid000000000000A"
+    representation = ifcopenshell.api.run("geometry.add_wall_representation", ifc_file, context=body,
+                                          length=5.0, height=height, thickness=0.2)
+    ifcopenshell.api.run("geometry.assign_representation", ifc_file, product=wall, representation=representation)
+    ifcopenshell.api.run("geometry.edit_object_placement", ifc_file, product=wall)
+
+    if with_opening:
+        opening = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcOpeningElement")
+        opening_representation = ifcopenshell.api.run("geometry.add_wall_representation", ifc_file,
+                                                      context=body, length=1.0, height=2.0, thickness=0.2)
+        ifcopenshell.api.run("geometry.assign_representation", ifc_file,
+                             product=opening, representation=opening_representation)
+        ifcopenshell.api.run("geometry.edit_object_placement", ifc_file, product=opening)
+        ifcopenshell.api.run("feature.add_feature", ifc_file, feature=opening, element=wall)
+
+    return ifc_file, wall
+
+
+def create_mesh(offset=0.0):
+    """Create a small tetrahedron mesh."""
+    vertices = np.array([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]) + offset
+    return TriangleMesh(vertices=vertices, faces=[(0, 2, 1), (0, 1, 3), (1, 2, 3), (2, 0, 3)])
+
+
+def read_entry(cache_path, guid):
+    """Read one mesh entry in a worker process."""
+    data = DiskGeometryCache(cache_path).get(guid, KIND_MESH, "rev", "config")
+    return None if data is None else decode_mesh(data).vertices.sum()
+
+
+class TestMeshSerialisation:
+    """Test cases for mesh encoding."""
+
+    def test_round_trip(self):
+        """Test that meshes survive encoding unchanged."""
+        mesh = create_mesh(offset=0.125)
+
+        decoded = decode_mesh(encode_mesh(mesh))
+
+        np.testing.assert_array_equal(decoded.vertices, mesh.vertices)
+        np.testing.assert_array_equal(decoded.faces, mesh.faces)
+
+
+class TestDiskGeometryCache:
+    """Test cases for DiskGeometryCache."""
+
+    def test_entries_are_keyed_by_revision_and_config(self, tmp_path):
+        """Test that only the stored revision and configuration hit."""
+        cache = DiskGeometryCache(tmp_path / "geometry.sqlite")
+        cache.put("GUID", KIND_MESH, "rev1", "config", b"data")
+
+        assert cache.get("GUID", KIND_MESH, "rev1", "config") == b"data"
+        assert cache.get("GUID", KIND_MESH, "rev2", "config") is None
+        assert cache.get("GUID", KIND_MESH, "rev1", "other") is None
+        assert cache.get("GUID", "brep", "rev1", "config") is None
+
+    def test_new_revision_replaces_entry(self, tmp_path):
+        """Test that storing a revised element leaves a single entry."""
+        cache = DiskGeometryCache(tmp_path / "geometry.sqlite")
+        cache.put("GUID", KIND_MESH, "rev1", "config", b"old")
+        cache.put("GUID", KIND_MESH, "rev2", "config", b"new")
+
+        assert cache.get_stats()["entries"] == 1
+        assert cache.get("GUID", KIND_MESH, "rev2", "config") == b"new"
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that entries are visible to a new cache on the same file."""
+        cache = DiskGeometryCache(tmp_path / "geometry.sqlite")
+        cache.put("GUID", KIND_MESH, "rev", "config", b"data")
+        cache.close()
+
+        assert DiskGeometryCache(tmp_path / "geometry.sqlite").get("GUID", KIND_MESH, "rev", "config") == b"data"
+
+    def test_size_eviction_removes_least_recently_used(self, tmp_path):
+        """Test that the size limit evicts the entries read least recently."""
+        cache = DiskGeometryCache(tmp_path / "geometry.sqlite", max_size_mb=3000 / (1024 * 1024))
+        for guid in ("A", "B", "C"):
+            cache.put(guid, KIND_MESH, "rev", "config", b"x" * 1000)
+        cache.get("A", KIND_MESH, "rev", "config")
+        cache.flush()
+
+        cache.put("D", KIND_MESH, "rev", "config", b"x" * 1000)
+        cache.flush()
+
+        assert cache.get("A", KIND_MESH, "rev", "config") is not None
+        assert cache.get("B", KIND_MESH, "rev", "config") is None
+        assert cache.get("D", KIND_MESH, "rev", "config") is not None
+        assert cache.get_stats()["size_mb"] * 1024 * 1024 <= 3000
+
+    @pytest.mark.skipif(mp.get_start_method() != "fork", reason="Worker processes inherit the open cache")
+    def test_concurrent_readers_in_worker_processes(self, tmp_path):
+        """Test that worker processes read entries written by the parent."""
+        cache_path = tmp_path / "geometry.sqlite"
+        cache = DiskGeometryCache(cache_path)
+        for i in range(8):
+            cache.put(f"GUID{i}", KIND_MESH, "rev", "config", encode_mesh(create_mesh(offset=i)))
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            sums = list(executor.map(read_entry, [cache_path] * 8, [f"GUID{i}" for i in range(8)]))
+
+        assert sums == [create_mesh(offset=i).vertices.sum() for i in range(8)]
+        # The parent connection still works after the workers used their own
+        assert cache.get("GUID0", KIND_MESH, "rev", "config") is not None
+
+
+class TestElementGeometryHasher:
+    """Test cases for ElementGeometryHasher."""
+
+    def test_hash_is_independent_of_entity_ids(self):
+        """Test that renumbered but identical geometry hashes the same."""
+        _, wall = create_wall_file()
+        _, shifted_wall = create_wall_file(padding=5)
+
+        assert wall.id() != shifted_wall.id()
+        assert ElementGeometryHasher().hash_element(wall) == ElementGeometryHasher().hash_element(shifted_wall)
+
+    def test_geometry_change_changes_hash(self):
+        """Test that a changed representation gives a new hash."""
+        _, wall = create_wall_file(height=3.0)
+        _, taller_wall = create_wall_file(height=3.5)
+
+        assert ElementGeometryHasher().hash_element(wall) != ElementGeometryHasher().hash_element(taller_wall)
+
+    def test_openings_only_count_when_subtracted(self):
+        """Test that openings are part of the hash only when they are subtracted."""
+        _, wall = create_wall_file()
+        _, voided_wall = create_wall_file(with_opening=True)
+
+        assert (ElementGeometryHasher().hash_element(wall)
+                != ElementGeometryHasher().hash_element(voided_wall))
+        assert (ElementGeometryHasher(include_openings=False).hash_element(wall)
+                == ElementGeometryHasher(include_openings=False).hash_element(voided_wall))
+
+
+class TestEngineDiskCache:
+    """Test reuse of cached meshes by GeometryEngine."""
+
+    def test_unchanged_elements_are_not_tessellated_again(self, tmp_path):
+        """Test that a second run reuses meshes and a revised element is regenerated."""
+        config = GeometryConfig(section_backend="mesh", disk_cache_dir=str(tmp_path / "cache"))
+        _, wall = create_wall_file()
+
+        first_engine = GeometryEngine(config)
+        mesh = first_engine.generate_mesh(wall)
+        first_engine.close_cache()
+
+        second_engine = GeometryEngine(config)
+        with patch.object(engine_module.ifcopenshell.geom, 'create_shape',
+                          side_effect=AssertionError("tessellated again")):
+            cached = second_engine.generate_mesh(wall)
+
+        np.testing.assert_array_equal(cached.vertices, mesh.vertices)
+        np.testing.assert_array_equal(cached.faces, mesh.faces)
+
+        _, revised_wall = create_wall_file(height=3.5)
+        revised = second_engine.generate_mesh(revised_wall)
+
+        assert revised.z_range[1] == pytest.approx(3.5)
+        assert second_engine.get_cache_stats()["disk_cache"]["entries"] == 1
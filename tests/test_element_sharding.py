@@ -0,0 +1,207 @@
+"""
+Unit tests for element-level parallel section cutting.
+
+Worker processes need OpenCASCADE, so the pool is replaced by a thread pool
+running the same worker functions against fake geometry components.
+"""
+
+import pytest
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ifc_floor_plan_generator.models import Config, PerformanceConfig, Polyline2D
+from ifc_floor_plan_generator.errors.exceptions import ProcessingError
+from ifc_floor_plan_generator.performance import element_sharding
+from ifc_floor_plan_generator.performance.element_sharding import (
+    ElementShardProcessor, encode_polylines, decode_polylines, section_element
+)
+
+
+class FakeElement:
+    """IFC element stand-in identified by entity id."""
+
+    def __init__(self, element_id):
+        self._id = element_id
+        self.GlobalId = f"GUID_{element_id:04d}"
+
+    def id(self):
+        return self._id
+
+    def is_a(self):
+        return "IfcWall" if self._id % 2 else "IfcColumn"
+
+
+class FakeFile:
+    """IFC file stand-in resolving entity ids."""
+
+    def by_id(self, element_id):
+        return FakeElement(element_id)
+
+
+class FakeGeometryEngine:
+    """Returns no shape for every seventh element and fails on every eleventh."""
+
+    def generate_shape(self, element, element_hash=None):
+        if element.id() % 11 == 0:
+            raise RuntimeError("tessellation failed")
+        return None if element.id() % 7 == 0 else element.id()
+
+
+class FakeSectionProcessor:
+    """Produces one square outline per shape, offset by the element id."""
+
+    def process_shape_section(self, shape, z_height, ifc_class, element_guid):
+        x = float(shape)
+        points = [(x, z_height), (x + 1.0, z_height), (x + 1.0, z_height + 1.0), (x, z_height + 1.0)]
+        return [Polyline2D(points=points, ifc_class=ifc_class, element_guid=element_guid, is_closed=True)]
+
+
+def fake_initialize_worker(input_path, config):
+    """Install fake worker state instead of opening the IFC file."""
+    element_sharding._worker_file = FakeFile()
+    element_sharding._worker_geometry_engine = FakeGeometryEngine()
+    element_sharding._worker_section_processor = FakeSectionProcessor()
+
+
+def make_config(**performance):
+    """Create a configuration with element-level multiprocessing settings."""
+    return Config(
+        input_path="model.ifc",
+        output_dir="out",
+        cut_offset_m=1.05,
+        performance=PerformanceConfig(element_multiprocessing=True, **performance)
+    )
+
+
+def section_sequentially(elements, cut_height):
+    """Reference result produced one element at a time in the main process."""
+    engine, processor = FakeGeometryEngine(), FakeSectionProcessor()
+    polylines, element_count = [], 0
+    for element in elements:
+        try:
+            section_polylines = section_element(engine, processor, element, cut_height)
+        except RuntimeError:
+            continue
+        if section_polylines:
+            polylines.extend(section_polylines)
+            element_count += 1
+    return polylines, element_count
+
+
+class TestElementShardProcessor:
+    """Test cases for ElementShardProcessor."""
+
+    def test_polyline_records_round_trip(self):
+        """Test that compact records decode to equal polylines."""
+        polylines = [
+            Polyline2D(points=[(0.0, 0.0), (2.5, -1.25)], ifc_class="IfcWall", element_guid="A"),
+            Polyline2D(points=[(1.0, 1.0), (2.0, 1.0), (2.0, 2.0)], ifc_class="IfcSlab",
+                       element_guid="B", is_closed=True)
+        ]
+
+        assert decode_polylines(encode_polylines(polylines)) == polylines
+
+    def test_shards_are_contiguous(self):
+        """Test that shards preserve element order and respect the batch size."""
+        processor = ElementShardProcessor(make_config(element_workers=4, element_batch_size=10))
+        elements = [FakeElement(i) for i in range(1, 26)]
+
+        shards = processor.create_shards(elements)
+
+        assert [len(shard) for shard in shards] == [10, 10, 5]
+        assert sum(shards, []) == list(range(1, 26))
+
+    def test_should_shard(self):
+        """Test that small storeys and single-worker configurations stay sequential."""
+        processor = ElementShardProcessor(make_config(element_workers=4, element_batch_size=10))
+        assert not processor.should_shard(19)
+        assert processor.should_shard(20)
+
+        single = ElementShardProcessor(make_config(element_workers=1, element_batch_size=10))
+        assert not single.should_shard(1000)
+
+    def test_parallel_result_matches_sequential(self):
+        """Test that sharded sectioning merges to the sequential result."""
+        elements = [FakeElement(i) for i in range(1, 101)]
+        expected = section_sequentially(elements, 1.05)
+
+        with patch.object(element_sharding, 'ProcessPoolExecutor', ThreadPoolExecutor), \
+                patch.object(element_sharding, '_initialize_worker', fake_initialize_worker):
+            with ElementShardProcessor(make_config(element_workers=4, element_batch_size=7)) as processor:
+                polylines, element_count = processor.process_elements(elements, 1.05)
+                assert processor.get_performance_info()['pool_running']
+
+        assert (polylines, element_count) == expected
+        assert [p.element_guid for p in polylines] == sorted(p.element_guid for p in polylines)
+
+    def test_precomputed_hashes_reach_worker_engine(self):
+        """Test that element hashes known to the caller are passed to the worker's engine."""
+        received = {}
+
+        class HashRecordingEngine(FakeGeometryEngine):
+            def generate_shape(self, element, element_hash=None):
+                received[element.GlobalId] = element_hash
+                return super().generate_shape(element, element_hash)
+
+        def recording_initializer(input_path, config):
+            fake_initialize_worker(input_path, config)
+            element_sharding._worker_geometry_engine = HashRecordingEngine()
+
+        elements = [FakeElement(i) for i in range(1, 21)]
+        hashes = {element.GlobalId: f"hash{element.id()}" for element in elements}
+
+        with patch.object(element_sharding, 'ProcessPoolExecutor', ThreadPoolExecutor), \
+                patch.object(element_sharding, '_initialize_worker', recording_initializer):
+            with ElementShardProcessor(make_config(element_workers=2, element_batch_size=6)) as processor:
+                processor.process_elements_at_heights(elements, [1.05], hashes)
+
+        assert received == hashes
+
+    def test_failed_elements_are_reported_by_guid(self):
+        """Test that elements failing in a worker are collected by GUID."""
+        elements = [FakeElement(i) for i in range(1, 41)]
+        failed_guids = set()
+
+        with patch.object(element_sharding, 'ProcessPoolExecutor', ThreadPoolExecutor), \
+                patch.object(element_sharding, '_initialize_worker', fake_initialize_worker):
+            with ElementShardProcessor(make_config(element_workers=2, element_batch_size=8)) as processor:
+                processor.process_elements_at_heights(elements, [1.05], failed_guids=failed_guids)
+
+        assert failed_guids == {"GUID_0011", "GUID_0022", "GUID_0033"}
+
+    def test_worker_closes_disk_cache_on_exit(self):
+        """Test that the worker initializer registers closing the geometry engine's cache."""
+        with patch('ifcopenshell.open'), \
+                patch('ifc_floor_plan_generator.geometry.engine.GeometryEngine') as engine_class, \
+                patch('ifc_floor_plan_generator.geometry.section_processor.SectionProcessor'), \
+                patch.object(element_sharding, 'Finalize') as finalize:
+            element_sharding._initialize_worker("model.ifc", make_config())
+
+        finalize.assert_called_once_with(None, engine_class.return_value.close_cache, exitpriority=10)
+
+    def test_pool_failure_raises_processing_error(self):
+        """Test that a failing pool is shut down and reported."""
+        def broken_initializer(input_path, config):
+            raise RuntimeError("cannot open file")
+
+        with patch.object(element_sharding, 'ProcessPoolExecutor', ThreadPoolExecutor), \
+                patch.object(element_sharding, '_initialize_worker', broken_initializer):
+            processor = ElementShardProcessor(make_config(element_workers=2, element_batch_size=5))
+
+            with pytest.raises(ProcessingError) as excinfo:
+                processor.process_elements([FakeElement(i) for i in range(1, 11)], 1.05)
+
+        assert excinfo.value.error_code == "MULTIPROCESSING_ERROR"
+        assert not processor.get_performance_info()['pool_running']
+
+    def test_performance_config_validation(self):
+        """Test element-level settings validation."""
+        with pytest.raises(ValueError):
+            PerformanceConfig(element_workers=0)
+        with pytest.raises(ValueError):
+            PerformanceConfig(element_batch_size=0)
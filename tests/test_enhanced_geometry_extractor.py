@@ -355,6 +355,118 @@ class TestEnhancedGeometryExtraction:
             assert "SPACE003" in exc_info.value.affected_spaces
 
 
+class TestBatchGeometryExtraction:
+    """Test cases for multi-threaded batch meshing of spaces."""
+
+    class FakeIterator:
+        """Stand-in for ifcopenshell.geom.iterator yielding prepared shapes."""
+
+        def __init__(self, shapes):
+            self.shapes = shapes
+            self.index = 0
+
+        def initialize(self):
+            return bool(self.shapes)
+
+        def get(self):
+            return self.shapes[self.index]
+
+        def next(self):
+            self.index += 1
+            return self.index < len(self.shapes)
+
+    @pytest.fixture
+    def ifc_file(self):
+        """Create a real in-memory IFC file with two spaces."""
+        import ifcopenshell
+        import ifcopenshell.guid
+        ifc_file = ifcopenshell.file(schema="IFC4")
+        for name in ("101", "102"):
+            ifc_file.createIfcSpace(GlobalId=ifcopenshell.guid.new(), Name=name)
+        return ifc_file
+
+    def _shape(self, guid):
+        geometry = Mock()
+        geometry.verts = [0.0, 0.0, 0.0, 4.0, 0.0, 0.0, 4.0, 3.0, 0.0, 0.0, 3.0, 0.0]
+        return Mock(guid=guid, geometry=geometry)
+
+    def test_threads_configuration(self):
+        """Test that the thread count is configurable and at least one."""
+        with patch('ifc_room_schedule.visualization.geometry_extractor.IFC_AVAILABLE', True):
+            assert GeometryExtractor(geometry_threads=4).geometry_threads == 4
+            assert GeometryExtractor(geometry_threads=None).geometry_threads >= 1
+
+    def test_prefetch_skips_non_ifcopenshell_files(self, geometry_extractor, mock_ifc_file):
+        """Test that batch meshing is skipped for objects that are not IFC files."""
+        assert geometry_extractor.prefetch_space_geometry(mock_ifc_file) == 0
+
+    def test_prefetch_disabled(self, ifc_file):
+        """Test that batch meshing can be disabled."""
+        with patch('ifc_room_schedule.visualization.geometry_extractor.IFC_AVAILABLE', True):
+            extractor = GeometryExtractor(batch_geometry=False)
+        assert extractor.prefetch_space_geometry(ifc_file) == 0
+
+    def test_prefetch_uses_iterator_with_threads(self, ifc_file):
+        """Test that spaces are meshed through the iterator in one pass."""
+        spaces = ifc_file.by_type("IfcSpace")
+        shapes = [self._shape(spaces[0].GlobalId)]
+
+        with patch('ifc_room_schedule.visualization.geometry_extractor.IFC_AVAILABLE', True):
+            extractor = GeometryExtractor(geometry_threads=3)
+
+        with patch('ifcopenshell.geom.settings'), \
+                patch('ifcopenshell.geom.iterator', return_value=self.FakeIterator(shapes)) as mock_iterator:
+            meshed = extractor.prefetch_space_geometry(ifc_file)
+            # Second call is a no-op because every space was already attempted
+            extractor.prefetch_space_geometry(ifc_file)
+
+        assert meshed == 1
+        assert mock_iterator.call_count == 1
+        assert mock_iterator.call_args[0][2] == 3
+        assert extractor._is_batch_meshed(spaces[0].GlobalId)
+        assert not extractor._is_batch_meshed(spaces[1].GlobalId)
+
+    def test_batch_geometry_used_instead_of_create_shape(self, ifc_file):
+        """Test that meshed spaces skip create_shape and unmeshed spaces fall back to it."""
+        spaces = ifc_file.by_type("IfcSpace")
+        shapes = [self._shape(spaces[0].GlobalId)]
+
+        with patch('ifc_room_schedule.visualization.geometry_extractor.IFC_AVAILABLE', True):
+            extractor = GeometryExtractor()
+
+        with patch('ifcopenshell.geom.settings'), \
+                patch('ifcopenshell.geom.iterator', return_value=self.FakeIterator(shapes)):
+            extractor.prefetch_space_geometry(ifc_file)
+
+        with patch('ifcopenshell.geom.create_shape', side_effect=RuntimeError("no shape")) as mock_create:
+            polygon = extractor._extract_polygon_with_ifcopenshell(spaces[0], spaces[0].GlobalId, "101")
+            assert polygon is not None
+            assert abs(polygon.get_area() - 12.0) < 0.01
+            mock_create.assert_not_called()
+
+            extractor._extract_with_ifcopenshell_geom(spaces[1], spaces[1].GlobalId, "102")
+            assert mock_create.call_count == len(GeometryExtractor.SPACE_GEOMETRY_SETTINGS)
+
+    def test_clear_batch_geometry(self, ifc_file):
+        """Test releasing batch geometry for a subset of spaces."""
+        spaces = ifc_file.by_type("IfcSpace")
+        shapes = [self._shape(space.GlobalId) for space in spaces]
+
+        with patch('ifc_room_schedule.visualization.geometry_extractor.IFC_AVAILABLE', True):
+            extractor = GeometryExtractor()
+
+        with patch('ifcopenshell.geom.settings'), \
+                patch('ifcopenshell.geom.iterator', return_value=self.FakeIterator(shapes)):
+            assert extractor.prefetch_space_geometry(ifc_file) == 2
+
+        extractor.clear_batch_geometry([spaces[0].GlobalId])
+        assert not extractor._is_batch_meshed(spaces[0].GlobalId)
+        assert extractor._is_batch_meshed(spaces[1].GlobalId)
+
+        extractor.clear_batch_geometry()
+        assert not extractor._is_batch_meshed(spaces[1].GlobalId)
+
+
 class TestGeometryExtractionError:
     """Test cases for GeometryExtractionError exception."""
 
@@ -0,0 +1,151 @@
+"""
+Test cases for demand-driven section building in EnhancedJsonBuilder.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from ifc_room_schedule.export.enhanced_json_builder import EnhancedJsonBuilder
+from ifc_room_schedule.config.section_configuration import ExportProfile, SectionSettings
+from ifc_room_schedule.data.enhanced_room_schedule_model import Phase
+from ifc_room_schedule.data.space_model import SpaceData
+from ifc_room_schedule.parsers.ns8360_name_parser import NS8360NameParser
+
+
+CORE_SECTIONS = ["identification", "ifc_metadata", "geometry", "classification"]
+
+PHASE_2_MAPPERS = [
+    ("performance_requirements_mapper", "extract_performance_requirements"),
+    ("finishes_mapper", "extract_surface_finishes"),
+    ("openings_mapper", "extract_openings"),
+    ("fixtures_mapper", "extract_fixtures"),
+    ("hse_mapper", "extract_hse_requirements"),
+    ("qaqc_mapper", "extract_qa_qc_requirements"),
+    ("interfaces_mapper", "extract_interfaces"),
+    ("logistics_mapper", "extract_logistics"),
+    ("commissioning_mapper", "extract_commissioning")
+]
+
+
+def create_space(name, index=0):
+    """Create a space without surfaces."""
+    return SpaceData(
+        guid=f"test_space_{index}",
+        name=name,
+        long_name=f"{name} | 02",
+        description="Test space",
+        object_type="IfcSpace",
+        zone_category="A101",
+        number=f"{index:03d}",
+        elevation=0.0,
+        quantities={"Height": 2.4, "NetFloorArea": 25.0},
+        surfaces=[],
+        space_boundaries=[],
+        relationships=[]
+    )
+
+
+class TestEnhancedJsonSections:
+    """Test cases for section selection and shared inputs."""
+
+    @pytest.fixture
+    def builder(self):
+        """Create an EnhancedJsonBuilder."""
+        builder = EnhancedJsonBuilder()
+        builder.set_source_file("test.ifc")
+        return builder
+
+    def test_profile_sections(self, builder):
+        """Test the sections each predefined profile enables."""
+        assert builder.get_space_sections("minimal") == ["identification", "ifc_metadata", "geometry"]
+        assert builder.get_space_sections("core") == CORE_SECTIONS
+        assert builder.get_space_sections("advanced") == CORE_SECTIONS + [
+            "performance_requirements", "finishes", "openings"
+        ]
+        assert builder.get_space_sections("production") == list(EnhancedJsonBuilder.SPACE_SECTIONS)
+        assert builder.get_space_sections("unknown") == CORE_SECTIONS
+
+    def test_custom_profile(self, builder):
+        """Test that a custom profile builds only the sections it enables."""
+        profile = ExportProfile(
+            name="Fixtures",
+            description="Geometry and fixtures",
+            phase=Phase.PRODUCTION,
+            section_settings={
+                "geometry_enhanced": SectionSettings(enabled=True),
+                "fixtures": SectionSettings(enabled=True),
+                "hse": SectionSettings(enabled=False)
+            }
+        )
+
+        space_dict = builder._build_enhanced_space_dict(create_space("SPC-02-A101-130-001"), profile)
+
+        assert list(space_dict) == [
+            "guid", "properties", "geometry", "fixtures_and_equipment",
+            "surfaces", "space_boundaries", "relationships"
+        ]
+
+    def test_disabled_sections_not_computed(self, builder):
+        """Test that the minimal profile never calls the mappers of disabled sections."""
+        patches = [patch.object(getattr(builder, mapper), method) for mapper, method in PHASE_2_MAPPERS]
+        patches.append(patch.object(builder.classification_mapper, "map_classification"))
+        mocks = [p.start() for p in patches]
+        try:
+            builder.build_enhanced_json_structure([create_space("SPC-02-A101-111-001")], export_profile="minimal")
+        finally:
+            for p in patches:
+                p.stop()
+
+        for mock in mocks:
+            mock.assert_not_called()
+
+    def test_name_parsed_once_per_space(self, builder):
+        """Test that all production sections share one parsed name."""
+        spaces = [create_space("SPC-02-A101-111-001", 0), create_space("Bad 2", 1)]
+
+        with patch.object(NS8360NameParser, "parse", autospec=True, side_effect=NS8360NameParser.parse) as parse:
+            builder.build_enhanced_json_structure(spaces, export_profile="production")
+
+        assert parse.call_count == len(spaces)
+
+    def test_input_plan(self, builder):
+        """Test that shared inputs are planned after their dependencies and only when needed."""
+        assert builder._plan_space_inputs(["geometry"]) == []
+        assert builder._plan_space_inputs(["ifc_metadata"]) == ["parsed_name"]
+        assert builder._plan_space_inputs(["geometry", "commissioning"]) == ["parsed_name", "ns3940", "room_type"]
+
+    @pytest.mark.parametrize("name", [
+        "SPC-02-A101-130-001", "SPC-01-999-002", "Kjøkken", "Ukjent rom", ""
+    ])
+    def test_shared_inputs_match_mappers(self, builder, name):
+        """Test that shared inputs give the mappers what they derive themselves."""
+        space = create_space(name)
+        inputs = {}
+        for input_name in builder._plan_space_inputs(list(EnhancedJsonBuilder.SPACE_SECTIONS)):
+            inputs[input_name] = builder.input_builders[input_name](space, inputs)
+
+        assert inputs["room_type"] == builder.fixtures_mapper._get_room_type(space)
+        assert builder.classification_mapper.map_classification(
+            space, inputs["parsed_name"], inputs["ns3940"]
+        ) == builder.classification_mapper.map_classification(space)
+        assert builder.identification_mapper.map_identification(
+            space, "test.ifc", inputs["parsed_name"], inputs["ns3940"]
+        ) == builder.identification_mapper.map_identification(space, "test.ifc")
+
+    def test_selected_sections(self, builder):
+        """Test building an explicit selection, kept in output order."""
+        space_dict = builder._build_enhanced_space_dict(
+            create_space("SPC-02-A101-111-001"), sections=["classification", "identification", "surfaces"]
+        )
+
+        assert list(space_dict)[2:4] == ["identification", "classification"]
+        assert "geometry" not in space_dict
+
+    def test_minimal_export_validates(self, builder, tmp_path):
+        """Test that exports without the classification section pass validation."""
+        success, messages = builder.export_enhanced_json(
+            [create_space("SPC-02-A101-111-001")], str(tmp_path / "minimal.json"), export_profile="minimal"
+        )
+
+        assert success, messages
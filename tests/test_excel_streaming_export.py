@@ -0,0 +1,182 @@
+"""
+Test cases for the streaming Excel export.
+"""
+
+import tracemalloc
+
+import pytest
+
+try:
+    from openpyxl import load_workbook
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+from ifc_room_schedule.export import excel_exporter
+from ifc_room_schedule.export.excel_exporter import ExcelExporter
+from ifc_room_schedule.data.space_model import SpaceData
+from ifc_room_schedule.data.surface_model import SurfaceData
+from ifc_room_schedule.data.space_boundary_model import SpaceBoundaryData
+from ifc_room_schedule.data.relationship_model import RelationshipData
+
+
+def create_space(index):
+    """Create a space with surfaces, boundaries and a relationship."""
+    guid = f"space_guid_{index:05d}"
+    surfaces = [
+        SurfaceData(id=f"surface_{index}_{j}", type=["Wall", "Floor", "Ceiling"][j % 3], area=10.0 + j,
+                    material="Concrete", ifc_type="IfcWall", related_space_guid=guid)
+        for j in range(4)
+    ]
+    boundaries = [
+        SpaceBoundaryData(
+            id=f"boundary_{index}_{j}", guid=f"boundary_guid_{index}_{j}", name=f"Boundary {j}",
+            description="", physical_or_virtual_boundary="Physical", internal_or_external_boundary="Internal",
+            related_building_element_guid=f"wall_{index}_{j}", related_building_element_name="Wall",
+            related_building_element_type="IfcWall", related_space_guid=guid,
+            boundary_surface_type=["Wall", "Floor"][j % 2], boundary_orientation="North",
+            connection_geometry={}, calculated_area=5.0 + j, boundary_level=1, display_label=f"Wall {j}"
+        )
+        for j in range(4)
+    ]
+    return SpaceData(
+        guid=guid,
+        name=f"{index:03d}",
+        long_name=f"Office Room {index}" + (" with a long name" if index == 1 else ""),
+        description="Office",
+        object_type="Office",
+        zone_category="Work",
+        number=str(index),
+        elevation=0.0,
+        quantities={"Height": 3.0},
+        surfaces=surfaces,
+        space_boundaries=boundaries,
+        relationships=[RelationshipData(related_entity_guid="zone_1", related_entity_name="Zone",
+                                        related_entity_description="", relationship_type="Contains",
+                                        ifc_relationship_type="IfcRelContainedInSpatialStructure")],
+        processed=index % 2 == 0
+    )
+
+
+def sheet_contents(path):
+    """Get values, merged cells and column widths per sheet, without the export date."""
+    wb = load_workbook(path)
+    contents = {}
+    for ws in wb.worksheets:
+        values = [row for row in ws.iter_rows(values_only=True) if row[0] != "Export Date:"]
+        widths = {letter: dimension.width for letter, dimension in ws.column_dimensions.items()}
+        contents[ws.title] = (values, sorted(str(cells) for cells in ws.merged_cells.ranges), widths)
+    return wb.sheetnames, contents
+
+
+def peak_memory(export):
+    """Get the peak traced memory of a call."""
+    tracemalloc.start()
+    try:
+        export()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.skipif(not OPENPYXL_AVAILABLE, reason="openpyxl not available")
+class TestStreamingExcelExport:
+    """Test cases for streaming Excel export."""
+
+    def test_matches_regular_export(self, tmp_path):
+        """Test that streaming writes the same sheets, values, merges and widths."""
+        spaces = [create_space(i) for i in range(20)]
+        exporter = ExcelExporter()
+        exporter.set_source_file("/test/source.ifc")
+
+        assert exporter.export_to_excel(spaces, str(tmp_path / "regular.xlsx"), streaming=False)[0]
+        assert exporter.export_to_excel(spaces, str(tmp_path / "streamed.xlsx"), streaming=True)[0]
+
+        assert sheet_contents(tmp_path / "streamed.xlsx") == sheet_contents(tmp_path / "regular.xlsx")
+
+    def test_styles_applied(self, tmp_path):
+        """Test that headers and cells get the named styles."""
+        path = tmp_path / "streamed.xlsx"
+        assert ExcelExporter().export_to_excel([create_space(0)], str(path), streaming=True)[0]
+
+        wb = load_workbook(path)
+        assert wb["Spaces"]["A1"].font.bold is True
+        assert wb["Spaces"]["A1"].fill.fgColor.rgb.endswith("366092")
+        assert wb["Spaces"]["A2"].border.left.style == "thin"
+        assert wb["Overview"]["A1"].font.size == 16
+        assert wb["Summary"]["A4"].font.bold is True
+
+    def test_generator_input(self, tmp_path):
+        """Test that spaces can be generated while the workbook is written."""
+        path = tmp_path / "generated.xlsx"
+
+        success, message = ExcelExporter().export_to_excel(
+            (create_space(i) for i in range(30)), str(path), include_relationships=False, streaming=True
+        )
+
+        assert success
+        assert "Successfully exported 30 spaces" in message
+        wb = load_workbook(path)
+        assert wb.sheetnames == ["Overview", "Spaces", "Surfaces", "Space Boundaries", "Summary"]
+        assert wb["Surfaces"].max_row == 1 + 30 * 4
+
+    def test_generator_input_without_streaming_flag(self, tmp_path):
+        """Test that generated spaces are streamed by default and listed when streaming is off."""
+        for streaming in (None, False):
+            success, message = ExcelExporter().export_to_excel(
+                (create_space(i) for i in range(3)), str(tmp_path / f"generated_{streaming}.xlsx"),
+                streaming=streaming
+            )
+
+            assert success, message
+            assert "Successfully exported 3 spaces" in message
+
+    def test_widths_fixed_after_sample(self, tmp_path, monkeypatch):
+        """Test that columns are sized from the rows up to the sample size."""
+        monkeypatch.setattr(excel_exporter, "STREAMING_WIDTH_SAMPLE_ROWS", 3)
+        path = tmp_path / "sampled.xlsx"
+        spaces = [create_space(i) for i in range(5)]
+        spaces[4].long_name = "x" * 40
+
+        assert ExcelExporter().export_to_excel(spaces, str(path), streaming=True)[0]
+
+        spaces_ws = load_workbook(path)["Spaces"]
+        assert spaces_ws.column_dimensions["C"].width == len("Office Room 1 with a long name") + 2
+        assert spaces_ws["C6"].value == "x" * 40
+
+    def test_streams_from_threshold(self, tmp_path, monkeypatch):
+        """Test that large exports stream by default."""
+        monkeypatch.setattr(excel_exporter, "STREAMING_SPACE_THRESHOLD", 3)
+        exporter = ExcelExporter()
+        calls = []
+        original = exporter._create_streaming_workbook
+        monkeypatch.setattr(exporter, "_create_streaming_workbook",
+                            lambda *args: calls.append(len(args[0])) or original(*args))
+
+        exporter.export_to_excel([create_space(i) for i in range(2)], str(tmp_path / "small.xlsx"))
+        exporter.export_to_excel([create_space(i) for i in range(3)], str(tmp_path / "large.xlsx"))
+
+        assert calls == [3]
+
+
+@pytest.mark.skipif(not OPENPYXL_AVAILABLE, reason="openpyxl not available")
+class TestStreamingExcelMemory:
+    """Check that streaming memory does not grow with the number of spaces."""
+
+    def test_peak_memory_constant(self, tmp_path):
+        """Test that four times the spaces barely raise the streaming peak."""
+        exporter = ExcelExporter()
+
+        def streamed(count, name):
+            return peak_memory(lambda: exporter.export_to_excel(
+                (create_space(i) for i in range(count)), str(tmp_path / name), streaming=True))
+
+        small = streamed(250, "small.xlsx")
+        large = streamed(1000, "large.xlsx")
+        regular = peak_memory(lambda: exporter.export_to_excel(
+            [create_space(i) for i in range(1000)], str(tmp_path / "regular.xlsx"), streaming=False))
+
+        print(f"\nStreaming peak: {small / 1e6:.1f}MB (250), {large / 1e6:.1f}MB (1000); "
+              f"regular: {regular / 1e6:.1f}MB (1000)")
+        assert large < small * 1.5
+        assert large * 5 < regular
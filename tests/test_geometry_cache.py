@@ -302,32 +302,43 @@ class TestGeometryCacheWithDisk:
         assert self.cache_dir.exists()
         assert self.cache_dir.is_dir()
     
-    @patch('ifc_floor_plan_generator.geometry.cache.pickle')
-    def test_disk_cache_operations(self, mock_pickle):
+    @patch('ifc_floor_plan_generator.geometry.cache.decode_shape')
+    @patch('ifc_floor_plan_generator.geometry.cache.encode_shape')
+    def test_disk_cache_operations(self, mock_encode, mock_decode):
         """Test disk cache save/load operations."""
-        # Mock pickle operations
-        mock_pickle.dump = Mock()
-        mock_pickle.load = Mock(return_value=CacheEntry(
-            shape=self.test_shape,
-            timestamp=datetime.now(),
-            config_hash="test_hash"
-        ))
+        # Mock BRep serialisation
+        mock_encode.return_value = b"brep data"
+        mock_decode.return_value = self.test_shape
         
         # Store shape (should save to disk)
-        self.cache.put(self.test_guid, self.test_shape)
-        
-        # Verify pickle.dump was called
-        assert mock_pickle.dump.called
+        self.cache.put(self.test_guid, self.test_shape, element_hash="rev1")
+        assert mock_encode.called
+        assert (self.cache_dir / "geometry.sqlite").exists()
         
         # Clear memory cache
         self.cache._cache.clear()
         
-        # Mock file existence
-        with patch.object(Path, 'exists', return_value=True):
-            with patch('builtins.open', create=True):
-                # Retrieve should load from disk
-                retrieved = self.cache.get(self.test_guid)
-                assert mock_pickle.load.called
+        # Retrieve should load from disk
+        retrieved = self.cache.get(self.test_guid, element_hash="rev1")
+        mock_decode.assert_called_once_with(b"brep data")
+        assert retrieved == self.test_shape
+        
+        # Another revision of the element misses
+        self.cache._cache.clear()
+        assert self.cache.get(self.test_guid, element_hash="rev2") is None
+    
+    @patch('ifc_floor_plan_generator.geometry.cache.decode_shape')
+    @patch('ifc_floor_plan_generator.geometry.cache.encode_shape')
+    def test_disk_cache_survives_memory_eviction(self, mock_encode, mock_decode):
+        """Test that entries evicted from memory are still found on disk."""
+        mock_encode.return_value = b"brep data"
+        mock_decode.return_value = self.test_shape
+        
+        self.cache.put(self.test_guid, self.test_shape)
+        self.cache._evict_lru_entries(1)
+        
+        assert len(self.cache) == 0
+        assert self.cache.get(self.test_guid) == self.test_shape
 
 
 class TestCacheEntry:
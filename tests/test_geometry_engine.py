@@ -102,7 +102,8 @@ class TestGeometryEngineInitialization:
                         max_entries=500,
                         ttl_hours=12.0,
                         enable_disk_cache=True,
-                        disk_cache_dir=None
+                        disk_cache_dir=None,
+                        max_disk_mb=1024.0
                     )
 
 
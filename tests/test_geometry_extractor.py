@@ -5,7 +5,9 @@ Unit tests for GeometryExtractor class.
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from ifc_room_schedule.visualization.geometry_extractor import GeometryExtractor, GeometryExtractionError
-from ifc_room_schedule.visualization.geometry_models import Point2D, Polygon2D, FloorLevel, FloorGeometry
+from ifc_room_schedule.visualization.geometry_models import (
+    Point2D, Polygon2D, ArrayPolygon2D, FloorLevel, FloorGeometry
+)
 
 
 class TestGeometryExtractor:
@@ -268,6 +270,76 @@ class TestGeometryExtractor:
         assert polygon.points[1].x == 1.0
         assert polygon.points[1].y == 0.0
     
+    def test_compact_polygons(self):
+        """Test that floor polygons are converted only when compact storage is enabled."""
+        points = [Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)]
+        rooms = [Polygon2D(points, "space_1", "Room 1")]
+        
+        assert GeometryExtractor()._finalize_room_polygons(rooms) is rooms
+        
+        compact = GeometryExtractor(compact_polygons=True)._finalize_room_polygons(rooms)
+        assert isinstance(compact[0], ArrayPolygon2D)
+        assert compact[0].get_area() == pytest.approx(12.0)
+    
+    def test_compact_polygons_built_from_mesh(self):
+        """Test that mesh outlines become ArrayPolygon2D without Point2D objects."""
+        extractor = GeometryExtractor(compact_polygons=True)
+        mock_geometry = Mock()
+        # Floor and ceiling of a 4 x 3 m room in millimetres
+        mock_geometry.verts = [
+            0.0, 0.0, 0.0, 4000.0, 0.0, 0.0, 4000.0, 3000.0, 0.0, 0.0, 3000.0, 0.0,
+            0.0, 0.0, 2700.0, 4000.0, 0.0, 2700.0, 4000.0, 3000.0, 2700.0, 0.0, 3000.0, 2700.0
+        ]
+        
+        with patch.object(extractor, '_get_batch_geometry', return_value=mock_geometry), \
+                patch('ifc_room_schedule.visualization.geometry_extractor.Point2D') as mock_point:
+            polygon = extractor._extract_polygon_with_ifcopenshell(Mock(), "space_1", "Room 1")
+            assert extractor._validate_polygon(polygon)
+        
+        mock_point.assert_not_called()
+        assert isinstance(polygon, ArrayPolygon2D)
+        assert polygon._points is None
+        assert polygon.get_bounds() == (0.0, 0.0, 4.0, 3.0)
+        assert polygon.get_area() == pytest.approx(12.0)
+    
+    def test_rejected_batch_geometry_falls_back_to_settings(self):
+        """Test that template-like batch geometry goes through the settings cascade like serial extraction."""
+        extractor = GeometryExtractor()
+        template = Polygon2D([Point2D(0, 0), Point2D(13.7, 0), Point2D(13.7, 5.67), Point2D(0, 5.67)],
+                             "space_1", "Room 1")
+        room = Polygon2D([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)], "space_1", "Room 1")
+        
+        with patch.object(extractor, '_is_batch_meshed', return_value=True), \
+                patch.object(extractor, '_get_batch_geometry', return_value=Mock()), \
+                patch.object(extractor, '_get_geometry_settings'), \
+                patch.object(extractor, 'convert_to_2d_coordinates', side_effect=[template, room]), \
+                patch('ifc_room_schedule.visualization.geometry_extractor.ifcopenshell.geom.create_shape') as create_shape:
+            polygon = extractor._extract_with_ifcopenshell_geom(Mock(), "space_1", "Room 1")
+        
+        assert polygon is room
+        create_shape.assert_called_once()
+    
+    def test_compact_polygons_default_to_large_models(self):
+        """Test that compact polygons are used for models that take the progressive path."""
+        mock_ifc_file = Mock()
+        
+        for space_count, expected in [(10, False), (500, True)]:
+            extractor = GeometryExtractor()
+            mock_ifc_file.by_type.side_effect = lambda entity_type: (
+                [Mock()] * space_count if entity_type == "IfcSpace" else [Mock()]
+            )
+            with patch.object(extractor, '_extract_geometry_progressive', return_value={}), \
+                    patch.object(extractor, '_extract_geometry_standard', return_value={}), \
+                    patch.object(extractor, 'prefetch_space_geometry'):
+                extractor.extract_floor_geometry(mock_ifc_file)
+            
+            assert extractor._use_compact_polygons is expected
+        
+        extractor = GeometryExtractor(compact_polygons=False)
+        with patch.object(extractor, '_extract_geometry_progressive', return_value={}):
+            extractor.extract_floor_geometry(mock_ifc_file)
+        assert extractor._use_compact_polygons is False
+    
     def test_convert_to_2d_coordinates_invalid_geometry(self):
         """Test conversion with invalid geometry."""
         extractor = GeometryExtractor()
@@ -311,4 +383,83 @@ class TestGeometryExtractor:
         assert polygon.space_guid == "space1"
         assert polygon.space_name == "Test Room"
         # Should create a 4x4 square (area = 16)
-        assert abs(polygon.get_area() - 16.0) < 1e-10
\ No newline at end of file
+        assert abs(polygon.get_area() - 16.0) < 1e-10
+
+def create_storey_model():
+    """Create a model with spaces assigned to storeys in different ways."""
+    import ifcopenshell
+    import ifcopenshell.api
+    import ifcopenshell.guid
+    
+    ifc_file = ifcopenshell.api.run("project.create_file", version="IFC4")
+    ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcProject", name="Project")
+    
+    def placement(relative_to, z):
+        location = ifc_file.createIfcAxis2Placement3D(ifc_file.createIfcCartesianPoint((0.0, 0.0, z)))
+        return ifc_file.createIfcLocalPlacement(relative_to, location)
+    
+    storeys = {}
+    for name, z in (("Ground", 0.0), ("First", 4.0), ("Second", 8.0)):
+        storey = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcBuildingStorey", name=name)
+        storey.ObjectPlacement = placement(None, z)
+        storeys[name] = storey
+    
+    def space(name, relative_to, z):
+        entity = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcSpace", name=name)
+        entity.ObjectPlacement = placement(relative_to, z)
+        return entity
+    
+    # Aggregated, contained, placed-only, and orphaned spaces
+    aggregated = space("Aggregated", storeys["Ground"].ObjectPlacement, 0.0)
+    ifcopenshell.api.run("aggregate.assign_object", ifc_file, relating_object=storeys["Ground"], products=[aggregated])
+    contained = space("Contained", None, 4.0)
+    ifc_file.createIfcRelContainedInSpatialStructure(
+        ifcopenshell.guid.new(), None, None, None, [contained], storeys["First"]
+    )
+    nested_placement = placement(storeys["Second"].ObjectPlacement, 0.0)
+    placed = space("Placed", nested_placement, 0.0)
+    orphan = space("Orphan", None, 0.5)
+    
+    return ifc_file, storeys, {s.Name: s.GlobalId for s in (aggregated, contained, placed, orphan)}
+
+
+class TestStoreyMembership:
+    """Test the storey -> space membership map."""
+    
+    def test_floor_levels_from_membership_map(self):
+        """Test aggregation, containment, placement and orphan handling."""
+        ifc_file, storeys, guids = create_storey_model()
+        extractor = GeometryExtractor()
+        
+        floor_levels = extractor.get_floor_levels(ifc_file)
+        floors = {floor.name: floor.spaces for floor in floor_levels}
+        
+        assert [floor.name for floor in floor_levels] == ["Ground", "First", "Second"]
+        assert floors["Ground"] == [guids["Aggregated"], guids["Orphan"]]
+        assert floors["First"] == [guids["Contained"]]
+        assert floors["Second"] == [guids["Placed"]]
+    
+    def test_relations_are_scanned_once(self):
+        """Test that storey lookups do not rescan relationships per storey."""
+        ifc_file, storeys, guids = create_storey_model()
+        extractor = GeometryExtractor()
+        
+        with patch.object(ifc_file, 'by_type', wraps=ifc_file.by_type) as by_type:
+            extractor.get_floor_levels(ifc_file)
+        
+        scanned = [call.args[0] for call in by_type.call_args_list]
+        assert scanned.count("IfcRelAggregates") == 1
+        assert scanned.count("IfcRelContainedInSpatialStructure") == 1
+    
+    def test_placement_chains_are_memoised(self):
+        """Test that every placement is resolved once and shared between spaces."""
+        ifc_file, storeys, guids = create_storey_model()
+        extractor = GeometryExtractor()
+        extractor._build_storey_membership(ifc_file)
+        
+        placed = ifc_file.by_guid(guids["Placed"])
+        parent = placed.ObjectPlacement.PlacementRelTo
+        
+        assert extractor._placement_storeys[parent.id()] == frozenset([storeys["Second"]])
+        assert extractor._is_space_on_storey(placed, storeys["Second"])
+        assert not extractor._is_space_on_storey(placed, storeys["Ground"])
@@ -5,7 +5,7 @@ Unit tests for geometric data models used in 2D floor plan visualization.
 import pytest
 import math
 from ifc_room_schedule.visualization.geometry_models import (
-    Point2D, Polygon2D, FloorLevel, FloorGeometry, FloorPlanState
+    Point2D, Polygon2D, ArrayPolygon2D, FloorLevel, FloorGeometry, FloorPlanState, RoomSpatialIndex
 )
 
 
@@ -278,6 +278,125 @@ class TestFloorGeometry:
         assert no_room is None
 
 
+def make_room_grid(columns, rows, size=4.0):
+    """Create square rooms laid out on a grid."""
+    rooms = []
+    for column in range(columns):
+        for row in range(rows):
+            x, y = column * size, row * size
+            points = [Point2D(x, y), Point2D(x + size, y), Point2D(x + size, y + size), Point2D(x, y + size)]
+            rooms.append(Polygon2D(points, f"space_{column}_{row}", f"Room {column}-{row}"))
+    return rooms
+
+
+class TestRoomSpatialIndex:
+    """Test RoomSpatialIndex functionality."""
+    
+    def test_point_query_matches_linear_scan(self):
+        """Test that indexed hit-testing finds the same room as checking every polygon."""
+        rooms = make_room_grid(20, 20)
+        geometry = FloorGeometry(FloorLevel("id", "name", 0.0), rooms)
+        
+        for x, y in [(1, 1), (41.5, 17.2), (79.9, 79.9), (12.0, 30.0), (-1, 5), (100, 100)]:
+            point = Point2D(x, y)
+            expected = next((room for room in rooms if room.contains_point(point)), None)
+            assert geometry.find_room_at_point(point) is expected
+    
+    def test_rect_query_culls_to_viewport(self):
+        """Test that rectangle queries return intersecting rooms in list order."""
+        rooms = make_room_grid(10, 10)
+        geometry = FloorGeometry(FloorLevel("id", "name", 0.0), rooms)
+        
+        visible = geometry.find_rooms_in_bounds((5.0, 5.0, 11.0, 7.0))
+        
+        assert [room.space_guid for room in visible] == [
+            "space_1_1", "space_2_1"
+        ]
+        assert len(geometry.find_rooms_in_bounds((-100, -100, 100, 100))) == 100
+        assert geometry.find_rooms_in_bounds((200, 200, 300, 300)) == []
+    
+    def test_oversized_rooms_are_always_candidates(self):
+        """Test that rooms spanning many cells are still found."""
+        rooms = make_room_grid(3, 3, size=1.0)
+        hall = Polygon2D([Point2D(-50, -50), Point2D(50, -50), Point2D(50, -10), Point2D(-50, -10)], "hall", "Hall")
+        index = RoomSpatialIndex(rooms + [hall], cell_size=1.0)
+        
+        assert index.query_point(40.0, -20.0) == [hall]
+        assert hall in index.query_rect(0.0, -15.0, 1.0, -12.0)
+    
+    def test_combined_bounds_and_rebuild(self):
+        """Test cached bounds for zooming and rebuilding after rooms are added."""
+        rooms = make_room_grid(2, 2)
+        geometry = FloorGeometry(FloorLevel("id", "name", 0.0), rooms)
+        
+        assert geometry.get_rooms_bounds(["space_0_0", "space_1_1"]) == (0.0, 0.0, 8.0, 8.0)
+        assert geometry.get_rooms_bounds(["missing"]) is None
+        
+        extra = make_room_grid(1, 1)[0].translate(20, 20)
+        geometry.room_polygons.append(extra)
+        assert geometry.find_room_at_point(Point2D(22, 22)) is extra
+
+
+class TestArrayPolygon2D:
+    """Test ArrayPolygon2D functionality."""
+    
+    def make_l_shape(self):
+        """Create an L-shaped room as a Point2D polygon."""
+        points = [Point2D(0, 0), Point2D(6, 0), Point2D(6, 2), Point2D(2, 2), Point2D(2, 5), Point2D(0, 5)]
+        return Polygon2D(points, "guid-l", "L Room")
+    
+    def test_matches_polygon2d(self):
+        """Test that bounds, area, centroid and tuples match Polygon2D."""
+        polygon = self.make_l_shape()
+        compact = ArrayPolygon2D.from_polygon(polygon)
+        
+        assert compact.get_bounds() == polygon.get_bounds()
+        assert compact.get_area() == pytest.approx(polygon.get_area())
+        assert compact.get_centroid().x == pytest.approx(polygon.get_centroid().x)
+        assert compact.get_centroid().y == pytest.approx(polygon.get_centroid().y)
+        assert compact.to_tuples() == polygon.to_tuples()
+        assert compact.points == polygon.points
+        assert compact.to_polygon() == polygon
+    
+    def test_contains_point_matches_polygon2d(self):
+        """Test that the vectorised ray cast agrees with Polygon2D."""
+        polygon = self.make_l_shape()
+        compact = ArrayPolygon2D.from_polygon(polygon)
+        samples = [(x * 0.5 + 0.25, y * 0.5 + 0.25) for x in range(-2, 14) for y in range(-2, 12)]
+        
+        expected = [polygon.contains_point(Point2D(x, y)) for x, y in samples]
+        
+        assert compact.contains_points(samples).tolist() == expected
+        assert [compact.contains_point(Point2D(x, y)) for x, y in samples] == expected
+    
+    def test_validation_and_closing(self):
+        """Test ring closing, default name and invalid input."""
+        square = ArrayPolygon2D([(0, 0), (1, 0), (1, 1), (0, 1)], "abcdefghij", "")
+        assert len(square.coordinates) == 5
+        assert square.space_name == "Space abcdefgh"
+        assert not square.coordinates.flags.writeable
+        
+        with pytest.raises(ValueError):
+            ArrayPolygon2D([(0, 0), (1, 1)], "guid", "Room")
+        with pytest.raises(ValueError):
+            ArrayPolygon2D([(0, 0), (1, 0), (float('nan'), 1)], "guid", "Room")
+        with pytest.raises(ValueError):
+            ArrayPolygon2D([(0, 0), (1, 0), (1, 1)], "", "Room")
+    
+    def test_transforms_and_floor_geometry(self):
+        """Test that transformed copies and floor queries work with compact rooms."""
+        rooms = [ArrayPolygon2D.from_polygon(room) for room in make_room_grid(3, 3)]
+        geometry = FloorGeometry(FloorLevel("id", "name", 0.0), rooms)
+        
+        assert geometry.bounds == (0.0, 0.0, 12.0, 12.0)
+        assert geometry.get_total_area() == pytest.approx(144.0)
+        assert geometry.find_room_at_point(Point2D(5, 9)).space_guid == "space_1_2"
+        
+        moved = rooms[0].translate(10, 0).scale(2.0)
+        assert moved.get_bounds() == (8.0, -2.0, 16.0, 6.0)
+        assert isinstance(moved, ArrayPolygon2D)
+
+
 class TestFloorPlanState:
     """Test FloorPlanState class functionality."""
     
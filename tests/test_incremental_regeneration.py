@@ -0,0 +1,258 @@
+"""
+Unit tests for incremental regeneration of floor plans.
+
+Covers the state file of a run, re-sectioning only changed or added elements of
+a new model revision, keeping unchanged output files, and the reuse counts in
+the manifest.
+"""
+
+import pytest
+import sys
+import os
+import json
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ifcopenshell
+import ifcopenshell.api
+
+from ifc_floor_plan_generator import main as generator_main
+from ifc_floor_plan_generator.main import FloorPlanGenerator
+from ifc_floor_plan_generator.models import Config, GeometryConfig, OutputConfig, PerformanceConfig, Polyline2D
+from ifc_floor_plan_generator.rendering.manifest_generator import ManifestGenerator
+from ifc_floor_plan_generator.performance.incremental import IncrementalState, config_fingerprint, STATE_FILENAME
+
+
+class DepthGeometryEngine:
+    """Records shape generation per element name; the shape depends on the wall height."""
+
+    generated = []
+    element_hashes = {}
+    failing = set()
+
+    def __init__(self, config, error_handler=None):
+        self.config = config
+
+    def generate_shape(self, element, element_hash=None):
+        DepthGeometryEngine.generated.append(element.Name)
+        DepthGeometryEngine.element_hashes[element.GlobalId] = element_hash
+        if element.Name in DepthGeometryEngine.failing:
+            raise RuntimeError("tessellation failed")
+        solid = element.Representation.Representations[0].Items[0]
+        return element.id() * 10.0 + solid.Depth
+
+    def close_cache(self):
+        pass
+
+    def get_cache_stats(self):
+        return {}
+
+
+class SquareSectionProcessor:
+    """Produces one square per shape at the cut height."""
+
+    def __init__(self, slice_tolerance=1e-6, chain_tolerance=1e-3):
+        pass
+
+    def process_shape_section(self, shape, z_height, ifc_class="Unknown", element_guid="unknown"):
+        x = float(shape)
+        points = [(x, z_height), (x + 1.0, z_height), (x + 1.0, z_height + 1.0), (x, z_height + 1.0)]
+        return [Polyline2D(points=points, ifc_class=ifc_class, element_guid=element_guid, is_closed=True)]
+
+
+def write_model(path, wall_heights):
+    """Write a one-storey model with a wall per name and height, with stable GUIDs."""
+    ifc_file = ifcopenshell.api.run("project.create_file", version="IFC4")
+    project = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcProject", name="Project")
+    ifcopenshell.api.run("unit.assign_unit", ifc_file, length={"is_metric": True, "raw": "METERS"})
+    model = ifcopenshell.api.run("context.add_context", ifc_file, context_type="Model")
+    body = ifcopenshell.api.run("context.add_context", ifc_file, context_type="Model",
+                                context_identifier="Body", target_view="MODEL_VIEW", parent=model)
+    building = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcBuilding", name="Building")
+    ifcopenshell.api.run("aggregate.assign_object", ifc_file, products=[building], relating_object=project)
+    storey = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcBuildingStorey", name="Level 0")
+    storey.Elevation = 0.0
+    ifcopenshell.api.run("aggregate.assign_object", ifc_file, products=[storey], relating_object=building)
+
+    for name, height in wall_heights.items():
+        wall = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcWall", name=name)
+        wall.GlobalId = f"0{name.replace(' ', '')}".ljust(22, "0")
+        representation = ifcopenshell.api.run("geometry.add_wall_representation", ifc_file, context=body,
+                                              length=5.0, height=height, thickness=0.2)
+        ifcopenshell.api.run("geometry.assign_representation", ifc_file, product=wall, representation=representation)
+        ifcopenshell.api.run("geometry.edit_object_placement", ifc_file, product=wall)
+        ifcopenshell.api.run("spatial.assign_container", ifc_file, products=[wall], relating_structure=storey)
+
+    ifc_file.write(str(path))
+    return str(path)
+
+
+def make_config(tmp_path, incremental=True, cut_offset_m=1.05):
+    """Create a configuration writing to the same output directory on every run."""
+    return Config(
+        input_path=str(tmp_path / "model.ifc"),
+        output_dir=str(tmp_path / "out"),
+        cut_offset_m=cut_offset_m,
+        geometry=GeometryConfig(cache_geometry=False),
+        output=OutputConfig(write_geojson=True),
+        performance=PerformanceConfig(incremental=incremental)
+    )
+
+
+def run(config):
+    """Run the full pipeline and return the processing result and the written manifest."""
+    DepthGeometryEngine.generated = []
+    DepthGeometryEngine.element_hashes = {}
+    with patch.object(generator_main, 'GeometryEngine', DepthGeometryEngine), \
+            patch.object(generator_main, 'SectionProcessor', SquareSectionProcessor), \
+            patch.object(FloorPlanGenerator, 'load_configuration', return_value=True):
+        result = FloorPlanGenerator.from_config(config).process_ifc_file()
+
+    assert result.success, result.error_message
+    with open(os.path.join(config.output_dir, config.output.manifest_filename)) as f:
+        return result, json.load(f)
+
+
+def storey_metadata(manifest):
+    """Get the metadata of the only storey in a manifest."""
+    storeys = manifest["storeys"]
+    assert len(storeys) == 1
+    return storeys[0]
+
+
+class TestIncrementalState:
+    """Test cases for IncrementalState."""
+
+    def test_state_round_trip(self, tmp_path):
+        """Test that a run leaves a state with fingerprints, polylines and output hashes."""
+        write_model(tmp_path / "model.ifc", {"Wall A": 3.0, "Wall B": 3.0})
+        config = make_config(tmp_path)
+        result, _ = run(config)
+
+        state = IncrementalState.load(str(tmp_path / "out" / STATE_FILENAME), config_fingerprint(config))
+
+        assert state is not None
+        assert state.unit_scale == result.unit_scale
+        assert set(state.storeys["Level 0"].fingerprints) == {"0WallA".ljust(22, "0"), "0WallB".ljust(22, "0")}
+        assert state.previous_output("Level 0")[1] == result.storeys[0].svg_file
+
+    def test_configuration_change_discards_state(self, tmp_path):
+        """Test that a state written with other section settings is not used."""
+        write_model(tmp_path / "model.ifc", {"Wall A": 3.0})
+        run(make_config(tmp_path))
+
+        state_path = str(tmp_path / "out" / STATE_FILENAME)
+        assert IncrementalState.load(state_path, config_fingerprint(make_config(tmp_path, cut_offset_m=0.9))) is None
+
+        run(make_config(tmp_path, cut_offset_m=0.9))
+        assert DepthGeometryEngine.generated == ["Wall A"]
+
+    def test_corrupt_state_is_ignored(self, tmp_path):
+        """Test that an unreadable state file gives a full run."""
+        config = make_config(tmp_path)
+        os.makedirs(config.output_dir)
+        with open(os.path.join(config.output_dir, STATE_FILENAME), 'wb') as f:
+            f.write(b"FPIS\x01not compressed")
+
+        assert IncrementalState.load(os.path.join(config.output_dir, STATE_FILENAME),
+                                     config_fingerprint(config)) is None
+
+
+class TestIncrementalRegeneration:
+    """Test incremental runs of the full pipeline."""
+
+    def test_only_changed_elements_are_sectioned(self, tmp_path):
+        """Test that a revision re-sections the changed wall and matches a full run."""
+        write_model(tmp_path / "model.ifc", {"Wall A": 3.0, "Wall B": 3.0, "Wall C": 3.0})
+        run(make_config(tmp_path))
+        assert sorted(DepthGeometryEngine.generated) == ["Wall A", "Wall B", "Wall C"]
+
+        write_model(tmp_path / "model.ifc", {"Wall A": 3.0, "Wall B": 2.5, "Wall C": 3.0})
+        result, manifest = run(make_config(tmp_path))
+
+        assert DepthGeometryEngine.generated == ["Wall B"]
+        storey = result.storeys[0]
+        assert storey.reused_element_count == 2
+        assert not storey.outputs_reused
+
+        full_result, _ = run(make_config(tmp_path, incremental=False))
+        assert storey.polylines == full_result.storeys[0].polylines
+        assert storey.element_count == full_result.storeys[0].element_count
+
+        assert storey_metadata(manifest)["incremental"] == {
+            "reused_element_count": 2,
+            "resectioned_element_count": 1,
+            "removed_element_count": 0,
+            "outputs_reused": False
+        }
+
+    def test_unchanged_outputs_are_not_rewritten(self, tmp_path):
+        """Test that an unchanged model keeps its SVG and GeoJSON files."""
+        write_model(tmp_path / "model.ifc", {"Wall A": 3.0, "Wall B": 3.0})
+        first, _ = run(make_config(tmp_path))
+        svg_file = first.storeys[0].svg_file
+        geojson_file = first.storeys[0].geojson_file
+        written = (os.stat(svg_file).st_mtime_ns, os.stat(geojson_file).st_mtime_ns)
+
+        with patch.object(generator_main.OutputCoordinator, '_generate_svg_for_storey',
+                          side_effect=AssertionError("rendered again")):
+            result, manifest = run(make_config(tmp_path))
+
+        storey = result.storeys[0]
+        assert DepthGeometryEngine.generated == []
+        assert storey.outputs_reused
+        assert (storey.svg_file, storey.geojson_file) == (svg_file, geojson_file)
+        assert (os.stat(svg_file).st_mtime_ns, os.stat(geojson_file).st_mtime_ns) == written
+        assert storey_metadata(manifest)["incremental"]["outputs_reused"] is True
+        assert ManifestGenerator().create_summary_statistics(result.storeys)["total_reused_elements"] == 2
+
+    def test_fingerprint_hash_is_reused_for_geometry(self, tmp_path):
+        """Test that the hash computed for the fingerprint is passed on to shape generation."""
+        write_model(tmp_path / "model.ifc", {"Wall A": 3.0, "Wall B": 3.0})
+        config = make_config(tmp_path)
+
+        with patch.object(generator_main.ElementFingerprinter, 'element_hash',
+                          autospec=True, side_effect=lambda self, element: f"hash-{element.Name}") as element_hash:
+            run(config)
+
+        assert element_hash.call_count == 2
+        state = IncrementalState.load(str(tmp_path / "out" / STATE_FILENAME), config_fingerprint(config))
+        assert DepthGeometryEngine.element_hashes == {
+            guid: fingerprint.split(":", 1)[1] for guid, fingerprint in state.storeys["Level 0"].fingerprints.items()
+        }
+
+    def test_failed_elements_are_sectioned_again(self, tmp_path):
+        """Test that an element whose sectioning failed is not reused as empty in the next run."""
+        write_model(tmp_path / "model.ifc", {"Wall A": 3.0, "Wall B": 3.0})
+        DepthGeometryEngine.failing = {"Wall B"}
+        try:
+            first, _ = run(make_config(tmp_path))
+        finally:
+            DepthGeometryEngine.failing = set()
+        assert {polyline.element_guid for polyline in first.storeys[0].polylines} == {"0WallA".ljust(22, "0")}
+
+        result, _ = run(make_config(tmp_path))
+
+        assert DepthGeometryEngine.generated == ["Wall B"]
+        assert result.storeys[0].reused_element_count == 1
+        assert {polyline.element_guid for polyline in result.storeys[0].polylines} == {
+            "0WallA".ljust(22, "0"), "0WallB".ljust(22, "0")
+        }
+
+    def test_removed_and_added_elements(self, tmp_path):
+        """Test that removed walls are counted and added walls are sectioned."""
+        write_model(tmp_path / "model.ifc", {"Wall A": 3.0, "Wall B": 3.0})
+        run(make_config(tmp_path))
+
+        write_model(tmp_path / "model.ifc", {"Wall A": 3.0, "Wall D": 3.0})
+        result, _ = run(make_config(tmp_path))
+
+        storey = result.storeys[0]
+        assert DepthGeometryEngine.generated == ["Wall D"]
+        assert storey.reused_element_count == 1
+        assert storey.removed_element_count == 1
+        assert {polyline.element_guid for polyline in storey.polylines} == {
+            "0WallA".ljust(22, "0"), "0WallD".ljust(22, "0")
+        }
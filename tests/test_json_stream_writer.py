@@ -0,0 +1,307 @@
+"""
+Test cases for streaming JSON export.
+
+Covers the JSON and NDJSON stream writers, and streamed output from
+EnhancedJsonBuilder, ComprehensiveJsonBuilder and BatchProcessor.
+"""
+
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from ifc_room_schedule.export import json_stream_writer
+from ifc_room_schedule.export.json_stream_writer import (
+    JsonStreamWriter, NdjsonStreamWriter, serialize_json, ORJSON_AVAILABLE
+)
+from ifc_room_schedule.export.enhanced_json_builder import EnhancedJsonBuilder
+from ifc_room_schedule.export.comprehensive_json_builder import ComprehensiveJsonBuilder
+from ifc_room_schedule.parser.batch_processor import BatchProcessor
+from ifc_room_schedule.data.space_model import SpaceData
+
+
+SAMPLE_DOCUMENT = {
+    "metadata": {"name": "Bygg Ø", "empty": {}, "levels": [], "version": 2},
+    "spaces": [
+        {"guid": "A", "area": 12.5, "tags": ["a", "b"], "nested": {"x": [1, {"y": None}]}},
+        {"guid": "B", "area": 0.1, "tags": [], "nested": {}}
+    ],
+    "summary": {"total": 2, "ok": True}
+}
+
+# Keys whose values are the time they were generated
+TIMESTAMP_KEYS = {"created_at", "export_date", "generation_date", "last_updated", "validation_timestamp", "exported_at"}
+
+
+def stream_document(indent=2, backend="json"):
+    """Write SAMPLE_DOCUMENT piece by piece."""
+    output = io.StringIO()
+    with JsonStreamWriter(output, indent=indent, backend=backend) as writer:
+        writer.begin_object()
+        writer.write(SAMPLE_DOCUMENT["metadata"], "metadata")
+        writer.begin_array("spaces")
+        for space in SAMPLE_DOCUMENT["spaces"]:
+            writer.write(space)
+        writer.end()
+        writer.write(SAMPLE_DOCUMENT["summary"], "summary")
+    return output.getvalue()
+
+
+def create_space(index):
+    """Create a space with an NS 8360 name and quantities."""
+    return SpaceData(
+        guid=f"test_space_{index:05d}",
+        name=f"SPC-02-A101-111-{index:03d}",
+        long_name=f"Stue {index} | 02/A101 | NS3940:111",
+        description=f"Test space {index}",
+        object_type="IfcSpace",
+        zone_category="A101",
+        number=f"{index:03d}",
+        elevation=0.0,
+        quantities={"Height": 2.4, "NetFloorArea": 25.0},
+        surfaces=[],
+        space_boundaries=[],
+        relationships=[],
+        processed=index % 2 == 0
+    )
+
+
+def without_timestamps(value):
+    """Drop generation timestamps from parsed JSON."""
+    if isinstance(value, dict):
+        return {key: without_timestamps(item) for key, item in value.items() if key not in TIMESTAMP_KEYS}
+    if isinstance(value, list):
+        return [without_timestamps(item) for item in value]
+    return value
+
+
+def as_json(value):
+    """Round-trip a value through JSON, as it appears in a file."""
+    return json.loads(json.dumps(value, ensure_ascii=False))
+
+
+class TestJsonStreamWriter:
+    """Test cases for JsonStreamWriter."""
+
+    def test_matches_json_dump(self):
+        """Test that streamed output is identical to json.dump of the whole document."""
+        assert stream_document() == json.dumps(SAMPLE_DOCUMENT, indent=2, ensure_ascii=False) + "\n"
+        assert stream_document(indent=4) == json.dumps(SAMPLE_DOCUMENT, indent=4, ensure_ascii=False) + "\n"
+
+    def test_compact_output(self):
+        """Test output without indentation."""
+        assert stream_document(indent=None) == json.dumps(
+            SAMPLE_DOCUMENT, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    @pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not available")
+    def test_orjson_backend(self):
+        """Test that the orjson backend writes the same document."""
+        assert stream_document(backend="orjson") == stream_document(backend="json")
+        assert json.loads(stream_document(indent=None, backend="orjson")) == SAMPLE_DOCUMENT
+
+    def test_auto_backend_falls_back_to_json(self, monkeypatch):
+        """Test that auto uses json without orjson and for indentations orjson cannot write."""
+        assert JsonStreamWriter(io.StringIO(), indent=4).backend == "json"
+
+        monkeypatch.setattr(json_stream_writer, "ORJSON_AVAILABLE", False)
+        assert JsonStreamWriter(io.StringIO(), indent=2).backend == "json"
+        with pytest.raises(ImportError):
+            JsonStreamWriter(io.StringIO(), backend="orjson")
+
+    def test_invalid_backend_options(self):
+        """Test that unsupported backend options are rejected."""
+        with pytest.raises(ValueError):
+            JsonStreamWriter(io.StringIO(), backend="ujson")
+        if ORJSON_AVAILABLE:
+            with pytest.raises(ValueError):
+                JsonStreamWriter(io.StringIO(), indent=4, backend="orjson")
+
+    def test_framing_errors(self):
+        """Test that keys and roots are checked against the open container."""
+        writer = JsonStreamWriter(io.StringIO())
+        writer.begin_object()
+        with pytest.raises(ValueError):
+            writer.write(1)
+        writer.begin_array("items")
+        with pytest.raises(ValueError):
+            writer.write(1, "key")
+        writer.close()
+        with pytest.raises(ValueError):
+            writer.begin_object()
+        with pytest.raises(ValueError):
+            writer.end()
+
+    def test_failed_document_left_open(self):
+        """Test that an exception does not close the document as if complete."""
+        output = io.StringIO()
+        with pytest.raises(RuntimeError):
+            with JsonStreamWriter(output) as writer:
+                writer.begin_array()
+                writer.write(1)
+                raise RuntimeError("failed")
+
+        assert not output.getvalue().endswith("]\n")
+
+    def test_ndjson_records(self):
+        """Test that NDJSON writes one compact record per line."""
+        output = io.StringIO()
+        writer = NdjsonStreamWriter(output)
+        writer.write_record("metadata", {"name": "Bygg Ø"})
+        writer.write([1, 2])
+
+        assert output.getvalue().splitlines() == ['{"type":"metadata","data":{"name":"Bygg Ø"}}', '[1,2]']
+
+    def test_serialize_json(self):
+        """Test serializing single values with both backends."""
+        assert serialize_json({"a": [1]}, backend="json") == '{"a":[1]}'
+        assert json.loads(serialize_json({1: "x"}, indent=2)) == {"1": "x"}
+
+
+class TestEnhancedJsonStreaming:
+    """Test cases for streamed EnhancedJsonBuilder exports."""
+
+    def test_stream_matches_structure(self):
+        """Test that the streamed document equals the built structure."""
+        builder = EnhancedJsonBuilder()
+        spaces = [create_space(i) for i in range(5)]
+        output = io.StringIO()
+
+        count = builder.write_enhanced_json_stream(output, iter(spaces))
+
+        assert count == 5
+        expected = as_json(builder.build_enhanced_json_structure(spaces))
+        assert without_timestamps(json.loads(output.getvalue())) == without_timestamps(expected)
+
+    def test_summary_from_running_totals(self):
+        """Test the summary sections of a streamed export."""
+        output = io.StringIO()
+
+        EnhancedJsonBuilder().write_enhanced_json_stream(output, (create_space(i) for i in range(4)))
+
+        data = json.loads(output.getvalue())
+        assert list(data) == ["metadata", "spaces", "summary", "ns_standards_compliance"]
+        assert data["summary"]["total_spaces"] == 4
+        assert data["summary"]["processed_spaces"] == 2
+        assert sum(data["summary"]["room_type_distribution"].values()) == 4
+        assert data["ns_standards_compliance"]["overall_compliance"]["total_spaces"] == 4
+
+    def test_ndjson_export(self, tmp_path):
+        """Test the NDJSON variant of the export."""
+        path = tmp_path / "export.ndjson"
+
+        success, messages = EnhancedJsonBuilder().export_enhanced_json(
+            (create_space(i) for i in range(3)), str(path), ndjson=True)
+
+        assert success, messages
+        assert "Successfully exported 3 spaces" in messages[0]
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [record["type"] for record in records] == [
+            "metadata", "space", "space", "space", "summary", "ns_standards_compliance"
+        ]
+        assert records[1]["data"]["guid"] == "test_space_00000"
+
+    def test_invalid_export_not_written(self, tmp_path, monkeypatch):
+        """Test that validation errors leave no output file behind."""
+        builder = EnhancedJsonBuilder()
+        path = tmp_path / "export.json"
+        monkeypatch.setattr(builder, "_validate_enhanced_space_data",
+                            lambda space_data, index: [f"Space {index}: invalid"] if index == 1 else [])
+
+        success, errors = builder.export_enhanced_json([create_space(i) for i in range(3)], str(path))
+
+        assert not success
+        assert errors == ["Space 1: invalid"]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_peak_memory_constant(self, tmp_path):
+        """Test that four times the spaces barely raise the streaming peak."""
+        builder = EnhancedJsonBuilder()
+
+        def peak(count):
+            tracemalloc.start()
+            try:
+                with open(tmp_path / f"export_{count}.json", "w", encoding="utf-8") as f:
+                    builder.write_enhanced_json_stream(f, (create_space(i) for i in range(count)))
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small, large = peak(50), peak(200)
+
+        print(f"\nStreaming peak: {small / 1e6:.2f}MB (50), {large / 1e6:.2f}MB (200)")
+        assert large < small * 1.5
+
+
+class TestComprehensiveJsonStreaming:
+    """Test cases for streamed ComprehensiveJsonBuilder files."""
+
+    def test_file_matches_structure(self, tmp_path):
+        """Test that the streamed file equals the built structure."""
+        builder = ComprehensiveJsonBuilder()
+        spaces = [create_space(i) for i in range(3)]
+        path = tmp_path / "rooms.json"
+
+        assert builder.write_comprehensive_json_file(str(path), spaces)
+
+        expected = as_json(builder.build_comprehensive_json_structure(spaces))
+        assert without_timestamps(json.loads(path.read_text(encoding="utf-8"))) == without_timestamps(expected)
+        assert not (tmp_path / "rooms.json.tmp").exists()
+
+    def test_ndjson_file(self, tmp_path):
+        """Test one room per line."""
+        path = tmp_path / "rooms.ndjson"
+
+        assert ComprehensiveJsonBuilder().write_comprehensive_json_file(
+            str(path), (create_space(i) for i in range(3)), ndjson=True)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        assert all(isinstance(json.loads(line), dict) for line in lines)
+
+
+class TestBatchProcessorStreaming:
+    """Test cases for BatchProcessor.process_spaces_streaming."""
+
+    def test_streamed_document(self, tmp_path):
+        """Test that chunks are streamed into one valid document with a summary."""
+        processor = BatchProcessor(chunk_size=4)
+        path = tmp_path / "batch.json"
+
+        stats = processor.process_spaces_streaming([create_space(i) for i in range(10)], str(path))
+
+        assert stats["chunks_processed"] == 3
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["metadata"]["total_spaces"] == 10
+        assert [space["guid"] for space in data["spaces"]] == [f"test_space_{i:05d}" for i in range(10)]
+        assert data["summary"]["total_spaces"] == 10
+        assert path.read_text(encoding="utf-8") == json.dumps(data, indent=4, ensure_ascii=False) + "\n"
+
+    def test_failed_spaces_are_logged_and_skipped(self, tmp_path, caplog):
+        """Test that a space that cannot be built is logged and left out."""
+        processor = BatchProcessor(chunk_size=4)
+        build = processor.builder._build_enhanced_space_dict
+
+        def build_or_fail(space, export_profile):
+            if space.guid == "test_space_00001":
+                raise ValueError("broken")
+            return build(space, export_profile)
+
+        processor.builder._build_enhanced_space_dict = build_or_fail
+        path = tmp_path / "batch.json"
+
+        with caplog.at_level("ERROR", logger="ifc_room_schedule.parser.batch_processor"):
+            processor.process_spaces_streaming([create_space(i) for i in range(3)], str(path))
+
+        assert "Error processing space SPC-02-A101-111-001: broken" in caplog.text
+        assert json.loads(path.read_text(encoding="utf-8"))["summary"]["total_spaces"] == 2
+
+    def test_ndjson(self, tmp_path):
+        """Test the NDJSON variant of batch streaming."""
+        path = tmp_path / "batch.ndjson"
+
+        BatchProcessor(chunk_size=4).process_spaces_streaming(
+            [create_space(i) for i in range(5)], str(path), ndjson=True)
+
+        types = [json.loads(line)["type"] for line in path.read_text(encoding="utf-8").splitlines()]
+        assert types == ["metadata"] + ["space"] * 5 + ["summary"]
@@ -188,6 +188,24 @@ class TestMainAzureSQLIntegration:
                         assert "Server=test;Database=test;" in str(call_args)
                         assert "custom_table" in str(call_args)
 
+    
+    def test_azure_project_guid(self):
+        """Test that the Azure SQL project key is the IfcProject GlobalId unless given, and required for sync"""
+        with patch.object(self.app.ifc_reader, 'load_cached_spaces', return_value=self.mock_spaces), \
+                patch.object(self.app.ifc_reader, 'get_project_guid', return_value=None), \
+                patch.object(self.app.quality_analyzer, 'analyze_spaces_quality', return_value={}), \
+                patch.object(self.app, '_process_standard', return_value={"success": True}) as mock_standard:
+            self.app.azure_sync = True
+            result = self.app.process_ifc_file("test.ifc", "out", export_format="azure-sql")
+            
+            assert "--azure-project-guid" in result["error"]
+            mock_standard.assert_not_called()
+            
+            self.app.azure_project_guid = "0YvctVUKr0kugbFTf53O9L"
+            result = self.app.process_ifc_file("test.ifc", "out", export_format="azure-sql")
+            
+            assert result["success"]
+            assert self.app.json_builder.project_guid == "0YvctVUKr0kugbFTf53O9L"
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""
+Unit tests for the triangle-mesh section backend.
+
+Covers plane/triangle intersection and stitching in MeshSlicer, mesh sections in
+SectionProcessor, and backend selection in section_element against real
+IfcOpenShell tessellation.
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ifcopenshell
+import ifcopenshell.api
+
+from ifc_floor_plan_generator.geometry.engine import GeometryEngine
+from ifc_floor_plan_generator.geometry.mesh_slicer import MeshSlicer, TriangleMesh
+from ifc_floor_plan_generator.geometry.section_processor import SectionProcessor
+from ifc_floor_plan_generator.errors.exceptions import EmptyCutResultError
+from ifc_floor_plan_generator.models import GeometryConfig
+from ifc_floor_plan_generator.performance.element_sharding import section_element
+
+
+def create_box_mesh(x0=0.0, y0=0.0, x1=4.0, y1=2.0, z0=0.0, z1=3.0):
+    """Create a welded, triangulated axis-aligned box."""
+    vertices = [
+        (x0, y0, z0), (x1, y0, z0), (x1, y1, z0), (x0, y1, z0),
+        (x0, y0, z1), (x1, y0, z1), (x1, y1, z1), (x0, y1, z1),
+    ]
+    faces = [
+        (0, 2, 1), (0, 3, 2), (4, 5, 6), (4, 6, 7),
+        (0, 1, 5), (0, 5, 4), (1, 2, 6), (1, 6, 5),
+        (2, 3, 7), (2, 7, 6), (3, 0, 4), (3, 4, 7),
+    ]
+    return TriangleMesh(vertices=vertices, faces=faces)
+
+
+def unweld(mesh):
+    """Give every triangle its own copy of its vertices."""
+    vertices = mesh.vertices[mesh.faces.reshape(-1)]
+    faces = np.arange(len(vertices)).reshape(-1, 3)
+    return TriangleMesh(vertices=vertices, faces=faces)
+
+
+def normalized_ring(points):
+    """Rounded ring points as a set, independent of start point and direction."""
+    return {(round(x, 9), round(y, 9)) for x, y in points}
+
+
+def create_wall_file(profile="rectangle", offset=(0.0, 0.0, 0.0)):
+    """Create a model with one extruded wall, optionally with a circular profile and moved placement."""
+    ifc_file = ifcopenshell.api.run("project.create_file", version="IFC4")
+    ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcProject", name="Project")
+    ifcopenshell.api.run("unit.assign_unit", ifc_file)
+    model = ifcopenshell.api.run("context.add_context", ifc_file, context_type="Model")
+    body = ifcopenshell.api.run("context.add_context", ifc_file, context_type="Model",
+                                context_identifier="Body", target_view="MODEL_VIEW", parent=model)
+
+    wall = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcWall", name="Wall")
+    if profile == "circle":
+        circle = ifc_file.createIfcCircleProfileDef("AREA", None, None, 0.5)
+        representation = ifcopenshell.api.run("geometry.add_profile_representation", ifc_file,
+                                              context=body, profile=circle, depth=3.0)
+    else:
+        representation = ifcopenshell.api.run("geometry.add_wall_representation", ifc_file,
+                                              context=body, length=5.0, height=3.0, thickness=0.2)
+    ifcopenshell.api.run("geometry.assign_representation", ifc_file,
+                         product=wall, representation=representation)
+    matrix = np.eye(4)
+    matrix[:3, 3] = offset
+    ifcopenshell.api.run("geometry.edit_object_placement", ifc_file, product=wall, matrix=matrix)
+    return ifc_file, wall
+
+
+class RecordingSectionProcessor(SectionProcessor):
+    """SectionProcessor that records OpenCASCADE fallbacks instead of running them."""
+
+    def __init__(self):
+        super().__init__()
+        self.shape_sections = []
+
+    def process_shape_section(self, shape, z_height, ifc_class="Unknown", element_guid="unknown"):
+        self.shape_sections.append(element_guid)
+        return []
+
+
+class TestMeshSlicer:
+    """Test cases for MeshSlicer."""
+
+    def test_box_section_is_closed_rectangle(self):
+        """Test that a box cut through its sides gives one closed loop."""
+        chains = MeshSlicer().slice_mesh(create_box_mesh(), 1.5)
+
+        assert len(chains) == 1
+        points, is_closed = chains[0]
+        assert is_closed
+        assert {(0.0, 0.0), (4.0, 0.0), (4.0, 2.0), (0.0, 2.0)} <= normalized_ring(points)
+
+    def test_plane_outside_mesh_is_empty(self):
+        """Test that planes above or below the mesh produce nothing."""
+        slicer = MeshSlicer()
+
+        assert slicer.slice_mesh(create_box_mesh(), 3.5) == []
+        assert slicer.slice_mesh(create_box_mesh(), -0.5) == []
+
+    def test_shared_edges_give_identical_points(self):
+        """Test that neighbouring triangles meet in bit-identical points."""
+        segments, keys = MeshSlicer().slice_segments(create_box_mesh(), 1.0)
+
+        points_by_key = {}
+        for segment, segment_keys in zip(segments.tolist(), keys.tolist()):
+            for point, key in zip(segment, segment_keys):
+                assert points_by_key.setdefault(key, point) == point
+        assert all(np.count_nonzero(keys == key) == 2 for key in points_by_key)
+
+    def test_plane_through_vertices(self):
+        """Test that a plane through mesh vertices still closes the loop."""
+        mesh = create_box_mesh()
+        mesh.vertices[[1, 3], 2] = 1.5
+
+        chains = MeshSlicer().slice_mesh(mesh, 1.5)
+
+        assert [is_closed for _, is_closed in chains] == [True]
+        assert all(np.isfinite(chains[0][0]).all(axis=1))
+
+    def test_multiple_bodies(self):
+        """Test that separate bodies give separate loops."""
+        first = create_box_mesh()
+        second = create_box_mesh(x0=10.0, x1=12.0)
+        mesh = TriangleMesh(
+            vertices=np.vstack([first.vertices, second.vertices]),
+            faces=np.vstack([first.faces, second.faces + len(first.vertices)])
+        )
+
+        chains = MeshSlicer().slice_mesh(mesh, 1.5)
+
+        assert len(chains) == 2
+        assert all(is_closed for _, is_closed in chains)
+
+
+class TestMeshSection:
+    """Test cases for SectionProcessor.process_mesh_section."""
+
+    def test_box_section_polyline(self):
+        """Test that tessellation vertices along straight sides are removed."""
+        polylines = SectionProcessor().process_mesh_section(create_box_mesh(), 1.5, "IfcWall", "GUID")
+
+        assert len(polylines) == 1
+        polyline = polylines[0]
+        assert polyline.is_closed
+        assert polyline.ifc_class == "IfcWall"
+        assert polyline.element_guid == "GUID"
+        assert normalized_ring(polyline.points) == {(0.0, 0.0), (4.0, 0.0), (4.0, 2.0), (0.0, 2.0)}
+        assert len(polyline.points) == 4
+
+    def test_unwelded_mesh_is_chained(self):
+        """Test that meshes without shared vertices are joined by coordinates."""
+        polylines = SectionProcessor().process_mesh_section(unweld(create_box_mesh()), 1.5)
+
+        assert len(polylines) == 1
+        assert polylines[0].is_closed
+        assert normalized_ring(polylines[0].points) == {(0.0, 0.0), (4.0, 0.0), (4.0, 2.0), (0.0, 2.0)}
+
+    def test_empty_section_raises(self):
+        """Test that a plane missing the mesh is reported like an empty OCC cut."""
+        with pytest.raises(EmptyCutResultError):
+            SectionProcessor().process_mesh_section(create_box_mesh(), 5.0)
+
+
+class TestMeshBackend:
+    """Test cases for section backend selection."""
+
+    def test_config_validation(self):
+        """Test section backend validation."""
+        assert GeometryConfig().section_backend == "occ"
+        with pytest.raises(ValueError):
+            GeometryConfig(section_backend="gpu")
+
+    def test_mesh_backend_sections_wall(self):
+        """Test that a straight wall is cut from its IfcOpenShell mesh."""
+        ifc_file, wall = create_wall_file()
+        engine = GeometryEngine(GeometryConfig(cache_geometry=False, section_backend="mesh"))
+        processor = RecordingSectionProcessor()
+
+        polylines = section_element(engine, processor, wall, 1.0)
+
+        assert processor.shape_sections == []
+        assert len(polylines) == 1
+        assert polylines[0].is_closed
+        assert polylines[0].element_guid == wall.GlobalId
+        assert normalized_ring(polylines[0].points) == {(0.0, 0.0), (5.0, 0.0), (5.0, 0.2), (0.0, 0.2)}
+
+    def test_mesh_follows_world_coords_setting(self):
+        """Test that meshes use the same coordinate frame as BRep shapes."""
+        ifc_file, wall = create_wall_file(offset=(10.0, 20.0, 0.0))
+
+        world = GeometryEngine(GeometryConfig(cache_geometry=False, use_world_coords=True))
+        local = GeometryEngine(GeometryConfig(cache_geometry=False, use_world_coords=False))
+
+        assert np.allclose(world.generate_mesh(wall).vertices.min(axis=0), (10.0, 20.0, 0.0))
+        assert np.allclose(local.generate_mesh(wall).vertices.min(axis=0), (0.0, 0.0, 0.0))
+
+    def test_curved_geometry_uses_occ(self):
+        """Test that curved elements fall back to the OpenCASCADE backend."""
+        ifc_file, column = create_wall_file(profile="circle")
+        engine = GeometryEngine(GeometryConfig(cache_geometry=False, section_backend="mesh"))
+        processor = RecordingSectionProcessor()
+
+        assert engine.has_curved_geometry(column)
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(engine, 'generate_shape', lambda element, element_hash=None: object())
+            section_element(engine, processor, column, 1.0)
+
+        assert processor.shape_sections == [column.GlobalId]
+
+    def test_failed_mesh_uses_occ(self):
+        """Test that elements whose mesh cannot be generated fall back to OpenCASCADE."""
+        ifc_file, wall = create_wall_file()
+        engine = GeometryEngine(GeometryConfig(cache_geometry=False, section_backend="mesh"))
+        processor = RecordingSectionProcessor()
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(engine, 'generate_mesh', lambda element, element_hash=None: None)
+            monkeypatch.setattr(engine, 'generate_shape', lambda element, element_hash=None: object())
+            section_element(engine, processor, wall, 1.0)
+
+        assert processor.shape_sections == [wall.GlobalId]
@@ -0,0 +1,186 @@
+"""
+Tests for IFC Model Index
+
+Tests the single-pass relationship index shared by the room schedule parsers.
+"""
+
+import pytest
+from unittest.mock import Mock
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from ifc_room_schedule.parser.model_index import ModelIndex
+from ifc_room_schedule.parser.ifc_space_boundary_parser import IfcSpaceBoundaryParser
+from ifc_room_schedule.parser.ifc_relationship_parser import IfcRelationshipParser
+
+
+def make_entity(ifc_type, guid=None, **attributes):
+    """Create a mock IFC entity that answers is_a() like IfcOpenShell."""
+    entity = Mock()
+    entity.is_a.side_effect = lambda query=None: ifc_type if query is None else query == ifc_type
+    entity.GlobalId = guid
+    entity.Name = attributes.pop('Name', guid)
+    for name, value in attributes.items():
+        setattr(entity, name, value)
+    return entity
+
+
+def make_space(guid, **attributes):
+    """Create a mock IfcSpace with empty inverse attributes."""
+    defaults = {
+        'IsDefinedBy': [],
+        'ContainedInStructure': [],
+        'ContainsElements': [],
+        'Decomposes': [],
+        'BoundedBy': [],
+    }
+    defaults.update(attributes)
+    return make_entity('IfcSpace', guid, **defaults)
+
+
+def make_boundary(guid, space, element=None):
+    """Create a mock IfcRelSpaceBoundary."""
+    return make_entity(
+        'IfcRelSpaceBoundary', guid,
+        RelatingSpace=space,
+        RelatedBuildingElement=element,
+        Description='',
+        PhysicalOrVirtualBoundary='PHYSICAL',
+        InternalOrExternalBoundary='INTERNAL',
+        ConnectionGeometry=None,
+        CorrespondingBoundary=None,
+    )
+
+
+def make_file(spaces, boundaries):
+    """Create a mock IFC file answering by_type for spaces and boundaries."""
+    by_type = {'IfcSpace': spaces, 'IfcRelSpaceBoundary': boundaries}
+    ifc_file = Mock()
+    ifc_file.by_type.side_effect = lambda ifc_type: by_type.get(ifc_type, [])
+    return ifc_file
+
+
+class TestModelIndex:
+    """Test cases for ModelIndex class."""
+
+    def setup_method(self):
+        """Set up a small two-storey model."""
+        self.storey1 = make_entity('IfcBuildingStorey', 'STOREY1')
+        self.storey2 = make_entity('IfcBuildingStorey', 'STOREY2')
+
+        self.space1 = make_space('SPACE1', Decomposes=[
+            make_entity('IfcRelAggregates', 'AGG1', RelatingObject=self.storey1)
+        ])
+        self.space2 = make_space('SPACE2', ContainedInStructure=[
+            make_entity('IfcRelContainedInSpatialStructure', 'CONT1', RelatingStructure=self.storey2)
+        ])
+        # Nested space aggregated into SPACE1
+        self.space3 = make_space('SPACE3', Decomposes=[
+            make_entity('IfcRelAggregates', 'AGG2', RelatingObject=self.space1)
+        ])
+
+        self.wall = make_entity('IfcWall', 'WALL1')
+        self.boundaries = [
+            make_boundary('B1', self.space1, self.wall),
+            make_boundary('B2', self.space2, self.wall),
+            make_boundary('B3', self.space1, None),
+        ]
+        self.ifc_file = make_file([self.space1, self.space2, self.space3], self.boundaries)
+
+    def test_init_without_file(self):
+        """Test initialization without IFC file."""
+        index = ModelIndex()
+        assert not index.is_built
+        assert index.get_space_boundaries('SPACE1') == []
+
+    def test_build_without_file(self):
+        """Test building without an IFC file."""
+        with pytest.raises(ValueError, match="No IFC file given"):
+            ModelIndex().build(None)
+
+    def test_build_failure_raises_runtime_error(self):
+        """Test that build errors are wrapped and leave the index empty."""
+        ifc_file = Mock()
+        ifc_file.by_type.side_effect = Exception("Corrupt file")
+        index = ModelIndex()
+
+        with pytest.raises(RuntimeError, match="Failed to build model index"):
+            index.build(ifc_file)
+        assert not index.is_built
+
+    def test_space_boundaries_grouped_in_file_order(self):
+        """Test space -> boundaries lookup."""
+        index = ModelIndex(self.ifc_file)
+
+        assert index.is_for_file(self.ifc_file)
+        assert [b.GlobalId for b in index.get_space_boundaries('SPACE1')] == ['B1', 'B3']
+        assert [b.GlobalId for b in index.get_space_boundaries('SPACE2')] == ['B2']
+        assert index.get_space_boundaries('SPACE3') == []
+
+    def test_definitions_and_containment(self):
+        """Test space -> property definitions and containment lookups."""
+        pset_rel = make_entity('IfcRelDefinesByProperties', 'DEF1')
+        furniture = make_entity('IfcFurniture', 'FURN1')
+        contains_rel = make_entity('IfcRelContainedInSpatialStructure', 'CONT2', RelatedElements=[furniture])
+        space = make_space('SPACE4', IsDefinedBy=[pset_rel], ContainsElements=[contains_rel])
+        index = ModelIndex(make_file([space], []))
+
+        assert index.get_property_definitions('SPACE4') == [pset_rel]
+        assert index.get_contained_elements('SPACE4') == [furniture]
+        assert index.get_containing_structures('SPACE4') == []
+
+    def test_each_boundary_visited_once(self):
+        """Test that the file is scanned once per relationship type."""
+        ModelIndex(self.ifc_file)
+
+        requested = [call.args[0] for call in self.ifc_file.by_type.call_args_list]
+        assert requested.count('IfcRelSpaceBoundary') == 1
+
+    def test_statistics(self):
+        """Test index statistics."""
+        stats = ModelIndex(self.ifc_file).get_statistics()
+
+        assert stats['spaces'] == 3
+        assert stats['boundaries'] == 3
+
+
+class TestParsersWithModelIndex:
+    """Test cases for parsers reading from a shared ModelIndex."""
+
+    def setup_method(self):
+        """Set up a file with boundaries for two spaces."""
+        self.space1 = make_space('SPACE1')
+        self.space2 = make_space('SPACE2')
+        self.boundaries = [
+            make_boundary('B1', self.space1),
+            make_boundary('B2', self.space2),
+            make_boundary('B3', self.space1),
+        ]
+        self.ifc_file = make_file([self.space1, self.space2], self.boundaries)
+        self.index = ModelIndex(self.ifc_file)
+
+    def test_boundary_parser_uses_index_for_space_filter(self):
+        """Test that per-space extraction does not rescan all boundaries."""
+        parser = IfcSpaceBoundaryParser(self.ifc_file)
+        parser.set_model_index(self.index)
+        self.ifc_file.by_type.reset_mock()
+
+        boundaries = parser.extract_space_boundaries('SPACE1')
+
+        assert [b.guid for b in boundaries] == ['B1', 'B3']
+        self.ifc_file.by_type.assert_not_called()
+
+    def test_set_ifc_file_drops_stale_index(self):
+        """Test that an index built for another file is discarded."""
+        parser = IfcSpaceBoundaryParser(self.ifc_file, model_index=self.index)
+        parser.set_ifc_file(Mock())
+        assert parser.model_index is None
+
+    def test_relationship_parser_finds_space_through_index(self):
+        """Test that the relationship parser resolves spaces from the index."""
+        parser = IfcRelationshipParser(self.ifc_file)
+        parser.set_model_index(self.index)
+
+        parser.get_space_relationships('SPACE1')
+
+        self.ifc_file.by_guid.assert_not_called()
@@ -0,0 +1,261 @@
+"""
+Unit tests for sectioning storeys at several cut heights.
+
+Covers cut height resolution in the configuration, tessellating each element
+once for all heights, and the additional sections in storey results, output
+files and manifest metadata.
+"""
+
+import pytest
+import sys
+import os
+import json
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ifcopenshell
+import ifcopenshell.api
+
+from ifc_floor_plan_generator import main as generator_main
+from ifc_floor_plan_generator.main import FloorPlanGenerator
+from ifc_floor_plan_generator.config.manager import ConfigurationManager, ValidationError
+from ifc_floor_plan_generator.errors.exceptions import EmptyCutResultError
+from ifc_floor_plan_generator.geometry.z_range_filter import ZRangeFilter
+from ifc_floor_plan_generator.models import (
+    Config, GeometryConfig, OutputConfig, StoreyConfig, Polyline2D
+)
+from ifc_floor_plan_generator.performance.element_sharding import section_element_at_heights
+from ifc_floor_plan_generator.rendering.manifest_generator import ManifestGenerator
+from ifc_floor_plan_generator.rendering.output_coordinator import OutputCoordinator
+
+
+class SampleModel:
+    """Model with walls and slabs in one storey, in metres."""
+
+    def __init__(self):
+        self.file = ifcopenshell.api.run("project.create_file", version="IFC4")
+        ifcopenshell.api.run("root.create_entity", self.file, ifc_class="IfcProject", name="Project")
+        ifcopenshell.api.run("unit.assign_unit", self.file,
+                             length={"is_metric": True, "raw": "METERS"})
+        model = ifcopenshell.api.run("context.add_context", self.file, context_type="Model")
+        self.body = ifcopenshell.api.run("context.add_context", self.file, context_type="Model",
+                                         context_identifier="Body", target_view="MODEL_VIEW", parent=model)
+        self.storey = ifcopenshell.api.run("root.create_entity", self.file, ifc_class="IfcBuildingStorey",
+                                           name="Level 0")
+        self.storey.Elevation = 0.0
+
+    def add(self, ifc_class, name, representation, z):
+        """Create a contained element with a body representation at height z."""
+        element = ifcopenshell.api.run("root.create_entity", self.file, ifc_class=ifc_class, name=name)
+        ifcopenshell.api.run("geometry.assign_representation", self.file,
+                             product=element, representation=representation)
+        matrix = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, z], [0.0, 0.0, 0.0, 1.0]]
+        ifcopenshell.api.run("geometry.edit_object_placement", self.file, product=element, matrix=matrix)
+        ifcopenshell.api.run("spatial.assign_container", self.file, products=[element],
+                             relating_structure=self.storey)
+        return element
+
+    def wall(self, name="Wall", height=3.0):
+        representation = ifcopenshell.api.run("geometry.add_wall_representation", self.file, context=self.body,
+                                              length=5.0, height=height, thickness=0.2)
+        return self.add("IfcWall", name, representation, 0.0)
+
+    def slab(self, name="Slab", z=3.0):
+        representation = ifcopenshell.api.run("geometry.add_slab_representation", self.file,
+                                              context=self.body, depth=0.2)
+        return self.add("IfcSlab", name, representation, z)
+
+
+class CountingGeometryEngine:
+    """Counts shape generation per element name."""
+
+    generated = []
+
+    def __init__(self, config, error_handler=None):
+        self.config = config
+
+    def generate_shape(self, element, element_hash=None):
+        CountingGeometryEngine.generated.append(element.Name)
+        return element.id()
+
+
+class HeightSectionProcessor:
+    """Produces one square per shape at heights below 2 m and nothing above."""
+
+    def __init__(self, slice_tolerance=1e-6, chain_tolerance=1e-3):
+        pass
+
+    def process_shape_section(self, shape, z_height, ifc_class="Unknown", element_guid="unknown"):
+        if z_height > 2.0:
+            raise EmptyCutResultError(storey_name=element_guid, cut_height=z_height)
+        x = float(shape)
+        points = [(x, z_height), (x + 1.0, z_height), (x + 1.0, z_height + 1.0), (x, z_height + 1.0)]
+        return [Polyline2D(points=points, ifc_class=ifc_class, element_guid=element_guid, is_closed=True)]
+
+
+class FakeElement:
+    """Minimal IFC element stand-in."""
+
+    def __init__(self, element_id):
+        self._id = element_id
+        self.GlobalId = f"GUID{element_id}"
+        self.Name = f"Element {element_id}"
+
+    def id(self):
+        return self._id
+
+    def is_a(self, ifc_class=None):
+        return "IfcWall" if ifc_class is None else ifc_class == "IfcWall"
+
+
+class TestCutHeightConfiguration:
+    """Test cases for cut height resolution."""
+
+    def test_global_additional_offsets(self):
+        """Test that the primary cut height comes first and duplicates are dropped."""
+        config = Config(input_path="model.ifc", output_dir="out", cut_offset_m=1.05,
+                        additional_cut_offsets_m=[0.3, 1.05, 2.1])
+
+        assert config.get_storey_cut_heights("Level 0") == [1.05, 0.3, 2.1]
+
+    def test_storey_override(self):
+        """Test that a storey list replaces the global list and None inherits it."""
+        config = Config(
+            input_path="model.ifc", output_dir="out", cut_offset_m=1.05,
+            additional_cut_offsets_m=[2.1],
+            per_storey_overrides={
+                "Basement": StoreyConfig(cut_offset_m=0.8, additional_cut_offsets_m=[]),
+                "Level 1": StoreyConfig(cut_offset_m=1.2, additional_cut_offsets_m=[0.5]),
+                "Level 2": StoreyConfig(cut_offset_m=1.5)
+            }
+        )
+
+        assert config.get_storey_cut_heights("Basement") == [0.8]
+        assert config.get_storey_cut_heights("Level 1") == [1.2, 0.5]
+        assert config.get_storey_cut_heights("Level 2") == [1.5, 2.1]
+
+    def test_negative_offsets_rejected(self):
+        """Test that negative additional offsets are rejected."""
+        with pytest.raises(ValueError):
+            Config(input_path="model.ifc", output_dir="out", cut_offset_m=1.05,
+                   additional_cut_offsets_m=[-0.5])
+        with pytest.raises(ValueError):
+            StoreyConfig(cut_offset_m=1.0, additional_cut_offsets_m=[-0.5])
+
+    def test_load_from_json(self, tmp_path):
+        """Test that offsets are read from the configuration file and validated."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({
+            "input_path": "model.ifc",
+            "output_dir": "out",
+            "cut_offset_m": 1.05,
+            "additional_cut_offsets_m": [2.1],
+            "per_storey_overrides": {"Level 1": {"cut_offset_m": 1.2, "additional_cut_offsets_m": [0.5]}}
+        }))
+
+        manager = ConfigurationManager()
+        manager.load_config(str(config_path))
+
+        assert manager.get_storey_cut_heights("Level 0") == [1.05, 2.1]
+        assert manager.get_storey_cut_heights("Level 1") == [1.2, 0.5]
+        with pytest.raises(ValidationError):
+            manager._basic_validate_config({"input_path": "model.ifc", "output_dir": "out",
+                                            "additional_cut_offsets_m": [-1.0]})
+
+
+class TestSectionAtHeights:
+    """Test cases for section_element_at_heights."""
+
+    def test_shape_generated_once(self):
+        """Test that one shape is cut at every height and empty cuts give empty lists."""
+        CountingGeometryEngine.generated = []
+        engine = CountingGeometryEngine(GeometryConfig(cache_geometry=False))
+
+        sections = section_element_at_heights(engine, HeightSectionProcessor(), FakeElement(7), [1.0, 0.5, 2.5])
+
+        assert CountingGeometryEngine.generated == ["Element 7"]
+        assert [len(polylines) for polylines in sections] == [1, 1, 0]
+        assert sections[1][0].points[0] == (7.0, 0.5)
+
+    def test_single_height_keeps_empty_cut_error(self):
+        """Test that a single empty cut still raises like section_element."""
+        engine = CountingGeometryEngine(GeometryConfig(cache_geometry=False))
+
+        with pytest.raises(EmptyCutResultError):
+            section_element_at_heights(engine, HeightSectionProcessor(), FakeElement(7), [2.5])
+
+    def test_z_range_filter_keeps_elements_crossing_any_height(self):
+        """Test that the prefilter only drops elements missing every cut plane."""
+        model = SampleModel()
+        wall = model.wall(height=1.0)
+        slab = model.slab(z=3.0)
+
+        kept, skipped = ZRangeFilter().filter_elements([wall, slab], [0.5, 3.1])
+
+        assert kept == [wall, slab]
+        assert skipped == 0
+        assert ZRangeFilter().filter_elements([wall, slab], [0.5])[0] == [wall]
+
+
+class TestMultiHeightPipeline:
+    """Test additional cut heights in storey processing and output."""
+
+    def test_storey_sections_and_outputs(self, tmp_path):
+        """Test that every element is tessellated once and each height gets its own files."""
+        model = SampleModel()
+        model.wall(name="Wall A")
+        model.wall(name="Wall B")
+        input_path = str(tmp_path / "model.ifc")
+        model.file.write(input_path)
+
+        config = Config(
+            input_path=input_path,
+            output_dir=str(tmp_path / "out"),
+            cut_offset_m=1.05,
+            additional_cut_offsets_m=[0.3, 2.5],
+            geometry=GeometryConfig(cache_geometry=False),
+            output=OutputConfig(write_geojson=True)
+        )
+        CountingGeometryEngine.generated = []
+
+        with patch.object(generator_main, 'GeometryEngine', CountingGeometryEngine), \
+                patch.object(generator_main, 'SectionProcessor', HeightSectionProcessor):
+            generator = FloorPlanGenerator.from_config(config)
+            assert generator._initialize_components()
+            ifc_file = generator.ifc_parser.open_file(input_path)
+            storey = ifc_file.by_type("IfcBuildingStorey")[0]
+            result = generator._process_single_storey(ifc_file, storey, 0, 1.0)
+
+        assert sorted(CountingGeometryEngine.generated) == ["Wall A", "Wall B"]
+        assert result.cut_height == 1.05
+        assert result.element_count == 2
+        assert [section.cut_height for section in result.additional_sections] == [0.3]
+        assert result.additional_sections[0].element_count == 2
+        assert all(y == 0.3 for polyline in result.additional_sections[0].polylines
+                   for _, y in polyline.points[:2])
+        assert any("2.50m" in warning for warning in generator.processing_warnings)
+
+        summary = OutputCoordinator(config).generate_all_outputs([result], input_path, 0.1)
+
+        section = result.additional_sections[0]
+        assert len(summary["svg_files"]) == 2
+        assert len(summary["geojson_files"]) == 2
+        assert section.svg_file in summary["svg_files"]
+        assert "0.30m" in os.path.basename(section.svg_file)
+        assert os.path.exists(section.svg_file)
+        assert os.path.exists(section.geojson_file)
+
+        with open(section.geojson_file, encoding="utf-8") as f:
+            section_geojson = json.load(f)
+        assert {feature["properties"]["processing_config"]["cut_height"]
+                for feature in section_geojson["features"]} == {0.3}
+
+        metadata = ManifestGenerator().create_storey_metadata(result)
+        assert metadata["additional_sections"] == [{
+            "cut_height": 0.3,
+            "element_count": 2,
+            "polyline_count": 2,
+            "output_files": {"svg": section.svg_file, "geojson": section.geojson_file}
+        }]
@@ -0,0 +1,117 @@
+"""
+Tests for process-parallel space extraction.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ifcopenshell
+import ifcopenshell.api
+
+from ifc_room_schedule.parser.parallel_space_extractor import ParallelSpaceExtractor
+from ifc_room_schedule.parser.ifc_space_extractor import IfcSpaceExtractor
+from ifc_room_schedule.parser.step_scanner import StepScanner
+
+
+def create_ifc_file(path, storeys=2, spaces_per_storey=20):
+    """Write a small IFC4 model with named spaces on several storeys."""
+    ifc_file = ifcopenshell.api.run("project.create_file", version="IFC4")
+    project = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcProject", name="Project")
+    ifcopenshell.api.run("unit.assign_unit", ifc_file)
+    building = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcBuilding", name="Building")
+    ifcopenshell.api.run("aggregate.assign_object", ifc_file, relating_object=project, products=[building])
+
+    for storey_index in range(storeys):
+        storey = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcBuildingStorey",
+                                      name=f"Level {storey_index}")
+        storey.Elevation = storey_index * 3.0
+        ifcopenshell.api.run("aggregate.assign_object", ifc_file, relating_object=building, products=[storey])
+
+        for space_index in range(spaces_per_storey):
+            space = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcSpace",
+                                         name=f"{storey_index}{space_index:03d}")
+            space.LongName = f"Office {storey_index}{space_index:03d}"
+            ifcopenshell.api.run("aggregate.assign_object", ifc_file, relating_object=storey, products=[space])
+
+    ifc_file.write(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def ifc_path(tmp_path):
+    """Create a model with 40 spaces."""
+    return create_ifc_file(tmp_path / "model.ifc")
+
+
+def extract_serial(path):
+    """Extract spaces with the regular single-process extractor."""
+    return IfcSpaceExtractor(ifcopenshell.open(path)).extract_spaces()
+
+
+class TestParallelSpaceExtractor:
+    """Test cases for ParallelSpaceExtractor."""
+
+    def test_parallel_matches_serial_extraction(self, ifc_path):
+        """Test that worker processes produce the serial result in the same order."""
+        extractor = ParallelSpaceExtractor(workers=2, min_spaces_per_worker=5)
+
+        spaces = extractor.extract_spaces(ifc_path)
+
+        assert extractor.get_statistics()['workers'] == 2
+        assert spaces == extract_serial(ifc_path)
+        assert [space.name for space in spaces] == [space.name for space in extract_serial(ifc_path)]
+
+    def test_repeated_runs_are_deterministic(self, ifc_path):
+        """Test that the merge order does not depend on worker scheduling."""
+        extractor = ParallelSpaceExtractor(workers=3, slices_per_worker=5, min_spaces_per_worker=2)
+
+        first = extractor.extract_spaces(ifc_path)
+        second = extractor.extract_spaces(ifc_path)
+
+        assert [space.guid for space in first] == [space.guid for space in second]
+
+    def test_small_models_are_extracted_in_process(self, ifc_path):
+        """Test that models too small to split do not start worker processes."""
+        extractor = ParallelSpaceExtractor(workers=4, min_spaces_per_worker=100)
+
+        with patch('ifc_room_schedule.parser.parallel_space_extractor.ProcessPoolExecutor') as mock_pool:
+            spaces = extractor.extract_spaces(ifc_path)
+
+        mock_pool.assert_not_called()
+        assert extractor.get_statistics()['workers'] == 1
+        assert spaces == extract_serial(ifc_path)
+
+    def test_slices_cover_all_spaces_in_order(self):
+        """Test that slices are contiguous and balanced."""
+        extractor = ParallelSpaceExtractor(workers=4, slices_per_worker=2)
+
+        slices = extractor._create_slices(1001, 4)
+
+        assert len(slices) == 8
+        assert slices[0][0] == 0 and slices[-1] == (875, None)
+        assert all(a[1] == b[0] for a, b in zip(slices, slices[1:]))
+        sizes = [end - start for start, end in slices[:-1]] + [1001 - slices[-1][0]]
+        assert max(sizes) - min(sizes) <= 1
+
+    def test_spaces_beyond_prescan_count_are_extracted(self, ifc_path):
+        """Test that spaces the pre-scan did not count still reach the last slice."""
+        scan_result = StepScanner().scan(ifc_path)
+        # As if 10 spaces were of a subtype the pre-scan could not resolve
+        scan_result.entity_counts["IFCSPACE"] = 30
+        extractor = ParallelSpaceExtractor(workers=2, min_spaces_per_worker=5)
+
+        spaces = extractor.extract_spaces(ifc_path, scan_result)
+
+        assert extractor.get_statistics()['workers'] == 2
+        assert len(spaces) == 40
+        assert spaces == extract_serial(ifc_path)
+
+    def test_missing_file_raises_value_error(self, tmp_path):
+        """Test that a missing file is rejected."""
+        with pytest.raises(ValueError):
+            ParallelSpaceExtractor(workers=2).extract_spaces(str(tmp_path / "missing.ifc"))
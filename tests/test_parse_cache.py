@@ -0,0 +1,268 @@
+"""
+Tests for the persistent parse cache.
+"""
+
+import pytest
+import sys
+import os
+import time
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ifc_room_schedule.parser.parse_cache import ParseCache
+from ifc_room_schedule.parser.ifc_file_reader import IfcFileReader
+from ifc_room_schedule.data.space_model import SpaceData
+from ifc_room_schedule.data.surface_model import SurfaceData
+from ifc_room_schedule.data.space_boundary_model import SpaceBoundaryData
+from ifc_room_schedule.data.relationship_model import RelationshipData
+from ifc_room_schedule.visualization.geometry_models import (
+    Point2D, Polygon2D, ArrayPolygon2D, FloorLevel, FloorGeometry
+)
+
+
+def create_space(index):
+    """Create a space with surfaces, boundaries and relationships."""
+    guid = f"SPACE_{index:04d}"
+    space = SpaceData(
+        guid=guid,
+        name=f"{100 + index}",
+        long_name=f"Office {index}",
+        description="Test space",
+        object_type="Office",
+        zone_category="Work",
+        number=f"{100 + index}",
+        elevation=3.5,
+        quantities={"NetFloorArea": 20.5 + index, "Height": 2.7},
+        user_descriptions={"note": "Keep"},
+        processed=True
+    )
+    space.add_surface(SurfaceData(
+        id=f"SURF_{index}", type="Wall", area=12.0, material="Concrete",
+        ifc_type="IfcWall", related_space_guid=guid, properties={"FireRating": "EI60"}
+    ))
+    boundary = SpaceBoundaryData(
+        id=f"BND_{index}", guid=f"BND_{index}", name="1stLevel", description="",
+        physical_or_virtual_boundary="Physical", internal_or_external_boundary="External",
+        related_building_element_guid=f"WALL_{index}", related_building_element_name="Wall",
+        related_building_element_type="IfcWall", related_space_guid=guid,
+        boundary_surface_type="Wall", boundary_orientation="North",
+        connection_geometry={"points": [(0.0, 0.0), (4.0, 0.0)]}, calculated_area=10.8
+    )
+    boundary.update_display_label()
+    space.add_space_boundary(boundary)
+    space.add_relationship(RelationshipData(
+        related_entity_guid="STOREY_01", related_entity_name="Level 1",
+        related_entity_description="", relationship_type="Contains",
+        ifc_relationship_type="IfcRelContainedInSpatialStructure"
+    ))
+    return space
+
+
+def create_floor_geometries():
+    """Create two floors, one with Point2D polygons and one with array polygons."""
+    ground = FloorGeometry(
+        level=FloorLevel(id="STOREY_01", name="Level 1", elevation=0.0),
+        room_polygons=[Polygon2D(
+            points=[Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)],
+            space_guid="SPACE_0000", space_name="100"
+        )]
+    )
+    first = FloorGeometry(
+        level=FloorLevel(id="STOREY_02", name="Level 2", elevation=3.5),
+        room_polygons=[ArrayPolygon2D([(0, 0), (5, 0), (5, 5)], "SPACE_0001", "101")]
+    )
+    return {"STOREY_01": ground, "STOREY_02": first}
+
+
+@pytest.fixture
+def ifc_path(tmp_path):
+    """Create a small file standing in for an IFC model."""
+    path = tmp_path / "model.ifc"
+    path.write_text("ISO-10303-21;\nDATA;\n#1=IFCSPACE('A',$,$,$,$,$,$,$,$,$);\nENDSEC;\n")
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a parse cache in a temporary directory."""
+    return ParseCache(str(tmp_path / "cache"))
+
+
+class TestParseCache:
+    """Test cases for ParseCache."""
+
+    def test_round_trip_preserves_space_graph(self, cache, ifc_path):
+        """Test that the full space graph survives a store and load."""
+        spaces = [create_space(i) for i in range(5)]
+
+        assert cache.store(ifc_path, spaces)
+        loaded = cache.load(ifc_path)
+
+        assert loaded == spaces
+        assert loaded[0].space_boundaries[0].display_label == spaces[0].space_boundaries[0].display_label
+        assert loaded[0].relationships[0].ifc_relationship_type == "IfcRelContainedInSpatialStructure"
+        assert cache.hits == 1
+
+    def test_miss_when_not_stored(self, cache, ifc_path):
+        """Test that an uncached file misses."""
+        assert cache.load(ifc_path) is None
+        assert cache.misses == 1
+
+    def test_key_follows_content_not_path(self, cache, ifc_path, tmp_path):
+        """Test that a copy of the file hits and a modified file misses."""
+        cache.store(ifc_path, [create_space(0)])
+
+        copy_path = tmp_path / "copy.ifc"
+        copy_path.write_bytes(open(ifc_path, 'rb').read())
+        assert cache.load(str(copy_path)) is not None
+
+        # Keep the size but move the mtime so the remembered hash is not reused
+        with open(ifc_path, 'r+b') as f:
+            f.write(b"X")
+        os.utime(ifc_path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+        assert cache.load(ifc_path) is None
+
+    def test_extraction_and_parser_version_are_part_of_key(self, cache, ifc_path):
+        """Test that other extraction pipelines and parser versions miss."""
+        cache.store(ifc_path, [create_space(0)], extraction="spaces")
+
+        assert cache.load(ifc_path, extraction="full") is None
+        assert cache.load(ifc_path, extraction="spaces") is not None
+
+        with patch('ifc_room_schedule.parser.parse_cache.PARSER_VERSION', "999"):
+            assert cache.load(ifc_path, extraction="spaces") is None
+
+    def test_rejects_incompatible_data(self, cache):
+        """Test that data without the cache header is rejected."""
+        with pytest.raises(ValueError):
+            cache.decode_spaces(b"not a cache file")
+
+    def test_corrupt_cache_file_is_a_miss(self, cache, ifc_path):
+        """Test that a damaged cache file is treated as a miss."""
+        cache.store(ifc_path, [create_space(0)])
+        cache_path = cache.get_cache_path(cache.get_cache_key(cache.get_file_hash(ifc_path)))
+        with open(cache_path, 'wb') as f:
+            f.write(b"RSPC garbage")
+
+        assert cache.load(ifc_path) is None
+
+    def test_floor_geometry_round_trip(self, cache, ifc_path):
+        """Test that floor geometry is cached separately from the spaces."""
+        floor_geometries = create_floor_geometries()
+        floor_geometries["STOREY_01"].find_room_at_point(Point2D(1, 1))
+
+        assert cache.load_floor_geometry(ifc_path) is None
+        assert cache.store_floor_geometry(ifc_path, floor_geometries)
+        assert cache.load(ifc_path) is None
+
+        loaded = cache.load_floor_geometry(ifc_path)
+
+        assert list(loaded) == ["STOREY_01", "STOREY_02"]
+        assert loaded["STOREY_01"] == floor_geometries["STOREY_01"]
+        assert loaded["STOREY_01"].find_room_at_point(Point2D(1, 1)).space_guid == "SPACE_0000"
+        assert loaded["STOREY_02"].room_polygons[0].get_area() == pytest.approx(12.5)
+        assert loaded["STOREY_02"].level.spaces == ["SPACE_0001"]
+
+    def test_evicts_oldest_entries(self, tmp_path):
+        """Test that the cache is trimmed to its size limit."""
+        cache = ParseCache(str(tmp_path / "cache"), max_disk_mb=0)
+        path = tmp_path / "model.ifc"
+        path.write_text("content")
+
+        cache.store(str(path), [create_space(0)])
+
+        assert cache.get_stats()['entries'] == 0
+
+    def test_warm_load_is_fast(self, cache, ifc_path):
+        """Test that loading a large cached model takes well under a second."""
+        spaces = [create_space(i) for i in range(2000)]
+        cache.store(ifc_path, spaces)
+
+        start_time = time.time()
+        loaded = cache.load(ifc_path)
+        load_time = time.time() - start_time
+
+        assert len(loaded) == 2000
+        assert load_time < 1.0, f"Warm load took {load_time:.2f}s, expected < 1.0s"
+
+
+class TestIfcFileReaderParseCache:
+    """Test cases for the parse cache integration in IfcFileReader."""
+
+    def test_load_cached_spaces_skips_file_loading(self, tmp_path, ifc_path):
+        """Test that a cache hit returns spaces without opening the IFC file."""
+        reader = IfcFileReader(parse_cache_directory=str(tmp_path / "cache"))
+        spaces = [create_space(0), create_space(1)]
+
+        assert reader.store_cached_spaces(spaces, file_path=ifc_path)
+
+        with patch('ifcopenshell.open') as mock_open:
+            loaded = reader.load_cached_spaces(ifc_path)
+
+        mock_open.assert_not_called()
+        assert loaded == spaces
+        assert reader.file_path == ifc_path
+        assert not reader.is_loaded()
+
+    def test_missing_file_and_disabled_cache(self, tmp_path, ifc_path):
+        """Test that missing files and disabled caches never hit."""
+        reader = IfcFileReader(parse_cache_directory=str(tmp_path / "cache"))
+        assert reader.load_cached_spaces(str(tmp_path / "missing.ifc")) is None
+        assert reader.load_cached_spaces(None) is None
+
+        disabled = IfcFileReader(enable_parse_cache=False)
+        assert disabled.store_cached_spaces([create_space(0)], file_path=ifc_path) is False
+        assert disabled.load_cached_spaces(ifc_path) is None
+
+
+class TestMainWindowParseCache:
+    """Test cases for warm opens in the main window."""
+
+    @pytest.fixture
+    def main_window(self, tmp_path):
+        """Create a main window whose reader caches into a temporary directory."""
+        QApplication = pytest.importorskip("PyQt6.QtWidgets").QApplication
+        app = QApplication.instance() or QApplication([])
+        from ifc_room_schedule.ui.main_window import MainWindow
+
+        window = MainWindow()
+        window._testing_mode = True
+        window.ifc_reader.parse_cache = ParseCache(str(tmp_path / "cache"))
+        yield window
+        window.close()
+
+    def test_warm_open_skips_ifc_file(self, main_window, ifc_path):
+        """Test that a cached file is shown without validating, opening or parsing it."""
+        spaces = [create_space(0), create_space(1)]
+        main_window.ifc_reader.store_cached_spaces(spaces, file_path=ifc_path)
+        main_window.ifc_reader.store_cached_floor_geometry(create_floor_geometries(), file_path=ifc_path)
+
+        with patch('ifcopenshell.open') as mock_open, \
+                patch.object(main_window.ifc_reader, 'validate_file') as mock_validate, \
+                patch.object(main_window, 'extract_spaces_internal') as mock_extract:
+            main_window.process_ifc_file(ifc_path)
+
+        mock_open.assert_not_called()
+        mock_validate.assert_not_called()
+        mock_extract.assert_not_called()
+        assert main_window.spaces == spaces
+        assert list(main_window.floor_geometries) == ["STOREY_01", "STOREY_02"]
+        assert main_window.current_file_path == ifc_path
+        assert main_window.has_loaded_file()
+
+        main_window.close_file()
+        assert not main_window.has_loaded_file()
+        assert main_window.spaces == []
+
+    def test_spaces_without_geometry_load_normally(self, main_window, ifc_path):
+        """Test that a partial cache entry falls back to loading the file."""
+        main_window.ifc_reader.store_cached_spaces([create_space(0)], file_path=ifc_path)
+
+        with patch.object(main_window.ifc_reader, 'validate_file', return_value=(True, "Valid")), \
+                patch.object(main_window, 'load_file_directly') as mock_load:
+            main_window.process_ifc_file(ifc_path)
+
+        mock_load.assert_called_once_with(ifc_path)
+        assert not main_window.loaded_from_cache
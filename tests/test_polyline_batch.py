@@ -0,0 +1,215 @@
+"""
+Unit tests for batch polyline operations.
+
+Tests the packed-array transform, simplification and duplicate removal in
+SectionProcessor against point-by-point reference implementations, and
+benchmarks the batch path on a storey-sized set of polylines.
+"""
+
+import pytest
+import sys
+import os
+import random
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ifc_floor_plan_generator.geometry.section_processor import SectionProcessor
+from ifc_floor_plan_generator.geometry.polyline_batch import (
+    pack_polylines, unpack_polylines, simplify_batch, deduplicate_batch
+)
+from ifc_floor_plan_generator.models import Polyline2D
+
+
+def create_tessellated_rooms(num_rooms, seed=1, max_steps=6):
+    """Create rectangular room outlines with extra collinear and near-duplicate vertices."""
+    rng = random.Random(seed)
+    polylines = []
+
+    for room in range(num_rooms):
+        x = (room % 50) * 5.0
+        y = (room // 50) * 5.0
+        corners = [(x, y), (x + 4.0, y), (x + 4.0, y + 4.0), (x, y + 4.0), (x, y)]
+
+        points = []
+        for start, end in zip(corners, corners[1:]):
+            for step in range(rng.randint(1, max_steps)):
+                t = step / max_steps
+                points.append((start[0] + t * (end[0] - start[0]) + rng.uniform(-1e-4, 1e-4),
+                               start[1] + t * (end[1] - start[1]) + rng.uniform(-1e-4, 1e-4)))
+            if rng.random() < 0.3:
+                points.append(points[-1])
+        points.append(corners[-1])
+        polylines.append(Polyline2D(points=points, ifc_class="IfcWall", element_guid=f"WALL_{room:04d}"))
+
+    return polylines
+
+
+def reference_optimize(processor, polylines, tolerance):
+    """Optimize polylines point by point, as before the batch path."""
+    optimized = []
+    for polyline in polylines:
+        points = processor._simplify_collinear_points(polyline.points, tolerance)
+        points = processor._remove_duplicate_points(points, tolerance)
+        if len(points) >= 2:
+            optimized.append(Polyline2D(points=points, ifc_class=polyline.ifc_class,
+                                        element_guid=polyline.element_guid, is_closed=polyline.is_closed))
+    return optimized
+
+
+def line_distance(point, start, end):
+    """Distance of a point to the line through start and end."""
+    (x0, y0), (x1, y1), (x2, y2) = point, start, end
+    length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+    if length == 0:
+        return ((x0 - x1) ** 2 + (y0 - y1) ** 2) ** 0.5
+    return abs((y2 - y1) * x0 - (x2 - x1) * y0 + x2 * y1 - y2 * x1) / length
+
+
+@pytest.fixture
+def processor():
+    """Create a section processor."""
+    return SectionProcessor()
+
+
+class TestPackedCoordinates:
+    """Test cases for packed coordinates on Polyline2D."""
+
+    def test_pack_and_unpack_round_trip(self):
+        """Test that unpacked polylines keep their points, metadata and packed arrays."""
+        polylines = create_tessellated_rooms(3)
+
+        coordinates, offsets = pack_polylines(polylines)
+        unpacked = unpack_polylines(coordinates, offsets, polylines)
+
+        assert unpacked == polylines
+        assert unpacked[1].cached_coordinates() is not None
+        np.testing.assert_array_equal(pack_polylines(unpacked)[0], coordinates)
+
+    def test_cache_follows_point_changes(self):
+        """Test that replacing, extending or editing the points invalidates the packed array."""
+        polyline = Polyline2D.from_coordinates(np.array([[0.0, 0.0], [1.0, 0.0]]), "IfcWall", "GUID")
+
+        polyline.points.append((1.0, 1.0))
+        assert polyline.cached_coordinates() is None
+        assert polyline.coordinates.tolist() == [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0]]
+
+        polyline.points = [(5.0, 5.0), (6.0, 6.0)]
+        assert polyline.coordinates.tolist() == [[5.0, 5.0], [6.0, 6.0]]
+
+        polyline.points[0] = (7.0, 7.0)
+        assert polyline.cached_coordinates() is None
+        assert polyline.coordinates.tolist() == [[7.0, 7.0], [6.0, 6.0]]
+
+
+class TestBatchOperations:
+    """Test the batch path against point-by-point processing."""
+
+    def test_transform_matches_point_by_point(self, processor):
+        """Test scaling, Y-inversion and offsets over all polylines."""
+        polylines = create_tessellated_rooms(4)
+        y_values = [y for polyline in polylines for _, y in polyline.points]
+        y_reference = (max(y_values) + min(y_values)) / 2
+
+        transformed = processor.transform_coordinates(polylines, invert_y=True, scale_factor=2.0,
+                                                      offset_x=1.0, offset_y=-3.0)
+
+        for original, result in zip(polylines, transformed):
+            expected = [(x * 2.0 + 1.0, 2 * y_reference - y * 2.0 - 3.0) for x, y in original.points]
+            np.testing.assert_allclose(result.points, expected)
+            assert (result.ifc_class, result.element_guid) == (original.ifc_class, original.element_guid)
+
+    def test_optimize_matches_point_by_point_on_rooms(self, processor):
+        """Test that tessellated room outlines simplify to the same corners."""
+        polylines = create_tessellated_rooms(200)
+
+        optimized = processor.optimize_polylines(polylines, 1e-3)
+        expected = reference_optimize(processor, polylines, 1e-3)
+
+        assert len(optimized) == len(expected)
+        for result, reference in zip(optimized, expected):
+            np.testing.assert_allclose(result.points, reference.points, atol=1e-3)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_simplification_stays_within_tolerance(self, seed):
+        """Test that every removed point lies within tolerance of the simplified polyline."""
+        rng = random.Random(seed)
+        tolerance = rng.choice([1e-3, 0.05, 0.5])
+        polylines = [
+            Polyline2D(points=[(i * 0.1, rng.uniform(-0.1, 0.1) if rng.random() < 0.8 else rng.uniform(-2, 2))
+                               for i in range(rng.randint(2, 40))],
+                       ifc_class="IfcWall", element_guid=f"W{n}")
+            for n in range(10)
+        ]
+        coordinates, offsets = pack_polylines(polylines)
+
+        keep = simplify_batch(coordinates, offsets, tolerance)
+
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            kept = [i for i in range(start, end) if keep[i]]
+            assert kept[0] == start and kept[-1] == end - 1
+            for left, right in zip(kept, kept[1:]):
+                for i in range(left + 1, right):
+                    assert line_distance(coordinates[i], coordinates[left], coordinates[right]) <= tolerance
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_small_batches_keep_the_same_points(self, processor, seed):
+        """Test that the per-point path for small batches matches the batch simplification."""
+        rng = random.Random(seed)
+        tolerance = rng.choice([1e-3, 0.05, 0.5])
+        polylines = [
+            Polyline2D(points=[(i * 0.1, rng.uniform(-0.1, 0.1) if rng.random() < 0.8 else rng.uniform(-2, 2))
+                               for i in range(rng.randint(2, 40))],
+                       ifc_class="IfcWall", element_guid=f"W{n}")
+            for n in range(10)
+        ]
+        coordinates, offsets = pack_polylines(polylines)
+
+        keep = simplify_batch(coordinates, offsets, tolerance)
+
+        for polyline, start, end in zip(polylines, offsets[:-1], offsets[1:]):
+            expected = [tuple(point) for point in coordinates[start:end][keep[start:end]].tolist()]
+            assert processor._simplify_douglas_peucker(polyline.points, tolerance) == expected
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_duplicate_removal_matches_point_by_point(self, processor, seed):
+        """Test that batch duplicate removal keeps exactly the same points."""
+        rng = random.Random(seed)
+        tolerance = 0.5
+        polylines = []
+        for n in range(8):
+            points = [(0.0, 0.0)]
+            for _ in range(rng.randint(1, 30)):
+                step = rng.choice([0.0, 0.2, 0.4, 0.6, 1.5])
+                points.append((points[-1][0] + step, points[-1][1]))
+            polylines.append(Polyline2D(points=points, ifc_class="IfcWall", element_guid=f"W{n}"))
+        coordinates, offsets = pack_polylines(polylines)
+
+        keep = deduplicate_batch(coordinates, offsets, tolerance)
+
+        for polyline, start, end in zip(polylines, offsets[:-1], offsets[1:]):
+            expected = processor._remove_duplicate_points(polyline.points, tolerance)
+            assert [tuple(point) for point in coordinates[start:end][keep[start:end]].tolist()] == expected
+
+
+class TestBatchBenchmark:
+    """Benchmark the batch path against point-by-point processing."""
+
+    def test_batch_optimize_beats_point_by_point(self, processor):
+        """Test that optimizing a storey-sized batch is faster than per-point loops."""
+        polylines = create_tessellated_rooms(2000, max_steps=40)
+
+        start_time = time.perf_counter()
+        reference_optimize(processor, polylines, 1e-3)
+        reference_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        processor.optimize_polylines(polylines, 1e-3)
+        batch_time = time.perf_counter() - start_time
+
+        print(f"\nPoint by point: {reference_time:.3f}s, batch: {batch_time:.3f}s, "
+              f"speed-up: {reference_time / batch_time:.2f}x")
+        assert batch_time < reference_time
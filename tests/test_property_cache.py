@@ -0,0 +1,117 @@
+"""
+Tests for the shared property set and quantity decode cache.
+"""
+
+import pytest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ifcopenshell
+import ifcopenshell.api
+
+from ifc_room_schedule.parser.property_cache import PropertyCache
+from ifc_room_schedule.parser.ifc_space_extractor import IfcSpaceExtractor
+from ifc_room_schedule.parser.ifc_surface_extractor import IfcSurfaceExtractor
+from ifc_room_schedule.parser.ifc_space_boundary_parser import IfcSpaceBoundaryParser
+from ifc_room_schedule.parser.ifc_relationship_parser import IfcRelationshipParser
+
+
+def create_ifc_file():
+    """Create a model with one wall whose property sets are shared by two spaces."""
+    ifc_file = ifcopenshell.api.run("project.create_file", version="IFC4")
+    ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcProject", name="Project")
+
+    wall = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcWall", name="Wall")
+    qto = ifcopenshell.api.run("pset.add_qto", ifc_file, product=wall, name="Qto_WallBaseQuantities")
+    ifcopenshell.api.run("pset.edit_qto", ifc_file, qto=qto,
+                         properties={"NetSideArea": 12.5, "Length": 5.0})
+    pset = ifcopenshell.api.run("pset.add_pset", ifc_file, product=wall, name="Pset_ThermalProperties")
+    ifcopenshell.api.run("pset.edit_pset", ifc_file, pset=pset,
+                         properties={"ThermalTransmittance": 0.18, "IsExternal": True})
+
+    for name in ("101", "102"):
+        space = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcSpace", name=name)
+        space_qto = ifcopenshell.api.run("pset.add_qto", ifc_file, product=space,
+                                         name="Qto_SpaceBaseQuantities")
+        ifcopenshell.api.run("pset.edit_qto", ifc_file, qto=space_qto,
+                             properties={"NetFloorArea": 20.0, "Height": 3.0})
+        ifc_file.createIfcRelSpaceBoundary(
+            ifcopenshell.guid.new(), None, None, None, space, wall, None, "PHYSICAL", "INTERNAL"
+        )
+
+    return ifc_file
+
+
+@pytest.fixture
+def ifc_file():
+    """Create the test model."""
+    return create_ifc_file()
+
+
+class TestPropertyCache:
+    """Test cases for PropertyCache."""
+
+    def test_decodes_quantities_once(self, ifc_file):
+        """Test that repeated lookups of the same element hit the cache."""
+        cache = PropertyCache(ifc_file)
+        wall = ifc_file.by_type("IfcWall")[0]
+
+        first = cache.get_element_quantities(wall)
+        second = cache.get_element_quantities(wall)
+
+        assert ("NetSideArea", "IfcQuantityArea", 12.5) in first
+        assert ("Length", "IfcQuantityLength", 5.0) in first
+        assert second is first
+        assert cache.get_statistics()['hits'] == 1
+
+    def test_decodes_property_set(self, ifc_file):
+        """Test that single values are unwrapped."""
+        cache = PropertyCache(ifc_file)
+        pset = ifc_file.by_type("IfcPropertySet")[0]
+
+        properties = cache.get_properties(pset)
+
+        assert properties == {"ThermalTransmittance": 0.18, "IsExternal": True}
+        assert cache.get_properties(pset) is properties
+
+    def test_new_file_invalidates_cache(self, ifc_file):
+        """Test that setting another file clears entries and counters."""
+        cache = PropertyCache(ifc_file)
+        cache.get_element_quantities(ifc_file.by_type("IfcWall")[0])
+
+        cache.set_ifc_file(ifc_file)
+        assert cache.get_statistics()['elements'] == 1
+
+        cache.set_ifc_file(create_ifc_file())
+        stats = cache.get_statistics()
+        assert stats['elements'] == 0
+        assert stats['hits'] == stats['misses'] == 0
+
+    def test_parsers_share_decoded_sets(self, ifc_file):
+        """Test that a wall bounding several spaces is decoded once across parsers."""
+        cache = PropertyCache()
+        space_extractor = IfcSpaceExtractor(property_cache=cache)
+        surface_extractor = IfcSurfaceExtractor(property_cache=cache)
+        boundary_parser = IfcSpaceBoundaryParser(property_cache=cache)
+        relationship_parser = IfcRelationshipParser(property_cache=cache)
+        for parser in (space_extractor, surface_extractor, boundary_parser, relationship_parser):
+            parser.set_ifc_file(ifc_file)
+
+        wall = ifc_file.by_type("IfcWall")[0]
+        spaces = space_extractor.extract_spaces()
+        assert spaces[0].quantities["NetFloorArea"] == 20.0
+
+        assert surface_extractor._get_area_from_quantities(wall) == 12.5
+        for boundary in ifc_file.by_type("IfcRelSpaceBoundary"):
+            assert boundary_parser._get_area_from_related_element(boundary) == 12.5
+
+        properties = relationship_parser.extract_thermal_and_material_properties(wall.GlobalId)
+        assert properties['thermal_properties']["ThermalTransmittance"] == 0.18
+
+        stats = cache.get_statistics()
+        assert stats['quantity_sets'] == 3
+        assert stats['property_sets'] == 1
+        assert stats['hits'] >= 2
@@ -0,0 +1,152 @@
+"""
+Unit tests for SectionProcessor polyline chaining.
+
+Tests the endpoint-grid chaining against the linear reference implementation
+and benchmarks how both scale with the number of section segments.
+"""
+
+import pytest
+import sys
+import os
+import random
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ifc_floor_plan_generator.geometry.section_processor import SectionProcessor
+from ifc_floor_plan_generator.models import Polyline2D
+
+
+def create_room_segments(num_rooms, seed=1):
+    """Create shuffled wall segments forming closed rectangular rooms."""
+    segments = []
+
+    for room in range(num_rooms):
+        x = (room % 50) * 5.0
+        y = (room // 50) * 5.0
+        corners = [(x, y), (x + 4.0, y), (x + 4.0, y + 4.0), (x, y + 4.0)]
+
+        for i in range(4):
+            start, end = corners[i], corners[(i + 1) % 4]
+            # Every other segment is reversed so both connection directions are used
+            if i % 2:
+                start, end = end, start
+            segments.append(Polyline2D(points=[start, end], ifc_class="IfcWall",
+                                       element_guid=f"WALL_{room:04d}"))
+
+    random.Random(seed).shuffle(segments)
+    return segments
+
+
+def create_random_polylines(seed):
+    """Create polylines with many near-coincident endpoints and some closed loops."""
+    rng = random.Random(seed)
+    tolerance = rng.choice([1e-3, 0.5, 1.0])
+    anchors = [(rng.randint(0, 8) * tolerance * rng.choice([0.3, 0.5, 1.0, 1.5, 2.0]),
+                rng.randint(0, 8) * tolerance * rng.choice([0.5, 1.0, 1.9]))
+               for _ in range(12)]
+
+    polylines = []
+    for i in range(rng.randint(2, 25)):
+        points = []
+        for _ in range(rng.randint(2, 4)):
+            if rng.random() < 0.7:
+                points.append(rng.choice(anchors))
+            else:
+                points.append((rng.uniform(0, 10 * tolerance), rng.uniform(0, 10 * tolerance)))
+        polylines.append(Polyline2D(points=points, ifc_class=rng.choice(["IfcWall", "IfcDoor"]),
+                                    element_guid=f"ELEM_{i:03d}", is_closed=rng.random() < 0.1))
+
+    return polylines, tolerance
+
+
+@pytest.fixture
+def processor():
+    """Create a section processor."""
+    return SectionProcessor()
+
+
+class TestChainPolylines:
+    """Test cases for polyline chaining."""
+
+    def test_empty_and_single_input(self, processor):
+        """Test that trivial inputs are returned unchanged."""
+        polyline = Polyline2D(points=[(0.0, 0.0), (1.0, 0.0)], ifc_class="IfcWall", element_guid="W1")
+
+        assert processor.chain_polylines([], 1e-3) == []
+        assert processor.chain_polylines([polyline], 1e-3) == [polyline]
+
+    def test_chains_segments_into_closed_loop(self, processor):
+        """Test that shuffled and reversed wall segments form one closed room outline."""
+        segments = create_room_segments(1)
+
+        result = processor.chain_polylines(segments, 1e-3)
+
+        assert len(result) == 1
+        assert result[0].is_closed
+        assert sorted(result[0].points) == [(0.0, 0.0), (0.0, 4.0), (4.0, 0.0), (4.0, 4.0)]
+
+    def test_closed_polylines_are_not_connected(self, processor):
+        """Test that closed polylines are kept as separate chains."""
+        closed = Polyline2D(points=[(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)], ifc_class="IfcSlab",
+                            element_guid="S1", is_closed=True)
+        open_segment = Polyline2D(points=[(0.0, 0.0), (-1.0, 0.0)], ifc_class="IfcWall", element_guid="W1")
+
+        result = processor.chain_polylines([closed, open_segment], 1e-3)
+
+        assert result == [closed, open_segment]
+
+    def test_matches_linear_chaining(self, processor):
+        """Test that the grid-based chaining gives identical output to the linear scan."""
+        for seed in range(500):
+            polylines, tolerance = create_random_polylines(seed)
+
+            expected = processor._chain_polylines_linear(polylines, tolerance)
+            result = processor.chain_polylines(polylines, tolerance)
+
+            assert result == expected, f"Chaining differs for seed {seed}"
+
+    def test_falls_back_to_linear_for_zero_tolerance(self, processor):
+        """Test that a non-positive tolerance uses the linear scan."""
+        segments = create_room_segments(2)
+
+        assert processor.chain_polylines(segments, 0.0) == processor._chain_polylines_linear(segments, 0.0)
+
+    def test_input_polylines_are_not_modified(self, processor):
+        """Test that chaining works on copies of the input."""
+        segments = create_room_segments(3)
+        original_points = [list(segment.points) for segment in segments]
+
+        processor.chain_polylines(segments, 1e-3)
+
+        assert [segment.points for segment in segments] == original_points
+
+
+class TestChainPolylinesPerformance:
+    """Benchmark grid-based chaining against the linear scan."""
+
+    def test_chaining_scales_with_segment_count(self, processor):
+        """Test that grid chaining stays fast and beats the linear scan on large sections."""
+        timings = {}
+
+        for num_rooms in (50, 200, 800):
+            segments = create_room_segments(num_rooms)
+
+            start_time = time.perf_counter()
+            result = processor.chain_polylines(segments, 1e-3)
+            grid_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            expected = processor._chain_polylines_linear(segments, 1e-3)
+            linear_time = time.perf_counter() - start_time
+
+            assert result == expected
+            assert len(result) == num_rooms
+            timings[num_rooms] = (grid_time, linear_time)
+
+        grid_time, linear_time = timings[800]
+        assert grid_time < 1.0, f"Chaining 3200 segments took {grid_time:.2f}s, expected < 1.0s"
+        assert grid_time < linear_time, (
+            f"Grid chaining ({grid_time:.3f}s) should beat linear chaining ({linear_time:.3f}s)"
+        )
@@ -0,0 +1,169 @@
+"""
+Tests for the streaming IFC-SPF pre-scanner.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ifc_room_schedule.parser.step_scanner import StepScanner
+from ifc_room_schedule.parser.optimized_ifc_parser import OptimizedIFCParser
+from ifc_room_schedule.parser.ifc_file_reader import IfcFileReader
+
+
+SAMPLE_IFC = """ISO-10303-21;
+HEADER;
+FILE_DESCRIPTION(('ViewDefinition [CoordinationView]'),'2;1');
+FILE_NAME('office.ifc','2024-05-01T10:00:00',('Ola Nordmann'),('Arkitekt AS'),'IfcOpenShell 0.7.0','ArchiCAD 27','');
+FILE_SCHEMA(('IFC4'));
+ENDSEC;
+DATA;
+#1=IFCPROJECT('0YvctVUKr0kugbFTf53O9L',$,'Office',$,$,$,$,$,$);
+#2=IFCBUILDINGSTOREY('2YvctVUKr0kugbFTf53O9L',$,'Level 1',$,$,$,$,$,.ELEMENT.,0.);
+#3=IFCBUILDINGSTOREY('3YvctVUKr0kugbFTf53O9L',$,'Level 2',$,$,$,$,$,.ELEMENT.,3.5);
+#4=IFCSPACE('4YvctVUKr0kugbFTf53O9L',$,'101','Office; north #9=IFCSPACE(',$,$,$,$,.ELEMENT.,.SPACE.,$);
+#5=IFCSPACE('5YvctVUKr0kugbFTf53O9L',$,'102',$,$,$,$,$,.ELEMENT.,.SPACE.,$);#6=IFCWALL('6YvctVUKr0kugbFTf53O9L',$,$,$,$,$,$,$,$);
+#7 = IFCWALLSTANDARDCASE('7YvctVUKr0kugbFTf53O9L',$,$,$,$,$,$,$,$);
+#8=IFCSLAB('8YvctVUKr0kugbFTf53O9L',$,$,$,$,$,$,$,$);
+ENDSEC;
+END-ISO-10303-21;
+"""
+
+
+@pytest.fixture
+def sample_path(tmp_path):
+    """Write the sample IFC-SPF file."""
+    path = tmp_path / "office.ifc"
+    path.write_text(SAMPLE_IFC)
+    return str(path)
+
+
+class TestStepScanner:
+    """Test cases for StepScanner."""
+
+    def test_counts_entities_by_type(self, sample_path):
+        """Test per-type counts, including records sharing a line."""
+        result = StepScanner().scan(sample_path)
+
+        assert result.total_entities == 8
+        assert result.space_count == 2
+        assert result.storey_count == 2
+        assert result.get_count("IfcWall") == 1
+        assert result.get_count("ifcwallstandardcase") == 1
+        assert result.entity_counts["IFCSLAB"] == 1
+
+    def test_counts_subtypes_like_by_type(self, sample_path):
+        """Test that subtype counting follows the schema inheritance."""
+        result = StepScanner().scan(sample_path)
+
+        assert result.get_count("IfcWall", include_subtypes=True) == 2
+        assert result.get_count("IfcBuildingElement", include_subtypes=True) == 3
+
+    def test_parses_header(self, sample_path):
+        """Test schema and header extraction."""
+        result = StepScanner().scan(sample_path)
+
+        assert result.schema == "IFC4"
+        assert result.header['name'] == "office.ifc"
+        assert result.header['author'] == ["Ola Nordmann"]
+        assert result.header['originating_system'] == "ArchiCAD 27"
+        assert result.header['implementation_level'] == "2;1"
+        assert result.project_guid == "0YvctVUKr0kugbFTf53O9L"
+
+    def test_small_chunks_give_same_counts(self, sample_path):
+        """Test that chunk boundaries do not change the counts and progress is reported."""
+        progress = []
+
+        result = StepScanner(chunk_size=16).scan(sample_path, lambda done, total: progress.append((done, total)))
+
+        assert result.entity_counts == StepScanner().scan(sample_path).entity_counts
+        assert len(progress) > 1
+        assert progress[-1][0] == progress[-1][1] == os.path.getsize(sample_path)
+
+    def test_rejects_non_step_files(self, tmp_path):
+        """Test that empty and non-SPF files raise ValueError."""
+        empty = tmp_path / "empty.ifc"
+        empty.write_bytes(b"")
+        xml = tmp_path / "model.ifc"
+        xml.write_text("<?xml version='1.0'?><ifcXML/>")
+
+        with pytest.raises(ValueError):
+            StepScanner().scan(str(empty))
+        with pytest.raises(ValueError):
+            StepScanner().scan(str(xml))
+
+
+class TestPrescanIntegration:
+    """Test cases for loaders using the pre-scan."""
+
+    def test_count_spaces_uses_prescan(self, sample_path):
+        """Test that the space count comes from the pre-scan without iterating the model."""
+        parser = OptimizedIFCParser()
+        parser.scan_result = StepScanner().scan(sample_path)
+        parser.file_path = sample_path
+        parser.ifc_file = None
+
+        assert parser._count_spaces_efficiently() == 2
+        assert parser._count_entities() == 8
+
+    def test_files_without_spaces_are_not_parsed(self, tmp_path):
+        """Test that a pre-scan without spaces rejects the file before parsing."""
+        path = tmp_path / "no_spaces.ifc"
+        path.write_text(SAMPLE_IFC.replace("IFCSPACE", "IFCZONE"))
+
+        with patch('ifcopenshell.open') as mock_open:
+            success, message = OptimizedIFCParser().load_file_optimized(str(path))
+
+        assert not success
+        assert "No IfcSpace" in message
+        mock_open.assert_not_called()
+
+    def test_validate_rejects_from_prescan(self, tmp_path):
+        """Test that files the pre-scan rules out are rejected without opening them."""
+        no_spaces = tmp_path / "no_spaces.ifc"
+        no_spaces.write_text(SAMPLE_IFC.replace("IFCSPACE", "IFCZONE"))
+        old_schema = tmp_path / "old_schema.ifc"
+        old_schema.write_text(SAMPLE_IFC.replace("'IFC4'", "'IFC2X2_FINAL'"))
+        reader = IfcFileReader(enable_parse_cache=False)
+
+        with patch('ifcopenshell.open') as mock_open:
+            assert reader.validate_file(str(no_spaces)) == (False, "No IfcSpace entities found")
+            assert reader.validate_file(str(old_schema)) == (False, "Unsupported IFC schema: IFC2X2_FINAL")
+
+        mock_open.assert_not_called()
+
+    def test_validate_still_opens_file(self, sample_path):
+        """Test that files passing the pre-scan are opened, unless the caller opens them itself."""
+        reader = IfcFileReader(enable_parse_cache=False)
+        scan_result = StepScanner().scan(sample_path)
+
+        with patch('ifcopenshell.open', side_effect=RuntimeError("Unable to parse")) as mock_open:
+            is_valid, message = reader.validate_file(sample_path, scan_result)
+            assert not is_valid
+            assert "Unable to parse" in message
+
+            is_valid, message = reader.validate_file(sample_path, scan_result, open_file=False)
+            assert is_valid
+            assert "IFC4" in message
+
+        mock_open.assert_called_once_with(sample_path)
+
+    def test_file_info_without_loading(self, sample_path):
+        """Test that the reader describes a file from the pre-scan."""
+        reader = IfcFileReader(enable_parse_cache=False)
+
+        with patch('ifcopenshell.open') as mock_open:
+            info = reader.get_file_info(sample_path)
+
+        mock_open.assert_not_called()
+        assert info['spaces_count'] == 2
+        assert info['storeys_count'] == 2
+        assert info['building_elements'] == 3
+        assert info['created_by'] == "ArchiCAD 27"
+        assert info['project_guid'] == "0YvctVUKr0kugbFTf53O9L"
+        assert reader.get_project_guid(sample_path) == "0YvctVUKr0kugbFTf53O9L"
+        assert not reader.is_loaded()
@@ -0,0 +1,195 @@
+"""
+Tests and benchmark for process-parallel storey processing in FloorPlanGenerator.
+
+Section cutting needs OpenCASCADE, so the geometry engine and section processor
+are replaced by CPU-bound stand-ins. They are patched before the worker pool
+forks, so workers run the same stand-ins against their own copy of the model.
+"""
+
+import pytest
+import sys
+import os
+import math
+import pickle
+import time
+import multiprocessing as mp
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ifcopenshell
+import ifcopenshell.api
+
+from ifc_floor_plan_generator import main as generator_main
+from ifc_floor_plan_generator.main import FloorPlanGenerator
+from ifc_floor_plan_generator.models import Config, GeometryConfig, OutputConfig, PerformanceConfig, Polyline2D
+from ifc_floor_plan_generator.errors.exceptions import ProcessingError, EmptyCutResultError
+
+
+pytestmark = pytest.mark.skipif(
+    mp.get_start_method() != "fork",
+    reason="Geometry stand-ins reach the workers through fork"
+)
+
+
+class FakeGeometryEngine:
+    """Returns the element id as its shape after a fixed amount of CPU work."""
+
+    def __init__(self, config, error_handler=None):
+        self.config = config
+
+    def generate_shape(self, element, element_hash=None):
+        total = 0.0
+        for i in range(1, 20000):
+            total += math.sqrt(i)
+        return element.id()
+
+    def close_cache(self):
+        pass
+
+
+class FakeSectionProcessor:
+    """Produces one closed square per shape at the cut height."""
+
+    def __init__(self, slice_tolerance=1e-6, chain_tolerance=1e-3):
+        self.slice_tolerance = slice_tolerance
+
+    def process_shape_section(self, shape, z_height, ifc_class, element_guid):
+        x = float(shape)
+        points = [(x, z_height), (x + 1.0, z_height), (x + 1.0, z_height + 1.0), (x, z_height + 1.0)]
+        return [Polyline2D(points=points, ifc_class=ifc_class, element_guid=element_guid, is_closed=True)]
+
+
+def create_multi_storey_file(path, storeys=4, walls_per_storey=40):
+    """Create and write a model with walls contained in several storeys."""
+    ifc_file = ifcopenshell.api.run("project.create_file", version="IFC4")
+    project = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcProject", name="Project")
+    ifcopenshell.api.run("unit.assign_unit", ifc_file)
+    site = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcSite", name="Site")
+    building = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcBuilding", name="Building")
+    ifcopenshell.api.run("aggregate.assign_object", ifc_file, products=[site], relating_object=project)
+    ifcopenshell.api.run("aggregate.assign_object", ifc_file, products=[building], relating_object=site)
+
+    for level in range(storeys):
+        storey = ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcBuildingStorey",
+                                      name=f"Level {level}")
+        storey.Elevation = level * 3.0
+        ifcopenshell.api.run("aggregate.assign_object", ifc_file, products=[storey], relating_object=building)
+
+        walls = [
+            ifcopenshell.api.run("root.create_entity", ifc_file, ifc_class="IfcWall", name=f"Wall {level}-{i}")
+            for i in range(walls_per_storey)
+        ]
+        ifcopenshell.api.run("spatial.assign_container", ifc_file, products=walls, relating_structure=storey)
+
+    ifc_file.write(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Create a generator for a multi-storey sample with storey multiprocessing enabled."""
+    config = Config(
+        input_path=create_multi_storey_file(tmp_path / "multi_storey.ifc"),
+        output_dir=str(tmp_path / "out"),
+        cut_offset_m=1.05,
+        geometry=GeometryConfig(cache_geometry=False),
+        output=OutputConfig(write_geojson=False),
+        performance=PerformanceConfig(multiprocessing=True, max_workers=4)
+    )
+
+    with patch.object(generator_main, 'GeometryEngine', FakeGeometryEngine), \
+            patch.object(generator_main, 'SectionProcessor', FakeSectionProcessor):
+        instance = FloorPlanGenerator.from_config(config)
+        assert instance._initialize_components()
+        yield instance
+
+    instance.performance_optimizer.cleanup()
+
+
+def open_storeys(generator):
+    """Open the sample model and return it with its storeys."""
+    ifc_file = generator.ifc_parser.open_file(generator.config.input_path)
+    return ifc_file, generator.ifc_parser.extract_storeys(ifc_file)
+
+
+class TestStoreyMultiprocessing:
+    """Test cases for process-parallel storey processing."""
+
+    def test_parallel_matches_sequential(self, generator):
+        """Test that worker processes produce the sequential storey results."""
+        ifc_file, storeys = open_storeys(generator)
+
+        expected = generator._process_storeys_sequential(ifc_file, storeys, 1.0)
+        with patch.object(generator, '_process_storeys_sequential',
+                          side_effect=AssertionError("fell back to sequential")):
+            results = generator._process_storeys_parallel(ifc_file, storeys, 1.0)
+
+        assert [r.storey_name for r in results] == ["Level 0", "Level 1", "Level 2", "Level 3"]
+        assert results == expected
+        assert results[2].elevation == 6.0
+        assert results[0].element_count == 40
+
+    def test_parallel_keeps_additional_sections(self, generator):
+        """Test that sections at additional cut heights survive the worker transport."""
+        generator.config.additional_cut_offsets_m = [0.3]
+        ifc_file, storeys = open_storeys(generator)
+
+        expected = generator._process_storeys_sequential(ifc_file, storeys, 1.0)
+        results = generator._process_storeys_parallel(ifc_file, storeys, 1.0)
+
+        assert results == expected
+        assert [section.cut_height for section in results[1].additional_sections] == [0.3]
+        assert results[1].additional_sections[0].polylines[0].points[0][1] == 0.3
+
+    def test_broken_pool_falls_back_to_sequential(self, generator):
+        """Test that a worker that cannot start does not lose any storeys."""
+        ifc_file, storeys = open_storeys(generator)
+        expected = generator._process_storeys_sequential(ifc_file, storeys, 1.0)
+
+        def broken_initializer(config, verbose):
+            raise RuntimeError("cannot open model")
+
+        with patch.object(generator_main, '_initialize_storey_worker', broken_initializer):
+            results = generator._process_storeys_parallel(ifc_file, storeys, 1.0)
+
+        assert results == expected
+
+    def test_errors_cross_process_boundary(self):
+        """Test that structured errors keep their type and context when pickled."""
+        error = EmptyCutResultError(storey_name="Level 1", cut_height=1.05)
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is EmptyCutResultError
+        assert isinstance(restored, ProcessingError)
+        assert restored.error_code == error.error_code
+        assert restored.context == error.context
+        assert str(restored) == str(error)
+
+
+class TestStoreyMultiprocessingBenchmark:
+    """Benchmark parallel storey processing against the sequential path."""
+
+    def test_parallel_speedup_on_multi_storey_sample(self, generator):
+        """Test that worker processes beat sequential processing on a multi-storey model."""
+        ifc_file, storeys = open_storeys(generator)
+
+        start_time = time.perf_counter()
+        expected = generator._process_storeys_sequential(ifc_file, storeys, 1.0)
+        sequential_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        results = generator._process_storeys_parallel(ifc_file, storeys, 1.0)
+        parallel_time = time.perf_counter() - start_time
+
+        assert results == expected
+        print(f"\nSequential: {sequential_time:.3f}s, parallel: {parallel_time:.3f}s, "
+              f"speed-up: {sequential_time / parallel_time:.2f}x")
+
+        if (os.cpu_count() or 1) < 2:
+            pytest.skip("Speed-up needs at least 2 CPUs")
+        assert parallel_time < sequential_time, (
+            f"Parallel processing ({parallel_time:.3f}s) should beat sequential ({sequential_time:.3f}s)"
+        )
@@ -0,0 +1,131 @@
+"""
+Unit tests for streaming SVG output.
+
+Covers the document structure with shared CSS classes per IFC class, bulk
+coordinate formatting with limited precision, and streaming straight to the
+output file.
+"""
+
+import pytest
+import sys
+import os
+import io
+import xml.etree.ElementTree as ET
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ifc_floor_plan_generator.models import Config, RenderingConfig, BoundingBox, Polyline2D
+from ifc_floor_plan_generator.errors.exceptions import ProcessingError
+from ifc_floor_plan_generator.rendering.svg_renderer import SVGRenderer, POLYLINE_CHUNK_SIZE
+from ifc_floor_plan_generator.rendering.output_manager import OutputManager
+
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+class RecordingStream(io.StringIO):
+    """Text stream that records the size of every write."""
+
+    def __init__(self):
+        super().__init__()
+        self.write_sizes = []
+
+    def write(self, text):
+        self.write_sizes.append(len(text))
+        return super().write(text)
+
+
+def sample_polylines():
+    """Create walls and a slab, with the walls not adjacent in input order."""
+    return [
+        Polyline2D(points=[(0.0, 0.0), (4.0, 0.0), (4.0, 0.2), (0.0, 0.2)],
+                   ifc_class="IfcWall", element_guid="WALL1", is_closed=True),
+        Polyline2D(points=[(0.0, 0.0), (1.23456, 2.0)], ifc_class="IfcSlab", element_guid="SLAB1"),
+        Polyline2D(points=[(4.0, 0.0), (4.0, 3.0)], ifc_class="IfcWall", element_guid="WALL2"),
+    ]
+
+
+class TestStreamingSVGRenderer:
+    """Test cases for SVGRenderer.write_svg."""
+
+    def test_groups_polylines_by_class_with_shared_styles(self):
+        """Test that each IFC class gets one CSS rule and one group without per-element styles."""
+        renderer = SVGRenderer(RenderingConfig(class_styles={"IfcWall": {"color": "#FF0000", "linewidth_px": 2.0}}))
+
+        root = ET.fromstring(renderer.render_polylines(sample_polylines(), {"title": "Level 0 & roof"}))
+
+        assert root.find(f"{SVG_NS}title").text == "Level 0 & roof"
+        style = root.find(f"{SVG_NS}style").text
+        assert ".ifc-ifcwall { stroke:#FF0000;stroke-width:2.0;fill:none }" in style
+        assert ".ifc-ifcslab { stroke:#000000;stroke-width:1.0;fill:none }" in style
+
+        groups = root.find(f"{SVG_NS}g").findall(f"{SVG_NS}g")
+        assert [group.get("data-ifc-class") for group in groups] == ["IfcWall", "IfcSlab"]
+        assert [child.get("id") for child in groups[0]] == ["polyline_0", "polyline_2"]
+        assert [child.tag for child in groups[0]] == [f"{SVG_NS}polygon", f"{SVG_NS}polyline"]
+        assert groups[0][1].get("data-element-guid") == "WALL2"
+        assert all(child.get("style") is None for group in groups for child in group)
+
+    def test_coordinates_are_precision_limited_and_inverted(self):
+        """Test bulk formatting with the configured precision and Y-inversion."""
+        polylines = [Polyline2D(points=[(0.0, 0.0), (1.23456, 2.0)], ifc_class="IfcSlab", element_guid="SLAB1")]
+
+        inverted = SVGRenderer(RenderingConfig(coordinate_precision=2))
+        inverted.set_viewport(BoundingBox(min_x=0.0, min_y=0.0, max_x=2.0, max_y=2.0))
+        plain = SVGRenderer(RenderingConfig(invert_y=False, coordinate_precision=0))
+
+        assert 'points="0.00,2.00 1.23,0.00"' in inverted.render_polylines(polylines, {})
+        assert 'points="0,0 1,2"' in plain.render_polylines(polylines, {})
+
+    def test_large_storey_is_written_in_chunks(self):
+        """Test that no single write holds more than one chunk of polylines."""
+        polylines = [
+            Polyline2D(points=[(float(i), 0.0), (float(i), 1.0)], ifc_class="IfcWall", element_guid=f"G{i}")
+            for i in range(3 * POLYLINE_CHUNK_SIZE)
+        ]
+        stream = RecordingStream()
+
+        written = SVGRenderer(RenderingConfig()).write_svg(polylines, stream, {})
+
+        assert written == len(polylines)
+        assert len(ET.fromstring(stream.getvalue()).find(f"{SVG_NS}g")[0]) == len(polylines)
+        assert max(stream.write_sizes) < len(stream.getvalue()) / 2
+
+    def test_empty_document(self):
+        """Test that no polylines give a placeholder document."""
+        root = ET.fromstring(SVGRenderer(RenderingConfig()).render_polylines([], {}))
+
+        assert root.find(f"{SVG_NS}text").text == "No geometry to display"
+
+    def test_invalid_precision_rejected(self):
+        """Test that the coordinate precision is validated."""
+        with pytest.raises(ValueError):
+            RenderingConfig(coordinate_precision=-1)
+
+
+class TestStreamingSVGFile:
+    """Test streaming SVG documents to output files."""
+
+    def test_render_and_save_streams_to_file(self, tmp_path):
+        """Test that the saved file matches the rendered document."""
+        output_manager = OutputManager(Config(input_path="model.ifc", output_dir=str(tmp_path), cut_offset_m=1.05))
+        renderer = SVGRenderer(RenderingConfig())
+
+        file_path = renderer.render_and_save(sample_polylines(), output_manager, "Level 0", 0, {})
+
+        with open(file_path, encoding="utf-8") as f:
+            assert f.read() == renderer.render_polylines(sample_polylines(), {})
+        assert os.listdir(tmp_path) == [os.path.basename(file_path)]
+
+    def test_failed_rendering_leaves_no_partial_file(self, tmp_path):
+        """Test that a rendering error keeps its error code and removes the temporary file."""
+        output_manager = OutputManager(Config(input_path="model.ifc", output_dir=str(tmp_path), cut_offset_m=1.05))
+        broken = [Polyline2D(points=[(0.0, 0.0), (1.0, 1.0)], ifc_class="IfcWall", element_guid="G")]
+        broken[0].points.append(("x", "y"))
+
+        with pytest.raises(ProcessingError) as error:
+            SVGRenderer(RenderingConfig()).render_and_save(broken, output_manager, "Level 0", 0, {})
+
+        assert error.value.error_code == "SVG_RENDER_FAILED"
+        assert os.listdir(tmp_path) == []
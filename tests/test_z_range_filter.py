@@ -0,0 +1,222 @@
+"""
+Unit tests for the Z-range prefilter.
+
+Estimated extents are checked against IfcOpenShell tessellation, and the storey
+pipeline is checked to skip elements before any shape is generated.
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import ifcopenshell
+import ifcopenshell.api
+import ifcopenshell.geom
+
+from ifc_floor_plan_generator import main as generator_main
+from ifc_floor_plan_generator.main import FloorPlanGenerator
+from ifc_floor_plan_generator.geometry.z_range_filter import ZRangeFilter
+from ifc_floor_plan_generator.rendering.manifest_generator import ManifestGenerator
+from ifc_floor_plan_generator.models import Config, GeometryConfig, OutputConfig, Polyline2D
+
+
+def placement_matrix(z=0.0, rotate_to_x=False):
+    """Create a placement matrix at height z, optionally with local Z along world X."""
+    matrix = np.eye(4)
+    if rotate_to_x:
+        matrix[:3, :3] = [[0.0, 0.0, 1.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]]
+    matrix[2, 3] = z
+    return matrix
+
+
+class SampleModel:
+    """Model with elements at different heights above one storey."""
+
+    def __init__(self):
+        self.file = ifcopenshell.api.run("project.create_file", version="IFC4")
+        ifcopenshell.api.run("root.create_entity", self.file, ifc_class="IfcProject", name="Project")
+        ifcopenshell.api.run("unit.assign_unit", self.file,
+                             length={"is_metric": True, "raw": "METERS"})
+        model = ifcopenshell.api.run("context.add_context", self.file, context_type="Model")
+        self.body = ifcopenshell.api.run("context.add_context", self.file, context_type="Model",
+                                         context_identifier="Body", target_view="MODEL_VIEW", parent=model)
+        self.storey = ifcopenshell.api.run("root.create_entity", self.file, ifc_class="IfcBuildingStorey",
+                                           name="Level 0")
+        self.storey.Elevation = 0.0
+
+    def add(self, ifc_class, name, representation, matrix):
+        """Create a contained element with a body representation and placement."""
+        element = ifcopenshell.api.run("root.create_entity", self.file, ifc_class=ifc_class, name=name)
+        ifcopenshell.api.run("geometry.assign_representation", self.file,
+                             product=element, representation=representation)
+        ifcopenshell.api.run("geometry.edit_object_placement", self.file, product=element, matrix=matrix)
+        ifcopenshell.api.run("spatial.assign_container", self.file, products=[element],
+                             relating_structure=self.storey)
+        return element
+
+    def wall(self, name="Wall", z=0.0, height=3.0):
+        representation = ifcopenshell.api.run("geometry.add_wall_representation", self.file, context=self.body,
+                                              length=5.0, height=height, thickness=0.2)
+        return self.add("IfcWall", name, representation, placement_matrix(z))
+
+    def slab(self, name="Slab", z=3.0):
+        representation = ifcopenshell.api.run("geometry.add_slab_representation", self.file,
+                                              context=self.body, depth=0.2)
+        return self.add("IfcSlab", name, representation, placement_matrix(z))
+
+    def beam(self, name="Beam", z=2.5, profile_height=0.4):
+        """Horizontal beam whose profile plane is vertical, with the profile X axis pointing down."""
+        profile = self.file.createIfcRectangleProfileDef("AREA", None, None, profile_height, 0.2)
+        representation = ifcopenshell.api.run("geometry.add_profile_representation", self.file,
+                                              context=self.body, profile=profile, depth=4.0)
+        return self.add("IfcBeam", name, representation, placement_matrix(z, rotate_to_x=True))
+
+    def mesh_element(self, name="Furniture", z=0.0):
+        """Element with a triangulated face set body."""
+        representation = ifcopenshell.api.run("geometry.add_mesh_representation", self.file, context=self.body,
+                                              vertices=[[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0),
+                                                         (0.0, 0.0, 0.5)]],
+                                              faces=[[(0, 2, 1), (0, 1, 3), (1, 2, 3), (2, 0, 3)]])
+        return self.add("IfcFurniture", name, representation, placement_matrix(z))
+
+
+def tessellated_z_range(element):
+    """Z-range of an element as tessellated by IfcOpenShell."""
+    settings = ifcopenshell.geom.settings()
+    settings.set(settings.USE_WORLD_COORDS, True)
+    vertices = np.array(ifcopenshell.geom.create_shape(settings, element).geometry.verts).reshape(-1, 3)
+    return vertices[:, 2].min(), vertices[:, 2].max()
+
+
+class TestZRangeFilter:
+    """Test cases for ZRangeFilter."""
+
+    @pytest.mark.parametrize("build", [
+        lambda model: model.wall(z=0.5),
+        lambda model: model.slab(z=3.0),
+        lambda model: model.beam(z=2.5),
+        lambda model: model.mesh_element(z=1.0),
+    ])
+    def test_estimate_contains_tessellation(self, build):
+        """Test that estimated extents contain the tessellated geometry."""
+        model = SampleModel()
+        element = build(model)
+
+        estimate = ZRangeFilter().estimate_z_range(element)
+        actual_min, actual_max = tessellated_z_range(element)
+
+        assert estimate is not None
+        assert estimate[0] <= actual_min + 1e-9
+        assert estimate[1] >= actual_max - 1e-9
+
+    def test_vertical_profile_extent(self):
+        """Test that a horizontal beam is bounded by its profile, not its length."""
+        model = SampleModel()
+        beam = model.beam(z=2.5, profile_height=0.4)
+
+        z_min, z_max = ZRangeFilter().estimate_z_range(beam)
+
+        assert z_max - z_min == pytest.approx(0.4)
+        assert z_min >= 2.0 and z_max <= 3.0
+
+    def test_unit_scale(self):
+        """Test that extents are converted to metres."""
+        model = SampleModel()
+        wall = model.wall(z=0.0, height=3.0)
+
+        assert ZRangeFilter().estimate_z_range(wall, unit_scale=0.001) == pytest.approx((0.0, 0.003))
+
+    def test_filter_elements(self):
+        """Test that only elements reaching the cut plane are kept, in order."""
+        model = SampleModel()
+        wall = model.wall()
+        slab = model.slab(z=3.0)
+        footing = model.wall(name="Footing", z=-1.0, height=0.5)
+        element_without_body = ifcopenshell.api.run("root.create_entity", model.file,
+                                                    ifc_class="IfcWall", name="Empty")
+
+        kept, skipped = ZRangeFilter().filter_elements([slab, wall, footing, element_without_body], 1.05)
+
+        assert kept == [wall, element_without_body]
+        assert skipped == 2
+
+    def test_tolerance_at_boundary(self):
+        """Test that elements ending exactly at the cut plane are kept."""
+        model = SampleModel()
+        slab = model.slab(z=1.25)
+        z_min, z_max = ZRangeFilter().estimate_z_range(slab)
+
+        assert ZRangeFilter(tolerance=1e-6).filter_elements([slab], z_max)[1] == 0
+        assert ZRangeFilter(tolerance=1e-6).filter_elements([slab], z_max + 1e-3)[1] == 1
+
+
+class RecordingGeometryEngine:
+    """Records the elements it is asked to tessellate."""
+
+    generated = []
+
+    def __init__(self, config, error_handler=None):
+        self.config = config
+
+    def generate_shape(self, element, element_hash=None):
+        RecordingGeometryEngine.generated.append(element.Name)
+        return element.id()
+
+
+class SquareSectionProcessor:
+    """Produces one closed square per shape."""
+
+    def __init__(self, slice_tolerance=1e-6, chain_tolerance=1e-3):
+        pass
+
+    def process_shape_section(self, shape, z_height, ifc_class, element_guid):
+        x = float(shape)
+        points = [(x, 0.0), (x + 1.0, 0.0), (x + 1.0, 1.0), (x, 1.0)]
+        return [Polyline2D(points=points, ifc_class=ifc_class, element_guid=element_guid, is_closed=True)]
+
+
+class TestZRangePrefilterPipeline:
+    """Test the prefilter in storey processing."""
+
+    @pytest.mark.parametrize("z_prefilter, expected_generated, expected_skipped", [
+        (True, ["Wall"], 2),
+        (False, ["Wall", "Slab", "Roof beam"], 0),
+    ])
+    def test_storey_skips_elements_before_tessellation(self, tmp_path, z_prefilter,
+                                                       expected_generated, expected_skipped):
+        """Test that skipped elements are never tessellated and are reported."""
+        model = SampleModel()
+        model.wall()
+        model.slab(z=3.0)
+        model.beam(name="Roof beam", z=2.8)
+        input_path = str(tmp_path / "model.ifc")
+        model.file.write(input_path)
+
+        config = Config(
+            input_path=input_path,
+            output_dir=str(tmp_path / "out"),
+            cut_offset_m=1.05,
+            geometry=GeometryConfig(cache_geometry=False, z_prefilter=z_prefilter),
+            output=OutputConfig(write_geojson=False)
+        )
+        RecordingGeometryEngine.generated = []
+
+        with patch.object(generator_main, 'GeometryEngine', RecordingGeometryEngine), \
+                patch.object(generator_main, 'SectionProcessor', SquareSectionProcessor):
+            generator = FloorPlanGenerator.from_config(config)
+            assert generator._initialize_components()
+            ifc_file = generator.ifc_parser.open_file(input_path)
+            storey = ifc_file.by_type("IfcBuildingStorey")[0]
+            result = generator._process_single_storey(ifc_file, storey, 0, 1.0)
+
+        assert sorted(RecordingGeometryEngine.generated) == sorted(expected_generated)
+        assert result.element_count == len(expected_generated)
+        assert result.skipped_element_count == expected_skipped
+
+        metadata = ManifestGenerator().create_storey_metadata(result)
+        assert metadata["skipped_element_count"] == expected_skipped